@@ -0,0 +1,183 @@
+"""
+Circuit-Breaker und adaptive Parallelität (AIMD) für den n8n-Webhook
+
+Bisher versucht jeder Batch für sich bis zu 3x (je bis 15s Timeout plus
+Pausen) - während eines n8n-Ausfalls blockiert jeder Flush den Ingest-Loop
+rund 45s, und nach dem Ausfall geht alles auf einmal raus. Gemeinsam für alle
+Sender (Bulk-Batches, schnelle Lane, Standby, DLQ-Replay):
+
+CircuitBreaker (closed → open → half_open → closed):
+- closed: alles geht durch; nach failure_threshold Fehlschlägen in Folge
+  (Timeout, Verbindung, 404, 429, 5xx) → open
+- open: Requests werden sofort abgelehnt (kostet nichts im Ingest-Loop, die
+  Coins bleiben im Buffer) - bis open_seconds abgelaufen sind bzw. solange
+  n8n per Retry-After um Pause gebeten hat
+- half_open: genau ein Probe-Request (ein echter Batch) darf raus; Erfolg →
+  closed, Fehler → wieder open mit doppelter Pause (bis max_open_seconds)
+
+AimdLimiter (wie TCP-Congestion-Control, nur für gleichzeitige Requests):
+- Additive Increase: jede schnelle, erfolgreiche Antwort erhöht das Limit um
+  1/Limit (≈ +1 pro Runde), bis max_limit
+- Multiplicative Decrease: 429, 5xx, Timeout oder Latenz über latency_target
+  halbiert das Limit (höchstens einmal pro Antwortzeit), mindestens min_limit
+- Start und jede Öffnung des Breakers beginnen bei min_limit - nach einem
+  Ausfall tastet sich der Relay wieder hoch statt n8n zu fluten
+"""
+import asyncio
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}  # für die Prometheus-Gauge
+PROBE_TIMEOUT = 30  # Sekunden - ein Probe ohne Ergebnis (abgebrochener Task) blockiert nicht ewig
+
+
+class CircuitBreaker:
+    """Gemeinsamer Schutzschalter vor einem Sink"""
+
+    def __init__(self, failure_threshold=5, open_seconds=15, max_open_seconds=60):
+        self.failure_threshold = failure_threshold
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.open_until = 0.0
+        self.probe_inflight = False
+        self.probe_started = 0.0
+        self.last_change = time.time()
+        self.stats = {"opens": 0, "rejected": 0, "probes": 0}
+
+    @property
+    def enabled(self):
+        return self.failure_threshold > 0
+
+    def ready(self):
+        """Würde allow() jetzt durchlassen? (ohne Zähler - für die Flush-Bedingung)"""
+        if not self.enabled or self.state == CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == OPEN:
+            return now >= self.open_until
+        return not self.probe_inflight or now - self.probe_started > PROBE_TIMEOUT
+
+    def allow(self):
+        """Darf ein Request raus? (im half_open-Zustand nur der eine Probe-Request)"""
+        if not self.enabled or self.state == CLOSED:
+            return True
+        if not self.ready():
+            self.stats["rejected"] += 1
+            return False
+        if self.state == OPEN:
+            self._set_state(HALF_OPEN)
+        self.probe_inflight = True
+        self.probe_started = time.monotonic()
+        self.stats["probes"] += 1
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        if self.state != CLOSED:
+            self.probe_inflight = False
+            self.open_seconds = self.base_open_seconds
+            self._set_state(CLOSED)
+            return True  # wieder geschlossen
+        return False
+
+    def record_failure(self, retry_after=None):
+        """Fehlschlag eines Requests → True, wenn der Breaker dadurch öffnet"""
+        if not self.enabled:
+            return False
+        self.failures += 1
+        if self.state == HALF_OPEN:
+            # Probe gescheitert: länger warten bis zur nächsten
+            self.open_seconds = min(self.open_seconds * 2, self.max_open_seconds)
+            self._open(retry_after)
+            return True
+        if self.state == CLOSED and (self.failures >= self.failure_threshold or retry_after):
+            self._open(retry_after)
+            return True
+        if self.state == OPEN and retry_after:
+            self.open_until = max(self.open_until, time.monotonic() + retry_after)
+        return False
+
+    def _open(self, retry_after=None):
+        self.probe_inflight = False
+        self.opened_at = time.time()
+        self.open_until = time.monotonic() + max(self.open_seconds, retry_after or 0)
+        self.stats["opens"] += 1
+        self._set_state(OPEN)
+
+    def _set_state(self, state):
+        self.state = state
+        self.last_change = time.time()
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            "enabled": self.enabled,
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "state_since_seconds": int(time.time() - self.last_change),
+            "retry_in_seconds": round(max(0.0, self.open_until - time.monotonic()), 1) if self.state == OPEN else None,
+            **self.stats,
+        }
+
+
+class AimdLimiter:
+    """Begrenzung gleichzeitiger Requests, Limit per AIMD aus Latenz und Überlast-Antworten"""
+
+    def __init__(self, max_limit=4, min_limit=1, latency_target=2.0, decrease_factor=0.5):
+        self.max_limit = max(min_limit, max_limit)
+        self.min_limit = min_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.limit = float(min_limit)
+        self.inflight = 0
+        self.condition = asyncio.Condition()
+        self.last_decrease = 0.0
+        self.stats = {"increases": 0, "decreases": 0, "waits": 0}
+
+    async def __aenter__(self):
+        async with self.condition:
+            if self.inflight >= int(self.limit):
+                self.stats["waits"] += 1
+                await self.condition.wait_for(lambda: self.inflight < int(self.limit))
+            self.inflight += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        async with self.condition:
+            self.inflight -= 1
+            self.condition.notify_all()
+
+    def record(self, latency, overloaded=False):
+        """Antwort nach `latency` Sekunden; overloaded = 429/5xx/Timeout"""
+        if overloaded or latency > self.latency_target:
+            now = time.monotonic()
+            # Eine Überlast-Welle trifft meist mehrere Requests - nur einmal pro Antwortzeit halbieren
+            if now - self.last_decrease >= latency:
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+                self.last_decrease = now
+                self.stats["decreases"] += 1
+            return
+        if self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.stats["increases"] += 1
+
+    def reset(self):
+        """Nach einem Ausfall wieder klein anfangen"""
+        self.limit = float(self.min_limit)
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            "limit": int(self.limit),
+            "limit_exact": round(self.limit, 2),
+            "max_limit": self.max_limit,
+            "inflight": self.inflight,
+            "latency_target_seconds": self.latency_target,
+            **self.stats,
+        }
@@ -0,0 +1,401 @@
+"""
+Dead-Letter-Queue für Coins, die n8n dauerhaft ablehnt
+
+Bisher blockiert ein einzelner Coin, dessen Payload n8n mit 4xx/5xx ablehnt
+(z.B. ein Workflow-Knoten scheitert an einem Feld), den ganzen Batch: er bleibt
+im Buffer und wird mit jedem Flush erneut (und erfolglos) gesendet.
+
+Mit DEAD_LETTER=file|postgres:
+- Scheitert ein Batch an einem Payload-Fehler (HTTP-Status außer 404/408/429/
+  502/503/504, siehe is_payload_error), wird er halbiert und die Hälften
+  einzeln gesendet (Bisektion), bis die fehlerhaften Coins allein stehen -
+  der Rest wird dabei zugestellt
+- Ein allein gescheiterter Coin kommt erst in die Dead-Letter-Queue, wenn n8n
+  seit seinem ersten Fehler andere Coins angenommen hat. Fällt n8n komplett
+  aus (alles scheitert), landet also nichts in der DLQ - die Coins bleiben wie
+  bisher im Buffer
+- Fehler, die den Sink selbst betreffen (Timeout, Verbindung, 404 = Workflow
+  nicht aktiv, 429, 502-504), brechen die Bisektion ab
+- Payload-Fehler während der Bisektion zählen nicht für den Circuit-Breaker
+  (sonst öffnet ein Poison-Coin mit 500 ihn mitten in der Bisektion); ein
+  Batch nur aus verdächtigen Coins kommt hinten in den Buffer, damit er nicht
+  jeder Probe-Batch des Breakers ist
+- replay() sendet Einträge erneut (z.B. nach einer Korrektur im Workflow):
+  zugestellte werden gelöscht, weiter scheiternde bleiben mit Fehler und
+  Versuchszähler stehen
+
+Stores (blockierend - im Relay über asyncio.to_thread):
+- FileDeadLetterStore: JSON Lines (Standard /app/config/deadletter.jsonl, im Volume);
+  das Ergebnis eines Replays wird mit einer einzigen Neuschreibung übernommen (settle)
+- PostgresDeadLetterStore: Tabelle relay_dead_letters (psycopg2 optional)
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+try:
+    import psycopg2
+    from psycopg2.extras import Json
+except ImportError:
+    psycopg2 = None
+
+# Fehlertypen wie in pumpfun_n8n_errors_total{type}, die den ganzen Sink betreffen
+SINK_ERRORS = {"404", "timeout", "connection", "no_url", "circuit_open", "status_408", "status_429",
+               "status_502", "status_503", "status_504"}
+MAX_SUSPECTS = 10000
+
+
+def is_payload_error(error):
+    """Liegt der Fehler (vermutlich) an den Coins im Batch statt am Sink?"""
+    return bool(error) and error not in SINK_ERRORS
+
+
+def make_entry(coin, error):
+    return {
+        "mint": coin.get("mint"),
+        "symbol": coin.get("symbol"),
+        "error": error,
+        "failed_at": datetime.now(timezone.utc).isoformat(),
+        "attempts": 1,
+        "coin": coin,
+    }
+
+
+class FileDeadLetterStore:
+    """Einträge als JSON Lines in einer Datei (älteste zuerst, max_entries begrenzt)"""
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        self.next_id = max((entry["id"] for entry in self.entries), default=0) + 1
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # abgeschnittene letzte Zeile (Absturz beim Schreiben)
+        return entries
+
+    def _rewrite(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def add(self, entries):
+        """Einträge anhängen → Anzahl wegen max_entries verworfener (älteste) Einträge"""
+        with self.lock:
+            for entry in entries:
+                entry["id"] = self.next_id
+                self.next_id += 1
+            self.entries.extend(entries)
+            dropped = max(0, len(self.entries) - self.max_entries)
+            if dropped:
+                del self.entries[:dropped]
+                self._rewrite()
+            else:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a") as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry, default=str) + "\n")
+            return dropped
+
+    def list(self, limit=100):
+        with self.lock:
+            return [dict(entry) for entry in self.entries[:limit]]
+
+    def settle(self, delivered_ids, failed):
+        """Replay-Ergebnis übernehmen: zugestellte löschen, gescheiterte ({Fehler: IDs}) markieren"""
+        delivered_ids = set(delivered_ids)
+        errors = {entry_id: error for error, ids in failed.items() for entry_id in ids}
+        if not delivered_ids and not errors:
+            return
+        with self.lock:
+            kept = []
+            for entry in self.entries:
+                if entry["id"] in delivered_ids:
+                    continue
+                if entry["id"] in errors:
+                    entry["attempts"] += 1
+                    entry["error"] = errors[entry["id"]]
+                kept.append(entry)
+            self.entries = kept
+            self._rewrite()
+
+    def count(self):
+        with self.lock:
+            return len(self.entries)
+
+    def close(self):
+        pass
+
+
+class PostgresDeadLetterStore:
+    """Einträge in der Tabelle relay_dead_letters (blockierend - im Relay über asyncio.to_thread)"""
+
+    SCHEMA_SQL = """
+        CREATE TABLE IF NOT EXISTS relay_dead_letters (
+            id BIGSERIAL PRIMARY KEY,
+            mint VARCHAR(64),
+            symbol VARCHAR(64),
+            error VARCHAR(255) NOT NULL,
+            failed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            attempts INTEGER NOT NULL DEFAULT 1,
+            coin JSONB NOT NULL
+        );
+    """
+    INSERT_SQL = """
+        INSERT INTO relay_dead_letters (mint, symbol, error, coin)
+        SELECT * FROM unnest(%s::varchar[], %s::varchar[], %s::varchar[], %s::jsonb[])
+    """
+    LIST_SQL = """
+        SELECT id, mint, symbol, error, failed_at, attempts, coin
+        FROM relay_dead_letters ORDER BY id LIMIT %s
+    """
+    SETTLE_SQL = """
+        WITH removed AS (DELETE FROM relay_dead_letters WHERE id = ANY(%s::bigint[]))
+        UPDATE relay_dead_letters d SET attempts = d.attempts + 1, error = f.error
+        FROM unnest(%s::bigint[], %s::varchar[]) AS f(id, error)
+        WHERE d.id = f.id
+    """
+    COUNT_SQL = "SELECT COUNT(*) FROM relay_dead_letters"
+
+    def __init__(self, host, port, database, user, password):
+        if psycopg2 is None:
+            raise RuntimeError("psycopg2 ist nicht installiert (pip install psycopg2-binary)")
+        self.params = dict(host=host, port=port, database=database, user=user, password=password,
+                           connect_timeout=5)
+        self.conn = None
+        self.schema_ready = False
+
+    def _execute(self, sql, args=None):
+        try:
+            if self.conn is None or self.conn.closed:
+                self.conn = psycopg2.connect(**self.params)
+                self.conn.autocommit = True
+            cursor = self.conn.cursor()
+            if not self.schema_ready:
+                cursor.execute(self.SCHEMA_SQL)
+                self.schema_ready = True
+            cursor.execute(sql, args)
+            rows = cursor.fetchall() if cursor.description else []
+            cursor.close()
+            return rows
+        except psycopg2.Error:
+            # Verbindung verwerfen, beim nächsten Aufruf neu verbinden
+            self.close()
+            raise
+
+    def add(self, entries):
+        self._execute(self.INSERT_SQL, (
+            [entry["mint"] for entry in entries],
+            [entry["symbol"] for entry in entries],
+            [entry["error"][:255] for entry in entries],
+            [Json(entry["coin"], dumps=lambda value: json.dumps(value, default=str)) for entry in entries],
+        ))
+        return 0
+
+    def list(self, limit=100):
+        return [
+            {"id": row[0], "mint": row[1], "symbol": row[2], "error": row[3],
+             "failed_at": row[4].isoformat(), "attempts": row[5], "coin": row[6]}
+            for row in self._execute(self.LIST_SQL, (limit,))
+        ]
+
+    def settle(self, delivered_ids, failed):
+        """Replay-Ergebnis übernehmen (ein Statement): zugestellte löschen, gescheiterte markieren"""
+        failed_ids = [entry_id for ids in failed.values() for entry_id in ids]
+        if not delivered_ids and not failed_ids:
+            return
+        self._execute(self.SETTLE_SQL, (
+            list(delivered_ids),
+            failed_ids,
+            [error[:255] for error, ids in failed.items() for _ in ids],
+        ))
+
+    def count(self):
+        return self._execute(self.COUNT_SQL)[0][0]
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+        self.conn = None
+
+
+class DeadLetterQueue:
+    """Bisektion fehlgeschlagener Batches, Dead-Letter-Store und Replay
+
+    send(coins) → None bei Erfolg, sonst Fehlertyp; entfernt (wie send_to_n8n)
+    zugestellte Teile aus `coins`.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.suspects = {}  # Mint → Zeitpunkt des ersten Payload-Fehlers
+        self.last_success = 0.0
+        self.size = 0
+        self.replay_lock = asyncio.Lock()
+        self.last_error = None
+        self.stats = {"isolated": 0, "bisections": 0, "dropped": 0, "replayed": 0, "replay_failed": 0}
+
+    async def load(self):
+        """Größe aus dem Store lesen (beim Start)"""
+        self.size = await asyncio.to_thread(self.store.count)
+        return self.size
+
+    def record_success(self, coins):
+        """n8n hat Coins angenommen - Beleg, dass der Sink funktioniert"""
+        self.last_success = time.monotonic()
+        for coin in coins:
+            self.suspects.pop(coin.get("mint"), None)
+
+    def all_suspect(self, coins):
+        """Sind alle Coins schon einmal mit einem Payload-Fehler gescheitert?"""
+        return bool(coins) and all(coin.get("mint") in self.suspects for coin in coins)
+
+    def _suspect(self, coins, now):
+        for coin in coins:
+            if len(self.suspects) >= MAX_SUSPECTS:
+                self.suspects.pop(next(iter(self.suspects)))
+            self.suspects.setdefault(coin.get("mint"), now)
+
+    async def isolate(self, coins, send, error):
+        """Batch ist mit `error` gescheitert → (offene Coins, Coins in der DLQ)
+
+        Offene Coins bleiben beim Aufrufer (Buffer); alles andere ist zugestellt
+        oder in der DLQ.
+        """
+        self._suspect(coins, time.monotonic())
+        failed_alone = []
+        pending = []
+        if len(coins) == 1:
+            failed_alone.append((coins[0], error))
+        else:
+            await self._bisect(coins, send, failed_alone, pending)
+
+        dead = []
+        for coin, coin_error in failed_alone:
+            if self.last_success > self.suspects.get(coin.get("mint"), float("inf")):
+                dead.append((coin, coin_error))
+            else:
+                pending.append(coin)
+        if dead:
+            try:
+                await self.add(dead)
+            except Exception as e:
+                # Store nicht erreichbar: lieber weiter im Buffer als verloren
+                self.last_error = f"store: {str(e)[:100]}"
+                pending.extend(coin for coin, _ in dead)
+                dead = []
+        pending_ids = {id(coin) for coin in pending}
+        return [coin for coin in coins if id(coin) in pending_ids], [coin for coin, _ in dead]
+
+    async def _bisect(self, coins, send, failed_alone, pending):
+        """Hälften einzeln senden; False, sobald ein Fehler den Sink selbst betrifft"""
+        self.stats["bisections"] += 1
+        middle = len(coins) // 2
+        sink_ok = True
+        for part in (coins[:middle], coins[middle:]):
+            if not sink_ok:
+                pending.extend(part)
+                continue
+            rest = list(part)
+            error = await send(rest)
+            delivered = part[:len(part) - len(rest)]
+            if delivered:
+                self.record_success(delivered)
+            if error is None:
+                self.record_success(part)
+            elif not is_payload_error(error):
+                pending.extend(rest)
+                sink_ok = False
+            elif len(rest) == 1:
+                failed_alone.append((rest[0], error))
+            else:
+                self._suspect(rest, time.monotonic())
+                sink_ok = await self._bisect(rest, send, failed_alone, pending)
+        return sink_ok
+
+    async def add(self, dead):
+        """[(Coin, Fehler)] in den Store schreiben"""
+        entries = [make_entry(coin, error) for coin, error in dead]
+        dropped = await asyncio.to_thread(self.store.add, entries)
+        for coin, _ in dead:
+            self.suspects.pop(coin.get("mint"), None)
+        self.stats["isolated"] += len(entries)
+        self.stats["dropped"] += dropped
+        self.size += len(entries) - dropped
+
+    async def entries(self, limit=100):
+        return await asyncio.to_thread(self.store.list, limit)
+
+    async def replay(self, send, limit=100, batch_size=10):
+        """Bis zu `limit` Einträge erneut senden → Ergebnis (zugestellt, gescheitert, Rest)
+
+        Scheitert ein Batch an einem Payload-Fehler, wird jeder Eintrag einzeln
+        versucht; bei einem Sink-Fehler bricht der Replay ab.
+        """
+        async with self.replay_lock:
+            entries = await asyncio.to_thread(self.store.list, limit)
+            delivered_ids = []
+            failed = {}  # Fehler → IDs
+            error = None
+            for start in range(0, len(entries), batch_size):
+                chunk = entries[start:start + batch_size]
+                error = await send([entry["coin"] for entry in chunk])
+                if error is None:
+                    delivered_ids.extend(entry["id"] for entry in chunk)
+                    continue
+                if not is_payload_error(error):
+                    break
+                for entry in chunk:
+                    error = await send([entry["coin"]]) if len(chunk) > 1 else error
+                    if error is None:
+                        delivered_ids.append(entry["id"])
+                    elif is_payload_error(error):
+                        failed.setdefault(error, []).append(entry["id"])
+                    else:
+                        break
+                if error is not None and not is_payload_error(error):
+                    break
+            stopped = error if error is not None and not is_payload_error(error) else None
+
+            await asyncio.to_thread(self.store.settle, delivered_ids, failed)
+            failed_count = sum(len(ids) for ids in failed.values())
+            self.stats["replayed"] += len(delivered_ids)
+            self.stats["replay_failed"] += failed_count
+            self.last_error = f"replay: {stopped}" if stopped else None
+            self.size = await asyncio.to_thread(self.store.count)
+            return {
+                "replayed": len(delivered_ids),
+                "failed": failed_count,
+                "not_attempted": len(entries) - len(delivered_ids) - failed_count,
+                "remaining": self.size,
+                "stopped_by": stopped,
+            }
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            "size": self.size,
+            "suspects": len(self.suspects),
+            "last_error": self.last_error,
+            **self.stats,
+        }
+
+    async def close(self):
+        await asyncio.to_thread(self.store.close)
@@ -0,0 +1,36 @@
+"""
+Auswahl der Event-Loop-Implementierung für den Relay
+
+Der Relay ist reiner I/O-Multiplexer (WebSocket, aiohttp-Server, Webhook-Client).
+EVENT_LOOP wählt beim Start:
+- "asyncio": Standard-Loop von Python (Default)
+- "uvloop": uvloop (libuv), fällt mit Warnung auf asyncio zurück, wenn nicht installiert
+- "auto": uvloop, wenn installiert, sonst asyncio
+
+Die Loop wird über asyncio.Runner(loop_factory=...) erzeugt statt über eine
+globale Event-Loop-Policy - nur der Relay-Prozess ist betroffen.
+"""
+import asyncio
+
+EVENT_LOOPS = ("auto", "uvloop", "asyncio")
+
+
+def resolve_event_loop(name):
+    """(Loop-Factory, tatsächlicher Name, Warnung oder None) für einen EVENT_LOOP-Wert"""
+    name = (name or "asyncio").strip().lower()
+    if name not in EVENT_LOOPS:
+        return None, "asyncio", f"Unbekannter EVENT_LOOP '{name}' (erlaubt: {', '.join(EVENT_LOOPS)}) - nutze asyncio"
+    if name == "asyncio":
+        return None, "asyncio", None
+    try:
+        import uvloop
+    except ImportError:
+        warning = "uvloop nicht installiert - nutze asyncio" if name == "uvloop" else None
+        return None, "asyncio", warning
+    return uvloop.new_event_loop, "uvloop", None
+
+
+def run(coro, loop_factory=None):
+    """Wie asyncio.run(), aber mit wählbarer Loop-Factory (None = asyncio)"""
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
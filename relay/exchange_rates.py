@@ -0,0 +1,217 @@
+"""
+Wechselkurs-Cache für den Relay (USD-Werte direkt beim Ingest)
+
+Statt in jeder Abfrage per `CROSS JOIN LATERAL ... ORDER BY created_at DESC LIMIT 1`
+den Kurs aus coin_metrics zu suchen, hält der Relay den aktuellen SOL/USD- und
+USD/EUR-Kurs im Speicher und stempelt `sol_price_usd`, `market_cap_usd` und
+`price_usd` auf jeden Coin:
+- ExchangeRateCache: aktueller Kurs, regelmäßig aus coin_metrics aktualisiert
+- RateHistory: sortierte Kurs-Historie mit bisect für Point-in-Time-Lookups
+  (Backfill historischer Zeilen, siehe scripts/backfill_usd.py)
+- PostgresRateSource: liest coin_metrics (psycopg2 optional - nur nötig, wenn aktiviert)
+"""
+import asyncio
+import time
+from bisect import bisect_right, insort
+from datetime import datetime, timezone
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+
+def usd_fields(market_cap_sol, price_sol, sol_price_usd):
+    """Berechnet die USD-Felder eines Coins für einen SOL/USD-Kurs"""
+    return {
+        "sol_price_usd": sol_price_usd,
+        "market_cap_usd": round(market_cap_sol * sol_price_usd, 2) if market_cap_sol is not None else None,
+        "price_usd": price_sol * sol_price_usd if price_sol is not None else None,
+    }
+
+
+def _epoch(ts):
+    if isinstance(ts, datetime):
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return ts.timestamp()
+    return float(ts)
+
+
+class RateHistory:
+    """Kurs-Historie als parallele, nach Zeit sortierte Arrays (Lookup per bisect in O(log n))"""
+
+    def __init__(self):
+        self.times = []
+        self.sol_usd = []
+        self.usd_eur = []
+
+    def add(self, ts, sol_price_usd, usd_to_eur_rate=None):
+        epoch = _epoch(ts)
+        if not self.times or epoch >= self.times[-1]:
+            # Normalfall: Kurse kommen zeitlich sortiert
+            self.times.append(epoch)
+            self.sol_usd.append(sol_price_usd)
+            self.usd_eur.append(usd_to_eur_rate)
+            return
+        index = bisect_right(self.times, epoch)
+        insort(self.times, epoch)
+        self.sol_usd.insert(index, sol_price_usd)
+        self.usd_eur.insert(index, usd_to_eur_rate)
+
+    def lookup(self, ts, max_gap=None):
+        """Kurs, der zum Zeitpunkt `ts` galt (letzter Eintrag <= ts) als (sol_usd, usd_eur)
+
+        None, wenn es vor `ts` keinen Kurs gibt oder der letzte älter als `max_gap` Sekunden ist.
+        """
+        epoch = _epoch(ts)
+        index = bisect_right(self.times, epoch) - 1
+        if index < 0:
+            return None
+        if max_gap is not None and epoch - self.times[index] > max_gap:
+            return None
+        return self.sol_usd[index], self.usd_eur[index]
+
+    def __len__(self):
+        return len(self.times)
+
+
+class PostgresRateSource:
+    """Liest Kurse aus coin_metrics (blockierend - im Relay über asyncio.to_thread)"""
+
+    LATEST_SQL = """
+        SELECT created_at, sol_price_usd, usd_to_eur_rate
+        FROM coin_metrics
+        WHERE blockchain_id = %s AND sol_price_usd IS NOT NULL
+        ORDER BY created_at DESC
+        LIMIT 1
+    """
+    HISTORY_SQL = """
+        SELECT created_at, sol_price_usd, usd_to_eur_rate
+        FROM coin_metrics
+        WHERE blockchain_id = %s AND sol_price_usd IS NOT NULL
+        ORDER BY created_at
+    """
+
+    def __init__(self, host, port, database, user, password, blockchain_id=1):
+        if psycopg2 is None:
+            raise RuntimeError("psycopg2 ist nicht installiert (pip install psycopg2-binary)")
+        self.params = dict(host=host, port=port, database=database, user=user, password=password,
+                           connect_timeout=5)
+        self.blockchain_id = blockchain_id
+        self.conn = None
+
+    def _cursor(self):
+        if self.conn is None or self.conn.closed:
+            self.conn = psycopg2.connect(**self.params)
+            self.conn.autocommit = True
+        return self.conn.cursor()
+
+    def _query(self, sql):
+        try:
+            cursor = self._cursor()
+            cursor.execute(sql, (self.blockchain_id,))
+            rows = cursor.fetchall()
+            cursor.close()
+            return rows
+        except psycopg2.Error:
+            # Verbindung verwerfen, beim nächsten Aufruf neu verbinden
+            self.close()
+            raise
+
+    def fetch_latest(self):
+        """(created_at, sol_usd, usd_eur) des neuesten Kurses oder None"""
+        rows = self._query(self.LATEST_SQL)
+        if not rows:
+            return None
+        created_at, sol_usd, usd_eur = rows[0]
+        return created_at, float(sol_usd), float(usd_eur) if usd_eur is not None else None
+
+    def fetch_history(self):
+        """Alle Kurse als RateHistory"""
+        history = RateHistory()
+        for created_at, sol_usd, usd_eur in self._query(self.HISTORY_SQL):
+            history.add(created_at, float(sol_usd), float(usd_eur) if usd_eur is not None else None)
+        return history
+
+    def close(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.conn = None
+
+
+class ExchangeRateCache:
+    """Hält den aktuellen Kurs im Speicher und stempelt USD-Werte auf Coins"""
+
+    def __init__(self, source, refresh_interval=60, max_age=900):
+        self.source = source
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.sol_usd = None
+        self.usd_eur = None
+        self.rate_time = None
+        self.last_refresh = None
+        self.last_error = None
+        self.stats = {"refreshes": 0, "errors": 0, "stamped": 0, "unstamped": 0}
+
+    async def refresh(self):
+        """Lädt den neuesten Kurs (DB-Zugriff im Thread, blockiert den Event-Loop nicht)"""
+        try:
+            latest = await asyncio.to_thread(self.source.fetch_latest)
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.last_error = str(e)[:100]
+            return False
+        self.stats["refreshes"] += 1
+        self.last_refresh = time.time()
+        self.last_error = None
+        if latest is None:
+            return False
+        self.rate_time, self.sol_usd, self.usd_eur = latest
+        return True
+
+    async def run(self):
+        """Aktualisiert den Kurs alle refresh_interval Sekunden (als Task starten)"""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def close(self):
+        """DB-Verbindung der Quelle schließen (Shutdown)"""
+        await asyncio.to_thread(self.source.close)
+
+    def age_seconds(self):
+        if self.rate_time is None:
+            return None
+        return max(0.0, time.time() - _epoch(self.rate_time))
+
+    def current(self):
+        """Aktueller SOL/USD-Kurs oder None, wenn keiner vorhanden bzw. älter als max_age"""
+        age = self.age_seconds()
+        if age is None or (self.max_age and age > self.max_age):
+            return None
+        return self.sol_usd
+
+    def stamp(self, coin):
+        """Ergänzt sol_price_usd, market_cap_usd und price_usd (nur mit aktuellem Kurs)"""
+        sol_usd = self.current()
+        if sol_usd is None:
+            self.stats["unstamped"] += 1
+            return False
+        coin.update(usd_fields(coin.get("marketCapSol"), coin.get("price_sol"), sol_usd))
+        self.stats["stamped"] += 1
+        return True
+
+    def snapshot(self):
+        age = self.age_seconds()
+        return {
+            "sol_price_usd": self.sol_usd,
+            "usd_to_eur_rate": self.usd_eur,
+            "rate_age_seconds": int(age) if age is not None else None,
+            "stale": self.current() is None,
+            "last_error": self.last_error,
+            **self.stats,
+        }
@@ -0,0 +1,102 @@
+"""
+Live-Feed der Coins für die UI (Server-Sent Events über den Health-Server)
+
+Der Ingest-Loop ruft nur `publish()` auf: ein deque-append und - falls jemand
+zuhört - einmal JSON-Encoding plus `put_nowait` pro Abonnent. Geschrieben wird
+in den Handler-Tasks der einzelnen Clients, nie im Ingest-Loop.
+- Pro Client eine begrenzte asyncio.Queue; ist sie voll (langsamer Client),
+  wird das Event für diesen Client verworfen und gezählt
+- Die letzten N Events bleiben für neue Abonnenten (Backfill) im Speicher
+"""
+import asyncio
+import json
+import time
+from collections import deque
+
+# Felder, die pro Coin in den Feed gehen (der Rest bleibt im Relay)
+FEED_FIELDS = (
+    "mint", "name", "symbol", "marketCapSol", "price_sol", "market_cap_usd",
+    "social_count", "initialBuy", "solAmount", "traderPublicKey",
+)
+
+
+class FeedSubscriber:
+    """Ein verbundener Client mit eigener, begrenzter Queue"""
+
+    def __init__(self, queue_size, status=None):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.status = status  # None = alle, sonst "accepted" oder "filtered"
+        self.connected_at = time.time()
+        self.sent = 0
+        self.dropped = 0
+        self.dropped_unreported = 0
+
+    def offer(self, status, payload):
+        if self.status and self.status != status:
+            return
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Langsamer Client: Event verwerfen statt den Ingest-Loop zu bremsen
+            self.dropped += 1
+            self.dropped_unreported += 1
+
+
+class CoinFeed:
+    """Verteilt akzeptierte/gefilterte Coins an beliebig viele Abonnenten"""
+
+    def __init__(self, queue_size=500, backlog=200, max_clients=20):
+        self.queue_size = queue_size
+        self.max_clients = max_clients
+        self.recent = deque(maxlen=backlog)
+        self.subscribers = set()
+        self.stats = {"published": 0, "delivered": 0, "dropped": 0, "clients_total": 0}
+
+    @staticmethod
+    def encode(event):
+        return json.dumps(event, default=str)
+
+    def publish(self, coin, status, reason=None):
+        """Aus dem Ingest-Loop: Coin als Event ablegen und an alle Abonnenten verteilen"""
+        event = {
+            "ts": time.time(),
+            "status": status,
+            "reason": reason,
+            **{field: coin.get(field) for field in FEED_FIELDS},
+        }
+        self.recent.append(event)
+        self.stats["published"] += 1
+        if not self.subscribers:
+            return
+        payload = self.encode(event)
+        for subscriber in self.subscribers:
+            subscriber.offer(status, payload)
+
+    def subscribe(self, status=None):
+        """Neuer Client oder None, wenn max_clients erreicht ist"""
+        if len(self.subscribers) >= self.max_clients:
+            return None
+        subscriber = FeedSubscriber(self.queue_size, status)
+        self.subscribers.add(subscriber)
+        self.stats["clients_total"] += 1
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        if subscriber in self.subscribers:
+            self.subscribers.discard(subscriber)
+            self.stats["delivered"] += subscriber.sent
+            self.stats["dropped"] += subscriber.dropped
+
+    def backfill(self, count, status=None):
+        """Die letzten `count` Events (älteste zuerst) als JSON-Strings"""
+        events = [event for event in self.recent if not status or event["status"] == status]
+        return [self.encode(event) for event in events[-count:]] if count > 0 else []
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            **self.stats,
+            "clients": len(self.subscribers),
+            "queued": sum(subscriber.queue.qsize() for subscriber in self.subscribers),
+            "dropped_active": sum(subscriber.dropped for subscriber in self.subscribers),
+        }
@@ -0,0 +1,146 @@
+"""
+Liveness/Readiness des Relays (/livez, /readyz), im Hintergrund berechnet
+
+Bisher antwortet /health mit 503, sobald der WebSocket getrennt ist - der
+Docker-Healthcheck startet den Container dann während des normalen
+Reconnect-Backoffs neu, was viel teurer ist als der Reconnect selbst.
+HealthMonitor trennt das:
+- live: die Event-Loop reagiert. Ein Tick pro `interval` misst die
+  Verspätung (Loop-Lag); live, solange der größte Lag der letzten Ticks unter
+  max_lag liegt und der letzte Tick nicht länger als 5 Intervalle her ist
+- ready: Ingest läuft und mindestens ein Sink ist gesund. Ein Ausfall zählt
+  erst nach seiner Schonfrist (ingest_grace bzw. sink_grace) - ein Reconnect
+  oder ein kurz offener Circuit-Breaker macht den Relay nicht unready. Vor der
+  ersten gesunden Beobachtung gibt es keine Schonfrist (Start: erst nach der
+  ersten Verbindung ready). Beim Shutdown sofort unready
+
+Der Zustand wird nur im Tick (bzw. per refresh(), z.B. beim Shutdown-Signal)
+aktualisiert, probe() liefert die Rohdaten - die Endpunkte lesen ihn nur.
+"""
+import asyncio
+import time
+from collections import deque
+
+LAG_WINDOW = 10  # Ticks für den max. Lag
+STALE_TICKS = 5  # so viele Intervalle ohne Tick = Loop hängt bzw. Monitor läuft nicht
+
+
+class Component:
+    """Gesund/ungesund eines Teils (Ingest oder ein Sink) mit Schonfrist"""
+
+    def __init__(self, grace):
+        self.grace = grace
+        self.healthy = False
+        self.ever_healthy = False
+        self.down_since = None
+
+    def update(self, healthy, now):
+        if healthy:
+            self.ever_healthy = True
+            self.down_since = None
+        elif self.healthy or self.down_since is None:
+            self.down_since = now
+        self.healthy = healthy
+
+    def ok(self, now):
+        """Gesund oder erst seit weniger als `grace` Sekunden ausgefallen (nach dem ersten Erfolg)"""
+        if self.healthy:
+            return True
+        return self.ever_healthy and now - self.down_since < self.grace
+
+    def snapshot(self, now):
+        return {
+            "healthy": self.healthy,
+            "ok": self.ok(now),
+            "down_seconds": round(now - self.down_since, 1) if self.down_since and not self.healthy else None,
+        }
+
+
+class HealthMonitor:
+    """Loop-Lag und Readiness, aktualisiert von run() (als Task starten)"""
+
+    def __init__(self, interval=1.0, max_lag=1.0, ingest_grace=60, sink_grace=120):
+        self.interval = interval
+        self.max_lag = max_lag
+        self.ingest = Component(ingest_grace)
+        self.sink_grace = sink_grace
+        self.sinks = {}
+        self.lags = deque(maxlen=LAG_WINDOW)
+        self.last_tick = None
+        self.shutting_down = False
+        self.ready = False
+        self.reason = "Start"
+        self.probe = None
+        self.on_change = None
+        self.stats = {"ticks": 0, "ready_changes": 0}
+
+    async def run(self, probe, on_change=None):
+        """probe() → {"ingest": bool, "sinks": {name: bool}, "shutting_down": bool}"""
+        self.probe = probe
+        self.on_change = on_change
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.lags.append(max(0.0, now - expected))
+            self.last_tick = now
+            self.stats["ticks"] += 1
+            self.refresh()
+
+    def refresh(self):
+        """Readiness sofort neu berechnen (Tick oder z.B. Shutdown-Signal)"""
+        if self.probe is None:
+            return
+        was_ready = self.ready
+        self.update(self.probe(), time.monotonic())
+        if self.ready != was_ready:
+            self.stats["ready_changes"] += 1
+            if self.on_change:
+                self.on_change(self.ready, self.reason)
+
+    def update(self, state, now):
+        self.shutting_down = state.get("shutting_down", False)
+        self.ingest.update(state["ingest"], now)
+        for name, healthy in state["sinks"].items():
+            if name not in self.sinks:
+                self.sinks[name] = Component(self.sink_grace)
+            self.sinks[name].update(healthy, now)
+        for name in set(self.sinks) - set(state["sinks"]):
+            del self.sinks[name]
+        if self.shutting_down:
+            self.ready, self.reason = False, "Shutdown"
+        elif not self.ingest.ok(now):
+            self.ready, self.reason = False, "Ingest (WebSocket) ausgefallen"
+        elif not any(sink.ok(now) for sink in self.sinks.values()):
+            self.ready, self.reason = False, "Kein Sink gesund"
+        else:
+            self.ready, self.reason = True, None
+
+    @property
+    def lag(self):
+        """Größter Loop-Lag der letzten Ticks in Sekunden"""
+        return max(self.lags, default=0.0)
+
+    def live(self):
+        """(live?, Grund) - nur gecachte Werte, kein eigener Check"""
+        if self.last_tick is None:
+            return True, None  # erster Tick steht noch aus
+        if time.monotonic() - self.last_tick > self.interval * STALE_TICKS:
+            return False, f"Kein Tick seit {time.monotonic() - self.last_tick:.1f}s"
+        if self.lag > self.max_lag:
+            return False, f"Loop-Lag {self.lag * 1000:.0f} ms > {self.max_lag * 1000:.0f} ms"
+        return True, None
+
+    def snapshot(self):
+        """Status für /readyz und /health"""
+        now = time.monotonic()
+        return {
+            "ready": self.ready,
+            "reason": self.reason,
+            "shutting_down": self.shutting_down,
+            "ingest": self.ingest.snapshot(now),
+            "sinks": {name: sink.snapshot(now) for name, sink in self.sinks.items()},
+            "grace_seconds": {"ingest": self.ingest.grace, "sink": self.sink_grace},
+            "loop_lag_ms": round(self.lag * 1000, 1),
+            **self.stats,
+        }
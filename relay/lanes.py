@@ -0,0 +1,174 @@
+"""
+Prioritäts-Lanes: Coins mit starkem Signal ohne Batch-Wartezeit an n8n
+
+Bisher warten alle angenommenen Coins im selben Buffer auf BATCH_SIZE bzw.
+BATCH_TIMEOUT - auch ein Coin mit großem Initial-Buy oder allen Socials sitzt
+bis zu 30s im Relay. Mit Lanes:
+- PriorityClassifier prüft Felder, die der Relay ohnehin hat: social_count,
+  solAmount (SOL des Initial-Buys; initialBuy selbst ist die Token-Menge) und
+  marketCapSol. Ein erfülltes Kriterium reicht, Schwelle 0 = Kriterium aus
+- "fast": eigener Puffer, run() sendet sofort bzw. in kleinen Batches
+  (batch_size Coins oder spätestens nach max_wait Sekunden), unabhängig vom
+  Ingest-Loop; schlägt das Senden fehl, bleiben die Coins in der Lane (Retry);
+  close() beendet den Loop nach dem laufenden Batch (Shutdown), der Rest liegt in fast
+- "bulk": alles andere, wie bisher im Buffer des Ingest-Loops
+
+Für beide Lanes wird die Zeit von der Annahme bis zur Zustellung gemessen
+(delivered() → Latenzen für das Prometheus-Histogramm, Perzentile in /health).
+"""
+import asyncio
+import time
+from collections import deque
+
+from stats import percentiles
+
+LANES = ("fast", "bulk")
+MAX_TRACKED = 20000  # Annahmezeiten nie zugestellter Coins (z.B. verworfene Batches) nicht endlos merken
+
+
+class PriorityClassifier:
+    """Entscheidet, ob ein Coin in die schnelle Lane gehört"""
+
+    def __init__(self, min_social_count=3, min_sol_amount=3.0, min_market_cap_sol=0.0):
+        self.min_social_count = min_social_count
+        self.min_sol_amount = min_sol_amount
+        self.min_market_cap_sol = min_market_cap_sol
+
+    def classify(self, coin):
+        """Grund für die schnelle Lane ("social_count", "sol_amount", "market_cap") oder None"""
+        if self.min_social_count and (coin.get("social_count") or 0) >= self.min_social_count:
+            return "social_count"
+        if self.min_sol_amount and (coin.get("solAmount") or 0) >= self.min_sol_amount:
+            return "sol_amount"
+        if self.min_market_cap_sol and (coin.get("marketCapSol") or 0) >= self.min_market_cap_sol:
+            return "market_cap"
+        return None
+
+    def describe(self):
+        parts = []
+        if self.min_social_count:
+            parts.append(f"Socials >= {self.min_social_count}")
+        if self.min_sol_amount:
+            parts.append(f"Initial-Buy >= {self.min_sol_amount:g} SOL")
+        if self.min_market_cap_sol:
+            parts.append(f"Market-Cap >= {self.min_market_cap_sol:g} SOL")
+        return " oder ".join(parts) or "kein Kriterium aktiv"
+
+
+class PriorityLanes:
+    """Zwei Lanes (fast/bulk) mit Latenzmessung; ohne Classifier landet alles in bulk"""
+
+    def __init__(self, classifier=None, batch_size=1, max_wait=0.25, retry_delay=5, recent_window=30):
+        self.classifier = classifier
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.retry_delay = retry_delay
+        self.recent_window = recent_window
+        self.fast = []
+        self.fast_since = None
+        self.wakeup = asyncio.Event()
+        self.closed = asyncio.Event()
+        self.recent = deque(maxlen=1000)  # (Zeit, Coin) der schnellen Lane - für den Spam-Burst-Filter
+        self.accepted_at = {}
+        self.latencies = {lane: deque(maxlen=1000) for lane in LANES}
+        self.last_error = None
+        self.stats = {
+            "coins": {lane: 0 for lane in LANES},
+            "delivered": {lane: 0 for lane in LANES},
+            "reasons": {"social_count": 0, "sol_amount": 0, "market_cap": 0},
+            "fast_batches": 0,
+            "fast_errors": 0,
+        }
+
+    def route(self, coin):
+        """Angenommenen Coin einer Lane zuordnen → "fast" (liegt dann im Lane-Puffer) oder "bulk" """
+        now = time.perf_counter()
+        mint = coin.get("mint")
+        if mint:
+            if len(self.accepted_at) >= MAX_TRACKED:
+                self.accepted_at.pop(next(iter(self.accepted_at)))
+            self.accepted_at[mint] = now
+        reason = self.classifier.classify(coin) if self.classifier else None
+        if reason is None:
+            self.stats["coins"]["bulk"] += 1
+            return "bulk"
+        self.stats["coins"]["fast"] += 1
+        self.stats["reasons"][reason] += 1
+        self.recent.append((time.monotonic(), coin))
+        if not self.fast:
+            self.fast_since = time.monotonic()
+        self.fast.append(coin)
+        self.wakeup.set()
+        return "fast"
+
+    def recent_fast(self):
+        """Coins der schnellen Lane aus den letzten recent_window Sekunden (schon gesendet oder nicht, als Iterator)"""
+        cutoff = time.monotonic() - self.recent_window
+        while self.recent and self.recent[0][0] < cutoff:
+            self.recent.popleft()
+        return (coin for _, coin in self.recent)
+
+    def delivered(self, lane, coins):
+        """Coins zugestellt → Latenzen seit der Annahme in Sekunden (Coins ohne Annahmezeit fehlen)"""
+        now = time.perf_counter()
+        latencies = []
+        for coin in coins:
+            accepted = self.accepted_at.pop(coin.get("mint"), None)
+            if accepted is not None:
+                latencies.append(now - accepted)
+        self.stats["delivered"][lane] += len(coins)
+        self.latencies[lane].extend(latencies)
+        return latencies
+
+    async def run(self, flush):
+        """Sende-Loop der schnellen Lane (als Task starten); flush(batch) → True bei Erfolg"""
+        while not self.closed.is_set():
+            self.wakeup.clear()
+            if not self.fast:
+                await self.wakeup.wait()
+                continue
+            wait = self.max_wait - (time.monotonic() - self.fast_since)
+            if len(self.fast) < self.batch_size and wait > 0:
+                # Kleiner Batch: auf weitere schnelle Coins warten, höchstens bis max_wait
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            batch = self.fast[:self.batch_size]
+            del self.fast[:len(batch)]
+            self.stats["fast_batches"] += 1
+            if await flush(batch):
+                self.last_error = None
+                if not self.fast:
+                    self.fast_since = None
+                continue
+            # Nicht zugestellter Rest (send_to_n8n entfernt zugestellte Teile) zurück an den Anfang
+            self.fast[:0] = batch
+            self.fast_since = time.monotonic()
+            self.stats["fast_errors"] += 1
+            self.last_error = time.time()
+            try:
+                await asyncio.wait_for(self.closed.wait(), timeout=self.retry_delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def close(self):
+        """Sende-Loop nach dem laufenden Batch beenden (nicht gesendete Coins bleiben in fast)"""
+        self.closed.set()
+        self.wakeup.set()
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            "enabled": self.classifier is not None,
+            "criteria": self.classifier.describe() if self.classifier else None,
+            "fast_pending": len(self.fast),
+            "last_fast_error_ago": int(time.time() - self.last_error) if self.last_error else None,
+            **self.stats,
+            "latency": {
+                lane: {name: round(value, 3) if value is not None else None
+                       for name, value in percentiles(list(self.latencies[lane])).items()}
+                for lane in LANES
+            },
+        }
@@ -0,0 +1,64 @@
+"""
+Log-Puffer des Relays mit Sequenznummern (für /logs und /logs/stream)
+
+Jede Zeile bekommt eine fortlaufende Sequenznummer. Clients merken sich die
+zuletzt gesehene Nummer und holen mit `?since=<seq>` nur noch neue Zeilen,
+statt bei jedem Refresh den kompletten Puffer zu laden.
+- deque mit maxlen: Anhängen und Verdrängen in O(1) (statt list.pop(0))
+- Abonnenten für den SSE-Tail mit begrenzter Queue (wie im Live-Feed)
+"""
+from collections import deque
+
+from feed import FeedSubscriber
+
+
+class LogBuffer:
+    """Ringpuffer der letzten Log-Zeilen als (seq, zeile)"""
+
+    def __init__(self, size=1000, queue_size=1000, max_clients=10):
+        self.entries = deque(maxlen=size)
+        self.last_seq = 0
+        self.queue_size = queue_size
+        self.max_clients = max_clients
+        self.subscribers = set()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def first_seq(self):
+        return self.entries[0][0] if self.entries else self.last_seq + 1
+
+    def append(self, line):
+        self.last_seq += 1
+        entry = (self.last_seq, line)
+        self.entries.append(entry)
+        for subscriber in self.subscribers:
+            subscriber.offer(None, entry)
+        return self.last_seq
+
+    def tail(self, lines):
+        """Die letzten `lines` Einträge (älteste zuerst)"""
+        if lines <= 0:
+            return []
+        start = max(0, len(self.entries) - lines)
+        return [self.entries[i] for i in range(start, len(self.entries))]
+
+    def since(self, seq, limit=None):
+        """Einträge mit Sequenznummer > seq (älteste zuerst), höchstens `limit`
+
+        Die Nummern sind lückenlos, daher lässt sich der Startindex direkt berechnen.
+        """
+        start = max(0, seq + 1 - self.first_seq)
+        end = len(self.entries) if limit is None else min(len(self.entries), start + limit)
+        return [self.entries[i] for i in range(start, end)]
+
+    def subscribe(self):
+        if len(self.subscribers) >= self.max_clients:
+            return None
+        subscriber = FeedSubscriber(self.queue_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.discard(subscriber)
@@ -2,13 +2,31 @@ import asyncio
 import websockets
 import json
 import time
+import itertools
 import re
 import aiohttp
 import sys
 import os
+import signal
+import socket
 from aiohttp import web
 from prometheus_client import Counter, Gauge, Histogram, generate_latest
 from datetime import datetime
+from rugcheck import RugCheckClient, HttpBackend
+from exchange_rates import ExchangeRateCache, PostgresRateSource
+from stats import RelayStats
+from feed import CoinFeed
+from logbuffer import LogBuffer
+import eventloop
+from workers import WorkerPool, process_frame
+from replicas import PostgresCoordinationStore, ReplicaCoordinator
+import stream_sink as streams
+from payloads import WebhookEncoder
+from lanes import PriorityClassifier, PriorityLanes
+from deadletter import DeadLetterQueue, FileDeadLetterStore, PostgresDeadLetterStore, is_payload_error
+from breaker import AimdLimiter, CircuitBreaker, STATE_VALUES, CLOSED, OPEN
+from spool import CoinSpool
+from health import HealthMonitor
 
 # Globale Konfigurationsvariablen (werden beim Start geladen)
 BATCH_SIZE = 10
@@ -24,12 +42,86 @@ WS_PING_TIMEOUT = 10
 WS_CONNECTION_TIMEOUT = 30
 WS_URI = "wss://pumpportal.fun/api/data"
 BAD_NAMES_PATTERN = "test|bot|rug|scam|cant|honey|faucet"
+RUGCHECK_ENABLED = False
+RUGCHECK_API_URL = "https://api.rugcheck.xyz/v1"
+RUGCHECK_RATE_LIMIT = 5
+RUGCHECK_CACHE_TTL = 600
+RUGCHECK_MAX_RETRIES = 3
+RUGCHECK_RETRY_DELAY = 10
+RUGCHECK_ENRICH_TIMEOUT = 5
+EXCHANGE_RATE_ENABLED = False
+EXCHANGE_RATE_REFRESH = 60
+EXCHANGE_RATE_MAX_AGE = 900
+DB_HOST = "localhost"
+DB_PORT = "5432"
+DB_NAME = "pump_discover"
+DB_USER = "postgres"
+DB_PASSWORD = ""
+EVENT_LOOP = "asyncio"
+WORKERS = 0
+REPLICA_COORDINATION = "off"
+REPLICA_ID = socket.gethostname()
+REPLICA_ELECTION_INTERVAL = 1
+REPLICA_STANDBY_SECONDS = 120
+REPLICA_DEDUPE_HOURS = 24
+STREAM_SINK = "off"
+STREAM_REDIS_URL = "redis://localhost:6379/0"
+STREAM_NAME = "pumpfun:coins"
+STREAM_MAXLEN = 100000
+STREAM_BATCH_SIZE = 100
+STREAM_FLUSH_MS = 200
+STREAM_GROUPS = ""
+N8N_BODY_FORMAT = "json"
+N8N_CONTENT_ENCODING = "identity"
+N8N_MAX_URL_LENGTH = 8000
+PRIORITY_LANE = False
+PRIORITY_MIN_SOCIALS = 3
+PRIORITY_MIN_SOL_AMOUNT = 3.0
+PRIORITY_MIN_MARKET_CAP_SOL = 0.0
+PRIORITY_BATCH_SIZE = 1
+PRIORITY_MAX_WAIT_MS = 250
+PRIORITY_ENRICH_TIMEOUT = 1
+DEAD_LETTER = "off"
+DEAD_LETTER_PATH = "/app/config/deadletter.jsonl"
+DEAD_LETTER_MAX = 10000
+N8N_CIRCUIT_FAILURES = 5
+N8N_CIRCUIT_OPEN_SECONDS = 15
+N8N_CIRCUIT_MAX_OPEN_SECONDS = 60
+N8N_MAX_CONCURRENCY = 4
+N8N_LATENCY_TARGET_MS = 2000
+SHUTDOWN_TIMEOUT = 20
+SHUTDOWN_SPOOL_PATH = "/app/config/shutdown_spool.jsonl"
+HEALTH_MAX_LOOP_LAG_MS = 1000
+READY_INGEST_GRACE = 60
+READY_SINK_GRACE = 120
+HEALTH_CACHE_SECONDS = 1.0  # /health wird höchstens so oft neu berechnet
+
+def is_number(value):
+    """Für Schwellwerte mit Nachkommastellen (isdigit() passt nur auf Ganzzahlen)"""
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
 
 def load_config():
     """Lädt Konfiguration aus Environment Variables und Config-Datei (Volume)"""
     global BATCH_SIZE, BATCH_TIMEOUT, N8N_WEBHOOK_URL, N8N_WEBHOOK_METHOD
     global WS_RETRY_DELAY, WS_MAX_RETRY_DELAY, N8N_RETRY_DELAY, HEALTH_PORT
     global WS_PING_INTERVAL, WS_PING_TIMEOUT, WS_CONNECTION_TIMEOUT, WS_URI, BAD_NAMES_PATTERN
+    global RUGCHECK_ENABLED, RUGCHECK_API_URL, RUGCHECK_RATE_LIMIT, RUGCHECK_CACHE_TTL
+    global RUGCHECK_MAX_RETRIES, RUGCHECK_RETRY_DELAY, RUGCHECK_ENRICH_TIMEOUT
+    global EXCHANGE_RATE_ENABLED, EXCHANGE_RATE_REFRESH, EXCHANGE_RATE_MAX_AGE
+    global DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD, EVENT_LOOP, WORKERS
+    global REPLICA_COORDINATION, REPLICA_ID, REPLICA_ELECTION_INTERVAL, REPLICA_STANDBY_SECONDS, REPLICA_DEDUPE_HOURS
+    global STREAM_SINK, STREAM_REDIS_URL, STREAM_NAME, STREAM_MAXLEN, STREAM_BATCH_SIZE, STREAM_FLUSH_MS, STREAM_GROUPS
+    global N8N_BODY_FORMAT, N8N_CONTENT_ENCODING, N8N_MAX_URL_LENGTH
+    global PRIORITY_LANE, PRIORITY_MIN_SOCIALS, PRIORITY_MIN_SOL_AMOUNT, PRIORITY_MIN_MARKET_CAP_SOL
+    global PRIORITY_BATCH_SIZE, PRIORITY_MAX_WAIT_MS, PRIORITY_ENRICH_TIMEOUT
+    global DEAD_LETTER, DEAD_LETTER_PATH, DEAD_LETTER_MAX
+    global N8N_CIRCUIT_FAILURES, N8N_CIRCUIT_OPEN_SECONDS, N8N_CIRCUIT_MAX_OPEN_SECONDS
+    global N8N_MAX_CONCURRENCY, N8N_LATENCY_TARGET_MS, SHUTDOWN_TIMEOUT, SHUTDOWN_SPOOL_PATH
+    global HEALTH_MAX_LOOP_LAG_MS, READY_INGEST_GRACE, READY_SINK_GRACE
     
     # 1. Lade aus Environment Variables (Coolify)
     BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))
@@ -45,6 +137,58 @@ def load_config():
     WS_CONNECTION_TIMEOUT = int(os.getenv("WS_CONNECTION_TIMEOUT", "30"))
     WS_URI = os.getenv("WS_URI", "wss://pumpportal.fun/api/data")
     BAD_NAMES_PATTERN = os.getenv("BAD_NAMES_PATTERN", "test|bot|rug|scam|cant|honey|faucet")
+    RUGCHECK_ENABLED = os.getenv("RUGCHECK_ENABLED", "false").lower() == "true"
+    RUGCHECK_API_URL = os.getenv("RUGCHECK_API_URL", "https://api.rugcheck.xyz/v1").strip()
+    RUGCHECK_RATE_LIMIT = int(os.getenv("RUGCHECK_RATE_LIMIT", "5"))
+    RUGCHECK_CACHE_TTL = int(os.getenv("RUGCHECK_CACHE_TTL", "600"))
+    RUGCHECK_MAX_RETRIES = int(os.getenv("RUGCHECK_MAX_RETRIES", "3"))
+    RUGCHECK_RETRY_DELAY = int(os.getenv("RUGCHECK_RETRY_DELAY", "10"))
+    RUGCHECK_ENRICH_TIMEOUT = int(os.getenv("RUGCHECK_ENRICH_TIMEOUT", "5"))
+    EXCHANGE_RATE_ENABLED = os.getenv("EXCHANGE_RATE_ENABLED", "false").lower() == "true"
+    EXCHANGE_RATE_REFRESH = int(os.getenv("EXCHANGE_RATE_REFRESH", "60"))
+    EXCHANGE_RATE_MAX_AGE = int(os.getenv("EXCHANGE_RATE_MAX_AGE", "900"))
+    DB_HOST = os.getenv("DB_HOST", "localhost")
+    DB_PORT = os.getenv("DB_PORT", "5432")
+    DB_NAME = os.getenv("DB_NAME", "pump_discover")
+    DB_USER = os.getenv("DB_USER", "postgres")
+    DB_PASSWORD = os.getenv("DB_PASSWORD", "")
+    EVENT_LOOP = os.getenv("EVENT_LOOP", "asyncio").strip().lower()
+    WORKERS = int(os.getenv("WORKERS", "0"))
+    REPLICA_COORDINATION = os.getenv("REPLICA_COORDINATION", "off").strip().lower()
+    REPLICA_ID = os.getenv("REPLICA_ID", "").strip() or socket.gethostname()
+    REPLICA_ELECTION_INTERVAL = int(os.getenv("REPLICA_ELECTION_INTERVAL", "1"))
+    REPLICA_STANDBY_SECONDS = int(os.getenv("REPLICA_STANDBY_SECONDS", "120"))
+    REPLICA_DEDUPE_HOURS = int(os.getenv("REPLICA_DEDUPE_HOURS", "24"))
+    STREAM_SINK = os.getenv("STREAM_SINK", "off").strip().lower()
+    STREAM_REDIS_URL = os.getenv("STREAM_REDIS_URL", "redis://localhost:6379/0").strip()
+    STREAM_NAME = os.getenv("STREAM_NAME", "pumpfun:coins").strip()
+    STREAM_MAXLEN = int(os.getenv("STREAM_MAXLEN", "100000"))
+    STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "100"))
+    STREAM_FLUSH_MS = int(os.getenv("STREAM_FLUSH_MS", "200"))
+    STREAM_GROUPS = os.getenv("STREAM_GROUPS", "").strip()
+    N8N_BODY_FORMAT = os.getenv("N8N_BODY_FORMAT", "json").strip().lower()
+    N8N_CONTENT_ENCODING = os.getenv("N8N_CONTENT_ENCODING", "identity").strip().lower()
+    N8N_MAX_URL_LENGTH = int(os.getenv("N8N_MAX_URL_LENGTH", "8000"))
+    PRIORITY_LANE = os.getenv("PRIORITY_LANE", "false").lower() == "true"
+    PRIORITY_MIN_SOCIALS = int(os.getenv("PRIORITY_MIN_SOCIALS", "3"))
+    PRIORITY_MIN_SOL_AMOUNT = float(os.getenv("PRIORITY_MIN_SOL_AMOUNT", "3"))
+    PRIORITY_MIN_MARKET_CAP_SOL = float(os.getenv("PRIORITY_MIN_MARKET_CAP_SOL", "0"))
+    PRIORITY_BATCH_SIZE = int(os.getenv("PRIORITY_BATCH_SIZE", "1"))
+    PRIORITY_MAX_WAIT_MS = int(os.getenv("PRIORITY_MAX_WAIT_MS", "250"))
+    PRIORITY_ENRICH_TIMEOUT = int(os.getenv("PRIORITY_ENRICH_TIMEOUT", "1"))
+    DEAD_LETTER = os.getenv("DEAD_LETTER", "off").strip().lower()
+    DEAD_LETTER_PATH = os.getenv("DEAD_LETTER_PATH", "/app/config/deadletter.jsonl").strip()
+    DEAD_LETTER_MAX = int(os.getenv("DEAD_LETTER_MAX", "10000"))
+    N8N_CIRCUIT_FAILURES = int(os.getenv("N8N_CIRCUIT_FAILURES", "5"))
+    N8N_CIRCUIT_OPEN_SECONDS = int(os.getenv("N8N_CIRCUIT_OPEN_SECONDS", "15"))
+    N8N_CIRCUIT_MAX_OPEN_SECONDS = int(os.getenv("N8N_CIRCUIT_MAX_OPEN_SECONDS", "60"))
+    N8N_MAX_CONCURRENCY = int(os.getenv("N8N_MAX_CONCURRENCY", "4"))
+    N8N_LATENCY_TARGET_MS = int(os.getenv("N8N_LATENCY_TARGET_MS", "2000"))
+    SHUTDOWN_TIMEOUT = int(os.getenv("SHUTDOWN_TIMEOUT", "20"))
+    SHUTDOWN_SPOOL_PATH = os.getenv("SHUTDOWN_SPOOL_PATH", "/app/config/shutdown_spool.jsonl")
+    HEALTH_MAX_LOOP_LAG_MS = int(os.getenv("HEALTH_MAX_LOOP_LAG_MS", "1000"))
+    READY_INGEST_GRACE = int(os.getenv("READY_INGEST_GRACE", "60"))
+    READY_SINK_GRACE = int(os.getenv("READY_SINK_GRACE", "120"))
     
     # 2. Überschreibe mit Config-Datei aus Volume (wenn vorhanden)
     config_file = "/app/config/.env"
@@ -82,28 +226,142 @@ def load_config():
                             WS_URI = value
                         elif key == "BAD_NAMES_PATTERN":
                             BAD_NAMES_PATTERN = value
+                        elif key == "RUGCHECK_ENABLED":
+                            RUGCHECK_ENABLED = value.lower() == "true"
+                        elif key == "RUGCHECK_API_URL":
+                            RUGCHECK_API_URL = value
+                        elif key == "RUGCHECK_RATE_LIMIT" and value.isdigit():
+                            RUGCHECK_RATE_LIMIT = int(value)
+                        elif key == "RUGCHECK_CACHE_TTL" and value.isdigit():
+                            RUGCHECK_CACHE_TTL = int(value)
+                        elif key == "RUGCHECK_MAX_RETRIES" and value.isdigit():
+                            RUGCHECK_MAX_RETRIES = int(value)
+                        elif key == "RUGCHECK_RETRY_DELAY" and value.isdigit():
+                            RUGCHECK_RETRY_DELAY = int(value)
+                        elif key == "RUGCHECK_ENRICH_TIMEOUT" and value.isdigit():
+                            RUGCHECK_ENRICH_TIMEOUT = int(value)
+                        elif key == "EXCHANGE_RATE_ENABLED":
+                            EXCHANGE_RATE_ENABLED = value.lower() == "true"
+                        elif key == "EXCHANGE_RATE_REFRESH" and value.isdigit():
+                            EXCHANGE_RATE_REFRESH = int(value)
+                        elif key == "EXCHANGE_RATE_MAX_AGE" and value.isdigit():
+                            EXCHANGE_RATE_MAX_AGE = int(value)
+                        elif key == "DB_HOST":
+                            DB_HOST = value
+                        elif key == "DB_PORT" and value.isdigit():
+                            DB_PORT = value
+                        elif key == "DB_NAME":
+                            DB_NAME = value
+                        elif key == "DB_USER":
+                            DB_USER = value
+                        elif key == "DB_PASSWORD":
+                            DB_PASSWORD = value
+                        elif key == "EVENT_LOOP":
+                            EVENT_LOOP = value.lower()
+                        elif key == "WORKERS" and value.isdigit():
+                            WORKERS = int(value)
+                        elif key == "REPLICA_COORDINATION":
+                            REPLICA_COORDINATION = value.lower()
+                        elif key == "REPLICA_ID" and value:
+                            REPLICA_ID = value
+                        elif key == "REPLICA_ELECTION_INTERVAL" and value.isdigit():
+                            REPLICA_ELECTION_INTERVAL = int(value)
+                        elif key == "REPLICA_STANDBY_SECONDS" and value.isdigit():
+                            REPLICA_STANDBY_SECONDS = int(value)
+                        elif key == "REPLICA_DEDUPE_HOURS" and value.isdigit():
+                            REPLICA_DEDUPE_HOURS = int(value)
+                        elif key == "STREAM_SINK":
+                            STREAM_SINK = value.lower()
+                        elif key == "STREAM_REDIS_URL":
+                            STREAM_REDIS_URL = value
+                        elif key == "STREAM_NAME" and value:
+                            STREAM_NAME = value
+                        elif key == "STREAM_MAXLEN" and value.isdigit():
+                            STREAM_MAXLEN = int(value)
+                        elif key == "STREAM_BATCH_SIZE" and value.isdigit():
+                            STREAM_BATCH_SIZE = int(value)
+                        elif key == "STREAM_FLUSH_MS" and value.isdigit():
+                            STREAM_FLUSH_MS = int(value)
+                        elif key == "STREAM_GROUPS":
+                            STREAM_GROUPS = value
+                        elif key == "N8N_BODY_FORMAT":
+                            N8N_BODY_FORMAT = value.lower()
+                        elif key == "N8N_CONTENT_ENCODING":
+                            N8N_CONTENT_ENCODING = value.lower()
+                        elif key == "N8N_MAX_URL_LENGTH" and value.isdigit():
+                            N8N_MAX_URL_LENGTH = int(value)
+                        elif key == "PRIORITY_LANE":
+                            PRIORITY_LANE = value.lower() == "true"
+                        elif key == "PRIORITY_MIN_SOCIALS" and value.isdigit():
+                            PRIORITY_MIN_SOCIALS = int(value)
+                        elif key == "PRIORITY_MIN_SOL_AMOUNT" and is_number(value):
+                            PRIORITY_MIN_SOL_AMOUNT = float(value)
+                        elif key == "PRIORITY_MIN_MARKET_CAP_SOL" and is_number(value):
+                            PRIORITY_MIN_MARKET_CAP_SOL = float(value)
+                        elif key == "PRIORITY_BATCH_SIZE" and value.isdigit():
+                            PRIORITY_BATCH_SIZE = int(value)
+                        elif key == "PRIORITY_MAX_WAIT_MS" and value.isdigit():
+                            PRIORITY_MAX_WAIT_MS = int(value)
+                        elif key == "PRIORITY_ENRICH_TIMEOUT" and value.isdigit():
+                            PRIORITY_ENRICH_TIMEOUT = int(value)
+                        elif key == "DEAD_LETTER":
+                            DEAD_LETTER = value.lower()
+                        elif key == "DEAD_LETTER_PATH" and value:
+                            DEAD_LETTER_PATH = value
+                        elif key == "DEAD_LETTER_MAX" and value.isdigit():
+                            DEAD_LETTER_MAX = int(value)
+                        elif key == "N8N_CIRCUIT_FAILURES" and value.isdigit():
+                            N8N_CIRCUIT_FAILURES = int(value)
+                        elif key == "N8N_CIRCUIT_OPEN_SECONDS" and value.isdigit():
+                            N8N_CIRCUIT_OPEN_SECONDS = int(value)
+                        elif key == "N8N_CIRCUIT_MAX_OPEN_SECONDS" and value.isdigit():
+                            N8N_CIRCUIT_MAX_OPEN_SECONDS = int(value)
+                        elif key == "N8N_MAX_CONCURRENCY" and value.isdigit():
+                            N8N_MAX_CONCURRENCY = int(value)
+                        elif key == "N8N_LATENCY_TARGET_MS" and value.isdigit():
+                            N8N_LATENCY_TARGET_MS = int(value)
+                        elif key == "SHUTDOWN_TIMEOUT" and value.isdigit():
+                            SHUTDOWN_TIMEOUT = int(value)
+                        elif key == "SHUTDOWN_SPOOL_PATH":
+                            SHUTDOWN_SPOOL_PATH = value
+                        elif key == "HEALTH_MAX_LOOP_LAG_MS" and value.isdigit():
+                            HEALTH_MAX_LOOP_LAG_MS = int(value)
+                        elif key == "READY_INGEST_GRACE" and value.isdigit():
+                            READY_INGEST_GRACE = int(value)
+                        elif key == "READY_SINK_GRACE" and value.isdigit():
+                            READY_SINK_GRACE = int(value)
         except Exception as e:
             print(f"⚠️ Fehler beim Laden der Config-Datei: {e}", flush=True)
     
     # Aktualisiere BAD_NAMES Regex
     global BAD_NAMES
     BAD_NAMES = re.compile(rf'({BAD_NAMES_PATTERN})', re.IGNORECASE)
+    
+    # Payload-Kodierung des n8n-Webhooks (Zähler bleiben bei /reload-config erhalten)
+    global webhook_encoder
+    try:
+        encoder = WebhookEncoder(N8N_BODY_FORMAT, N8N_CONTENT_ENCODING, max_url_length=N8N_MAX_URL_LENGTH)
+    except (ValueError, RuntimeError) as e:
+        print(f"⚠️ N8N_BODY_FORMAT/N8N_CONTENT_ENCODING ungültig ({e}) - nutze json ohne Kompression", flush=True)
+        encoder = WebhookEncoder(max_url_length=N8N_MAX_URL_LENGTH)
+    if webhook_encoder:
+        encoder.stats = webhook_encoder.stats
+    webhook_encoder = encoder
 
-# BAD_NAMES wird nach load_config() gesetzt
+# BAD_NAMES und webhook_encoder werden nach load_config() gesetzt
 BAD_NAMES = None
+webhook_encoder = None
 
-# Logs-Buffer für API-Zugriff
-log_buffer = []
+# Logs-Buffer für API-Zugriff (Zeilen mit fortlaufender Sequenznummer)
 MAX_LOG_BUFFER_SIZE = 1000  # Maximale Anzahl Log-Zeilen im Buffer
+log_buffer = LogBuffer(MAX_LOG_BUFFER_SIZE)
+LOG_GZIP_MIN_BYTES = 1024  # Kleinere Antworten (typische ?since-Abfragen) nicht komprimieren
 
 def add_log(message):
     """Fügt eine Log-Nachricht zum Buffer hinzu"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_entry = f"[{timestamp}] {message}"
     log_buffer.append(log_entry)
-    # Buffer begrenzen
-    if len(log_buffer) > MAX_LOG_BUFFER_SIZE:
-        log_buffer.pop(0)
     # Auch auf stdout ausgeben (für Docker Logs)
     print(log_entry, flush=True)
 
@@ -122,6 +380,86 @@ batch_send_duration = Histogram("pumpfun_batch_send_duration_seconds", "Dauer f
 uptime_seconds = Gauge("pumpfun_uptime_seconds", "Uptime in Sekunden")
 last_coin_timestamp = Gauge("pumpfun_last_coin_timestamp", "Timestamp des letzten empfangenen Coins")
 connection_duration = Gauge("pumpfun_connection_duration_seconds", "Dauer der aktuellen Verbindung")
+rugcheck_requests = Gauge("pumpfun_rugcheck_requests", "RugCheck API Requests (inkl. Retries)")
+rugcheck_cache_hits = Gauge("pumpfun_rugcheck_cache_hits", "RugCheck Cache-Treffer")
+rugcheck_latency = Gauge("pumpfun_rugcheck_latency_seconds", "RugCheck Enrichment-Latenz", ["quantile"])
+sol_price_usd = Gauge("pumpfun_sol_price_usd", "Aktueller SOL/USD-Kurs (aus coin_metrics)")
+exchange_rate_age = Gauge("pumpfun_exchange_rate_age_seconds", "Alter des aktuellen Wechselkurses")
+# Mehrprozess-Modus (WORKERS > 0): die Worker melden ihre Zähler mit jedem Ergebnis an den Ingest-Prozess
+worker_frames = Counter("pumpfun_worker_frames_total", "Von Worker-Prozessen verarbeitete Frames", ["worker"])
+worker_busy_seconds = Counter("pumpfun_worker_busy_seconds_total", "Rechenzeit der Worker-Prozesse", ["worker"])
+worker_restarts = Counter("pumpfun_worker_restarts_total", "Neu gestartete Worker-Prozesse")
+worker_lost_frames = Counter("pumpfun_worker_lost_frames_total", "Frames, die mit einem Worker verloren gingen")
+worker_inflight = Gauge("pumpfun_worker_inflight", "Frames unterwegs zu/von den Worker-Prozessen")
+# Mehrere Replikas (REPLICA_COORDINATION=postgres): nur der Leader liefert an n8n
+replica_leader = Gauge("pumpfun_replica_leader", "Diese Replika ist Leader (1) oder Follower (0)")
+replica_duplicates = Counter("pumpfun_replica_duplicates_total", "Coins, die schon von einer Replika geliefert wurden")
+replica_standby = Gauge("pumpfun_replica_standby", "Coins im Standby-Puffer (Follower)")
+# Stream-Sink (STREAM_SINK=redis): Zähler aus dem Sink, beim Scrape übernommen
+stream_published = Gauge("pumpfun_stream_published", "In den Redis Stream geschriebene Coins")
+stream_errors = Gauge("pumpfun_stream_errors", "Fehlgeschlagene Stream-Pipelines (Retry folgt)")
+stream_dropped = Gauge("pumpfun_stream_dropped", "Verworfene Coins (Stream-Queue voll)")
+stream_queue = Gauge("pumpfun_stream_queue", "Coins, die auf das Schreiben in den Stream warten")
+# Webhook-Payloads: Bytes vor/nach Kompression (Verhältnis = Ersparnis durch N8N_CONTENT_ENCODING)
+n8n_body_bytes = Gauge("pumpfun_n8n_body_bytes", "Webhook-Payload-Bytes vor Kompression (GET: URL-Länge)")
+n8n_wire_bytes = Gauge("pumpfun_n8n_wire_bytes", "Gesendete Webhook-Payload-Bytes (nach Kompression)")
+n8n_split_batches = Gauge("pumpfun_n8n_split_batches", "GET-Batches, die wegen N8N_MAX_URL_LENGTH aufgeteilt wurden")
+# Prioritäts-Lanes (PRIORITY_LANE=true): Zeit von der Annahme bis zur Zustellung an n8n, pro Lane
+coin_delivery_latency = Histogram(
+    "pumpfun_coin_delivery_seconds", "Zeit von der Annahme eines Coins bis zur Zustellung an n8n", ["lane"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 30, 60, 120)
+)
+lane_coins = Counter("pumpfun_lane_coins_total", "Angenommene Coins pro Lane", ["lane"])
+fast_lane_pending = Gauge("pumpfun_fast_lane_pending", "Coins in der schnellen Lane, die auf das Senden warten")
+# Dead-Letter-Queue (DEAD_LETTER=file|postgres): von n8n dauerhaft abgelehnte Coins
+dead_letter_size = Gauge("pumpfun_dead_letter_size", "Coins in der Dead-Letter-Queue")
+dead_letter_added = Counter("pumpfun_dead_letter_added_total", "Isolierte Coins, die in die Dead-Letter-Queue kamen")
+dead_letter_replayed = Counter("pumpfun_dead_letter_replayed_total", "Erneut gesendete DLQ-Einträge", ["result"])
+# Circuit-Breaker und AIMD-Limit vor dem n8n-Webhook (Zähler aus breaker.py, beim Scrape übernommen)
+n8n_circuit_state = Gauge("pumpfun_n8n_circuit_state", "Circuit-Breaker des n8n-Webhooks (0=closed, 1=half_open, 2=open)")
+n8n_circuit_opens = Gauge("pumpfun_n8n_circuit_opens", "Wie oft der Circuit-Breaker geöffnet hat")
+n8n_circuit_rejected = Gauge("pumpfun_n8n_circuit_rejected", "Requests, die der offene Circuit-Breaker abgelehnt hat")
+n8n_concurrency_limit = Gauge("pumpfun_n8n_concurrency_limit", "Aktuelles AIMD-Limit gleichzeitiger n8n-Requests")
+n8n_inflight = Gauge("pumpfun_n8n_inflight", "Laufende n8n-Requests")
+# Liveness/Readiness (health.py)
+relay_ready = Gauge("pumpfun_ready", "Relay ready (1=Ingest läuft und mindestens ein Sink gesund)")
+event_loop_lag = Gauge("pumpfun_event_loop_lag_seconds", "Größter Event-Loop-Lag der letzten 10 Sekunden")
+
+# Aggregierte Kennzahlen für /stats (Raten 1m/5m/15m, Filter nach Grund, Batch-Latenz)
+relay_stats = RelayStats()
+# Live-Feed der Coins für die UI (/feed, Server-Sent Events)
+coin_feed = CoinFeed()
+FEED_HEARTBEAT = 15  # Sekunden - hält die SSE-Verbindung durch Proxies offen
+
+# RugCheck Enrichment-Client (wird in listen_and_relay erstellt, wenn aktiviert)
+rugcheck_client = None
+# Wechselkurs-Cache für USD-Werte (wird in listen_and_relay erstellt, wenn aktiviert)
+exchange_rate_cache = None
+# Worker-Prozesse für Decode/Filter (wird in listen_and_relay erstellt, wenn WORKERS > 0)
+worker_pool = None
+# Leader-Wahl und Mint-Dedupe (wird in listen_and_relay erstellt, wenn REPLICA_COORDINATION=postgres)
+replica_coordinator = None
+# Redis-Stream für weitere Abnehmer (wird in listen_and_relay erstellt, wenn STREAM_SINK=redis)
+stream_sink = None
+# Lanes und Zustell-Latenz (wird in listen_and_relay erstellt; schnelle Lane nur mit PRIORITY_LANE=true)
+priority_lanes = None
+# Bisektion + Dead-Letter-Store (wird in listen_and_relay erstellt, wenn DEAD_LETTER=file|postgres)
+dead_letter_queue = None
+# HTTP-Session des Relays (für den DLQ-Replay über die API)
+http_session = None
+# Circuit-Breaker und AIMD-Limiter für alle n8n-Requests (werden in listen_and_relay erstellt)
+n8n_breaker = None
+n8n_limiter = None
+# Laufende Bulk-Flushes (höchstens so viele wie das AIMD-Limit)
+bulk_flushes = set()
+# SIGTERM/SIGINT: keine neuen Frames mehr, Buffer leeren (siehe drain_on_shutdown)
+shutdown_requested = asyncio.Event()
+shutdown_started = None
+# Shutdown-Spool (wird in listen_and_relay erstellt, wenn SHUTDOWN_SPOOL_PATH gesetzt ist)
+coin_spool = None
+# Liveness/Readiness, im Hintergrund aktualisiert (wird in main() erstellt)
+health_monitor = None
+health_cache = {"at": 0.0, "data": None, "status": 200}
 
 relay_status = {
     "ws_connected": False,
@@ -133,14 +471,54 @@ relay_status = {
     "last_message_time": None,
     "total_coins": 0,
     "total_batches": 0,
-    "reconnect_count": 0
+    "reconnect_count": 0,
+    "buffer_size": 0,
+    "event_loop": "asyncio"  # tatsächlich genutzte Loop (siehe eventloop.py)
 }
 
+def set_buffer_size(size):
+    """Aktualisiert Buffer-Größe für Prometheus und /stats"""
+    buffer_size.set(size)
+    relay_status["buffer_size"] = size
+
 async def metrics_handler(request):
     """Prometheus Metrics Endpoint"""
     uptime_seconds.set(time.time() - relay_status["start_time"])
     if relay_status["connection_start"]:
         connection_duration.set(time.time() - relay_status["connection_start"])
+    if rugcheck_client:
+        rugcheck_requests.set(rugcheck_client.stats["requests"])
+        rugcheck_cache_hits.set(rugcheck_client.stats["cache_hits"])
+        for name, value in rugcheck_client.latency_percentiles().items():
+            if value is not None:
+                rugcheck_latency.labels(quantile=name).set(value)
+    if exchange_rate_cache and exchange_rate_cache.sol_usd is not None:
+        sol_price_usd.set(exchange_rate_cache.sol_usd)
+        exchange_rate_age.set(exchange_rate_cache.age_seconds())
+    if worker_pool:
+        worker_inflight.set(worker_pool.inflight)
+    if replica_coordinator:
+        replica_standby.set(len(replica_coordinator.standby))
+    n8n_body_bytes.set(webhook_encoder.stats["body_bytes"])
+    n8n_wire_bytes.set(webhook_encoder.stats["wire_bytes"])
+    n8n_split_batches.set(webhook_encoder.stats["split_batches"])
+    if stream_sink:
+        stream_published.set(stream_sink.stats["published"])
+        stream_errors.set(stream_sink.stats["errors"])
+        stream_dropped.set(stream_sink.stats["dropped"])
+        stream_queue.set(len(stream_sink.queue))
+    if priority_lanes:
+        fast_lane_pending.set(len(priority_lanes.fast))
+    if dead_letter_queue:
+        dead_letter_size.set(dead_letter_queue.size)
+    if health_monitor:
+        event_loop_lag.set(health_monitor.lag)
+    if n8n_breaker:
+        n8n_circuit_state.set(STATE_VALUES[n8n_breaker.state])
+        n8n_circuit_opens.set(n8n_breaker.stats["opens"])
+        n8n_circuit_rejected.set(n8n_breaker.stats["rejected"])
+        n8n_concurrency_limit.set(int(n8n_limiter.limit))
+        n8n_inflight.set(n8n_limiter.inflight)
     
     return web.Response(
         body=generate_latest(),
@@ -149,7 +527,49 @@ async def metrics_handler(request):
     )
 
 async def health_check(request):
-    """Health Check Endpoint mit detaillierten Infos"""
+    """Health Check Endpoint mit detaillierten Infos (höchstens einmal pro HEALTH_CACHE_SECONDS berechnet)
+
+    Für Docker/Coolify-Healthchecks /livez nutzen - /health ist 503, solange der
+    WebSocket getrennt ist (auch während eines normalen Reconnects).
+    """
+    if time.monotonic() - health_cache["at"] >= HEALTH_CACHE_SECONDS:
+        health_cache["data"], health_cache["status"] = build_health()
+        health_cache["at"] = time.monotonic()
+    return web.json_response(health_cache["data"], status=health_cache["status"])
+
+async def livez_handler(request):
+    """Liveness: Event-Loop reagiert (für den Docker-Healthcheck)"""
+    live, reason = health_monitor.live()
+    return web.json_response(
+        {"status": "ok" if live else "stalled", "reason": reason, "loop_lag_ms": round(health_monitor.lag * 1000, 1)},
+        status=200 if live else 503
+    )
+
+async def readyz_handler(request):
+    """Readiness: Ingest läuft und mindestens ein Sink ist gesund (mit Schonfristen)"""
+    readiness = health_monitor.snapshot()
+    return web.json_response(readiness, status=200 if readiness["ready"] else 503)
+
+def probe_health():
+    """Rohdaten für den HealthMonitor (einmal pro Tick, nicht pro Request)"""
+    sinks = {}
+    if N8N_WEBHOOK_URL:
+        # Mit Circuit-Breaker: gesund, solange er nicht offen ist (auch vor dem ersten Batch)
+        sinks["n8n"] = n8n_breaker.state != OPEN if n8n_breaker and n8n_breaker.enabled else relay_status["n8n_available"]
+    if stream_sink:
+        sinks["stream"] = stream_sink.last_error is None
+    return {
+        "ingest": relay_status["ws_connected"],
+        "sinks": sinks,
+        "shutting_down": shutdown_requested.is_set(),
+    }
+
+def on_ready_change(ready, reason):
+    relay_ready.set(1 if ready else 0)
+    add_log("✅ Relay ist ready" if ready else f"⚠️ Relay nicht ready: {reason}")
+
+def build_health():
+    """Inhalt und Status-Code für /health"""
     ws_status = relay_status.get("ws_connected", False)
     n8n_status = relay_status.get("n8n_available", False)  # Default: False
     uptime = time.time() - relay_status["start_time"]
@@ -167,30 +587,148 @@ async def health_check(request):
         "last_coin_ago": int(time.time() - last_coin) if last_coin else None,
         "last_message_ago": int(time.time() - last_msg) if last_msg else None,
         "reconnect_count": relay_status["reconnect_count"],
-        "last_error": relay_status.get("last_error")
+        "last_error": relay_status.get("last_error"),
+        "event_loop": relay_status["event_loop"],
+        "webhook": webhook_encoder.snapshot()
     }
+    if n8n_breaker:
+        health_data["circuit"] = {**n8n_breaker.snapshot(), "concurrency": n8n_limiter.snapshot()}
+    if rugcheck_client:
+        health_data["rugcheck"] = rugcheck_client.snapshot()
+    if exchange_rate_cache:
+        health_data["exchange_rate"] = exchange_rate_cache.snapshot()
+    health_data["feed"] = coin_feed.snapshot()
+    if worker_pool:
+        health_data["workers"] = worker_pool.snapshot()
+    if replica_coordinator:
+        health_data["replica"] = replica_coordinator.snapshot()
+    if stream_sink:
+        health_data["stream"] = stream_sink.snapshot()
+    if priority_lanes:
+        health_data["lanes"] = priority_lanes.snapshot()
+    if dead_letter_queue:
+        health_data["dead_letter"] = dead_letter_queue.snapshot()
+    if health_monitor:
+        health_data["readiness"] = health_monitor.snapshot()
     
     status_code = 200 if ws_status else 503
-    return web.json_response(health_data, status=status_code)
+    return health_data, status_code
+
+async def stats_handler(request):
+    """Aggregierte Statistiken als JSON (für die UI statt Prometheus-Text)"""
+    stats = relay_stats.snapshot()
+    stats["status"] = {
+        "ws_connected": relay_status.get("ws_connected", False),
+        "n8n_available": relay_status.get("n8n_available", False),
+        "buffer_size": relay_status["buffer_size"],
+        "uptime_seconds": int(time.time() - relay_status["start_time"]),
+        "last_coin_ago": int(time.time() - relay_status["last_coin_time"]) if relay_status.get("last_coin_time") else None,
+    }
+    return web.json_response(stats)
+
+async def stats_series_handler(request):
+    """Zeitreihe einer Kennzahl für Sparklines/Alerting (?metric=received&window=300&step=10)"""
+    metric = request.query.get("metric", "received")
+    try:
+        window = int(request.query.get("window", "300"))
+        step = int(request.query.get("step", "10"))
+    except ValueError:
+        return web.json_response({"error": "window und step müssen Ganzzahlen sein"}, status=400)
+    if window <= 0 or step <= 0:
+        return web.json_response({"error": "window und step müssen > 0 sein"}, status=400)
+    series = relay_stats.series(metric, window=window, step=step)
+    if series is None:
+        return web.json_response({"error": f"Unbekannte Kennzahl: {metric}"}, status=404)
+    return web.json_response(series)
+
+async def feed_handler(request):
+    """Live-Feed als Server-Sent Events (?status=accepted|filtered&backfill=50)"""
+    status = request.query.get("status")
+    if status not in (None, "accepted", "filtered"):
+        return web.json_response({"error": "status muss accepted oder filtered sein"}, status=400)
+    try:
+        backfill = min(int(request.query.get("backfill", "50")), coin_feed.recent.maxlen)
+    except ValueError:
+        return web.json_response({"error": "backfill muss eine Ganzzahl sein"}, status=400)
+    subscriber = coin_feed.subscribe(status)
+    if subscriber is None:
+        return web.json_response({"error": "Zu viele Feed-Clients"}, status=503)
+    
+    response = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+    try:
+        await response.prepare(request)
+        for payload in coin_feed.backfill(backfill, status):
+            await response.write(f"data: {payload}\n\n".encode())
+        while True:
+            try:
+                payload = await asyncio.wait_for(subscriber.queue.get(), timeout=FEED_HEARTBEAT)
+            except asyncio.TimeoutError:
+                await response.write(b": ping\n\n")
+                continue
+            if subscriber.dropped_unreported:
+                # Client war zu langsam - mitteilen, wie viele Events fehlen
+                await response.write(f"event: dropped\ndata: {subscriber.dropped_unreported}\n\n".encode())
+                subscriber.dropped_unreported = 0
+            await response.write(f"data: {payload}\n\n".encode())
+            subscriber.sent += 1
+    except (ConnectionResetError, asyncio.CancelledError):
+        pass
+    finally:
+        coin_feed.unsubscribe(subscriber)
+    return response
 
 async def logs_handler(request):
-    """Logs Endpoint für API-Zugriff"""
+    """Logs Endpoint für API-Zugriff
+    
+    - ?lines=N: die letzten N Zeilen (neueste zuerst, wie bisher)
+    - ?since=<seq>: nur Zeilen nach dieser Sequenznummer (älteste zuerst, max. ?limit=)
+    Antworten ab LOG_GZIP_MIN_BYTES werden gzip-komprimiert, wenn der Client es akzeptiert.
+    """
     try:
-        lines = int(request.query.get("lines", "100"))
-        # Hole die letzten N Zeilen (neueste zuerst)
-        if log_buffer:
-            # Neueste Logs sind am Ende des Buffers
-            logs = log_buffer[-lines:] if lines <= len(log_buffer) else log_buffer
-            # Umkehren: Neueste oben (letzte Einträge zuerst)
-            logs.reverse()
+        if "since" in request.query:
+            since = int(request.query["since"])
+            limit = int(request.query.get("limit", str(MAX_LOG_BUFFER_SIZE)))
+            truncated = since + 1 < log_buffer.first_seq or since > log_buffer.last_seq
+            # Relay neu gestartet (since > last_seq) → ab Anfang, damit der Client
+            # mit dieser einen Antwort neu aufsetzen kann
+            entries = log_buffer.since(since if since <= log_buffer.last_seq else 0, limit)
+            response = web.json_response({
+                "entries": [{"seq": seq, "line": line} for seq, line in entries],
+                "first_seq": log_buffer.first_seq,
+                "last_seq": log_buffer.last_seq,
+                # Zeilen zwischen since und first_seq sind schon aus dem Buffer verdrängt
+                # (oder der Relay wurde neu gestartet und zählt wieder ab 1) - entries
+                # enthält dann das komplette aktuelle Fenster
+                "truncated": truncated
+            })
         else:
-            logs = ["[Keine Logs verfügbar - Service startet gerade...]"]
-        
+            lines = int(request.query.get("lines", "100"))
+            entries = log_buffer.tail(lines)
+            if entries:
+                # Neueste oben (Kopie - der Buffer selbst bleibt unverändert)
+                logs = [line for _, line in reversed(entries)]
+            else:
+                logs = ["[Keine Logs verfügbar - Service startet gerade...]"]
+            response = web.json_response({
+                "logs": logs,
+                "total_lines": len(log_buffer),
+                "requested_lines": lines,
+                "last_seq": log_buffer.last_seq
+            })
+        if len(response.body) >= LOG_GZIP_MIN_BYTES and "gzip" in request.headers.get("Accept-Encoding", ""):
+            response.enable_compression(web.ContentCoding.gzip)
+        return response
+    except ValueError as e:
         return web.json_response({
-            "logs": logs,
-            "total_lines": len(log_buffer),
-            "requested_lines": lines
-        })
+            "logs": [f"[Ungültiger Parameter: {str(e)}]"],
+            "total_lines": 0,
+            "requested_lines": 0,
+            "error": str(e)
+        }, status=400)
     except Exception as e:
         return web.json_response({
             "logs": [f"[Fehler beim Abrufen der Logs: {str(e)}]"],
@@ -199,10 +737,115 @@ async def logs_handler(request):
             "error": str(e)
         }, status=500)
 
+def sse_log_event(seq, line):
+    """SSE-Event einer Log-Zeile (mehrzeilige Meldungen → mehrere data:-Zeilen)"""
+    data = "\n".join(f"data: {part}" for part in line.split("\n"))
+    return f"id: {seq}\n{data}\n\n".encode()
+
+async def logs_stream_handler(request):
+    """Log-Tail als Server-Sent Events (id = Sequenznummer, ?since= bzw. Last-Event-ID)"""
+    try:
+        since = int(request.query.get("since", request.headers.get("Last-Event-ID", "-1")))
+    except ValueError:
+        return web.json_response({"error": "since muss eine Ganzzahl sein"}, status=400)
+    subscriber = log_buffer.subscribe()
+    if subscriber is None:
+        return web.json_response({"error": "Zu viele Log-Clients"}, status=503)
+    
+    response = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+    try:
+        await response.prepare(request)
+        # Ohne since: nur neue Zeilen; sonst erst den Rückstand aus dem Buffer
+        last_seq = log_buffer.last_seq if since < 0 else since
+        for seq, line in log_buffer.since(last_seq):
+            await response.write(sse_log_event(seq, line))
+            last_seq = seq
+        while True:
+            try:
+                seq, line = await asyncio.wait_for(subscriber.queue.get(), timeout=FEED_HEARTBEAT)
+            except asyncio.TimeoutError:
+                await response.write(b": ping\n\n")
+                continue
+            if seq <= last_seq:
+                continue  # schon mit dem Rückstand gesendet
+            if subscriber.dropped_unreported:
+                await response.write(f"event: dropped\ndata: {subscriber.dropped_unreported}\n\n".encode())
+                subscriber.dropped_unreported = 0
+            await response.write(sse_log_event(seq, line))
+            last_seq = seq
+    except (ConnectionResetError, asyncio.CancelledError):
+        pass
+    finally:
+        log_buffer.unsubscribe(subscriber)
+    return response
+
+async def dead_letter_handler(request):
+    """Einträge der Dead-Letter-Queue (älteste zuerst, ?limit=100)"""
+    if not dead_letter_queue:
+        return web.json_response({"error": "Dead-Letter-Queue ist nicht aktiv (DEAD_LETTER=off)"}, status=404)
+    try:
+        limit = int(request.query.get("limit", "100"))
+    except ValueError:
+        return web.json_response({"error": "limit muss eine Ganzzahl sein"}, status=400)
+    try:
+        entries = await dead_letter_queue.entries(limit)
+    except Exception as e:
+        return web.json_response({"error": f"Dead-Letter-Store nicht lesbar: {e}"}, status=503)
+    return web.json_response({"size": dead_letter_queue.size, "entries": entries})
+
+async def dead_letter_replay_handler(request):
+    """Sendet Einträge der Dead-Letter-Queue erneut an n8n (?limit=100)"""
+    if not dead_letter_queue:
+        return web.json_response({"error": "Dead-Letter-Queue ist nicht aktiv (DEAD_LETTER=off)"}, status=404)
+    if replica_coordinator and not replica_coordinator.is_leader:
+        return web.json_response({"error": "Nur der Leader liefert an n8n - Replay dort aufrufen"}, status=409)
+    if not http_session:
+        return web.json_response({"error": "Relay läuft noch nicht"}, status=503)
+    try:
+        limit = int(request.query.get("limit", "100"))
+    except ValueError:
+        return web.json_response({"error": "limit muss eine Ganzzahl sein"}, status=400)
+    add_log(f"🔁 Dead-Letter-Replay gestartet ({min(limit, dead_letter_queue.size)} Einträge)...")
+    try:
+        result = await dead_letter_queue.replay(
+            lambda coins: send_to_n8n(http_session, coins, max_retries=1), limit=limit, batch_size=BATCH_SIZE
+        )
+    except Exception as e:
+        add_log(f"❌ Dead-Letter-Replay fehlgeschlagen: {e}")
+        return web.json_response({"error": f"Dead-Letter-Store nicht erreichbar: {e}"}, status=503)
+    dead_letter_replayed.labels(result="success").inc(result["replayed"])
+    dead_letter_replayed.labels(result="failed").inc(result["failed"])
+    add_log(f"🔁 Dead-Letter-Replay: {result['replayed']} zugestellt, {result['failed']} weiter abgelehnt, {result['remaining']} in der Queue")
+    return web.json_response(result)
+
 async def reload_config_handler(request):
     """Lädt die Konfiguration neu (ohne Neustart)"""
     try:
         load_config()
+        if worker_pool:
+            # WORKERS selbst wirkt erst nach Neustart, der Namensfilter sofort
+            worker_pool.set_pattern(BAD_NAMES_PATTERN)
+        if priority_lanes and priority_lanes.classifier:
+            # Schwellwerte sofort; PRIORITY_LANE an/aus und Batch-Größe erst nach Neustart
+            priority_lanes.classifier = make_priority_classifier()
+        if n8n_breaker:
+            # Schwellwerte sofort, Zustand und Zähler bleiben erhalten
+            n8n_breaker.failure_threshold = N8N_CIRCUIT_FAILURES
+            n8n_breaker.base_open_seconds = N8N_CIRCUIT_OPEN_SECONDS
+            n8n_breaker.max_open_seconds = N8N_CIRCUIT_MAX_OPEN_SECONDS
+            n8n_limiter.max_limit = max(n8n_limiter.min_limit, N8N_MAX_CONCURRENCY)
+            n8n_limiter.limit = min(n8n_limiter.limit, n8n_limiter.max_limit)
+            n8n_limiter.latency_target = N8N_LATENCY_TARGET_MS / 1000
+        if health_monitor:
+            health_monitor.max_lag = HEALTH_MAX_LOOP_LAG_MS / 1000
+            health_monitor.ingest.grace = READY_INGEST_GRACE
+            health_monitor.sink_grace = READY_SINK_GRACE
+            for sink in health_monitor.sinks.values():
+                sink.grace = READY_SINK_GRACE
         add_log("🔄 Konfiguration wurde neu geladen!")
         return web.json_response({
             "status": "success",
@@ -221,81 +864,169 @@ async def start_health_server():
     app = web.Application()
     app.add_routes([
         web.get("/health", health_check),
+        web.get("/livez", livez_handler),
+        web.get("/readyz", readyz_handler),
         web.get("/metrics", metrics_handler),
+        web.get("/stats", stats_handler),
+        web.get("/stats/series", stats_series_handler),
+        web.get("/feed", feed_handler),
         web.get("/logs", logs_handler),
+        web.get("/logs/stream", logs_stream_handler),
+        web.get("/dlq", dead_letter_handler),
+        web.post("/dlq/replay", dead_letter_replay_handler),
         web.post("/reload-config", reload_config_handler)
     ])
-    runner = web.AppRunner(app)
+    # Kurzer shutdown_timeout: offene SSE-Verbindungen (/feed, /logs/stream) halten den Shutdown nicht auf
+    runner = web.AppRunner(app, shutdown_timeout=1)
     await runner.setup()
     site = web.TCPSite(runner, "0.0.0.0", HEALTH_PORT)
     add_log(f"🏥 Health-Check Server läuft auf Port {HEALTH_PORT}")
     add_log(f"📊 Prometheus Metrics auf http://localhost:{HEALTH_PORT}/metrics")
-    add_log(f"📋 Logs API auf http://localhost:{HEALTH_PORT}/logs")
+    add_log(f"📈 Stats API auf http://localhost:{HEALTH_PORT}/stats")
+    add_log(f"🪙 Live-Feed (SSE) auf http://localhost:{HEALTH_PORT}/feed")
+    add_log(f"📋 Logs API auf http://localhost:{HEALTH_PORT}/logs (?since=<seq>, SSE: /logs/stream)")
     await site.start()
+    return runner
+
+def n8n_payload(batch):
+    """Hülle eines Webhook-Requests (auch für jeden Teil eines aufgeteilten GET-Batches)"""
+    return {
+        "source": "pump_fun_relay",
+        "count": len(batch),
+        "timestamp": datetime.utcnow().isoformat(),
+        "data": batch
+    }
 
-async def send_to_n8n(session, batch):
-    """Sendet Batch an n8n mit Retry-Logik"""
+async def send_to_n8n(session, batch, max_retries=3, isolating=False):
+    """Sendet Batch an n8n mit Retry-Logik → None bei Erfolg, sonst Fehlertyp (z.B. "status_422")
+
+    Im GET-Modus wird der Batch auf mehrere Requests verteilt, wenn die URL sonst
+    länger als N8N_MAX_URL_LENGTH wäre. Zugestellte Teile werden aus `batch`
+    entfernt - ein erneuter Versuch des Aufrufers sendet nur den Rest.
+    isolating=True (Bisektion der DLQ): Payload-Fehler wie 500 zählen nicht für
+    den Circuit-Breaker - sie liegen dann vermutlich an einem Coin, nicht am Sink.
+    """
     if not N8N_WEBHOOK_URL:
         add_log("❌ FEHLER: N8N_WEBHOOK_URL ist nicht gesetzt! Kann Coins nicht senden.")
-        return False
+        return "no_url"
     
-    max_retries = 3
+    if N8N_WEBHOOK_METHOD == "GET":
+        # n8n Webhooks können GET mit Body nicht, daher als Query-Parameter (URL-safe encoding)
+        requests = webhook_encoder.split_get(N8N_WEBHOOK_URL, n8n_payload, batch)
+        if len(requests) > 1:
+            add_log(f"✂️ GET-Batch aufgeteilt: {len(batch)} Coins in {len(requests)} Requests (max. {N8N_MAX_URL_LENGTH} Zeichen URL)")
+    else:
+        requests = [(None, batch)]
+    
+    for url, chunk in requests:
+        error = await send_chunk_to_n8n(session, url, chunk, max_retries, isolating)
+        if error:
+            return error
+        del batch[:len(chunk)]
+    return None
+
+def n8n_request_ok():
+    """n8n hat geantwortet (auch mit Payload-Fehler) - Breaker schließt ggf. wieder"""
+    if n8n_breaker.record_success():
+        add_log("🟢 n8n antwortet wieder - Circuit-Breaker geschlossen, Parallelität steigt langsam")
+
+def n8n_request_failed(error, retry_after=None):
+    """Sink-Fehler (Timeout, Verbindung, 404, 408, 429, 5xx) - öffnet ggf. den Breaker"""
+    if n8n_breaker.record_failure(retry_after):
+        n8n_limiter.reset()
+        relay_status["n8n_available"] = False
+        relay_status["last_error"] = "n8n_circuit_open"
+        n8n_available.set(0)
+        wait = max(n8n_breaker.open_seconds, retry_after or 0)
+        add_log(f"🔴 Circuit-Breaker offen ({error}) - keine n8n-Requests für {wait}s, Coins bleiben im Buffer")
+
+def parse_retry_after(value):
+    """Retry-After in Sekunden (nur die Sekunden-Form, max. 5 Minuten)"""
+    if value and value.strip().isdigit():
+        return min(int(value.strip()), 300)
+    return None
+
+async def send_chunk_to_n8n(session, url, chunk, max_retries=3, isolating=False):
+    """Ein Webhook-Request (GET: fertige URL, POST: url=None) mit Retry-Logik → None oder Fehlertyp
+
+    Ist der Circuit-Breaker offen, kommt sofort "circuit_open" zurück (kein Request).
+    """
     retry_count = 0
+    error = None
+    body = None
     
     while retry_count < max_retries:
+        if not n8n_breaker.allow():
+            return "circuit_open"
+        started = time.perf_counter()
         try:
             with batch_send_duration.time():
-                payload = {
-                    "source": "pump_fun_relay",
-                    "count": len(batch),
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "data": batch
-                }
-                
-                # Unterstützung für GET und POST
-                if N8N_WEBHOOK_METHOD == "GET":
-                    # Für GET: Daten als JSON im Query-Parameter
-                    # n8n Webhooks können GET mit Body nicht, daher als Query-Parameter
-                    import urllib.parse
-                    json_data = json.dumps(payload)
-                    # URL-safe encoding
-                    encoded_data = urllib.parse.quote(json_data)
-                    url_with_params = f"{N8N_WEBHOOK_URL}?data={encoded_data}"
-                    
-                    async with session.get(
-                        url_with_params,
-                        timeout=aiohttp.ClientTimeout(total=15)
-                    ) as resp:
-                        status = resp.status
-                else:
-                    # POST (Standard)
-                    async with session.post(
-                        N8N_WEBHOOK_URL,
-                        json=payload,
-                        timeout=aiohttp.ClientTimeout(total=15)
-                    ) as resp:
-                        status = resp.status
+                async with n8n_limiter:
+                    started = time.perf_counter()
+                    if url:
+                        async with session.get(
+                            url,
+                            timeout=aiohttp.ClientTimeout(total=15)
+                        ) as resp:
+                            status = resp.status
+                            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                    else:
+                        # POST (Standard) - Body einmal kodieren, Retries senden dieselben Bytes
+                        if body is None:
+                            body, headers = webhook_encoder.encode_body(n8n_payload(chunk))
+                        async with session.post(
+                            N8N_WEBHOOK_URL,
+                            data=body,
+                            headers=headers,
+                            timeout=aiohttp.ClientTimeout(total=15)
+                        ) as resp:
+                            status = resp.status
+                            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                    overloaded = status in (408, 429) or status >= 500
+                    n8n_limiter.record(time.perf_counter() - started, overloaded)
                 
                 # Status-Verarbeitung (gleich für GET und POST)
                 if status:
                     if status == 200:
-                        add_log(f"📦 Paket ({len(batch)} Coins) an n8n übergeben! ✅")
+                        n8n_request_ok()
+                        add_log(f"📦 Paket ({len(chunk)} Coins) an n8n übergeben! ✅")
                         relay_status["n8n_available"] = True
                         relay_status["total_batches"] += 1
                         n8n_available.set(1)
                         batches_sent.inc()
-                        coins_sent.inc(len(batch))
-                        return True
+                        coins_sent.inc(len(chunk))
+                        return None
                     elif status == 404:
                         add_log(f"❌ n8n Fehler 404: Bitte in n8n auf 'Execute Workflow' klicken!")
                         relay_status["n8n_available"] = False
                         relay_status["last_error"] = "n8n_404"
                         n8n_available.set(0)
                         n8n_errors.labels(type="404").inc()
-                        return False
+                        relay_stats.record_n8n_error("404")
+                        n8n_request_failed("404")
+                        return "404"
+                    elif status == 415 and not url and webhook_encoder.downgrade():
+                        # Empfänger versteht Format/Kodierung nicht → ab jetzt einfaches JSON
+                        add_log(f"⚠️ n8n Status 415: {N8N_BODY_FORMAT}/{N8N_CONTENT_ENCODING} nicht unterstützt - sende ab jetzt json ohne Kompression")
+                        n8n_errors.labels(type="status_415").inc()
+                        relay_stats.record_n8n_error("status_415")
+                        n8n_request_ok()
+                        body = None
+                        # Zählt als Versuch - sonst hinge die Terminierung allein an downgrade()
+                        error = "status_415"
+                        retry_count += 1
+                        continue
                     else:
                         add_log(f"⚠️ n8n Status: {status} (Retry {retry_count + 1}/{max_retries})")
-                        n8n_errors.labels(type=f"status_{status}").inc()
+                        error = f"status_{status}"
+                        n8n_errors.labels(type=error).inc()
+                        relay_stats.record_n8n_error(error)
+                        if isolating and is_payload_error(error) and n8n_breaker.state == CLOSED:
+                            pass  # Bisektion: weder zählen noch zurücksetzen (ein Poison-Coin öffnet den Breaker nicht)
+                        elif overloaded:
+                            n8n_request_failed(error, retry_after)
+                        else:
+                            n8n_request_ok()  # n8n läuft, lehnt aber den Inhalt ab
                         retry_count += 1
         except asyncio.TimeoutError:
             add_log(f"⚠️ n8n Timeout (Retry {retry_count + 1}/{max_retries})")
@@ -303,6 +1034,10 @@ async def send_to_n8n(session, batch):
             relay_status["last_error"] = "n8n_timeout"
             n8n_available.set(0)
             n8n_errors.labels(type="timeout").inc()
+            relay_stats.record_n8n_error("timeout")
+            error = "timeout"
+            n8n_limiter.record(time.perf_counter() - started, overloaded=True)
+            n8n_request_failed(error)
             retry_count += 1
         except aiohttp.ClientError as e:
             add_log(f"⚠️ n8n Connection Error: {e} (Retry {retry_count + 1}/{max_retries})")
@@ -310,6 +1045,10 @@ async def send_to_n8n(session, batch):
             relay_status["last_error"] = f"n8n_connection: {str(e)[:50]}"
             n8n_available.set(0)
             n8n_errors.labels(type="connection").inc()
+            relay_stats.record_n8n_error("connection")
+            error = "connection"
+            n8n_limiter.record(time.perf_counter() - started, overloaded=True)
+            n8n_request_failed(error)
             retry_count += 1
         except Exception as e:
             add_log(f"⚠️ n8n Unerwarteter Fehler: {e}")
@@ -317,8 +1056,13 @@ async def send_to_n8n(session, batch):
             relay_status["last_error"] = f"n8n_unknown: {str(e)[:50]}"
             n8n_available.set(0)
             n8n_errors.labels(type="unknown").inc()
-            return False
+            relay_stats.record_n8n_error("unknown")
+            n8n_request_failed("unknown")
+            return "unknown"
         
+        if n8n_breaker.state == OPEN:
+            # Keine weiteren Versuche - der Breaker lehnt bis zur nächsten Probe ohnehin ab
+            return error
         if retry_count < max_retries:
             await asyncio.sleep(N8N_RETRY_DELAY * retry_count)
     
@@ -326,24 +1070,521 @@ async def send_to_n8n(session, batch):
     relay_status["last_error"] = "n8n_max_retries"
     n8n_available.set(0)
     add_log(f"❌ n8n nicht erreichbar nach {max_retries} Versuchen")
-    return False
+    return error
+
+async def flush_buffer(session, buffer, lane="bulk"):
+    """Reichert einen Batch an (RugCheck) und sendet ihn an n8n
+
+    Mit Replika-Koordination sendet nur der Leader, und nur Coins, deren Mint
+    noch keine Replika geliefert hat (Follower halten den Batch im Standby).
+    Die schnelle Lane wartet kürzer auf RugCheck (PRIORITY_ENRICH_TIMEOUT).
+    Mit DEAD_LETTER werden Batches, die an einzelnen Coins scheitern, geteilt.
+    `buffer` (Liste des Aufrufers) enthält danach nur noch die offenen Coins.
+    """
+    if replica_coordinator and not replica_coordinator.is_leader:
+        replica_coordinator.keep_standby(buffer)
+        return True
+    if not n8n_breaker.ready():
+        return False  # Circuit-Breaker offen - Coins bleiben liegen, kein RugCheck/Claim umsonst
+    if replica_coordinator:
+        claimed = await replica_coordinator.claim(buffer)
+        if len(claimed) < len(buffer):
+            replica_duplicates.inc(len(buffer) - len(claimed))
+            add_log(f"👥 {len(buffer) - len(claimed)} Coins schon geliefert bzw. im Standby - sende {len(claimed)}")
+        # Im Listen-Objekt des Aufrufers: übersprungene Coins gelten als erledigt
+        buffer[:] = claimed
+        if not claimed:
+            return True
+    started = time.perf_counter()
+    coins = list(buffer)  # send_to_n8n entfernt zugestellte Teile aus dem Buffer
+    if rugcheck_client:
+        timeout = min(PRIORITY_ENRICH_TIMEOUT, RUGCHECK_ENRICH_TIMEOUT) if lane == "fast" else RUGCHECK_ENRICH_TIMEOUT
+        enriched = await rugcheck_client.enrich_batch(buffer, timeout=timeout)
+        add_log(f"🔎 RugCheck: {enriched}/{len(buffer)} Coins angereichert")
+    error = await send_to_n8n(session, buffer)
+    dead = []
+    if error and dead_letter_queue and is_payload_error(error):
+        # Abgelehnte Coins isolieren (Batch halbieren), der Rest wird zugestellt
+        pending, dead = await dead_letter_queue.isolate(
+            buffer, lambda part: send_to_n8n(session, part, max_retries=1, isolating=True), error
+        )
+        buffer[:] = pending
+        if dead:
+            dead_letter_added.inc(len(dead))
+            symbols = ", ".join(coin.get("symbol", "???") for coin in dead)
+            add_log(f"☠️ {len(dead)} Coins in die Dead-Letter-Queue ({error}): {symbols}")
+        if not pending:
+            error = None
+    elif not error and dead_letter_queue:
+        dead_letter_queue.record_success(coins)
+    success = error is None
+    undelivered = {id(coin) for coin in buffer} | {id(coin) for coin in dead}
+    delivered = [coin for coin in coins if id(coin) not in undelivered]
+    relay_stats.record_batch(len(delivered) if success else len(coins), time.perf_counter() - started, success)
+    if delivered and priority_lanes:
+        for seconds in priority_lanes.delivered(lane, delivered):
+            coin_delivery_latency.labels(lane=lane).observe(seconds)
+    if not success and replica_coordinator:
+        # Claims zurückgeben - der nächste Flush (auch einer anderen Replika) beansprucht neu
+        await replica_coordinator.release(buffer)
+    return success
+
+def can_dispatch(buffer, last_flush):
+    """Bulk-Batch fällig (voll oder BATCH_TIMEOUT) und erlaubt (Breaker bereit, AIMD-Limit frei)?"""
+    if not buffer or not (len(buffer) >= BATCH_SIZE or time.time() - last_flush > BATCH_TIMEOUT):
+        return False
+    return n8n_breaker.ready() and len(bulk_flushes) < max(1, int(n8n_limiter.limit))
+
+def dispatch_flush(session, buffer):
+    """Bis zu BATCH_SIZE Coins aus dem Buffer im Hintergrund senden
+
+    Der Ingest-Loop wartet nicht auf n8n - ein langsamer oder ausgefallener
+    Webhook hält das Lesen der Frames nicht auf. Nicht zugestellte Coins kommen
+    zurück an den Anfang von `buffer` (gleiches Listen-Objekt).
+    """
+    batch = buffer[:BATCH_SIZE]
+    del buffer[:len(batch)]
+    set_buffer_size(len(buffer))
+    add_log(f"🚚 Sende {len(batch)} Coins an n8n...")
+    task = asyncio.create_task(flush_in_background(session, batch, buffer))
+    bulk_flushes.add(task)
+    task.add_done_callback(bulk_flushes.discard)
+
+async def flush_in_background(session, batch, buffer):
+    offered = list(batch)
+    try:
+        success = await flush_buffer(session, batch)
+    except asyncio.CancelledError:
+        # Shutdown-Frist abgelaufen - Rest zurück, damit er gespoolt wird
+        buffer[:0] = batch
+        raise
+    except Exception as e:
+        add_log(f"❌ Fehler beim Senden: {e}")
+        success = False
+    if coin_spool and coin_spool.pending:
+        await release_spool(offered, [] if success else batch)
+    if not success and batch:
+        if dead_letter_queue and dead_letter_queue.all_suspect(batch):
+            # Nur verdächtige Coins (Payload-Fehler) - hinten anstellen, sonst wäre jeder
+            # Probe-Batch des Breakers wieder derselbe scheiternde Batch
+            buffer.extend(batch)
+        else:
+            buffer[:0] = batch
+        set_buffer_size(len(buffer))
+
+async def release_spool(offered, remaining):
+    """Aus dem Spool übernommene Coins erledigt (zugestellt, DLQ, Standby)? Dann die Spool-Datei löschen"""
+    left = {id(coin) for coin in remaining}
+    if coin_spool.delivered(coin for coin in offered if id(coin) not in left):
+        try:
+            await asyncio.to_thread(coin_spool.finish)
+            add_log("📥 Coins aus dem Shutdown-Spool zugestellt - Spool-Datei gelöscht")
+        except OSError as e:
+            add_log(f"⚠️ Shutdown-Spool nicht gelöscht ({coin_spool.inflight_path}): {e}")
+
+def handle_frame(status, data, reason, buffer):
+    """Ergebnis von process_frame() im Ingest-Prozess: Zähler, Spam-Burst-Filter, Buffer, Feed"""
+    if status == "error":
+        add_log(f"⚠️ JSON Fehler: {reason}")
+        return
+    if status == "lost":
+        worker_lost_frames.inc()
+        return
+    coins_received.inc()
+    relay_stats.record_received()
+    
+    if status == "ignored":
+        return
+    
+    if status == "filtered":
+        coins_filtered.labels(reason=reason).inc()
+        relay_stats.record_filtered(reason)
+        coin_feed.publish(data, "filtered", reason)
+        return
+    
+    name = data.get("name", "").strip()
+    symbol = data.get("symbol", "???").strip()
+    
+    is_spam_burst = False
+    # Coins der schnellen Lane sind meist schon gesendet - gleiches Zeitfenster wie ein Bulk-Batch
+    recent_fast = priority_lanes.recent_fast() if priority_lanes and priority_lanes.classifier else ()
+    # Ohne Kopie - der Buffer wächst während eines n8n-Ausfalls, das hier läuft für jeden Frame
+    for buffered_coin in itertools.chain(buffer, recent_fast):
+        if (buffered_coin.get("name", "").strip() == name or 
+            buffered_coin.get("symbol", "").strip() == symbol):
+            is_spam_burst = True
+            break
+    
+    if is_spam_burst:
+        print(f"♻️ Spam-Burst: {symbol}", flush=True)
+        coins_filtered.labels(reason="spam_burst").inc()
+        relay_stats.record_filtered("spam_burst")
+        coin_feed.publish(data, "filtered", "spam_burst")
+        return
+    
+    if exchange_rate_cache:
+        # sol_price_usd, market_cap_usd, price_usd (nur mit aktuellem Kurs)
+        exchange_rate_cache.stamp(data)
+    
+    lane = priority_lanes.route(data) if priority_lanes else "bulk"
+    if lane == "bulk":
+        buffer.append(data)
+    lane_coins.labels(lane=lane).inc()
+    relay_stats.record_accepted()
+    coin_feed.publish(data, "accepted")
+    # Follower liefern nicht (siehe replicas.py) - weder RugCheck-Abrufe noch Stream-Einträge
+    delivers = not replica_coordinator or replica_coordinator.is_leader
+    if rugcheck_client and delivers:
+        # Abruf startet sofort, Ergebnis wird beim Flush eingesammelt
+        rugcheck_client.prefetch(data["mint"])
+    if stream_sink and delivers:
+        # Sofort in den Stream (gebündelt im Hintergrund), unabhängig vom n8n-Batch
+        stream_sink.add(data)
+    relay_status["last_coin_time"] = time.time()
+    relay_status["total_coins"] += 1
+    last_coin_timestamp.set(time.time())
+    set_buffer_size(len(buffer))
+    add_log(f"⚡ {symbol} (schnelle Lane)" if lane == "fast" else f"➕ {symbol}")
+
+async def relay_worker_results(session, buffer):
+    """Mehrprozess-Modus: Worker-Ergebnisse in Empfangsreihenfolge verarbeiten und Batches senden
+
+    Endet beim Shutdown, sobald alle schon eingereichten Frames verarbeitet sind.
+    """
+    last_flush = time.time()
+    while not (shutdown_requested.is_set() and not worker_pool.inflight and not worker_pool.ready):
+        # [None] = nichts angekommen, nur den Batch-Timeout prüfen
+        results = await worker_pool.results(timeout=1.0) or [None]
+        for result in results:
+            if result:
+                handle_frame(*result, buffer)
+            
+            while can_dispatch(buffer, last_flush):
+                dispatch_flush(session, buffer)
+                last_flush = time.time()
+
+async def on_replica_change(session, change):
+    """Leader-Wechsel: Metrik, Log und Standby-Puffer nachliefern"""
+    if change == "lost":
+        replica_leader.set(0)
+        add_log(f"👑 {REPLICA_ID} ist nicht mehr Leader - halte Batches im Standby")
+        return
+    replica_leader.set(1)
+    add_log(f"👑 {REPLICA_ID} ist jetzt Leader - liefere an n8n")
+    standby = replica_coordinator.take_standby()
+    if standby:
+        add_log(f"📦 Liefere {len(standby)} Coins aus dem Standby-Puffer nach (schon gelieferte werden übersprungen)")
+        # Im Hintergrund - ein langsames n8n darf die Wahl-Loop (Lock-Erneuerung) nicht aufhalten
+        task = asyncio.create_task(flush_standby(session, standby))
+        bulk_flushes.add(task)
+        task.add_done_callback(bulk_flushes.discard)
+
+async def flush_standby(session, coins):
+    """Neuer Leader: Standby-Coins in BATCH_SIZE-Batches senden, Rest bei Fehler zurück in den Standby"""
+    while coins:
+        batch = coins[:BATCH_SIZE]
+        del coins[:len(batch)]
+        try:
+            success = await flush_buffer(session, batch)
+        except asyncio.CancelledError:
+            replica_coordinator.keep_standby(batch + coins)
+            raise
+        except Exception as e:
+            add_log(f"❌ Fehler beim Senden des Standby-Puffers: {e}")
+            success = False
+        if not success:
+            replica_coordinator.keep_standby(batch + coins)
+            return
+
+def make_priority_classifier():
+    return PriorityClassifier(
+        min_social_count=PRIORITY_MIN_SOCIALS,
+        min_sol_amount=PRIORITY_MIN_SOL_AMOUNT,
+        min_market_cap_sol=PRIORITY_MIN_MARKET_CAP_SOL
+    )
+
+async def flush_fast_lane(session, batch):
+    """Batch der schnellen Lane senden (aus PriorityLanes.run)"""
+    if not n8n_breaker.ready():
+        return False  # Circuit-Breaker offen - Lane versucht es nach retry_delay erneut
+    add_log(f"⚡ Sende {len(batch)} Coins (schnelle Lane) an n8n...")
+    return await flush_buffer(session, batch, lane="fast")
+
+def request_shutdown(signame):
+    """Signal-Handler (SIGTERM/SIGINT): keine neuen Frames, Buffer leeren, dann beenden"""
+    global shutdown_started
+    if shutdown_requested.is_set():
+        add_log(f"⏳ {signame}: Shutdown läuft bereits (max. {SHUTDOWN_TIMEOUT}s)")
+        return
+    shutdown_started = time.monotonic()
+    add_log(f"🛑 {signame} empfangen - nehme keine Frames mehr an, leere Buffer (max. {SHUTDOWN_TIMEOUT}s)")
+    shutdown_requested.set()
+    if health_monitor:
+        health_monitor.refresh()  # /readyz sofort 503
+
+async def wait_until(awaitable, deadline):
+    """Bis zur Shutdown-Frist warten → False, wenn sie vorher abläuft (awaitable wird dann abgebrochen)"""
+    try:
+        await asyncio.wait_for(awaitable, timeout=max(0.0, deadline - time.monotonic()))
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+async def cancel_tasks(*tasks):
+    """Hintergrund-Tasks abbrechen und auf ihr Ende warten (Shutdown)"""
+    tasks = [task for task in tasks if task]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+async def drain_on_shutdown(session, buffers, fast_lane_task, worker_results_task, stream_task, background_tasks):
+    """WebSocket ist zu: Buffer und Queues bis SHUTDOWN_TIMEOUT (ab Signal) zustellen, Rest spoolen
+
+    Reihenfolge: Worker-Ergebnisse, schnelle Lane und laufende Bulk-Batches
+    abschließen (nicht Zugestelltes kommt zurück in die Buffer), dann die Buffer
+    in BATCH_SIZE-Batches senden. Scheitert ein Batch oder läuft die Frist ab,
+    gehen alle übrigen Coins in den Spool (SHUTDOWN_SPOOL_PATH). Zum Schluss
+    werden `background_tasks` (Wechselkurs, Leader-Wahl) beendet und alle
+    Verbindungen geschlossen.
+    """
+    deadline = (shutdown_started or time.monotonic()) + SHUTDOWN_TIMEOUT
+    worker_lost = 0
+    if worker_results_task:
+        # Frames, die schon bei den Workern sind, noch in den Buffer übernehmen
+        if not await wait_until(worker_results_task, deadline):
+            worker_lost = worker_pool.inflight
+        await worker_pool.stop(timeout=min(5, max(1, deadline - time.monotonic())))
+    if fast_lane_task:
+        priority_lanes.close()
+        await wait_until(fast_lane_task, deadline)
+    if bulk_flushes:
+        await wait_until(asyncio.gather(*bulk_flushes, return_exceptions=True), deadline)
+    
+    pending = [coin for buffer in buffers for coin in buffer]
+    if priority_lanes:
+        pending = priority_lanes.fast + pending
+        priority_lanes.fast = []
+    for buffer in buffers:
+        buffer.clear()
+    set_buffer_size(0)
+    flushed = 0
+    standby = 0
+    if pending and replica_coordinator and not replica_coordinator.is_leader:
+        # Follower liefern nicht - der Leader hat dieselben Coins
+        standby = len(pending)
+        pending = []
+    if pending and n8n_breaker.ready() and time.monotonic() < deadline:
+        add_log(f"📤 Shutdown: sende {len(pending)} Coins an n8n...")
+    while pending and n8n_breaker.ready() and time.monotonic() < deadline:
+        batch = pending[:BATCH_SIZE]
+        size = len(batch)
+        try:
+            success = await asyncio.wait_for(flush_buffer(session, batch), timeout=deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            success = False
+        if success:
+            flushed += size
+            del pending[:size]
+        else:
+            # batch enthält nur noch den nicht zugestellten Rest
+            flushed += size - len(batch)
+            pending[:size] = batch
+            break
+    
+    stream_left = 0
+    if stream_sink:
+        await cancel_tasks(stream_task)
+        while stream_sink.queue and time.monotonic() < deadline:
+            try:
+                await asyncio.wait_for(stream_sink.flush(), timeout=deadline - time.monotonic())
+            except Exception:
+                break
+        stream_left = len(stream_sink.queue)
+        await stream_sink.close()
+    
+    spooled = 0
+    if pending and coin_spool:
+        try:
+            spooled = await asyncio.to_thread(coin_spool.save, pending)
+        except OSError as e:
+            add_log(f"❌ Shutdown-Spool nicht geschrieben ({SHUTDOWN_SPOOL_PATH}): {e}")
+    if coin_spool and coin_spool.pending and spooled == len(pending):
+        # Noch offene übernommene Coins sind jetzt neu gespoolt (oder zugestellt)
+        try:
+            await asyncio.to_thread(coin_spool.finish)
+        except OSError as e:
+            add_log(f"⚠️ Shutdown-Spool nicht gelöscht ({coin_spool.inflight_path}): {e}")
+    # Wahl-Loop zuerst beenden - sonst wählt er sich nach dem Rücktritt neu
+    await cancel_tasks(*background_tasks)
+    if replica_coordinator:
+        await replica_coordinator.close()
+    if exchange_rate_cache:
+        await exchange_rate_cache.close()
+    if dead_letter_queue:
+        await dead_letter_queue.close()
+    
+    elapsed = time.monotonic() - (shutdown_started or deadline - SHUTDOWN_TIMEOUT)
+    report = f"🛑 Shutdown nach {elapsed:.1f}s: {flushed} Coins zugestellt, {spooled} gespoolt"
+    if len(pending) > spooled:
+        report += f", {len(pending) - spooled} verloren"
+    if worker_lost:
+        report += f", {worker_lost} Frames bei den Workern verworfen"
+    if standby:
+        report += f", {standby} im Standby (liefert der Leader)"
+    if stream_left:
+        report += f", {stream_left} nicht in den Stream geschrieben"
+    add_log(report)
+
+def on_worker_batch(index, frames, busy):
+    worker_frames.labels(worker=str(index)).inc(frames)
+    worker_busy_seconds.labels(worker=str(index)).inc(busy)
+
+def on_worker_restart(index, lost):
+    worker_restarts.inc()
+    add_log(f"⚠️ Worker {index} beendet - neu gestartet ({lost} Frames verloren)")
 
 async def listen_and_relay():
     """Hauptfunktion mit verbesserter Verbindungsstabilität"""
+    global rugcheck_client, exchange_rate_cache, worker_pool, replica_coordinator, stream_sink, priority_lanes
+    global dead_letter_queue, http_session, n8n_breaker, n8n_limiter, coin_spool
     add_log("🚀 Starte Relay (Mit Spam-Burst-Filter & Prometheus Metrics)...")
     buffer = []
+    worker_buffer = []
+    fast_lane_task = worker_results_task = stream_task = None
+    exchange_rate_task = replica_task = None
     last_flush = time.time()
     reconnect_count = 0
     
+    n8n_breaker = CircuitBreaker(
+        failure_threshold=N8N_CIRCUIT_FAILURES,
+        open_seconds=N8N_CIRCUIT_OPEN_SECONDS,
+        max_open_seconds=N8N_CIRCUIT_MAX_OPEN_SECONDS
+    )
+    n8n_limiter = AimdLimiter(max_limit=N8N_MAX_CONCURRENCY, latency_target=N8N_LATENCY_TARGET_MS / 1000)
+    
     async with aiohttp.ClientSession() as session:
-        while True:
+        http_session = session
+        if RUGCHECK_ENABLED:
+            rugcheck_client = RugCheckClient(
+                HttpBackend(session, RUGCHECK_API_URL),
+                rate_per_sec=RUGCHECK_RATE_LIMIT,
+                cache_ttl=RUGCHECK_CACHE_TTL,
+                max_retries=RUGCHECK_MAX_RETRIES,
+                retry_delay=RUGCHECK_RETRY_DELAY
+            )
+            rate = f"{RUGCHECK_RATE_LIMIT} Req/s" if RUGCHECK_RATE_LIMIT > 0 else "ohne Rate-Limit"
+            add_log(f"🔎 RugCheck Enrichment aktiv ({rate}, Cache {RUGCHECK_CACHE_TTL}s)")
+        
+        if EXCHANGE_RATE_ENABLED:
+            try:
+                exchange_rate_cache = ExchangeRateCache(
+                    PostgresRateSource(DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD),
+                    refresh_interval=EXCHANGE_RATE_REFRESH,
+                    max_age=EXCHANGE_RATE_MAX_AGE
+                )
+                if await exchange_rate_cache.refresh():
+                    add_log(f"💱 Wechselkurs geladen: 1 SOL = {exchange_rate_cache.sol_usd:.2f} USD")
+                else:
+                    add_log(f"⚠️ Kein Wechselkurs in coin_metrics ({exchange_rate_cache.last_error or 'keine Daten'})")
+                exchange_rate_task = asyncio.create_task(exchange_rate_cache.run())
+            except RuntimeError as e:
+                add_log(f"❌ USD-Enrichment deaktiviert: {e}")
+        
+        if REPLICA_COORDINATION == "postgres":
+            try:
+                replica_coordinator = ReplicaCoordinator(
+                    PostgresCoordinationStore(
+                        DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD,
+                        session_timeout=max(10, REPLICA_ELECTION_INTERVAL * 5)
+                    ),
+                    REPLICA_ID,
+                    election_interval=REPLICA_ELECTION_INTERVAL,
+                    standby_seconds=REPLICA_STANDBY_SECONDS,
+                    dedupe_ttl=REPLICA_DEDUPE_HOURS * 3600
+                )
+                replica_task = asyncio.create_task(replica_coordinator.run(lambda change: on_replica_change(session, change)))
+                add_log(f"👥 Replika-Koordination aktiv: {REPLICA_ID} (Leader-Wahl alle {REPLICA_ELECTION_INTERVAL}s)")
+            except RuntimeError as e:
+                add_log(f"❌ Replika-Koordination deaktiviert: {e}")
+        
+        if STREAM_SINK == "redis":
+            try:
+                stream_sink = streams.RedisStreamSink(
+                    streams.connect(STREAM_REDIS_URL),
+                    STREAM_NAME,
+                    maxlen=STREAM_MAXLEN,
+                    batch_size=STREAM_BATCH_SIZE,
+                    flush_interval=STREAM_FLUSH_MS / 1000
+                )
+                groups = [group.strip() for group in STREAM_GROUPS.split(",") if group.strip()]
+                if groups:
+                    try:
+                        created = await stream_sink.ensure_groups(groups)
+                        if created:
+                            add_log(f"🌊 Consumer-Groups angelegt: {', '.join(created)}")
+                    except Exception as e:
+                        add_log(f"⚠️ Consumer-Groups nicht angelegt ({e}) - Stream-Sink schreibt trotzdem")
+                stream_task = asyncio.create_task(stream_sink.run())
+                add_log(f"🌊 Stream-Sink aktiv: {STREAM_NAME} (MAXLEN ~{STREAM_MAXLEN}, bis {STREAM_BATCH_SIZE} XADD pro Pipeline)")
+            except RuntimeError as e:
+                add_log(f"❌ Stream-Sink deaktiviert: {e}")
+        
+        if DEAD_LETTER in ("file", "postgres"):
+            try:
+                if DEAD_LETTER == "postgres":
+                    store = PostgresDeadLetterStore(DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD)
+                else:
+                    store = await asyncio.to_thread(FileDeadLetterStore, DEAD_LETTER_PATH, DEAD_LETTER_MAX)
+                dead_letter_queue = DeadLetterQueue(store)
+                size = await dead_letter_queue.load()
+                add_log(f"☠️ Dead-Letter-Queue aktiv ({DEAD_LETTER}, {size} Einträge) - Replay: POST /dlq/replay")
+            except Exception as e:
+                dead_letter_queue = None
+                add_log(f"❌ Dead-Letter-Queue deaktiviert: {e}")
+        
+        priority_lanes = PriorityLanes(
+            make_priority_classifier() if PRIORITY_LANE else None,
+            batch_size=PRIORITY_BATCH_SIZE,
+            max_wait=PRIORITY_MAX_WAIT_MS / 1000,
+            retry_delay=N8N_RETRY_DELAY,
+            recent_window=BATCH_TIMEOUT
+        )
+        if PRIORITY_LANE:
+            fast_lane_task = asyncio.create_task(priority_lanes.run(lambda batch: flush_fast_lane(session, batch)))
+            add_log(f"⚡ Schnelle Lane aktiv: {priority_lanes.classifier.describe()} (bis {PRIORITY_BATCH_SIZE} Coins, max. {PRIORITY_MAX_WAIT_MS}ms Wartezeit)")
+        
+        if WORKERS > 0:
+            worker_pool = WorkerPool(
+                WORKERS, BAD_NAMES_PATTERN,
+                on_batch=on_worker_batch, on_restart=on_worker_restart
+            )
+            await worker_pool.start()
+            worker_results_task = asyncio.create_task(relay_worker_results(session, worker_buffer))
+            add_log(f"🧵 Mehrprozess-Modus: {WORKERS} Worker-Prozesse für Decode/Filter")
+        
+        if SHUTDOWN_SPOOL_PATH:
+            coin_spool = CoinSpool(SHUTDOWN_SPOOL_PATH)
+            try:
+                spooled = await asyncio.to_thread(coin_spool.load)
+                if spooled:
+                    # Im Mehrprozess-Modus sendet relay_worker_results() - dort auch den Spool
+                    spool_buffer = worker_buffer if worker_pool else buffer
+                    spool_buffer[:0] = spooled
+                    set_buffer_size(len(spool_buffer))
+                    add_log(f"📥 {len(spooled)} Coins aus dem Shutdown-Spool übernommen")
+            except OSError as e:
+                add_log(f"⚠️ Shutdown-Spool nicht gelesen ({SHUTDOWN_SPOOL_PATH}): {e}")
+        
+        while not shutdown_requested.is_set():
             try:
                 add_log(f"🔌 Verbinde zu Pump.fun... (Versuch #{reconnect_count + 1})")
                 
-                import ssl
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
+                ssl_context = None  # ws:// (z.B. scripts/replay_relay.py) akzeptiert kein ssl-Argument
+                if WS_URI.startswith("wss://"):
+                    import ssl
+                    ssl_context = ssl.create_default_context()
+                    ssl_context.check_hostname = False
+                    ssl_context.verify_mode = ssl.CERT_NONE
                 
                 async with websockets.connect(
                     WS_URI,
@@ -366,69 +1607,17 @@ async def listen_and_relay():
                     
                     last_message_time = time.time()
                     
-                    while True:
+                    while not shutdown_requested.is_set():
                         try:
                             msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
                             last_message_time = time.time()
                             relay_status["last_message_time"] = last_message_time
                             
-                            data = json.loads(msg)
-                            coins_received.inc()
-                            
-                            if not data.get("mint"):
-                                continue
-                            
-                            name = data.get("name", "").strip()
-                            symbol = data.get("symbol", "???").strip()
-                            
-                            if BAD_NAMES.search(name):
-                                coins_filtered.labels(reason="bad_name").inc()
+                            if worker_pool:
+                                # Decode/Filter im Worker, Batches sendet relay_worker_results()
+                                await worker_pool.submit(msg)
                                 continue
-                            
-                            is_spam_burst = False
-                            for buffered_coin in buffer:
-                                if (buffered_coin.get("name", "").strip() == name or 
-                                    buffered_coin.get("symbol", "").strip() == symbol):
-                                    is_spam_burst = True
-                                    break
-                            
-                            if is_spam_burst:
-                                print(f"♻️ Spam-Burst: {symbol}", flush=True)
-                                coins_filtered.labels(reason="spam_burst").inc()
-                                continue
-                            
-                            # Berechne price_sol und füge pool_address hinzu
-                            v_tokens = data.get("vTokensInBondingCurve", 0)
-                            market_cap = data.get("marketCapSol", 0)
-                            
-                            # price_sol = marketCapSol / vTokensInBondingCurve (wenn vTokens > 0)
-                            if v_tokens and v_tokens > 0:
-                                price_sol = market_cap / v_tokens
-                            else:
-                                price_sol = 0
-                            
-                            # Berechne social_count (0-4): Anzahl vorhandener Social-Links
-                            social_count = 0
-                            if data.get("twitter_url") or data.get("twitter"):
-                                social_count += 1
-                            if data.get("telegram_url") or data.get("telegram"):
-                                social_count += 1
-                            if data.get("website_url") or data.get("website"):
-                                social_count += 1
-                            if data.get("discord_url") or data.get("discord"):
-                                social_count += 1
-                            
-                            # Füge berechnete Felder hinzu
-                            data["price_sol"] = price_sol
-                            data["pool_address"] = data.get("bondingCurveKey", "")
-                            data["social_count"] = social_count
-                            
-                            buffer.append(data)
-                            relay_status["last_coin_time"] = time.time()
-                            relay_status["total_coins"] += 1
-                            last_coin_timestamp.set(time.time())
-                            buffer_size.set(len(buffer))
-                            add_log(f"➕ {symbol}")
+                            handle_frame(*process_frame(msg, BAD_NAMES), buffer)
                             
                         except asyncio.TimeoutError:
                             if time.time() - last_message_time > WS_CONNECTION_TIMEOUT:
@@ -442,24 +1631,13 @@ async def listen_and_relay():
                             ws_connected.set(0)
                             break
                         
-                        except json.JSONDecodeError as e:
-                            add_log(f"⚠️ JSON Fehler: {e}")
-                            continue
-                        
                         except Exception as e:
                             add_log(f"⚠️ WS Receive Error: {e}")
                             relay_status["last_error"] = f"ws_error: {str(e)[:100]}"
                             break
                         
-                        is_full = len(buffer) >= BATCH_SIZE
-                        is_timeout = (time.time() - last_flush) > BATCH_TIMEOUT
-                        
-                        if buffer and (is_full or is_timeout):
-                            add_log(f"🚚 Sende {len(buffer)} Coins an n8n...")
-                            success = await send_to_n8n(session, buffer)
-                            if success:
-                                buffer = []
-                                buffer_size.set(0)
+                        while can_dispatch(buffer, last_flush):
+                            dispatch_flush(session, buffer)
                             last_flush = time.time()
                             
             except websockets.exceptions.WebSocketException as e:
@@ -467,6 +1645,7 @@ async def listen_and_relay():
                 relay_status["last_error"] = f"ws_exception: {str(e)[:100]}"
                 ws_connected.set(0)
                 ws_reconnects.inc()
+                relay_stats.record_reconnect()
                 add_log(f"❌ WebSocket Exception: {e}")
                 reconnect_count += 1
                 relay_status["reconnect_count"] = reconnect_count
@@ -476,26 +1655,38 @@ async def listen_and_relay():
                 relay_status["last_error"] = f"unexpected: {str(e)[:100]}"
                 ws_connected.set(0)
                 ws_reconnects.inc()
+                relay_stats.record_reconnect()
                 add_log(f"❌ Unerwarteter Fehler: {e}")
                 reconnect_count += 1
                 relay_status["reconnect_count"] = reconnect_count
             
+            if shutdown_requested.is_set():
+                break
+            
             if buffer:
                 add_log(f"⚠️ Buffer nicht leer ({len(buffer)} Coins). Sende vor Reconnect...")
-                await send_to_n8n(session, buffer)
-                buffer = []
-                buffer_size.set(0)
-                last_flush = time.time()
+                last_flush = 0
+                while can_dispatch(buffer, last_flush):
+                    dispatch_flush(session, buffer)
             
             delay = min(WS_RETRY_DELAY * (1 + reconnect_count * 0.5), WS_MAX_RETRY_DELAY)
             add_log(f"⏳ Reconnect in {delay:.1f}s...")
-            await asyncio.sleep(delay)
+            try:
+                await asyncio.wait_for(shutdown_requested.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        
+        # WebSocket ist geschlossen (async with verlassen), die HTTP-Session noch offen
+        relay_status["ws_connected"] = False
+        ws_connected.set(0)
+        await drain_on_shutdown(
+            session, [buffer, worker_buffer], fast_lane_task, worker_results_task, stream_task,
+            [exchange_rate_task, replica_task]
+        )
 
 async def main():
-    """Hauptfunktion"""
-    # Lade Konfiguration beim Start
-    load_config()
-    
+    """Hauptfunktion (Konfiguration ist schon geladen, siehe __main__)"""
+    global health_monitor
     add_log("=" * 60)
     add_log("🚀 PUMP DISCOVER RELAY - Starte...")
     add_log("=" * 60)
@@ -512,13 +1703,48 @@ async def main():
         add_log(f"  - N8N_WEBHOOK_URL: NICHT GESETZT ⚠️")
         add_log(f"  ⚠️ WARNUNG: n8n Webhook URL ist leer! Coins werden nicht weitergeleitet!")
     add_log(f"  - N8N_WEBHOOK_METHOD: {N8N_WEBHOOK_METHOD}")
+    if N8N_WEBHOOK_METHOD == "GET":
+        add_log(f"  - N8N_MAX_URL_LENGTH: {N8N_MAX_URL_LENGTH} (größere Batches werden aufgeteilt)")
+    else:
+        add_log(f"  - N8N Payload: {webhook_encoder.name}")
     add_log(f"  - BAD_NAMES_PATTERN: {BAD_NAMES_PATTERN}")
+    add_log(f"  - RUGCHECK_ENABLED: {RUGCHECK_ENABLED}")
+    add_log(f"  - EXCHANGE_RATE_ENABLED: {EXCHANGE_RATE_ENABLED}")
+    add_log(f"  - EVENT_LOOP: {relay_status['event_loop']} (konfiguriert: {EVENT_LOOP})")
+    add_log(f"  - WORKERS: {WORKERS or 'aus (Einzelprozess)'}")
+    add_log(f"  - PRIORITY_LANE: {PRIORITY_LANE}")
+    add_log("  - N8N Circuit-Breaker: " + (f"nach {N8N_CIRCUIT_FAILURES} Fehlern {N8N_CIRCUIT_OPEN_SECONDS}-{N8N_CIRCUIT_MAX_OPEN_SECONDS}s offen" if N8N_CIRCUIT_FAILURES else "aus") + f", max. {N8N_MAX_CONCURRENCY} parallele Requests")
+    add_log(f"  - DEAD_LETTER: {DEAD_LETTER}" + (f" ({DEAD_LETTER_PATH})" if DEAD_LETTER == "file" else ""))
+    add_log(f"  - STREAM_SINK: {STREAM_SINK}" + (f" ({STREAM_NAME})" if STREAM_SINK != "off" else ""))
+    add_log(f"  - REPLICA_COORDINATION: {REPLICA_COORDINATION}" + (f" (REPLICA_ID: {REPLICA_ID})" if REPLICA_COORDINATION != "off" else ""))
+    add_log(f"  - SHUTDOWN_TIMEOUT: {SHUTDOWN_TIMEOUT}s" + (f" (Spool: {SHUTDOWN_SPOOL_PATH})" if SHUTDOWN_SPOOL_PATH else " (ohne Spool)"))
+    add_log(f"  - Readiness: Schonfrist Ingest {READY_INGEST_GRACE}s, Sinks {READY_SINK_GRACE}s; Liveness: Loop-Lag < {HEALTH_MAX_LOOP_LAG_MS}ms")
     add_log("=" * 60)
-    await asyncio.gather(listen_and_relay(), start_health_server())
+    health_monitor = HealthMonitor(
+        max_lag=HEALTH_MAX_LOOP_LAG_MS / 1000,
+        ingest_grace=READY_INGEST_GRACE,
+        sink_grace=READY_SINK_GRACE
+    )
+    relay_ready.set(0)
+    health_task = asyncio.create_task(health_monitor.run(probe_health, on_ready_change))
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, request_shutdown, sig.name)
+    _, runner = await asyncio.gather(listen_and_relay(), start_health_server())
+    # Health-Server bis zum Schluss (während des Leerens /readyz = 503), dann schließen
+    await cancel_tasks(health_task)
+    await runner.cleanup()
+    add_log("👋 Relay beendet")
 
 if __name__ == "__main__":
+    # Konfiguration vor dem Start der Loop laden - EVENT_LOOP bestimmt die Loop-Implementierung
+    # (Änderung wirkt erst nach Neustart, nicht über /reload-config)
+    load_config()
+    loop_factory, relay_status["event_loop"], loop_warning = eventloop.resolve_event_loop(EVENT_LOOP)
+    if loop_warning:
+        add_log(f"⚠️ {loop_warning}")
     try:
-        asyncio.run(main())
+        eventloop.run(main(), loop_factory)
     except KeyboardInterrupt:
         add_log("👋 Shutdown...")
 
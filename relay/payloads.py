@@ -0,0 +1,163 @@
+"""
+Kodierung der Webhook-Payloads (n8n) pro Sink
+
+Bisher: POST mit unkomprimiertem JSON, GET mit dem ganzen JSON URL-kodiert im
+Query-String (ab BATCH_SIZE > 10 schnell über den URL-Limits von Proxies/n8n).
+WebhookEncoder kapselt das pro Sink:
+- Body-Format: json (Standard) oder msgpack (kompakter, schneller zu kodieren;
+  der Empfänger muss es lesen können)
+- Content-Encoding: identity (Standard), gzip oder zstd - Bodies unter
+  compress_min_bytes bleiben unkomprimiert
+- GET: Batch wird auf mehrere Requests verteilt, sodass keine URL länger als
+  max_url_length ist (GET bleibt JSON ohne Kompression, wie bisher als ?data=)
+- Antwortet der Empfänger mit 415 (Format/Kodierung unbekannt), fällt der
+  Sink auf json/identity zurück (downgrade)
+
+msgpack und zstandard sind optional - nur nötig, wenn konfiguriert.
+"""
+import gzip
+import json
+import time
+import urllib.parse
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BODY_FORMATS = ("json", "msgpack")
+CONTENT_ENCODINGS = ("identity", "gzip", "zstd")
+CONTENT_TYPES = {"json": "application/json", "msgpack": "application/msgpack"}
+GET_SEPARATOR_LENGTH = len(urllib.parse.quote(", "))  # json.dumps trennt Listenelemente mit ", "
+
+
+def encode_json(payload):
+    return json.dumps(payload, default=str).encode()
+
+
+def encode_msgpack(payload):
+    return msgpack.packb(payload, use_bin_type=True, default=str)
+
+
+class WebhookEncoder:
+    """Body-Format, Content-Encoding und GET-Aufteilung eines Webhook-Sinks"""
+
+    def __init__(self, body_format="json", content_encoding="identity", max_url_length=8000,
+                 compress_min_bytes=1024, level=None):
+        body_format = (body_format or "json").lower()
+        content_encoding = (content_encoding or "identity").lower()
+        if content_encoding == "none":
+            content_encoding = "identity"
+        if body_format not in BODY_FORMATS:
+            raise ValueError(f"Unbekanntes Body-Format '{body_format}' (erlaubt: {', '.join(BODY_FORMATS)})")
+        if content_encoding not in CONTENT_ENCODINGS:
+            raise ValueError(f"Unbekanntes Content-Encoding '{content_encoding}' (erlaubt: {', '.join(CONTENT_ENCODINGS)})")
+        if body_format == "msgpack" and msgpack is None:
+            raise RuntimeError("msgpack ist nicht installiert (pip install msgpack)")
+        if content_encoding == "zstd" and zstandard is None:
+            raise RuntimeError("zstandard ist nicht installiert (pip install zstandard)")
+        self.body_format = body_format
+        self.content_encoding = content_encoding
+        self.max_url_length = max_url_length
+        self.compress_min_bytes = compress_min_bytes
+        self.level = level
+        self._zstd = None
+        self.stats = {"requests": 0, "body_bytes": 0, "wire_bytes": 0, "encode_seconds": 0.0,
+                      "split_batches": 0, "oversized_urls": 0, "downgrades": 0}
+
+    @property
+    def name(self):
+        return self.body_format if self.content_encoding == "identity" else f"{self.body_format}+{self.content_encoding}"
+
+    def compress(self, body):
+        """Body mit dem Content-Encoding komprimieren → (Bytes, Encoding oder None)"""
+        if self.content_encoding == "identity" or len(body) < self.compress_min_bytes:
+            return body, None
+        if self.content_encoding == "gzip":
+            # mtime=0: gleicher Body → gleiche Bytes
+            return gzip.compress(body, compresslevel=self.level or 6, mtime=0), "gzip"
+        if self._zstd is None:
+            self._zstd = zstandard.ZstdCompressor(level=self.level or 3)
+        return self._zstd.compress(body), "zstd"
+
+    def encode_body(self, payload):
+        """POST-Body → (Bytes, Header)"""
+        started = time.perf_counter()
+        body = encode_msgpack(payload) if self.body_format == "msgpack" else encode_json(payload)
+        wire, encoding = self.compress(body)
+        headers = {"Content-Type": CONTENT_TYPES[self.body_format]}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        self._record(len(body), len(wire), time.perf_counter() - started)
+        return wire, headers
+
+    @staticmethod
+    def get_url(base_url, payload):
+        separator = "&" if "?" in base_url else "?"
+        return f"{base_url}{separator}data={urllib.parse.quote(json.dumps(payload, default=str))}"
+
+    def split_get(self, base_url, make_payload, batch):
+        """GET: [(URL, Teil-Batch)] - aufeinanderfolgende Teile, jede URL höchstens max_url_length
+
+        make_payload(Teil-Batch) baut die Hülle (source, count, ...). Ein einzelner
+        Coin, der allein schon zu lang ist, geht trotzdem als eigener Request raus
+        (gezählt in oversized_urls).
+        """
+        started = time.perf_counter()
+        # Länge der URL ohne Coins + kodierte Länge jedes Coins (json.dumps der Liste = Coins mit ", ")
+        envelope = len(self.get_url(base_url, make_payload(batch[:0])))
+        count_digits = len(str(len(batch)))  # "count": 0 → bis zu len(batch) Stellen
+        sizes = [len(urllib.parse.quote(json.dumps(coin, default=str))) for coin in batch]
+        chunks = []
+        start = 0
+        length = envelope + count_digits - 1
+        for index, size in enumerate(sizes):
+            added = size if index == start else size + GET_SEPARATOR_LENGTH
+            if index > start and length + added > self.max_url_length:
+                chunks.append(batch[start:index])
+                start = index
+                length = envelope + count_digits - 1
+                added = size
+            length += added
+        if batch:
+            chunks.append(batch[start:])
+        urls = [(self.get_url(base_url, make_payload(chunk)), chunk) for chunk in chunks]
+        if len(urls) > 1:
+            self.stats["split_batches"] += 1
+        for url, _ in urls:
+            if len(url) > self.max_url_length:
+                self.stats["oversized_urls"] += 1
+            self._record(len(url), len(url), 0.0)
+        self.stats["encode_seconds"] += time.perf_counter() - started
+        return urls
+
+    def _record(self, body_bytes, wire_bytes, seconds):
+        self.stats["requests"] += 1
+        self.stats["body_bytes"] += body_bytes
+        self.stats["wire_bytes"] += wire_bytes
+        self.stats["encode_seconds"] += seconds
+
+    def downgrade(self):
+        """Empfänger kann Format/Kodierung nicht (415) → json/identity; False, wenn schon so"""
+        if self.body_format == "json" and self.content_encoding == "identity":
+            return False
+        self.body_format = "json"
+        self.content_encoding = "identity"
+        self.stats["downgrades"] += 1
+        return True
+
+    def snapshot(self):
+        """Status für /health"""
+        ratio = self.stats["wire_bytes"] / self.stats["body_bytes"] if self.stats["body_bytes"] else None
+        return {
+            "encoding": self.name,
+            "max_url_length": self.max_url_length,
+            "compression_ratio": round(ratio, 3) if ratio is not None else None,
+            **self.stats,
+            "encode_seconds": round(self.stats["encode_seconds"], 3),
+        }
@@ -0,0 +1,386 @@
+"""
+Mehrere Relay-Replikas mit Leader-Wahl und Dedupe über einen gemeinsamen Store
+
+Alle Replikas hängen am WebSocket und bauen ihre Batches selbst (Filter, Feed,
+Stats laufen überall), aber nur der gewählte Leader liefert an n8n:
+- Leader-Wahl über ein PostgreSQL-Advisory-Lock (session-gebunden: stirbt der
+  Leader oder reißt seine DB-Verbindung ab, gibt PostgreSQL das Lock frei und
+  die nächste Replika übernimmt innerhalb eines Wahl-Intervalls)
+- Vor jedem Versand beansprucht der Leader die Mints des Batches in
+  relay_delivered_mints (INSERT ... ON CONFLICT DO NOTHING) - gesendet werden
+  nur neu beanspruchte Mints. So liefert auch ein Leader-Wechsel mitten im
+  Batch keinen Coin doppelt; schlägt der Versand fehl, werden die Claims
+  wieder freigegeben
+- Follower legen ihre Batches in einen zeitlich begrenzten Standby-Puffer.
+  Wird ein Follower Leader, liefert er den Puffer über dieselben Claims nach
+  (Coins, die der alte Leader vor dem Ausfall noch nicht gesendet hatte)
+- Ist der Store nicht erreichbar, gibt der Leader die Führung ab statt ohne
+  Dedupe zu senden - die Coins bleiben im Standby-Puffer
+
+Stores (blockierend - im Relay über asyncio.to_thread):
+- PostgresCoordinationStore: Advisory-Lock + Tabelle (psycopg2 optional)
+- MemoryCoordinationStore: In-Prozess-Fake mit derselben Schnittstelle für
+  Simulationen (siehe scripts/simulate_replicas.py)
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+LEADER_LOCK_NAME = "pump_discover_relay_leader"
+
+
+class PostgresCoordinationStore:
+    """Leader-Lock und Mint-Claims in PostgreSQL (blockierend - im Relay über asyncio.to_thread)
+
+    Bulk- und schnelle Flushes rufen claim/release parallel aus mehreren Threads
+    auf - eine psycopg2-Verbindung verträgt das nicht. Je Verbindung ein Lock;
+    getrennt, damit ein langsamer Claim die Lock-Erneuerung nicht aufhält.
+    """
+
+    SCHEMA_SQL = """
+        CREATE TABLE IF NOT EXISTS relay_delivered_mints (
+            mint VARCHAR(64) PRIMARY KEY,
+            replica VARCHAR(128) NOT NULL,
+            claimed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_relay_delivered_mints_claimed_at
+            ON relay_delivered_mints (claimed_at);
+    """
+    CLAIM_SQL = """
+        INSERT INTO relay_delivered_mints (mint, replica)
+        SELECT unnest(%s::varchar[]), %s
+        ON CONFLICT (mint) DO NOTHING
+        RETURNING mint
+    """
+    RELEASE_SQL = "DELETE FROM relay_delivered_mints WHERE mint = ANY(%s) AND replica = %s"
+    CLEANUP_SQL = "DELETE FROM relay_delivered_mints WHERE claimed_at < NOW() - make_interval(secs => %s) RETURNING mint"
+
+    def __init__(self, host, port, database, user, password, lock_name=LEADER_LOCK_NAME, session_timeout=10):
+        if psycopg2 is None:
+            raise RuntimeError("psycopg2 ist nicht installiert (pip install psycopg2-binary)")
+        self.params = dict(host=host, port=port, database=database, user=user, password=password,
+                           connect_timeout=5)
+        self.lock_name = lock_name
+        # Ist der Leader nur vom Netz getrennt (kein sauberer Verbindungsabbau), beendet
+        # PostgreSQL die stille Lock-Session nach session_timeout Sekunden (ab PostgreSQL 14)
+        self.session_timeout = session_timeout
+        # Eigene Verbindung für das Lock: es gehört der Session und fällt mit ihr
+        self.lock_conn = None
+        self.leading = False
+        self.conn = None
+        self.schema_ready = False
+        self.lead_mutex = threading.RLock()  # lock_conn (try_lead ruft bei Fehlern resign)
+        self.conn_mutex = threading.Lock()  # conn (claim, release, cleanup)
+
+    def _connect(self):
+        conn = psycopg2.connect(**self.params)
+        conn.autocommit = True
+        return conn
+
+    def _execute(self, sql, args=None):
+        with self.conn_mutex:
+            return self._execute_locked(sql, args)
+
+    def _execute_locked(self, sql, args):
+        try:
+            if self.conn is None or self.conn.closed:
+                self.conn = self._connect()
+            cursor = self.conn.cursor()
+            if not self.schema_ready:
+                cursor.execute(self.SCHEMA_SQL)
+                self.schema_ready = True
+            cursor.execute(sql, args)
+            rows = cursor.fetchall() if cursor.description else []
+            cursor.close()
+            return rows
+        except psycopg2.Error:
+            # Verbindung verwerfen, beim nächsten Aufruf neu verbinden
+            self._close(self.conn)
+            self.conn = None
+            raise
+
+    def try_lead(self, replica):
+        """True, solange diese Replika das Leader-Lock hält (nimmt es, wenn es frei ist)"""
+        with self.lead_mutex:
+            return self._try_lead_locked(replica)
+
+    def _try_lead_locked(self, replica):
+        try:
+            if self.lock_conn is None or self.lock_conn.closed:
+                self.lock_conn = self._connect()
+                self.leading = False
+                if self.session_timeout and self.lock_conn.server_version >= 140000:
+                    with self.lock_conn.cursor() as cursor:
+                        cursor.execute("SELECT set_config('idle_session_timeout', %s, false)",
+                                       (f"{int(self.session_timeout * 1000)}",))
+            cursor = self.lock_conn.cursor()
+            if self.leading:
+                # Lock gehört der Session - eine lebende Verbindung heißt: noch Leader
+                cursor.execute("SELECT 1")
+            else:
+                cursor.execute("SELECT pg_try_advisory_lock(hashtext(%s))", (self.lock_name,))
+                self.leading = cursor.fetchone()[0]
+            cursor.close()
+            return self.leading
+        except psycopg2.Error:
+            self.resign(replica)
+            raise
+
+    def resign(self, replica):
+        """Führung abgeben (Verbindung schließen gibt das Lock in jedem Fall frei)"""
+        with self.lead_mutex:
+            self._close(self.lock_conn)
+            self.lock_conn = None
+            self.leading = False
+
+    def claim(self, replica, mints):
+        """Mints für diese Replika beanspruchen → Menge der neu beanspruchten Mints"""
+        if not mints:
+            return set()
+        return {row[0] for row in self._execute(self.CLAIM_SQL, (list(mints), replica))}
+
+    def release(self, replica, mints):
+        """Claims dieser Replika zurückgeben (Versand fehlgeschlagen)"""
+        if mints:
+            self._execute(self.RELEASE_SQL, (list(mints), replica))
+
+    def cleanup(self, max_age):
+        """Claims älter als max_age Sekunden löschen → Anzahl gelöschter Zeilen"""
+        return len(self._execute(self.CLEANUP_SQL, (max_age,)))
+
+    @staticmethod
+    def _close(conn):
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close(self):
+        self.resign(None)
+        with self.conn_mutex:
+            self._close(self.conn)
+            self.conn = None
+
+
+class MemoryCoordinationStore:
+    """In-Prozess-Fake für Tests/Simulationen: ein Store, den alle Replikas teilen
+
+    - disconnect(replica): Session-Abbruch simulieren (Lock wird frei wie bei PostgreSQL)
+    - fail: solange True, wirft jeder Zugriff (Store nicht erreichbar)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.leader = None
+        self.claims = {}  # Mint → (Replika, Zeitpunkt)
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("Store nicht erreichbar")
+
+    def try_lead(self, replica):
+        with self.lock:
+            self._check()
+            if self.leader is None:
+                self.leader = replica
+            return self.leader == replica
+
+    def resign(self, replica):
+        with self.lock:
+            if self.leader == replica:
+                self.leader = None
+
+    def disconnect(self, replica):
+        self.resign(replica)
+
+    def claim(self, replica, mints):
+        with self.lock:
+            self._check()
+            claimed = set()
+            now = time.time()
+            for mint in mints:
+                if mint not in self.claims:
+                    self.claims[mint] = (replica, now)
+                    claimed.add(mint)
+            return claimed
+
+    def release(self, replica, mints):
+        with self.lock:
+            self._check()
+            for mint in mints:
+                if self.claims.get(mint, (None,))[0] == replica:
+                    del self.claims[mint]
+
+    def cleanup(self, max_age):
+        with self.lock:
+            self._check()
+            cutoff = time.time() - max_age
+            expired = [mint for mint, (_, claimed_at) in self.claims.items() if claimed_at < cutoff]
+            for mint in expired:
+                del self.claims[mint]
+            return len(expired)
+
+    def close(self):
+        pass
+
+
+class ReplicaCoordinator:
+    """Leader-Wahl, Mint-Claims und Standby-Puffer einer Replika"""
+
+    def __init__(self, store, replica_id, election_interval=1.0, standby_seconds=120,
+                 dedupe_ttl=86400, cleanup_interval=600):
+        self.store = store
+        self.replica_id = replica_id
+        self.election_interval = election_interval
+        self.standby_seconds = standby_seconds
+        self.dedupe_ttl = dedupe_ttl
+        self.cleanup_interval = cleanup_interval
+        self.is_leader = False
+        self.leader_since = None
+        self.last_cleanup = 0.0
+        self.last_error = None
+        self.standby = deque()  # (Zeitpunkt, Coin) - Batches, die als Follower nicht gesendet wurden
+        self.stats = {"elections": 0, "resignations": 0, "claimed": 0, "duplicates": 0,
+                      "released": 0, "errors": 0}
+
+    async def elect(self):
+        """Lock nehmen bzw. halten → True, wenn diese Replika Leader ist"""
+        try:
+            leading = await asyncio.to_thread(self.store.try_lead, self.replica_id)
+        except Exception as e:
+            self._error(e)
+            leading = False
+        if leading and not self.is_leader:
+            self.is_leader = True
+            self.leader_since = time.time()
+            self.stats["elections"] += 1
+        elif not leading and self.is_leader:
+            self._step_down()
+        return self.is_leader
+
+    def _step_down(self):
+        self.is_leader = False
+        self.leader_since = None
+        self.stats["resignations"] += 1
+
+    def _error(self, e):
+        self.stats["errors"] += 1
+        self.last_error = str(e)[:100]
+
+    async def claim(self, coins):
+        """Nur die Coins, deren Mint diese Replika neu beansprucht hat (Rest wurde schon geliefert)
+
+        Ist der Store nicht erreichbar, gibt die Replika die Führung ab und legt
+        die Coins in den Standby-Puffer → [].
+        """
+        mints = {coin["mint"] for coin in coins}
+        try:
+            claimed = await asyncio.to_thread(self.store.claim, self.replica_id, mints)
+        except Exception as e:
+            self._error(e)
+            await self.resign()
+            self.keep_standby(coins)
+            return []
+        self.stats["claimed"] += len(claimed)
+        self.stats["duplicates"] += len(coins) - len(claimed)
+        # Jede Mint nur einmal (auch wenn sie mehrfach im Batch steht)
+        batch = []
+        for coin in coins:
+            if coin["mint"] in claimed:
+                claimed.discard(coin["mint"])
+                batch.append(coin)
+        return batch
+
+    async def release(self, coins):
+        """Claims nach fehlgeschlagenem Versand zurückgeben (nächster Flush beansprucht neu)"""
+        try:
+            await asyncio.to_thread(self.store.release, self.replica_id, [coin["mint"] for coin in coins])
+            self.stats["released"] += len(coins)
+        except Exception as e:
+            self._error(e)
+
+    async def resign(self):
+        """Führung abgeben (z.B. Store-Fehler, Shutdown)"""
+        if self.is_leader:
+            self._step_down()
+        try:
+            await asyncio.to_thread(self.store.resign, self.replica_id)
+        except Exception as e:
+            self._error(e)
+
+    async def close(self):
+        """Shutdown: Führung abgeben und Store-Verbindungen schließen (Wahl-Loop vorher beenden)"""
+        await self.resign()
+        try:
+            await asyncio.to_thread(self.store.close)
+        except Exception as e:
+            self._error(e)
+
+    def keep_standby(self, coins):
+        """Follower: Batch statt zu senden für einen Leader-Wechsel vorhalten"""
+        now = time.time()
+        self.standby.extend((now, coin) for coin in coins)
+        self._prune_standby(now)
+
+    def _prune_standby(self, now):
+        while self.standby and now - self.standby[0][0] > self.standby_seconds:
+            self.standby.popleft()
+
+    def take_standby(self):
+        """Neuer Leader: vorgehaltene Coins der letzten standby_seconds (Puffer wird geleert)"""
+        self._prune_standby(time.time())
+        coins = [coin for _, coin in self.standby]
+        self.standby.clear()
+        return coins
+
+    async def cleanup(self):
+        """Leader: alte Claims löschen (Dedupe-Fenster dedupe_ttl Sekunden)"""
+        self.last_cleanup = time.time()
+        try:
+            return await asyncio.to_thread(self.store.cleanup, self.dedupe_ttl)
+        except Exception as e:
+            self._error(e)
+            return 0
+
+    async def run(self, on_change=None):
+        """Wahl-Loop (als Task starten): on_change("elected"/"lost") bei Rollenwechsel
+
+        Auch ein Rücktritt nach Store-Fehler in claim() wird hier als "lost" gemeldet.
+        """
+        was_leader = False
+        elections = self.stats["elections"]
+        while True:
+            leading = await self.elect()
+            # Wahl gezählt statt Rolle verglichen: Rücktritt + Neuwahl zwischen zwei Runden ist auch "elected"
+            if self.stats["elections"] != elections:
+                change = "elected"
+            elif was_leader and not leading:
+                change = "lost"
+            else:
+                change = None
+            elections = self.stats["elections"]
+            was_leader = leading
+            if change and on_change:
+                await on_change(change)
+            if self.is_leader and time.time() - self.last_cleanup > self.cleanup_interval:
+                await self.cleanup()
+            await asyncio.sleep(self.election_interval)
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            "replica_id": self.replica_id,
+            "role": "leader" if self.is_leader else "follower",
+            "leader_since_seconds": int(time.time() - self.leader_since) if self.leader_since else None,
+            "standby": len(self.standby),
+            "last_error": self.last_error,
+            **self.stats,
+        }
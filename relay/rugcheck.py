@@ -0,0 +1,283 @@
+"""
+RugCheck Enrichment-Client für den Relay
+
+Holt `metadata_is_mutable` und `mint_authority_enabled` direkt im Relay
+(bisher einzeln pro Coin in n8n):
+- Token-Bucket Rate-Limiter (schont das RugCheck API-Limit)
+- Request-Coalescing: gleichzeitige Anfragen für denselben Mint teilen sich einen Request
+- TTL-Cache für bereits abgefragte Mints
+- Verzögerte Retries für Tokens, die RugCheck noch nicht indexiert hat (404)
+- Austauschbares Backend (HTTP oder Mock für lokale Lasttests)
+"""
+import asyncio
+import random
+import time
+import zlib
+from collections import OrderedDict, deque
+
+import aiohttp
+
+from stats import percentiles
+
+
+class NotIndexedError(Exception):
+    """Token ist bei RugCheck (noch) nicht indexiert"""
+
+
+class RugCheckError(Exception):
+    """Sonstiger Fehler der RugCheck API"""
+
+
+class TokenBucket:
+    """Token-Bucket Rate-Limiter (rate = Requests pro Sekunde, burst = Bucket-Größe; rate <= 0 = unbegrenzt)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst else max(1, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wartet, bis ein Token verfügbar ist (FIFO über Lock)"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class TTLCache:
+    """Einfacher LRU-Cache mit Ablaufzeit pro Eintrag"""
+
+    def __init__(self, ttl, max_size=10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data = OrderedDict()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+def parse_report(report):
+    """Extrahiert die beiden Flags aus einer RugCheck-Antwort"""
+    metadata = report.get("metadata") or {}
+    token_meta = report.get("tokenMeta") or {}
+    if "isMutable" in metadata:
+        is_mutable = metadata.get("isMutable")
+    else:
+        is_mutable = token_meta.get("mutable")
+
+    # mintAuthority ist je nach API-Version ein Objekt ({"enabled": ...}) oder ein Key/None
+    mint_authority = report.get("mintAuthority")
+    if isinstance(mint_authority, dict):
+        mint_authority_enabled = mint_authority.get("enabled")
+    else:
+        mint_authority_enabled = bool(mint_authority)
+
+    return {
+        "metadata_is_mutable": None if is_mutable is None else bool(is_mutable),
+        "mint_authority_enabled": None if mint_authority_enabled is None else bool(mint_authority_enabled),
+    }
+
+
+class HttpBackend:
+    """Echtes RugCheck Backend über aiohttp"""
+
+    def __init__(self, session, base_url="https://api.rugcheck.xyz/v1", timeout=10):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def fetch_report(self, mint):
+        url = f"{self.base_url}/tokens/{mint}/report"
+        async with self.session.get(url, timeout=self.timeout) as resp:
+            if resp.status == 200:
+                return await resp.json(content_type=None)
+            if resp.status == 404:
+                raise NotIndexedError(mint)
+            raise RugCheckError(f"status_{resp.status}")
+
+
+class MockBackend:
+    """Mock-Backend für Lasttests (ohne Netzwerk)
+
+    - latency: (min, max) Antwortzeit in Sekunden
+    - not_indexed_attempts: so viele Anfragen pro Mint liefern zuerst 404
+    - not_indexed_ratio: Anteil der Mints, die anfangs nicht indexiert sind
+    - error_ratio: Anteil zufälliger API-Fehler
+    """
+
+    def __init__(self, latency=(0.05, 0.3), not_indexed_ratio=0.2, not_indexed_attempts=1,
+                 error_ratio=0.0, seed=None):
+        self.latency = latency
+        self.not_indexed_ratio = not_indexed_ratio
+        self.not_indexed_attempts = not_indexed_attempts
+        self.error_ratio = error_ratio
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.requests_per_mint = {}
+
+    async def fetch_report(self, mint):
+        self.requests += 1
+        attempt = self.requests_per_mint.get(mint, 0)
+        self.requests_per_mint[mint] = attempt + 1
+        await asyncio.sleep(self.random.uniform(*self.latency))
+
+        if self.random.random() < self.error_ratio:
+            raise RugCheckError("status_500")
+        # Deterministisch pro Mint: entweder sofort indexiert oder erst nach N Versuchen
+        mint_hash = zlib.crc32(mint.encode())
+        if mint_hash % 1000 < self.not_indexed_ratio * 1000 and attempt < self.not_indexed_attempts:
+            raise NotIndexedError(mint)
+
+        return {
+            "metadata": {"isMutable": mint_hash % 3 == 0},
+            "mintAuthority": {"enabled": mint_hash % 7 == 0},
+        }
+
+
+class RugCheckClient:
+    """Enrichment-Client mit Rate-Limit, Coalescing, TTL-Cache und verzögerten Retries"""
+
+    def __init__(self, backend, rate_per_sec=5, burst=None, cache_ttl=600, cache_size=10000,
+                 max_retries=3, retry_delay=10, latency_window=1000):
+        self.backend = backend
+        self.bucket = TokenBucket(rate_per_sec, burst)
+        self.cache = TTLCache(cache_ttl, cache_size)
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._inflight = {}
+        self._latencies = deque(maxlen=latency_window)
+        self.stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "deferred_retries": 0,
+            "not_indexed": 0,
+            "errors": 0,
+            "enriched": 0,
+        }
+
+    def get_cached(self, mint):
+        return self.cache.get(mint)
+
+    def prefetch(self, mint):
+        """Startet den Abruf im Hintergrund (blockiert den Ingest-Loop nicht)"""
+        if self.cache.get(mint) is not None or mint in self._inflight:
+            return
+        self._start(mint)
+
+    def _start(self, mint):
+        task = asyncio.ensure_future(self._fetch_with_retries(mint, time.monotonic()))
+        self._inflight[mint] = task
+        task.add_done_callback(lambda _: self._inflight.pop(mint, None))
+        return task
+
+    async def get_flags(self, mint):
+        """Liefert die Flags für einen Mint (Cache → laufender Request → neuer Request)"""
+        cached = self.cache.get(mint)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return cached
+        task = self._inflight.get(mint)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            task = self._start(mint)
+        return await asyncio.shield(task)
+
+    async def _fetch_with_retries(self, mint, started):
+        attempt = 0
+        while True:
+            await self.bucket.acquire()
+            self.stats["requests"] += 1
+            try:
+                report = await self.backend.fetch_report(mint)
+                flags = parse_report(report)
+                self.cache.set(mint, flags)
+                self.stats["enriched"] += 1
+                self._latencies.append(time.monotonic() - started)
+                return flags
+            except NotIndexedError:
+                self.stats["not_indexed"] += 1
+            except (RugCheckError, aiohttp.ClientError, asyncio.TimeoutError, ValueError, AttributeError):
+                # ValueError/AttributeError: 200 mit kaputtem JSON bzw. ohne Objekt (parse_report)
+                self.stats["errors"] += 1
+
+            attempt += 1
+            if attempt > self.max_retries:
+                return None
+            # Verzögerter Retry: RugCheck indexiert neue Tokens erst nach einigen Sekunden
+            self.stats["deferred_retries"] += 1
+            await asyncio.sleep(self.retry_delay * attempt)
+
+    async def enrich_batch(self, batch, timeout=5):
+        """Setzt die Flags auf allen Coins eines Batches (max. `timeout` Sekunden warten)
+
+        Coins ohne Ergebnis innerhalb des Timeouts behalten None - der Abruf läuft
+        im Hintergrund weiter und landet im Cache.
+        """
+        tasks = {}
+        for coin in batch:
+            mint = coin.get("mint")
+            if mint and mint not in tasks:
+                tasks[mint] = asyncio.ensure_future(self.get_flags(mint))
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=timeout)
+
+        enriched = 0
+        for coin in batch:
+            task = tasks.get(coin.get("mint"))
+            flags = None
+            if task is not None and task.done() and not task.cancelled() and task.exception() is None:
+                flags = task.result()
+            if flags:
+                coin.update(flags)
+                enriched += 1
+            else:
+                coin.setdefault("metadata_is_mutable", None)
+                coin.setdefault("mint_authority_enabled", None)
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()  # nur der Wrapper - der geteilte Fetch läuft via shield weiter
+        return enriched
+
+    def latency_percentiles(self):
+        """Enrichment-Latenz (Sekunden, inkl. Wartezeit & Retries) als p50/p95/p99"""
+        return percentiles(list(self._latencies))
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            **self.stats,
+            "cache_size": len(self.cache),
+            "inflight": len(self._inflight),
+            "latency_seconds": self.latency_percentiles(),
+        }
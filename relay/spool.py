@@ -0,0 +1,80 @@
+"""
+Shutdown-Spool: beim Beenden nicht zugestellte Coins für den nächsten Start
+
+Bei SIGTERM (Coolify-Redeploy, docker stop) leert der Relay Buffer und Queues
+innerhalb von SHUTDOWN_TIMEOUT Sekunden. Was bis dahin nicht bei n8n ist
+(n8n down, Circuit-Breaker offen, Frist abgelaufen), landet hier als JSON Lines
+(Standard /app/config/shutdown_spool.jsonl, im Volume) und wird beim nächsten
+Start vor allen neuen Coins in den Buffer übernommen.
+
+Beim Übernehmen wird die Datei zu <path>.inflight und erst gelöscht, wenn alle
+übernommenen Coins erledigt sind (finish) - ein Absturz oder SIGKILL vorher
+verliert sie nicht, der nächste Start liest .inflight erneut.
+
+Blockierend - im Relay über asyncio.to_thread.
+"""
+import json
+import os
+
+
+class CoinSpool:
+    """Coins als JSON Lines in einer Datei"""
+
+    def __init__(self, path):
+        self.path = path
+        self.inflight_path = path + ".inflight"
+        self.pending = set()  # Mints der übernommenen, noch nicht erledigten Coins
+
+    def save(self, coins):
+        """Coins anhängen (auf Platte geschrieben, bevor der Prozess endet) → Anzahl"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._append(self.path, coins)
+        return len(coins)
+
+    def load(self):
+        """Gespoolte Coins lesen → Liste (älteste zuerst); die Datei bleibt als .inflight bis finish()"""
+        if os.path.exists(self.path):
+            if os.path.exists(self.inflight_path):
+                # Vorheriger Lauf hat seine übernommenen Coins nicht mehr zugestellt
+                self._append(self.inflight_path, self._read(self.path))
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.inflight_path)
+        coins = self._read(self.inflight_path)
+        self.pending = {coin.get("mint") for coin in coins}
+        if not coins and os.path.exists(self.inflight_path):
+            os.remove(self.inflight_path)
+        return coins
+
+    def delivered(self, coins):
+        """Übernommene Coins erledigt → True, sobald keiner mehr offen ist (dann finish())"""
+        if not self.pending:
+            return False
+        for coin in coins:
+            self.pending.discard(coin.get("mint"))
+        return not self.pending
+
+    def finish(self):
+        """Übernommene Coins sind zugestellt bzw. neu gespoolt - .inflight löschen"""
+        self.pending = set()
+        if os.path.exists(self.inflight_path):
+            os.remove(self.inflight_path)
+
+    def _append(self, path, coins):
+        with open(path, "a") as f:
+            for coin in coins:
+                f.write(json.dumps(coin, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read(self, path):
+        if not os.path.exists(path):
+            return []
+        coins = []
+        with open(path) as f:
+            for line in f:
+                try:
+                    coins.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # abgeschnittene letzte Zeile (SIGKILL beim Schreiben)
+        return coins
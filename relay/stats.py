@@ -0,0 +1,257 @@
+"""
+Aggregierte Relay-Statistiken für /stats und /stats/series
+
+Die UI musste bisher den Prometheus-Text von /metrics bei jedem Rerun selbst
+parsen (Labels wie der Filter-Grund gingen dabei verloren), Raten gab es nur mit
+Prometheus + Grafana. Der Relay führt die Kennzahlen stattdessen als kompakte
+In-Process-Zeitreihe:
+- RollingCounter: zwei Ringpuffer (array) - Sekunden-Buckets für die letzten
+  5 Minuten, Minuten-Buckets für die letzte Stunde → Raten über 1m/5m/15m/1h
+  und Sparkline-Daten ohne Event-Liste und ohne externe TSDB
+- RollingLatency: Summe + Anzahl pro Bucket (Ø-Latenz als Zeitreihe) und die
+  letzten N Werte für p50/p95/p99
+- RelayStats: alle Zähler des Relays (Filter nach Grund, n8n-Fehler nach Typ)
+- percentiles: Nearest-Rank-Perzentile (auch für RugCheck-Latenz und Lanes)
+"""
+import time
+from array import array
+from collections import deque
+
+# Zeitfenster für Raten: (Name, Sekunden)
+WINDOWS = (("1m", 60), ("5m", 300), ("15m", 900), ("1h", 3600))
+
+# Sparklines in /stats: letzte 5 Minuten in 10s-Schritten
+SPARKLINE_WINDOW = 300
+SPARKLINE_STEP = 10
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Berechnet Perzentile (Nearest-Rank) einer Werte-Liste"""
+    if not values:
+        return {f"p{p}": None for p in points}
+    ordered = sorted(values)
+    result = {}
+    for p in points:
+        index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered))) - 1))
+        result[f"p{p}"] = ordered[index]
+    return result
+
+
+class _Ring:
+    """Ringpuffer fester Größe; jeder Bucket merkt sich, zu welchem Zeitschlitz er gehört"""
+
+    def __init__(self, size, resolution):
+        self.size = size
+        self.resolution = resolution  # Sekunden pro Bucket
+        self.values = array("d", [0.0]) * size
+        self.slots = array("q", [-1]) * size
+
+    def add(self, slot, amount):
+        index = slot % self.size
+        if self.slots[index] != slot:
+            # Bucket gehört zu einer alten Runde des Rings → überschreiben
+            self.slots[index] = slot
+            self.values[index] = 0.0
+        self.values[index] += amount
+
+    def get(self, slot):
+        index = slot % self.size
+        return self.values[index] if self.slots[index] == slot else 0.0
+
+    def sum(self, last_slot, count):
+        return sum(self.get(slot) for slot in range(last_slot - count + 1, last_slot + 1))
+
+
+class RollingCounter:
+    """Zähler mit Sekunden- und Minuten-Ringpuffer (Summe über ein Fenster, Zeitreihe für Sparklines)"""
+
+    def __init__(self, seconds=300, minutes=60):
+        self.per_second = _Ring(seconds, 1)
+        self.per_minute = _Ring(minutes, 60)
+        self.total = 0
+
+    def add(self, amount=1, now=None):
+        second = int(time.time() if now is None else now)
+        self.per_second.add(second, amount)
+        self.per_minute.add(second // 60, amount)
+        self.total += amount
+
+    def _ring_for(self, window, step=1):
+        # Sekunden-Auflösung, solange das Fenster in den Sekunden-Ring passt
+        if window <= self.per_second.size and step < 60:
+            return self.per_second
+        return self.per_minute
+
+    def count(self, window, now=None):
+        """Summe der letzten `window` Sekunden (inkl. der laufenden; > 5 min auf Minuten genau)"""
+        second = int(time.time() if now is None else now)
+        ring = self._ring_for(window)
+        buckets = min(-(-window // ring.resolution), ring.size)
+        return ring.sum(second // ring.resolution, buckets)
+
+    def rates(self, now=None):
+        """Raten pro Minute für alle WINDOWS"""
+        return {name: round(self.count(seconds, now) * 60 / seconds, 2) for name, seconds in WINDOWS}
+
+    def series(self, window=SPARKLINE_WINDOW, step=SPARKLINE_STEP, now=None):
+        """Summen pro `step` Sekunden über die letzten `window` Sekunden (älteste zuerst)"""
+        second = int(time.time() if now is None else now)
+        ring = self._ring_for(window, step)
+        window = min(window, ring.size * ring.resolution)
+        step = min(step, window)
+        step = max(ring.resolution, step - step % ring.resolution)
+        per_point = step // ring.resolution
+        last_slot = second // ring.resolution
+        points = max(1, window // step)
+        return [
+            ring.sum(last_slot - (points - 1 - i) * per_point, per_point)
+            for i in range(points)
+        ], step
+
+
+class RollingLatency:
+    """Latenz-Zeitreihe (Ø pro Bucket) + die letzten N Werte für Perzentile"""
+
+    def __init__(self, size=1000, seconds=300, minutes=60):
+        self.sum = RollingCounter(seconds, minutes)
+        self.count = RollingCounter(seconds, minutes)
+        self.values = deque(maxlen=size)
+        self._cached = None
+
+    def add(self, seconds, now=None):
+        self.sum.add(seconds, now)
+        self.count.add(1, now)
+        self.values.append(seconds)
+        self._cached = None
+
+    def average(self, window, now=None):
+        count = self.count.count(window, now)
+        return round(self.sum.count(window, now) / count, 4) if count else None
+
+    def series(self, window=SPARKLINE_WINDOW, step=SPARKLINE_STEP, now=None):
+        sums, step = self.sum.series(window, step, now)
+        counts, _ = self.count.series(window, step, now)
+        return [round(s / c, 4) if c else None for s, c in zip(sums, counts)], step
+
+    def percentiles(self):
+        """p50/p95/p99 der letzten N Werte (nur nach neuen Werten neu berechnet)"""
+        if self._cached is None:
+            result = percentiles(list(self.values))
+            self._cached = {name: round(value, 4) if value is not None else None
+                            for name, value in result.items()}
+            self._cached["count"] = len(self.values)
+        return self._cached
+
+    def snapshot(self, now=None):
+        return {
+            **self.percentiles(),
+            "avg": {name: self.average(seconds, now) for name, seconds in WINDOWS},
+        }
+
+
+class RelayStats:
+    """Alle Zähler des Relays (wird von main.py parallel zu den Prometheus-Metriken geführt)"""
+
+    SPARKLINES = ("received", "filtered", "sent", "send_latency")
+
+    def __init__(self, latency_window=1000):
+        self.received = RollingCounter()
+        self.accepted = RollingCounter()
+        self.sent = RollingCounter()
+        self.batches = RollingCounter()
+        self.failed_batches = RollingCounter()
+        self.reconnects = RollingCounter()
+        self.filtered_total = RollingCounter()
+        self.filtered = {}
+        self.n8n_errors = {}
+        self.send_latency = RollingLatency(latency_window)
+
+    def _labeled(self, counters, label):
+        if label not in counters:
+            counters[label] = RollingCounter()
+        return counters[label]
+
+    def record_received(self):
+        self.received.add()
+
+    def record_accepted(self):
+        self.accepted.add()
+
+    def record_filtered(self, reason):
+        self._labeled(self.filtered, reason).add()
+        self.filtered_total.add()
+
+    def record_n8n_error(self, error_type):
+        self._labeled(self.n8n_errors, error_type).add()
+
+    def record_reconnect(self):
+        self.reconnects.add()
+
+    def record_batch(self, size, duration, success):
+        """Ein Flush (Enrichment + Versand inkl. Retries)"""
+        self.send_latency.add(duration)
+        if success:
+            self.batches.add()
+            self.sent.add(size)
+        else:
+            self.failed_batches.add()
+
+    def _counters(self):
+        return {
+            "received": self.received,
+            "accepted": self.accepted,
+            "filtered": self.filtered_total,
+            "sent": self.sent,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "reconnects": self.reconnects,
+        }
+
+    def _labeled_snapshot(self, counters, now):
+        return {
+            label: {"total": counter.total, **counter.rates(now)}
+            for label, counter in sorted(counters.items())
+        }
+
+    def series(self, metric, window=SPARKLINE_WINDOW, step=SPARKLINE_STEP, now=None):
+        """Zeitreihe einer Kennzahl ("received", "filtered:bad_name", "n8n_errors:timeout",
+        "send_latency" = Ø Sekunden); None bei unbekannter Kennzahl"""
+        now = time.time() if now is None else now
+        if metric == "send_latency":
+            values, step = self.send_latency.series(window, step, now)
+        else:
+            name, _, label = metric.partition(":")
+            if label and name == "filtered":
+                counter = self.filtered.get(label)
+            elif label and name == "n8n_errors":
+                counter = self.n8n_errors.get(label)
+            else:
+                counter = self._counters().get(metric)
+            if counter is None:
+                return None
+            values, step = counter.series(window, step, now)
+        return {
+            "metric": metric,
+            "step": step,
+            "end": int(now),
+            "values": values,
+        }
+
+    def snapshot(self, now=None):
+        """Aggregate für /stats (Raten = Ereignisse pro Minute)"""
+        now = time.time() if now is None else now
+        counters = self._counters()
+        totals = {name: int(counter.total) for name, counter in counters.items()}
+        totals["n8n_errors"] = int(sum(counter.total for counter in self.n8n_errors.values()))
+        return {
+            "windows": [name for name, _ in WINDOWS],
+            "totals": totals,
+            "rates_per_minute": {name: counter.rates(now) for name, counter in counters.items()},
+            "filtered_by_reason": self._labeled_snapshot(self.filtered, now),
+            "n8n_errors_by_type": self._labeled_snapshot(self.n8n_errors, now),
+            "batch_latency_seconds": self.send_latency.snapshot(now),
+            "sparklines": {
+                "step": SPARKLINE_STEP,
+                **{metric: self.series(metric, now=now)["values"] for metric in self.SPARKLINES},
+            },
+        }
@@ -0,0 +1,164 @@
+"""
+Stream-Sink: jeder angenommene Coin als Eintrag in einem Redis Stream
+
+n8n bekommt Batches per Webhook; weitere Abnehmer (Analytics, Tracker, auch
+n8n selbst) können stattdessen den Stream mit eigenen Consumer-Groups lesen -
+jede Gruppe in ihrem Tempo, ohne dass der Relay an jeden einzeln sendet:
+- add() legt den Coin nur in eine Queue (blockiert den Ingest-Loop nie)
+- run() schreibt die Queue gebündelt per Pipeline (ein Roundtrip für bis zu
+  batch_size XADD) alle flush_interval Sekunden bzw. sobald batch_size erreicht ist
+- MAXLEN ~ maxlen kürzt den Stream beim Schreiben (ungefähr, damit Redis ganze
+  Knoten verwerfen kann)
+- Ist Redis nicht erreichbar, bleibt der Batch in der Queue (Retry mit
+  wachsender Pause); über max_queue hinaus werden die ältesten Coins verworfen
+
+Eintrag: mint (für idempotente Consumer) + data (Coin als JSON).
+Lesen z.B.: XREADGROUP GROUP analytics c1 COUNT 100 BLOCK 5000 STREAMS pumpfun:coins >
+
+redis (redis.asyncio) ist optional - nur nötig, wenn STREAM_SINK=redis. Der
+Client wird übergeben, Tests/Benchmarks nutzen fakeredis (scripts/bench_stream_sink.py).
+"""
+import asyncio
+import json
+import time
+from collections import deque
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError, ResponseError
+except ImportError:
+    aioredis = None
+    RedisError = ResponseError = Exception
+
+
+def connect(url):
+    """redis.asyncio-Client für eine URL (redis://host:port/db)"""
+    if aioredis is None:
+        raise RuntimeError("redis ist nicht installiert (pip install redis)")
+    return aioredis.from_url(url, socket_connect_timeout=5, socket_timeout=5)
+
+
+class RedisStreamSink:
+    """Gebündeltes XADD mit MAXLEN-Trimming, Queue und Retry"""
+
+    def __init__(self, client, stream, maxlen=100000, batch_size=100, flush_interval=0.2,
+                 max_queue=10000, retry_delay=1, max_retry_delay=30):
+        self.client = client
+        self.stream = stream
+        self.maxlen = maxlen
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.queue = deque()
+        self.wakeup = asyncio.Event()
+        self.last_error = None
+        self.last_publish = None
+        self.stats = {"published": 0, "pipelines": 0, "errors": 0, "dropped": 0}
+
+    def add(self, coin):
+        """Coin zum Schreiben vormerken (synchron, aus dem Ingest-Loop)"""
+        if len(self.queue) >= self.max_queue:
+            self.queue.popleft()
+            self.stats["dropped"] += 1
+        self.queue.append(coin)
+        if len(self.queue) >= self.batch_size:
+            self.wakeup.set()
+
+    async def ensure_groups(self, groups):
+        """Consumer-Groups anlegen (ab neuen Einträgen, Stream wird bei Bedarf erstellt)"""
+        created = []
+        for group in groups:
+            try:
+                await self.client.xgroup_create(self.stream, group, id="$", mkstream=True)
+                created.append(group)
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        return created
+
+    async def publish(self, coins):
+        """Coins per Pipeline schreiben → Stream-IDs (wirft bei Redis-Fehlern)"""
+        pipe = self.client.pipeline(transaction=False)
+        for coin in coins:
+            pipe.xadd(
+                self.stream,
+                {"mint": coin.get("mint", ""), "data": json.dumps(coin, default=str)},
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+        ids = await pipe.execute()
+        self.stats["published"] += len(coins)
+        self.stats["pipelines"] += 1
+        self.last_publish = time.time()
+        return ids
+
+    async def flush(self):
+        """Bis zu batch_size Coins aus der Queue schreiben → Anzahl (bei Fehler bleiben sie in der Queue)
+
+        Der Batch wird vor dem Schreiben entnommen - add() kann während des
+        Wartens die ältesten Einträge verwerfen (max_queue), ohne dass danach
+        ungeschriebene Coins mit entfernt werden.
+        """
+        batch = [self.queue.popleft() for _ in range(min(self.batch_size, len(self.queue)))]
+        if not batch:
+            return 0
+        try:
+            await self.publish(batch)
+        except BaseException:
+            # Auch bei Abbruch (Shutdown-Frist): zurück an den Anfang, über max_queue die ältesten verwerfen
+            self.queue.extendleft(reversed(batch))
+            while len(self.queue) > self.max_queue:
+                self.queue.popleft()
+                self.stats["dropped"] += 1
+            raise
+        return len(batch)
+
+    async def run(self):
+        """Schreib-Loop (als Task starten)"""
+        delay = self.retry_delay
+        while True:
+            if len(self.queue) < self.batch_size:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                # Volle Batches ohne Pause nachschieben, den Rest beim nächsten Intervall
+                while await self.flush() == self.batch_size:
+                    pass
+                delay = self.retry_delay
+                self.last_error = None
+            except (RedisError, OSError) as e:
+                self.stats["errors"] += 1
+                self.last_error = str(e)[:100]
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+
+    async def stream_info(self):
+        """Länge des Streams und Rückstand je Consumer-Group (für Benchmarks/Diagnose)"""
+        length = await self.client.xlen(self.stream)
+        groups = await self.client.xinfo_groups(self.stream)
+        return length, {
+            _text(group["name"]): {"pending": group["pending"], "lag": group.get("lag")}
+            for group in groups
+        }
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            "stream": self.stream,
+            "queue": len(self.queue),
+            "last_publish_ago": int(time.time() - self.last_publish) if self.last_publish else None,
+            "last_error": self.last_error,
+            **self.stats,
+        }
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def _text(value):
+    return value.decode() if isinstance(value, bytes) else value
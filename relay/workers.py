@@ -0,0 +1,316 @@
+"""
+Mehrprozess-Modus des Relays: Ingest-Prozess + N Worker-Prozesse für die CPU-Stufen
+
+Im Standardbetrieb (WORKERS=0) dekodiert und filtert der Ingest-Loop jeden
+Frame selbst - JSON-Decode, Namensfilter und berechnete Felder teilen sich den
+Kern mit WebSocket, Health-Server und Webhook-Client. Mit WORKERS=N:
+- Der Ingest-Loop reicht nur den rohen Frame mit fortlaufender Sequenznummer
+  weiter (multiprocessing-Pipe pro Worker; Sender- und Empfänger-Thread pro
+  Worker lesen/schreiben blockierend und bündeln unter Last mehrere Frames pro
+  Nachricht, der Event-Loop selbst wartet nie auf eine Pipe)
+- Worker-Prozesse führen process_frame() aus (dieselbe Funktion wie im
+  Einzelprozess-Modus) und schicken die Ergebnisse gebündelt zurück
+- Der Merger im Ingest-Loop gibt die Ergebnisse strikt in Empfangsreihenfolge
+  frei (damit auch pro Mint) - Spam-Burst-Filter, Buffer, Feed und Versand
+  laufen danach unverändert im Ingest-Prozess
+- Höchstens `max_inflight` Frames unterwegs; ist das Limit erreicht, wartet der
+  Ingest-Loop (Backpressure auf den WebSocket statt unbegrenztem Speicher)
+- Stirbt ein Worker, werden seine offenen Frames als verloren freigegeben und
+  der Worker neu gestartet
+- stop() beendet alle Worker beim Shutdown (Stop-Signal, notfalls terminate)
+
+Die Worker zählen Frames und Rechenzeit selbst und melden sie mit jedem Ergebnis;
+der Ingest-Prozess führt daraus die Prometheus-Metriken (eine Registry für alle
+Prozesse).
+"""
+import asyncio
+import json
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+from collections import deque
+
+MAX_FRAMES_PER_MESSAGE = 500
+
+
+def process_frame(raw, bad_names):
+    """CPU-Stufe eines Frames: (status, data, grund)
+
+    status: "error" (kein JSON), "ignored" (keine Coin-Nachricht), "filtered"
+    (Namensfilter) oder "decoded" (mit price_sol, pool_address, social_count).
+    """
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        return "error", None, str(e)
+    if not isinstance(data, dict) or not data.get("mint"):
+        return "ignored", data, None
+
+    if bad_names.search(data.get("name", "").strip()):
+        return "filtered", data, "bad_name"
+
+    # price_sol = marketCapSol / vTokensInBondingCurve (wenn vTokens > 0)
+    v_tokens = data.get("vTokensInBondingCurve", 0)
+    market_cap = data.get("marketCapSol", 0)
+    price_sol = market_cap / v_tokens if v_tokens and v_tokens > 0 else 0
+
+    # social_count (0-4): Anzahl vorhandener Social-Links
+    social_count = 0
+    for field in ("twitter", "telegram", "website", "discord"):
+        if data.get(f"{field}_url") or data.get(field):
+            social_count += 1
+
+    data["price_sol"] = price_sol
+    data["pool_address"] = data.get("bondingCurveKey", "")
+    data["social_count"] = social_count
+    return "decoded", data, None
+
+
+def worker_main(inbox, outbox, bad_names_pattern):
+    """Worker-Prozess: Frames aus `inbox` verarbeiten, Ergebnisse nach `outbox`"""
+    import re
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C beendet nur den Ingest-Prozess
+    bad_names = re.compile(rf"({bad_names_pattern})", re.IGNORECASE)
+    outbox.send(([], 0.0))  # bereit (Import im Kind-Prozess dauert bei spawn einige 100 ms)
+    while True:
+        try:
+            message = inbox.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        kind, payload = message
+        if kind == "pattern":
+            bad_names = re.compile(rf"({payload})", re.IGNORECASE)
+            continue
+        started = time.perf_counter()
+        results = [(seq, *process_frame(raw, bad_names)) for seq, raw in payload]
+        outbox.send((results, time.perf_counter() - started))
+
+
+class _Worker:
+    """Ein Worker-Prozess mit Pipes, Sender-Thread und offenen Sequenznummern"""
+
+    def __init__(self, index, context, bad_names_pattern):
+        self.index = index
+        self.ready = None  # Future im Event-Loop, erfüllt mit der Bereit-Meldung des Prozesses
+        self.outstanding = set()
+        self.frames = 0
+        self.busy_seconds = 0.0
+        self.outbox = queue.SimpleQueue()
+        inbox_recv, self.inbox = context.Pipe(duplex=False)
+        self.results, results_send = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=worker_main, args=(inbox_recv, results_send, bad_names_pattern),
+            name=f"relay-worker-{index}", daemon=True,
+        )
+        self.process.start()
+        # Die Enden des Workers gehören jetzt dem Kind-Prozess
+        inbox_recv.close()
+        results_send.close()
+        self.sender = threading.Thread(target=self._send_loop, name=f"relay-worker-{index}-sender", daemon=True)
+        self.sender.start()
+
+    def _send_loop(self):
+        """Sender-Thread: blockierendes Schreiben in die Pipe, wartende Frames gebündelt"""
+        carry = None
+        while True:
+            item = carry or self.outbox.get()
+            carry = None
+            if item[0] == "frame":
+                frames = [item[1]]
+                while len(frames) < MAX_FRAMES_PER_MESSAGE:
+                    try:
+                        item = self.outbox.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item[0] != "frame":
+                        carry = item  # Steuer-Nachricht nach den Frames senden
+                        break
+                    frames.append(item[1])
+                message = ("frames", frames)
+            elif item[0] == "pattern":
+                message = item
+            else:
+                message = None  # Stop-Signal für den Worker
+            try:
+                self.inbox.send(message)
+            except OSError:
+                return
+            if message is None:
+                return
+
+    def submit(self, seq, raw):
+        self.outstanding.add(seq)
+        self.outbox.put(("frame", (seq, raw)))
+
+    def stop(self):
+        self.outbox.put(("stop", None))
+
+
+class WorkerPool:
+    """Worker-Prozesse + Merger, der die Ergebnisse in Empfangsreihenfolge freigibt"""
+
+    def __init__(self, count, bad_names_pattern, max_inflight=2000, on_batch=None, on_restart=None):
+        self.count = count
+        self.bad_names_pattern = bad_names_pattern
+        self.max_inflight = max_inflight
+        self.on_batch = on_batch  # (Worker-Index, Frames, Sekunden) für Metriken
+        self.on_restart = on_restart  # (Worker-Index, verlorene Frames) für Logs
+        self.context = multiprocessing.get_context("spawn")
+        self.loop = None
+        self.workers = []
+        self.next_seq = 0
+        self.release_seq = 0
+        self.pending = {}  # Sequenznummer → Ergebnis, wartet auf fehlende Vorgänger
+        self.ready = deque()
+        self.ready_event = asyncio.Event()
+        self.capacity = asyncio.Event()
+        self.capacity.set()
+        self.closed = False
+        self.stats = {"submitted": 0, "released": 0, "lost": 0, "restarts": 0, "backpressure_waits": 0}
+
+    @property
+    def inflight(self):
+        return self.next_seq - self.release_seq
+
+    async def start(self, timeout=30):
+        """Worker-Prozesse starten und warten, bis alle bereit sind"""
+        self.loop = asyncio.get_running_loop()
+        self.workers = [self._start_worker(index) for index in range(self.count)]
+        await asyncio.wait_for(asyncio.gather(*(worker.ready for worker in self.workers)), timeout=timeout)
+
+    def _start_worker(self, index):
+        worker = _Worker(index, self.context, self.bad_names_pattern)
+        worker.ready = self.loop.create_future()
+        threading.Thread(
+            target=self._receive_loop, args=(worker,), name=f"relay-worker-{index}-receiver", daemon=True
+        ).start()
+        return worker
+
+    def _receive_loop(self, worker):
+        """Empfänger-Thread: blockierend aus der Ergebnis-Pipe lesen, Verarbeitung im Event-Loop"""
+        while True:
+            try:
+                results, busy = worker.results.recv()
+            except (EOFError, OSError):
+                if self.closed:
+                    return  # stop(): Worker beendet sich planmäßig
+                # Im Thread auf das Ende des Prozesses warten - nicht im Event-Loop
+                worker.process.join(timeout=1)
+                callback, args = self._restart, (worker,)
+            else:
+                callback, args = self._on_results, (worker, results, busy)
+            try:
+                self.loop.call_soon_threadsafe(callback, *args)
+            except RuntimeError:
+                return  # Event-Loop ist schon beendet (Shutdown)
+            if callback == self._restart:
+                return
+
+    async def submit(self, raw):
+        """Rohen Frame an den Worker mit den wenigsten offenen Frames geben"""
+        if self.inflight >= self.max_inflight:
+            self.stats["backpressure_waits"] += 1
+            self.capacity.clear()
+            await self.capacity.wait()
+        worker = min(self.workers, key=lambda w: len(w.outstanding))
+        worker.submit(self.next_seq, raw)
+        self.next_seq += 1
+        self.stats["submitted"] += 1
+
+    def set_pattern(self, bad_names_pattern):
+        """Neuen Namensfilter an alle Worker (gilt ab dem nächsten Frame, z.B. nach /reload-config)"""
+        self.bad_names_pattern = bad_names_pattern
+        for worker in self.workers:
+            worker.outbox.put(("pattern", bad_names_pattern))
+
+    def _on_results(self, worker, results, busy):
+        """Im Event-Loop: Ergebnisse eines Workers einsortieren und lückenlos freigeben"""
+        if not worker.ready.done():
+            worker.ready.set_result(True)
+        for seq, status, data, reason in results:
+            worker.outstanding.discard(seq)
+            self.pending[seq] = (status, data, reason)
+        worker.frames += len(results)
+        worker.busy_seconds += busy
+        if self.on_batch:
+            self.on_batch(worker.index, len(results), busy)
+        self._release()
+
+    def _restart(self, worker):
+        """Worker ist weg: offene Frames als verloren freigeben, neuen Worker im selben Slot starten"""
+        if self.closed:
+            return
+        worker.results.close()
+        worker.stop()
+        for seq in worker.outstanding:
+            self.pending[seq] = ("lost", None, None)
+        self.stats["lost"] += len(worker.outstanding)
+        self.stats["restarts"] += 1
+        if self.on_restart:
+            self.on_restart(worker.index, len(worker.outstanding))
+        self.workers[worker.index] = self._start_worker(worker.index)
+        self._release()
+
+    async def stop(self, timeout=5):
+        """Alle Worker beenden (Shutdown): Stop-Signal, bis `timeout` warten, dann terminate()"""
+        self.closed = True
+        for worker in self.workers:
+            worker.stop()
+        await asyncio.to_thread(self._join_all, timeout)
+        self.capacity.set()  # wartende submit()-Aufrufe nicht hängen lassen
+
+    def _join_all(self, timeout):
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            worker.process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(timeout=1)
+
+    def _release(self):
+        # Nur lückenlos ab der nächsten erwarteten Nummer freigeben
+        released = False
+        while self.release_seq in self.pending:
+            self.ready.append(self.pending.pop(self.release_seq))
+            self.release_seq += 1
+            released = True
+        if released:
+            self.stats["released"] = self.release_seq
+            self.ready_event.set()
+            if self.inflight < self.max_inflight:
+                self.capacity.set()
+
+    async def results(self, timeout):
+        """Freigegebene Ergebnisse (status, data, grund) in Empfangsreihenfolge; [] nach `timeout`"""
+        if not self.ready:
+            self.ready_event.clear()
+            try:
+                await asyncio.wait_for(self.ready_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+        results = list(self.ready)
+        self.ready.clear()
+        return results
+
+    def snapshot(self):
+        """Status für /health"""
+        return {
+            **self.stats,
+            "workers": self.count,
+            "inflight": self.inflight,
+            "waiting_for_order": len(self.pending),
+            "per_worker": [
+                {
+                    "frames": worker.frames,
+                    "outstanding": len(worker.outstanding),
+                    "busy_seconds": round(worker.busy_seconds, 3),
+                    "alive": worker.process.is_alive(),
+                }
+                for worker in self.workers
+            ],
+        }
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Backfill der USD-Spalten (sol_price_usd, market_cap_usd, price_usd) in discovered_coins
+
+Lädt die komplette Kurs-Historie aus coin_metrics einmal in eine RateHistory
+(sortierte Arrays + bisect, relay/exchange_rates.py) und ordnet jedem Coin den Kurs
+zu, der bei `discovered_at` galt. Statt eines LATERAL-Subselects pro Zeile gibt es
+damit nur einen Lookup im Speicher und ein gebündeltes UPDATE pro Batch.
+
+Zeilen ohne passenden Kurs (vor dem ersten Kurs oder Lücke > --max-gap-hours)
+bleiben NULL. Abbrechen und erneut starten ist jederzeit möglich.
+
+Beispiel:
+    python scripts/backfill_usd.py --batch-size 5000
+"""
+import argparse
+import os
+import sys
+import time
+
+from psycopg2.extras import execute_values
+
+from db_utils import add_db_arguments, connect
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay"))
+from exchange_rates import RateHistory, usd_fields  # noqa: E402
+
+SELECT_BATCH_SQL = """
+    SELECT token_address, discovered_at, market_cap_sol, price_sol
+    FROM discovered_coins
+    WHERE market_cap_usd IS NULL
+      AND token_address > %s
+    ORDER BY token_address
+    LIMIT %s
+"""
+
+# discovered_at im Join: bei der partitionierten Tabelle wird nur eine Partition angefasst
+UPDATE_SQL = """
+    UPDATE discovered_coins dc
+    SET sol_price_usd = v.sol_price_usd,
+        market_cap_usd = v.market_cap_usd,
+        price_usd = v.price_usd
+    FROM (VALUES %s) AS v(token_address, discovered_at, sol_price_usd, market_cap_usd, price_usd)
+    WHERE dc.token_address = v.token_address
+      AND dc.discovered_at = v.discovered_at
+"""
+
+
+def load_history(conn):
+    history = RateHistory()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT created_at, sol_price_usd, usd_to_eur_rate
+        FROM coin_metrics
+        WHERE blockchain_id = 1 AND sol_price_usd IS NOT NULL
+        ORDER BY created_at
+    """)
+    for created_at, sol_usd, usd_eur in cursor:
+        history.add(created_at, float(sol_usd), float(usd_eur) if usd_eur is not None else None)
+    cursor.close()
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--max-gap-hours", type=float, default=24,
+                        help="Kurs höchstens so alt (relativ zu discovered_at), sonst NULL lassen")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    history = load_history(conn)
+    if not history:
+        print("❌ Keine Kurse in coin_metrics - nichts zu tun")
+        sys.exit(1)
+    print(f"💱 {len(history):,} Kurse geladen")
+
+    max_gap = args.max_gap_hours * 3600
+    last_token = ""
+    updated = 0
+    skipped = 0
+    started = time.perf_counter()
+    cursor = conn.cursor()
+    while True:
+        cursor.execute(SELECT_BATCH_SQL, (last_token, args.batch_size))
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        last_token = rows[-1][0]
+
+        values = []
+        for token_address, discovered_at, market_cap_sol, price_sol in rows:
+            rate = history.lookup(discovered_at, max_gap=max_gap) if discovered_at else None
+            if rate is None:
+                skipped += 1
+                continue
+            fields = usd_fields(
+                float(market_cap_sol) if market_cap_sol is not None else None,
+                float(price_sol) if price_sol is not None else None,
+                rate[0],
+            )
+            values.append((token_address, discovered_at, fields["sol_price_usd"],
+                           fields["market_cap_usd"], fields["price_usd"]))
+        if values:
+            execute_values(cursor, UPDATE_SQL, values, page_size=len(values))
+            updated += len(values)
+        print(f"   {updated:,} aktualisiert, {skipped:,} ohne Kurs ({updated / (time.perf_counter() - started):,.0f}/s)")
+
+    cursor.close()
+    conn.close()
+    print(f"✅ Fertig: {updated:,} Coins mit USD-Werten, {skipped:,} ohne passenden Kurs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+n8n-Ausfall durch den echten Relay spielen: Circuit-Breaker an vs. aus
+
+Wie scripts/replay_relay.py startet pro Lauf ein frischer Relay-Prozess mit
+lokaler WebSocket-Quelle (--rate Frames/s) und Webhook-Senke. Die Senke fällt
+von --outage-start bis --outage-start + --outage Sekunden aus:
+- --mode 503: antwortet sofort mit 503 (n8n überlastet / Proxy ohne Backend)
+- --mode hang: antwortet erst nach 20s (länger als der 15s-Timeout des Relays)
+
+Gemessen pro Lauf:
+- Requests an die Senke während des Ausfalls (ohne Breaker: jeder Batch 3x)
+- Längste Ingest-Pause: größte Lücke im Anstieg der empfangenen Coins (/stats,
+  alle 100ms - /health ist 1s gecacht) - solange ein Flush im Ingest-Loop hängt,
+  liest der Relay keine Frames
+- Max. gleichzeitige Requests an die Senke nach dem Ausfall
+- Zugestellte Coins und Aufholzeit: vom Ausfallende, bis jeder vor dem
+  Ausfallende gesendete Frame bei der Senke angekommen ist
+
+Läufe: N8N_CIRCUIT_FAILURES=5 (Standard) und 0 (Breaker aus, AIMD-Limit bleibt).
+
+Beispiel:
+    python scripts/bench_n8n_outage.py
+    python scripts/bench_n8n_outage.py --mode hang --rate 20 --duration 60 --outage 25
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import aiohttp
+import websockets
+from aiohttp import web
+
+RELAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db_utils import print_table  # noqa: E402
+from replay_relay import free_port, generate_frames, make_unique, wait_for_relay  # noqa: E402
+
+HANG_SECONDS = 20
+
+
+class OutageSink:
+    """Webhook-Senke mit Ausfallfenster"""
+
+    def __init__(self, mode, outage_start, outage):
+        self.mode = mode
+        self.outage_start = outage_start
+        self.outage_end = outage_start + outage
+        self.started = None
+        self.sent_at = []  # monotone Sendezeiten der Frames
+        self.delivered = set()
+        self.caught_up = None
+        self.outage_requests = 0
+        self.inflight = 0
+        self.max_inflight_after = 0
+
+    def in_outage(self):
+        elapsed = time.monotonic() - self.started
+        return self.outage_start <= elapsed < self.outage_end
+
+    async def handle(self, request):
+        self.inflight += 1
+        try:
+            if self.in_outage():
+                self.outage_requests += 1
+                if self.mode == "503":
+                    return web.Response(status=503)
+                await asyncio.sleep(HANG_SECONDS)
+                return web.Response(status=504)
+            if time.monotonic() - self.started >= self.outage_end:
+                self.max_inflight_after = max(self.max_inflight_after, self.inflight)
+            payload = await request.json()
+            self.delivered.update(coin["mint"] for coin in payload["data"])
+            now = time.monotonic()
+            outage_end = self.started + self.outage_end
+            if self.caught_up is None and now >= outage_end:
+                backlog = bisect.bisect_left(self.sent_at, outage_end)
+                if len(self.delivered) >= backlog:
+                    self.caught_up = now - outage_end
+            return web.json_response({"ok": True})
+        finally:
+            self.inflight -= 1
+
+
+async def run_once(frames, failures, args):
+    sink = OutageSink(args.mode, args.outage_start, args.outage)
+    app = web.Application()
+    app.add_routes([web.post("/hook", sink.handle)])
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    sink_port = free_port()
+    await web.TCPSite(runner, "127.0.0.1", sink_port).start()
+
+    sending_done = asyncio.Event()
+
+    async def source(ws):
+        await ws.recv()
+        sink.started = time.monotonic()
+        for i, frame in enumerate(frames):
+            delay = sink.started + i / args.rate - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            sink.sent_at.append(time.monotonic())
+            await ws.send(json.dumps(frame))
+        sending_done.set()
+        await ws.wait_closed()
+
+    ws_server = await websockets.serve(source, "127.0.0.1", 0, compression=None)
+    ws_port = ws_server.sockets[0].getsockname()[1]
+    health_port = free_port()
+    env = dict(os.environ)
+    env.update({
+        "WS_URI": f"ws://127.0.0.1:{ws_port}",
+        "N8N_WEBHOOK_URL": f"http://127.0.0.1:{sink_port}/hook",
+        "N8N_WEBHOOK_METHOD": "POST",
+        "HEALTH_PORT": str(health_port),
+        "BATCH_SIZE": str(args.batch_size),
+        "BATCH_TIMEOUT": "2",
+        "N8N_RETRY_DELAY": "1",
+        "N8N_CIRCUIT_FAILURES": str(failures),
+        "N8N_CIRCUIT_OPEN_SECONDS": str(args.open_seconds),
+        "N8N_CIRCUIT_MAX_OPEN_SECONDS": str(args.max_open_seconds),
+        "BAD_NAMES_PATTERN": "(?!)",
+        "RUGCHECK_ENABLED": "false",
+        "EXCHANGE_RATE_ENABLED": "false",
+        "DEAD_LETTER": "off",
+    })
+    process = subprocess.Popen(
+        [sys.executable, "-u", "main.py"], cwd=RELAY_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    max_stall = 0.0
+    health = {}
+    try:
+        await wait_for_relay(health_port, process)
+        async with aiohttp.ClientSession() as session:
+            last_total, last_change = 0, None
+            deadline = time.monotonic() + args.duration + args.timeout
+            while time.monotonic() < deadline and len(sink.delivered) < len(frames):
+                async with session.get(f"http://127.0.0.1:{health_port}/stats") as resp:
+                    received = (await resp.json())["totals"]["received"]
+                now = time.monotonic()
+                if received > last_total:
+                    if last_change is not None and not sending_done.is_set():
+                        max_stall = max(max_stall, now - last_change)
+                    last_total, last_change = received, now
+                await asyncio.sleep(0.1)
+            async with session.get(f"http://127.0.0.1:{health_port}/health") as resp:
+                health = await resp.json()
+    finally:
+        process.send_signal(signal.SIGINT)
+        try:
+            await asyncio.to_thread(process.wait, 10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        ws_server.close()
+        await ws_server.wait_closed()
+        await runner.cleanup()
+
+    circuit = health.get("circuit", {})
+    return {
+        "breaker": "an" if failures else "aus",
+        "outage_requests": sink.outage_requests,
+        "max_stall": max_stall,
+        "max_inflight_after": sink.max_inflight_after,
+        "delivered": len(sink.delivered),
+        "caught_up": sink.caught_up,
+        "opens": circuit.get("opens"),
+        "rejected": circuit.get("rejected"),
+    }
+
+
+async def bench(args):
+    frames = make_unique(generate_frames(int(args.rate * args.duration), seed=args.seed))
+    rows = []
+    for failures in (5, 0):
+        result = await run_once(frames, failures, args)
+        rows.append((
+            result["breaker"], result["outage_requests"], f"{result['max_stall']:.1f}",
+            result["max_inflight_after"], f"{result['delivered']}/{len(frames)}",
+            f"{result['caught_up']:.1f}" if result["caught_up"] is not None else "-",
+            result["opens"], result["rejected"],
+        ))
+    print(f"🔌 n8n-Ausfall ({args.mode}) von {args.outage_start}s bis {args.outage_start + args.outage}s, "
+          f"{args.rate} Frames/s für {args.duration}s, Batches à {args.batch_size}")
+    print_table(["Breaker", "Requests im Ausfall", "Max. Ingest-Pause s", "Max. parallel danach",
+                 "Zugestellt", "Aufgeholt nach s", "Öffnungen", "Abgelehnt"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("503", "hang"), default="503")
+    parser.add_argument("--rate", type=float, default=20, help="Frames pro Sekunde")
+    parser.add_argument("--duration", type=float, default=40, help="Sekunden mit Frames")
+    parser.add_argument("--outage-start", type=float, default=5)
+    parser.add_argument("--outage", type=float, default=20, help="Dauer des Ausfalls in Sekunden")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--open-seconds", type=int, default=5, help="N8N_CIRCUIT_OPEN_SECONDS")
+    parser.add_argument("--max-open-seconds", type=int, default=10, help="N8N_CIRCUIT_MAX_OPEN_SECONDS")
+    parser.add_argument("--timeout", type=float, default=120, help="Max. Nachlauf nach den Frames")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
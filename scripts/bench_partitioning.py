@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: discovered_coins als Heap-Tabelle vs. partitioniert (sql/partitioned_schema.sql)
+
+Lädt beide Varianten in eigene Schemas (bench_heap / bench_partitioned), füllt sie mit
+den gleichen generierten Daten und vergleicht Insert-Rate und Dashboard-Queries.
+Die Produktivtabellen werden nicht angefasst.
+
+Beispiel:
+    DB_PASSWORD=... python scripts/bench_partitioning.py --rows 1000000 --days 60
+"""
+import argparse
+import statistics
+
+from db_utils import (add_db_arguments, connect, generate_coins, insert_coins, load_sql_file,
+                      print_table, reset_schema, time_query)
+
+DASHBOARD_QUERIES = [
+    ("Neueste 50 Coins",
+     "SELECT token_address, name, market_cap_sol FROM discovered_coins ORDER BY discovered_at DESC LIMIT 50"),
+    ("Anzahl letzte 24h",
+     "SELECT COUNT(*) FROM discovered_coins WHERE discovered_at >= NOW() - INTERVAL '24 hours'"),
+    ("Aktive Coins, neueste 100",
+     "SELECT token_address, symbol FROM discovered_coins WHERE is_active = TRUE "
+     "ORDER BY discovered_at DESC LIMIT 100"),
+    ("Discovery-Rate pro Stunde (7 Tage)",
+     "SELECT date_trunc('hour', discovered_at) AS h, COUNT(*) FROM discovered_coins "
+     "WHERE discovered_at >= NOW() - INTERVAL '7 days' GROUP BY 1 ORDER BY 1"),
+    ("Top 20 Graduation-Progress (View)",
+     "SELECT token_address, graduation_progress_pct FROM discovered_coins_graduation "
+     "ORDER BY graduation_progress_pct DESC LIMIT 20"),
+    ("Lookup per token_address",
+     "SELECT * FROM discovered_coins WHERE token_address = %s"),
+]
+
+
+def setup_variant(conn, schema, partitioned, days):
+    reset_schema(conn, schema)
+    load_sql_file(conn, schema, "complete_schema.sql")
+    if partitioned:
+        load_sql_file(conn, schema, "partitioned_schema.sql")
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT discovered_coins_create_partitions_between(NOW() - %s * INTERVAL '1 day', NOW())",
+            (days + 7,),
+        )
+        cursor.close()
+    load_sql_file(conn, schema, "views.sql")
+
+
+def run_variant(conn, schema, partitioned, args):
+    setup_variant(conn, schema, partitioned, args.days)
+    rows = generate_coins(args.rows, days=args.days, seed=args.seed)
+    total, seconds, batch_rates = insert_coins(conn, "discovered_coins", rows, args.batch_size)
+
+    cursor = conn.cursor()
+    cursor.execute("ANALYZE discovered_coins")
+    cursor.execute("SELECT token_address FROM discovered_coins ORDER BY discovered_at LIMIT 1 OFFSET %s",
+                   (total // 3,))
+    lookup_token = cursor.fetchone()[0]
+    cursor.execute("SELECT pg_total_relation_size('discovered_coins')")
+    size = cursor.fetchone()[0]
+    if partitioned:
+        cursor.execute("""
+            SELECT SUM(pg_total_relation_size(inhrelid))
+            FROM pg_inherits WHERE inhparent = 'discovered_coins'::regclass
+        """)
+        size = cursor.fetchone()[0] or 0
+    cursor.close()
+
+    tail = batch_rates[-max(1, len(batch_rates) // 10):]
+    result = {
+        "insert_rate": total / seconds,
+        "insert_rate_tail": statistics.median(tail) if tail else 0,
+        "size_mb": size / 1024 / 1024,
+        "queries": {},
+    }
+    for label, query in DASHBOARD_QUERIES:
+        params = (lookup_token,) if "%s" in query else None
+        result["queries"][label] = time_query(conn, query, params, runs=args.runs)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    parser.add_argument("--rows", type=int, default=500000)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Benchmark-Schemas nicht löschen")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    print(f"📦 {args.rows:,} Zeilen über {args.days} Tage...")
+    print("⏳ Heap-Tabelle...")
+    heap = run_variant(conn, "bench_heap", False, args)
+    print("⏳ Partitionierte Tabelle...")
+    part = run_variant(conn, "bench_partitioned", True, args)
+
+    print()
+    print_table(
+        ["Messung", "Heap", "Partitioniert"],
+        [
+            ["Inserts/s (gesamt)", f"{heap['insert_rate']:,.0f}", f"{part['insert_rate']:,.0f}"],
+            ["Inserts/s (letzte 10%)", f"{heap['insert_rate_tail']:,.0f}", f"{part['insert_rate_tail']:,.0f}"],
+            ["Größe inkl. Indexe (MB)", f"{heap['size_mb']:,.1f}", f"{part['size_mb']:,.1f}"],
+        ] + [
+            [f"{label} (ms)", f"{heap['queries'][label]:.2f}", f"{part['queries'][label]:.2f}"]
+            for label, _ in DASHBOARD_QUERIES
+        ],
+    )
+
+    if not args.keep:
+        cursor = conn.cursor()
+        cursor.execute("DROP SCHEMA bench_heap CASCADE")
+        cursor.execute("DROP SCHEMA bench_partitioned CASCADE")
+        cursor.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
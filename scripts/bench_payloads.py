@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark der Webhook-Payload-Kodierung (relay/payloads.py)
+
+Pro Batch-Größe und Kodierung (json, msgpack, jeweils ohne/gzip/zstd): Bytes pro
+Batch, Anteil an unkomprimiertem JSON und Kodierzeit pro Batch (Median über
+--runs). Für GET zusätzlich: URL-Länge des ungeteilten Batches (bisheriges
+Verhalten) und wie viele Requests nach der Aufteilung auf --max-url-length
+nötig sind.
+
+Die Coins sind synthetische Frames (wie scripts/replay_relay.py), dekodiert mit
+process_frame() wie im Relay. msgpack/zstandard werden übersprungen, wenn nicht installiert.
+
+Beispiel:
+    python scripts/bench_payloads.py
+    python scripts/bench_payloads.py --batch-size 10 --batch-size 100 --max-url-length 2000
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+RELAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay")
+sys.path.insert(0, RELAY_DIR)
+
+from db_utils import print_table  # noqa: E402
+from payloads import BODY_FORMATS, CONTENT_ENCODINGS, WebhookEncoder  # noqa: E402
+from replay_relay import generate_frames, make_unique  # noqa: E402
+from workers import process_frame  # noqa: E402
+
+WEBHOOK_URL = "https://n8n.example.com/webhook/pump-discover"
+
+
+def make_payload(batch):
+    return {"source": "pump_fun_relay", "count": len(batch), "timestamp": "2026-01-01T00:00:00", "data": batch}
+
+
+def available_encoders():
+    encoders = []
+    for body_format in BODY_FORMATS:
+        for content_encoding in CONTENT_ENCODINGS:
+            try:
+                encoders.append(WebhookEncoder(body_format, content_encoding, compress_min_bytes=0))
+            except RuntimeError as e:
+                print(f"⚠️ {body_format}+{content_encoding} übersprungen: {e}")
+    return encoders
+
+
+def time_encode(encoder, payload, runs):
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        body, _ = encoder.encode_body(payload)
+        times.append(time.perf_counter() - started)
+    return len(body), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, action="append", help="Coins pro Batch (mehrfach möglich)")
+    parser.add_argument("--max-url-length", type=int, default=8000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    batch_sizes = args.batch_size or [10, 50, 100, 500]
+    bad_names = re.compile("(?!)")
+    frames = make_unique(generate_frames(max(batch_sizes), seed=args.seed))
+    coins = [process_frame(json.dumps(frame), bad_names)[1] for frame in frames]
+    encoders = available_encoders()
+
+    rows = []
+    for size in batch_sizes:
+        payload = make_payload(coins[:size])
+        json_bytes = None
+        for encoder in encoders:
+            body_bytes, seconds = time_encode(encoder, payload, args.runs)
+            json_bytes = json_bytes or body_bytes  # erste Kodierung ist json ohne Kompression
+            rows.append((size, encoder.name, body_bytes, f"{body_bytes / size:.0f}",
+                         f"{body_bytes / json_bytes:.0%}", f"{seconds * 1000:.3f}"))
+    print("📦 POST-Body pro Batch")
+    print_table(["Coins", "Kodierung", "Bytes", "Bytes/Coin", "vs. JSON", "Kodieren ms"], rows)
+
+    rows = []
+    encoder = WebhookEncoder(max_url_length=args.max_url_length)
+    for size in batch_sizes:
+        batch = coins[:size]
+        unsplit = len(encoder.get_url(WEBHOOK_URL, make_payload(batch)))
+        times = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            requests = encoder.split_get(WEBHOOK_URL, make_payload, batch)
+            times.append(time.perf_counter() - started)
+        longest = max(len(url) for url, _ in requests)
+        assert sum(len(chunk) for _, chunk in requests) == size
+        rows.append((size, unsplit, len(requests), longest, f"{statistics.median(times) * 1000:.3f}"))
+    print()
+    print(f"🔗 GET mit max. {args.max_url_length} Zeichen URL")
+    print_table(["Coins", "URL ungeteilt", "Requests", "Längste URL", "Aufteilen ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
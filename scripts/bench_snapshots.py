@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark: coin_snapshots (sql/coin_snapshots.sql) mit realistischen Phasen-Zeitreihen
+
+Erzeugt Snapshots im Takt von ref_coin_phases (Baby 5s / Survival 30s / Mature 60s)
+für Coins mit typischer Lebensdauer, zeitlich sortiert wie im Live-Betrieb, und misst:
+- COPY (SnapshotWriter) vs. INSERT (execute_values) - Zeilen pro Sekunde
+- Bytes pro Zeile: schmales Layout vs. "naives" Layout (token_address + NUMERIC)
+- Abfragen: Verlauf eines Coins, Zeitfenster-Aggregate (BRIN)
+- Laufzeit von coin_snapshots_maintain() (Verdichtung Baby Zone + Retention)
+
+Läuft im eigenen Schema bench_snapshots, Produktivtabellen bleiben unberührt.
+
+Beispiel:
+    python scripts/bench_snapshots.py --rows 20000000 --days 14
+"""
+import argparse
+import heapq
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from psycopg2.extras import execute_values
+
+from db_utils import add_db_arguments, connect, load_sql_file, print_table, reset_schema, time_query
+from snapshot_writer import SNAPSHOT_COLUMNS, SnapshotWriter
+
+SCHEMA = "bench_snapshots"
+
+# (phase_id, Intervall in Sekunden, Ende der Phase in Minuten) wie ref_coin_phases
+PHASES = [(1, 5, 10), (2, 30, 60), (3, 60, 1440)]
+
+NAIVE_TABLE_SQL = """
+    CREATE TABLE coin_snapshots_naive (
+        id BIGSERIAL PRIMARY KEY,
+        token_address VARCHAR(64) NOT NULL,
+        ts TIMESTAMPTZ NOT NULL,
+        phase_id INT NOT NULL,
+        price_sol NUMERIC(30, 18),
+        market_cap_sol NUMERIC(20, 6),
+        v_sol_in_bonding_curve NUMERIC(20, 6),
+        volume_sol NUMERIC(20, 6),
+        buy_count INT,
+        sell_count INT,
+        holder_count INT
+    );
+    CREATE INDEX idx_naive_ts ON coin_snapshots_naive(ts);
+    CREATE INDEX idx_naive_token_ts ON coin_snapshots_naive(token_address, ts);
+"""
+
+
+def coin_lifetime_minutes(rnd):
+    """Die meisten Coins sterben in der Baby Zone, wenige laufen bis zu 24h"""
+    roll = rnd.random()
+    if roll < 0.6:
+        return rnd.uniform(1, 10)
+    if roll < 0.85:
+        return rnd.uniform(10, 60)
+    return rnd.uniform(60, 1440)
+
+
+def coin_series(stream_id, start, lifetime_minutes, rnd):
+    """Snapshots eines Coins im Phasen-Takt (Random Walk für Preis/Volumen)"""
+    price = rnd.uniform(2e-8, 6e-8)
+    holders = 1
+    offset = 0.0
+    end = lifetime_minutes * 60
+    for phase_id, interval, phase_end_minutes in PHASES:
+        while offset < min(end, phase_end_minutes * 60):
+            price *= rnd.lognormvariate(0, 0.03)
+            buys = rnd.randint(0, 12)
+            sells = rnd.randint(0, 8)
+            holders = max(1, holders + buys - sells // 2)
+            yield (
+                start + timedelta(seconds=offset),
+                stream_id,
+                price,
+                price * 1e9,
+                30 + price * 1e9 / 10,
+                rnd.uniform(0, 5) * (buys + sells),
+                buys,
+                sells,
+                holders,
+                phase_id,
+            )
+            offset += interval
+
+
+def generate_snapshots(rows, days, seed=42, end=None):
+    """Zeitlich sortierte Snapshots (wie live eingehend) bis `rows` erreicht ist"""
+    rnd = random.Random(seed)
+    end = end or datetime.now(timezone.utc)
+    start = end - timedelta(days=days)
+    # ~215 Snapshots pro Coin im Mittel → Anzahl Coins grob abschätzen
+    coins = max(1, rows // 200)
+    step = (end - start - timedelta(days=1)) / coins
+    series = [
+        coin_series(stream_id, start + step * stream_id, coin_lifetime_minutes(rnd), random.Random(seed + stream_id))
+        for stream_id in range(coins)
+    ]
+    for i, row in enumerate(heapq.merge(*series)):
+        if i >= rows:
+            return
+        yield row
+
+
+def bench_insert(conn, rows, batch_size):
+    """INSERT per execute_values als Vergleich zu COPY"""
+    cursor = conn.cursor()
+    sql = f"INSERT INTO coin_snapshots ({', '.join(SNAPSHOT_COLUMNS)}) VALUES %s"
+    batch = []
+    total = 0
+    started = time.perf_counter()
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            execute_values(cursor, sql, batch, page_size=batch_size)
+            total += len(batch)
+            batch = []
+    if batch:
+        execute_values(cursor, sql, batch, page_size=batch_size)
+        total += len(batch)
+    cursor.close()
+    return total / (time.perf_counter() - started)
+
+
+def bench_copy(conn, rows, batch_size):
+    writer = SnapshotWriter(conn, batch_size=batch_size, flush_interval=3600)
+    started = time.perf_counter()
+    writer.add_many(rows)
+    writer.close()
+    return writer.written, writer.written / (time.perf_counter() - started)
+
+
+def bench_naive(conn, rows, batch_size):
+    """Gleiche Daten im naiven Layout - nur für den Größenvergleich"""
+    cursor = conn.cursor()
+    cursor.execute(NAIVE_TABLE_SQL)
+    sql = ("INSERT INTO coin_snapshots_naive (ts, token_address, price_sol, market_cap_sol, "
+           "v_sol_in_bonding_curve, volume_sol, buy_count, sell_count, holder_count, phase_id) VALUES %s")
+    batch = []
+    for row in rows:
+        # Token-Adresse wie in discovered_coins (44 Zeichen + "pump")
+        batch.append((row[0], f"{row[1]:044d}pump") + row[2:])
+        if len(batch) >= batch_size:
+            execute_values(cursor, sql, batch, page_size=batch_size)
+            batch = []
+    if batch:
+        execute_values(cursor, sql, batch, page_size=batch_size)
+    cursor.execute("VACUUM ANALYZE coin_snapshots_naive")
+    cursor.execute("""
+        SELECT pg_relation_size('coin_snapshots_naive'), pg_indexes_size('coin_snapshots_naive'),
+               COUNT(*) FROM coin_snapshots_naive
+    """)
+    result = cursor.fetchone()
+    cursor.execute("DROP TABLE coin_snapshots_naive")
+    cursor.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    parser.add_argument("--rows", type=int, default=20000000)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--compare-rows", type=int, default=500000,
+                        help="Zeilen für den INSERT- und Layout-Vergleich")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Benchmark-Schema nicht löschen")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    end = datetime.now(timezone.utc)
+    reset_schema(conn, SCHEMA)
+    load_sql_file(conn, SCHEMA, "complete_schema.sql")
+    load_sql_file(conn, SCHEMA, "coin_snapshots.sql")
+    cursor = conn.cursor()
+
+    print(f"📦 Vergleich INSERT vs. COPY und Layout mit {args.compare_rows:,} Snapshots...")
+    insert_rate = bench_insert(conn, generate_snapshots(args.compare_rows, args.days, args.seed, end),
+                               args.batch_size)
+    cursor.execute("TRUNCATE coin_snapshots")
+    _, copy_rate_small = bench_copy(conn, generate_snapshots(args.compare_rows, args.days, args.seed, end),
+                                    args.batch_size)
+    cursor.execute("VACUUM ANALYZE coin_snapshots")
+    cursor.execute("SELECT pg_relation_size('coin_snapshots'), pg_indexes_size('coin_snapshots')")
+    compact_table, compact_indexes = cursor.fetchone()
+    naive_table, naive_indexes, naive_rows = bench_naive(
+        conn, generate_snapshots(args.compare_rows, args.days, args.seed, end), args.batch_size)
+    cursor.execute("TRUNCATE coin_snapshots")
+
+    print(f"⏳ {args.rows:,} Snapshots über {args.days} Tage per COPY...")
+    total, copy_rate = bench_copy(conn, generate_snapshots(args.rows, args.days, args.seed, end), args.batch_size)
+    cursor.execute("VACUUM ANALYZE coin_snapshots")
+    cursor.execute("""
+        SELECT pg_relation_size('coin_snapshots'),
+               pg_relation_size('idx_coin_snapshots_ts_brin'),
+               pg_relation_size('idx_coin_snapshots_stream_ts')
+    """)
+    table_size, brin_size, btree_size = cursor.fetchone()
+    cursor.execute("SELECT stream_id FROM coin_snapshots GROUP BY stream_id ORDER BY COUNT(*) DESC LIMIT 1")
+    stream_id = cursor.fetchone()[0]
+    cursor.execute("SELECT MAX(ts) FROM coin_snapshots")
+    latest = cursor.fetchone()[0]
+
+    queries = [
+        ("Verlauf eines Coins (alle Snapshots)",
+         "SELECT ts, price_sol FROM coin_snapshots WHERE stream_id = %s ORDER BY ts", (stream_id,)),
+        ("Letzte Stunde: Snapshots pro Phase",
+         "SELECT phase_id, COUNT(*), AVG(market_cap_sol) FROM coin_snapshots "
+         "WHERE ts >= %s - INTERVAL '1 hour' GROUP BY phase_id", (latest,)),
+        ("1h-Fenster vor 3 Tagen: Volumen",
+         "SELECT SUM(volume_sol) FROM coin_snapshots "
+         "WHERE ts BETWEEN %s - INTERVAL '3 days' AND %s - INTERVAL '3 days' + INTERVAL '1 hour'",
+         (latest, latest)),
+    ]
+    timings = [(label, time_query(conn, sql, params, runs=args.runs)) for label, sql, params in queries]
+
+    print("⏳ coin_snapshots_maintain() (Baby Zone > 1 Tag verdichten, Retention 30 Tage)...")
+    started = time.perf_counter()
+    cursor.execute("SELECT action, affected_rows FROM coin_snapshots_maintain(p_lookback => %s::INTERVAL)",
+                   (f"{args.days + 1} days",))
+    maintenance = cursor.fetchall()
+    maintain_seconds = time.perf_counter() - started
+    cursor.execute("SELECT COUNT(*) FROM coin_snapshots_1m")
+    candles = cursor.fetchone()[0]
+
+    print()
+    print_table(
+        ["Messung", "Wert"],
+        [
+            [f"INSERT (execute_values), {args.compare_rows:,} Zeilen", f"{insert_rate:,.0f} Zeilen/s"],
+            [f"COPY (SnapshotWriter), {args.compare_rows:,} Zeilen", f"{copy_rate_small:,.0f} Zeilen/s"],
+            [f"COPY (SnapshotWriter), {total:,} Zeilen", f"{copy_rate:,.0f} Zeilen/s"],
+            ["Bytes/Zeile Tabelle (schmal / naiv)",
+             f"{compact_table / args.compare_rows:.0f} / {naive_table / max(naive_rows, 1):.0f}"],
+            ["Bytes/Zeile Indexe (schmal / naiv)",
+             f"{compact_indexes / args.compare_rows:.0f} / {naive_indexes / max(naive_rows, 1):.0f}"],
+            ["Tabellengröße", f"{table_size / 1024 / 1024:,.0f} MB"],
+            ["BRIN (ts) / B-Tree (stream_id, ts)",
+             f"{brin_size / 1024:,.0f} KB / {btree_size / 1024 / 1024:,.0f} MB"],
+        ] + [[f"{label} (ms)", f"{ms:.2f}"] for label, ms in timings] + [
+            [f"Wartung: {action}", f"{rows:,}"] for action, rows in maintenance
+        ] + [
+            ["Wartung: Laufzeit", f"{maintain_seconds:.1f} s"],
+            ["1-Minuten-Kerzen gesamt", f"{candles:,}"],
+        ],
+    )
+
+    cursor.close()
+    if not args.keep:
+        cursor = conn.cursor()
+        cursor.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+        cursor.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark des Stream-Sinks (relay/stream_sink.py): XADD pro Pipeline und Consumer-Groups
+
+1. Schreibrate: dieselben Coins mit verschiedenen Pipeline-Größen (--batch-size,
+   1 = ein Roundtrip pro Coin) → Coins/s, µs pro Coin, Stream-Länge nach MAXLEN ~
+2. Consumer-Groups: Coins über add()/run() wie im Relay schreiben, zwei Gruppen
+   lesen unabhängig (XREADGROUP + XACK) - "analytics" alles, "tracker" nur die
+   Hälfte → Rückstand (lag) und offene Einträge je Gruppe
+
+Ohne --redis-url startet ein lokaler fakeredis-TCP-Server (pip install fakeredis),
+echte Roundtrips über den Socket, aber keine Redis-Performance - für belastbare
+Zahlen gegen einen echten Server messen. Die Bench-Streams werden danach gelöscht.
+
+Beispiel:
+    python scripts/bench_stream_sink.py --count 20000
+    python scripts/bench_stream_sink.py --redis-url redis://localhost:6379/0 --batch-size 1 --batch-size 100
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+RELAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay")
+sys.path.insert(0, RELAY_DIR)
+
+from db_utils import print_table  # noqa: E402
+from replay_relay import generate_frames, make_unique  # noqa: E402
+from stream_sink import RedisStreamSink, connect  # noqa: E402
+
+
+def start_fake_server(port):
+    """fakeredis als TCP-Server im Hintergrund-Thread"""
+    try:
+        from fakeredis import TcpFakeServer
+    except ImportError:
+        raise SystemExit("❌ Ohne --redis-url wird fakeredis benötigt (pip install fakeredis)")
+
+    class Server(TcpFakeServer):
+        def get_request(self):
+            # Antworten sofort senden (ohne Nagle wartet jede zweite kleine Antwort auf das ACK)
+            conn, address = super().get_request()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return conn, address
+
+    server = Server(("127.0.0.1", port), server_type="redis")
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def bench_write(client, coins, batch_size, maxlen):
+    stream = f"bench:coins:{batch_size}"
+    await client.delete(stream)
+    sink = RedisStreamSink(client, stream, maxlen=maxlen, batch_size=batch_size)
+    started = time.perf_counter()
+    for i in range(0, len(coins), batch_size):
+        await sink.publish(coins[i:i + batch_size])
+    elapsed = time.perf_counter() - started
+    length = await client.xlen(stream)
+    await client.delete(stream)
+    return elapsed, length, sink.stats["pipelines"]
+
+
+async def consume(client, stream, group, limit, count=500):
+    """Gruppe liest bis `limit` Einträge und bestätigt sie"""
+    read = 0
+    while read < limit:
+        response = await client.xreadgroup(group, f"{group}-1", {stream: ">"}, count=min(count, limit - read), block=500)
+        if not response:
+            break
+        entries = response[0][1]
+        await client.xack(stream, group, *(entry_id for entry_id, _ in entries))
+        read += len(entries)
+    return read
+
+
+async def bench_groups(client, coins, batch_size, maxlen):
+    stream = "bench:coins:groups"
+    await client.delete(stream)
+    sink = RedisStreamSink(client, stream, maxlen=maxlen, batch_size=batch_size, flush_interval=0.05)
+    await sink.ensure_groups(["analytics", "tracker"])
+    writer = asyncio.create_task(sink.run())
+    started = time.perf_counter()
+    for coin in coins:
+        sink.add(coin)
+    while sink.queue:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    writer.cancel()
+    analytics, tracker = await asyncio.gather(
+        consume(client, stream, "analytics", len(coins)),
+        consume(client, stream, "tracker", len(coins) // 2),
+    )
+    length, groups = await sink.stream_info()
+    await client.delete(stream)
+    return elapsed, length, {"analytics": analytics, "tracker": tracker}, groups
+
+
+async def run(args):
+    server = None
+    url = args.redis_url
+    if not url:
+        server = start_fake_server(args.port)
+        url = f"redis://127.0.0.1:{args.port}/0"
+    client = connect(url)
+    await client.ping()
+    coins = make_unique(generate_frames(args.count, seed=args.seed))
+    print(f"🌊 {len(coins)} Coins → {url if args.redis_url else 'fakeredis (lokal, TCP)'}, MAXLEN ~{args.maxlen}")
+
+    rows = []
+    baseline = None
+    for batch_size in args.batch_size or [1, 10, 100, 500]:
+        elapsed, length, pipelines = await bench_write(client, coins, batch_size, args.maxlen)
+        rate = len(coins) / elapsed
+        baseline = baseline or rate
+        rows.append((batch_size, pipelines, f"{rate:.0f}", f"{elapsed / len(coins) * 1e6:.0f}",
+                     f"{rate / baseline:.1f}x", length))
+    print_table(["XADD/Pipeline", "Pipelines", "Coins/s", "µs/Coin", "vs. erste", "XLEN danach"], rows)
+
+    # Nicht mehr Coins als MAXLEN, sonst kürzt der Stream, was "tracker" noch lesen würde
+    group_coins = coins[:args.maxlen]
+    elapsed, length, read, groups = await bench_groups(client, group_coins, args.group_batch_size, args.maxlen)
+    print()
+    print(f"Consumer-Groups: {len(group_coins)} Coins per add()/run() in {elapsed:.2f}s geschrieben, XLEN {length}")
+    print_table(["Gruppe", "Gelesen", "Offen (pending)", "Rückstand (lag)"],
+                [(name, read[name], info["pending"], info["lag"]) for name, info in sorted(groups.items())])
+
+    await client.aclose()
+    if server:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", help="Redis-Server (sonst lokaler fakeredis-TCP-Server)")
+    parser.add_argument("--port", type=int, default=16379, help="Port des lokalen fakeredis-Servers")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, action="append", help="XADD pro Pipeline (mehrfach möglich)")
+    parser.add_argument("--group-batch-size", type=int, default=100, help="STREAM_BATCH_SIZE für den Gruppen-Test")
+    parser.add_argument("--maxlen", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
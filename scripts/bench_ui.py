@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Kaltstart und Rerun-Zeiten der Streamlit UI (ohne Browser)
+
+Führt ui/app.py mit streamlit.testing (AppTest) aus. Jeder Tab startet in einem
+eigenen Python-Prozess kalt (erster Run inkl. aller Imports), danach folgen
+--reruns Reruns im selben Tab. Ausgegeben werden pro Tab:
+- Kaltstart und Import-Zeit des Tab-Moduls (aus ui/timing.py)
+- p50/p95 der Reruns
+- ob pandas / psycopg2 geladen wurden (sollen nur die Tabs laden, die sie brauchen)
+
+Die Zeiten enthalten den Overhead von AppTest, sind also zum Vergleich zweier
+Stände gedacht, nicht als absolute Browser-Zeiten. Ohne erreichbaren Relay
+schlagen die Anfragen sofort fehl - für realistische Werte RELAY_SERVICE und
+RELAY_PORT wie in der UI setzen.
+
+Beispiel:
+    RELAY_SERVICE=localhost python scripts/bench_ui.py --reruns 20
+    python scripts/bench_ui.py --tab Logs --tab Info
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui", "app.py")
+
+
+def load_tab_labels(app):
+    """Tab-Labels aus der TABS-Tabelle in app.py (ohne die App auszuführen)"""
+    with open(app) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "TABS" for t in node.targets):
+            return [label for label, _ in ast.literal_eval(node.value)]
+    raise SystemExit(f"❌ Keine TABS-Tabelle in {app} gefunden")
+
+
+def measure(app, label, reruns):
+    """Läuft im Kind-Prozess: Kaltstart + Reruns eines Tabs, Ergebnis als JSON auf stdout"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app, default_timeout=60)
+    at.session_state["main_tab"] = label
+    started = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - started
+    if at.exception:
+        raise SystemExit(f"❌ Fehler im Tab {label}: {at.exception[0].message}")
+
+    durations = []
+    for _ in range(reruns):
+        started = time.perf_counter()
+        at.run()
+        durations.append(time.perf_counter() - started)
+    durations.sort()
+
+    timing = sys.modules.get("timing")
+    imports = timing.snapshot()["imports_ms"] if timing else {}
+    print(json.dumps({
+        "tab": label,
+        "cold_ms": round(cold * 1000, 1),
+        "import_ms": sum(imports.values()),
+        "p50_ms": round(durations[len(durations) // 2] * 1000, 1) if durations else None,
+        "p95_ms": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))] * 1000, 1) if durations else None,
+        "pandas": "pandas" in sys.modules,
+        "psycopg2": "psycopg2" in sys.modules,
+    }))
+
+
+def run_child(app, label, reruns):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--app", app, "--child", label, "--reruns", str(reruns)],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit(f"❌ Messung für {label} fehlgeschlagen")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default=DEFAULT_APP, help="Pfad zu ui/app.py")
+    parser.add_argument("--reruns", type=int, default=10, help="Reruns pro Tab nach dem Kaltstart")
+    parser.add_argument("--tab", action="append", help="Nur Tabs, deren Label diesen Text enthält (mehrfach möglich)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    app = os.path.abspath(args.app)
+
+    if args.child:
+        measure(app, args.child, args.reruns)
+        return
+
+    labels = load_tab_labels(app)
+    if args.tab:
+        labels = [label for label in labels if any(part in label for part in args.tab)]
+    print(f"⏱️ {len(labels)} Tabs, je ein kalter Prozess + {args.reruns} Reruns ({app})")
+
+    rows = []
+    for label in labels:
+        result = run_child(app, label, args.reruns)
+        rows.append((
+            label, f"{result['cold_ms']:.0f}", f"{result['import_ms']:.0f}",
+            f"{result['p50_ms']:.0f}" if result["p50_ms"] is not None else "-",
+            f"{result['p95_ms']:.0f}" if result["p95_ms"] is not None else "-",
+            "ja" if result["pandas"] else "nein", "ja" if result["psycopg2"] else "nein",
+        ))
+
+    # Erst hier importieren: db_utils lädt psycopg2, das soll in den Messprozessen nicht vorab geladen sein
+    from db_utils import print_table
+    print_table(["Tab", "Kaltstart ms", "Tab-Import ms", "Rerun p50 ms", "Rerun p95 ms", "pandas", "psycopg2"], rows)
+
+
+if __name__ == "__main__":
+    main()
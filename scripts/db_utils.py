@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Gemeinsame Datenbank-Helfer für die Scripts in scripts/ (Benchmarks, Wartung)
+
+- DB-Verbindung über die gleichen Variablen wie UI/Relay (DB_HOST, DB_PORT, ...)
+- Reproduzierbarer Generator für discovered_coins-Zeilen
+- SQL-Dateien in ein eigenes Schema laden (Benchmarks laufen isoliert)
+- Zeitmessung (Median über mehrere Läufe)
+"""
+import os
+import random
+import statistics
+import string
+import time
+from datetime import datetime, timedelta, timezone
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+SQL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sql")
+
+BASE58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+COIN_COLUMNS = [
+    "token_address", "symbol", "name", "signature", "trader_public_key",
+    "bonding_curve_key", "pool_address", "v_tokens_in_bonding_curve", "v_sol_in_bonding_curve",
+    "initial_buy_sol", "initial_buy_tokens", "discovered_at", "token_created_at",
+    "price_sol", "market_cap_sol", "liquidity_sol", "phase_id",
+    "is_active", "is_graduated", "risk_score", "social_count",
+    "metadata_is_mutable", "mint_authority_enabled", "classification",
+]
+
+
+def add_db_arguments(parser):
+    """Fügt die Standard-DB-Argumente hinzu (Defaults aus Environment Variables)"""
+    parser.add_argument("--db-host", default=os.getenv("DB_HOST", "localhost"))
+    parser.add_argument("--db-port", default=os.getenv("DB_PORT", "5432"))
+    parser.add_argument("--db-name", default=os.getenv("DB_NAME", "pump_discover"))
+    parser.add_argument("--db-user", default=os.getenv("DB_USER", "postgres"))
+    parser.add_argument("--db-password", default=os.getenv("DB_PASSWORD", ""))
+
+
+def connect(args):
+    conn = psycopg2.connect(
+        host=args.db_host,
+        port=args.db_port,
+        database=args.db_name,
+        user=args.db_user,
+        password=args.db_password,
+    )
+    conn.set_client_encoding("UTF8")
+    conn.autocommit = True
+    return conn
+
+
+def random_key(rnd, length=44):
+    return "".join(rnd.choice(BASE58) for _ in range(length))
+
+
+def generate_coins(count, days=30, seed=42, end=None):
+    """Erzeugt `count` realistische discovered_coins-Zeilen, zeitlich aufsteigend über `days` Tage"""
+    rnd = random.Random(seed)
+    end = end or datetime.now(timezone.utc)
+    start = end - timedelta(days=days)
+    step = (end - start) / max(count, 1)
+    # Wiederkehrende Creator (Serien-Deployer) wie in echten Daten
+    traders = [random_key(rnd) for _ in range(max(10, count // 20))]
+
+    for i in range(count):
+        discovered_at = start + step * i
+        v_tokens = rnd.uniform(8e8, 1.07e9)
+        v_sol = rnd.uniform(28, 45)
+        market_cap = rnd.lognormvariate(3.5, 0.6)
+        symbol = "".join(rnd.choice(string.ascii_uppercase) for _ in range(rnd.randint(3, 6)))
+        age_days = (end - discovered_at).days
+        yield (
+            random_key(rnd, 40) + "pump",
+            symbol,
+            symbol.title() + " Coin",
+            random_key(rnd, 88),
+            rnd.choice(traders),
+            random_key(rnd),
+            random_key(rnd),
+            v_tokens,
+            v_sol,
+            rnd.uniform(0, 5),
+            rnd.uniform(0, 1e8),
+            discovered_at,
+            discovered_at - timedelta(seconds=rnd.randint(0, 5)),
+            market_cap / v_tokens,
+            market_cap,
+            v_sol,
+            1 if age_days == 0 else rnd.choice([2, 3, 99]),
+            age_days < 1,
+            rnd.random() < 0.01,
+            rnd.randint(0, 100),
+            rnd.choice([0, 0, 0, 1, 1, 2, 3, 4]),
+            rnd.random() < 0.1,
+            rnd.random() < 0.02,
+            "UNKNOWN",
+        )
+
+
+def insert_coins(conn, table, rows, batch_size=1000):
+    """Fügt Zeilen batchweise ein und liefert (Anzahl, Sekunden, Rate pro Batch-Liste)"""
+    cursor = conn.cursor()
+    sql = f"INSERT INTO {table} ({', '.join(COIN_COLUMNS)}) VALUES %s"
+    batch = []
+    total = 0
+    batch_rates = []
+    started = time.perf_counter()
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            t0 = time.perf_counter()
+            execute_values(cursor, sql, batch, page_size=batch_size)
+            batch_rates.append(len(batch) / (time.perf_counter() - t0))
+            total += len(batch)
+            batch = []
+    if batch:
+        execute_values(cursor, sql, batch, page_size=batch_size)
+        total += len(batch)
+    cursor.close()
+    return total, time.perf_counter() - started, batch_rates
+
+
+def load_sql_file(conn, schema, filename):
+    """Führt eine SQL-Datei aus sql/ innerhalb eines eigenen Schemas aus"""
+    with open(os.path.join(SQL_DIR, filename)) as f:
+        script = f.read()
+    cursor = conn.cursor()
+    cursor.execute(f"SET search_path TO {schema}, public")
+    cursor.execute(script)
+    cursor.close()
+
+
+def reset_schema(conn, schema):
+    cursor = conn.cursor()
+    cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {schema}")
+    cursor.execute(f"SET search_path TO {schema}, public")
+    cursor.close()
+
+
+def time_query(conn, query, params=None, runs=5):
+    """Median-Laufzeit einer Query in Millisekunden (erster Lauf wärmt den Cache)"""
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    cursor.fetchall()
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        cursor.execute(query, params)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - t0) * 1000)
+    cursor.close()
+    return statistics.median(timings)
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print(" | ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("-+-".join("-" * w for w in widths))
+    for row in rows:
+        print(" | ".join(str(c).ljust(w) for c, w in zip(row, widths)))
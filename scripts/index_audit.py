@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Index-Audit für discovered_coins
+
+report  - Analysiert eine laufende Datenbank: Nutzung (pg_stat_user_indexes), Größe,
+          Selektivität der führenden Spalte (pg_stats) und gibt Empfehlungen aus.
+bench   - Reproduzierbarer Benchmark auf generierten Daten: Original-Indexe
+          (complete_schema.sql) vs. sql/optimized_indexes.sql. Misst Insert-Rate,
+          WAL-Volumen pro Zeile, Indexgröße, Query-Laufzeiten und welche Indexe
+          der Workload tatsächlich nutzt.
+
+Beide prüfen außerdem die Pläne der Coin-Explorer-Abfragen der UI (Keyset-Pagination,
+ui/explorer_sql.py): welcher Index genutzt wird und ob eine Seite sequentiell liest.
+
+Beispiele:
+    python scripts/index_audit.py report
+    python scripts/index_audit.py bench --rows 500000 --seed 42
+"""
+import argparse
+import os
+import sys
+
+from db_utils import (add_db_arguments, connect, generate_coins, insert_coins, load_sql_file,
+                      print_table, reset_schema, time_query)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+from explorer_sql import page_query, plan_scans  # noqa: E402
+
+# Typische Abfragen aus Dashboard, Grafana, Views und Ad-hoc-Analysen
+WORKLOAD = [
+    ("Neueste 50 Coins",
+     "SELECT token_address FROM discovered_coins ORDER BY discovered_at DESC LIMIT 50"),
+    ("Aktive Coins, neueste 100",
+     "SELECT token_address FROM discovered_coins WHERE is_active = TRUE ORDER BY discovered_at DESC LIMIT 100"),
+    ("Nahe Graduierung (View)",
+     "SELECT token_address FROM discovered_coins_near_graduation LIMIT 20"),
+    ("Graduierte Coins",
+     "SELECT token_address FROM discovered_coins WHERE is_graduated = TRUE ORDER BY discovered_at DESC LIMIT 50"),
+    ("Mint Authority aktiv (24h)",
+     "SELECT COUNT(*) FROM discovered_coins WHERE mint_authority_enabled = TRUE "
+     "AND discovered_at >= NOW() - INTERVAL '24 hours'"),
+    ("Phase 1, neueste 100",
+     "SELECT token_address FROM discovered_coins WHERE phase_id = 1 ORDER BY discovered_at DESC LIMIT 100"),
+    ("Social Count >= 3, neueste 100",
+     "SELECT token_address FROM discovered_coins WHERE social_count >= 3 ORDER BY discovered_at DESC LIMIT 100"),
+    ("Token erstellt in 1h-Fenster",
+     "SELECT COUNT(*) FROM discovered_coins WHERE token_created_at "
+     "BETWEEN NOW() - INTERVAL '3 days' AND NOW() - INTERVAL '3 days' + INTERVAL '1 hour'"),
+    ("Coins eines Creators",
+     "SELECT token_address FROM discovered_coins WHERE trader_public_key = %s"),
+]
+
+# Filter des Coin-Explorers (UI), deren Pläne geprüft werden; "%trader" wird ersetzt
+EXPLORER_CASES = [
+    ("Ohne Filter", {}),
+    ("Phase 2", {"phase_id": 2}),
+    ("Socials >= 3", {"min_social_count": 3}),
+    ("Risiko <= 10", {"max_risk_score": 10}),
+    ("Creator", {"trader_public_key": "%trader"}),
+    ("Phase 2 + Socials >= 3 + Risiko <= 30", {"phase_id": 2, "min_social_count": 3, "max_risk_score": 30}),
+]
+
+INDEX_STATS_SQL = """
+    SELECT s.indexrelname,
+           s.idx_scan,
+           s.idx_tup_read,
+           pg_relation_size(s.indexrelid) AS size_bytes,
+           pg_get_indexdef(s.indexrelid) AS definition,
+           i.indisunique OR i.indisprimary AS is_unique,
+           a.attname AS leading_column,
+           ps.n_distinct
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    LEFT JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+    LEFT JOIN pg_stats ps ON ps.schemaname = s.schemaname AND ps.tablename = s.relname
+                          AND ps.attname = a.attname
+    WHERE s.relname = %s AND s.schemaname = current_schema()
+    ORDER BY s.idx_scan, size_bytes DESC
+"""
+
+
+def fetch_index_stats(conn, table="discovered_coins"):
+    cursor = conn.cursor()
+    cursor.execute(INDEX_STATS_SQL, (table,))
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def recommendation(idx_scan, n_distinct, is_unique, definition):
+    """Einfache Heuristik: ungenutzt / geringe Selektivität / ok"""
+    if is_unique:
+        return "Constraint - behalten"
+    if "WHERE" in definition or "USING brin" in definition:
+        return "ok (partial/BRIN)"
+    if idx_scan == 0:
+        return "ungenutzt → löschen?"
+    # n_distinct > 0: absolute Anzahl unterschiedlicher Werte; < 0: Anteil der Zeilen
+    if n_distinct is not None and 0 < n_distinct <= 10:
+        return f"nur {int(n_distinct)} Werte → Partial/Composite"
+    return "ok"
+
+
+def explorer_plans(conn, trader, page=20, limit=50):
+    """Pläne der Explorer-Abfragen (erste Seite und Seite `page` per Keyset)
+
+    Liefert Zeilen (Abfrage, Seite, genutzte Indexe, Seq Scan?, Laufzeit ms).
+    """
+    cursor = conn.cursor()
+    rows = []
+    for label, filters in EXPLORER_CASES:
+        filters = {name: trader if value == "%trader" else value for name, value in filters.items()}
+        after = None
+        for page_number in range(1, page + 1):
+            if page_number in (1, page):
+                query, params = page_query(filters, after, limit)
+                cursor.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + query, params)
+                plan = cursor.fetchone()[0]
+                scans = plan_scans(plan)
+                indexes = sorted({index for _, _, index in scans if index})
+                seq_scan = any(node_type == "Seq Scan" for node_type, _, _ in scans)
+                rows.append((label, page_number, ", ".join(indexes) or "-", "⚠️ ja" if seq_scan else "nein",
+                             f"{plan[0]['Execution Time']:.2f}"))
+            query, params = page_query(filters, after, limit)
+            cursor.execute(query, params)
+            result = cursor.fetchall()
+            if len(result) <= limit:
+                break
+            after = (result[limit - 1][0], result[limit - 1][1])
+    cursor.close()
+    return rows
+
+
+def print_explorer_plans(rows):
+    print_table(["Explorer-Abfrage", "Seite", "Index", "Seq Scan", "ms"], rows)
+    if any(row[3] != "nein" for row in rows):
+        print("⚠️ Mindestens eine Explorer-Abfrage liest die Tabelle sequentiell")
+
+
+def cmd_report(args):
+    conn = connect(args)
+    cursor = conn.cursor()
+    cursor.execute("SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()")
+    stats_reset = cursor.fetchone()[0]
+    cursor.execute("SELECT n_live_tup, n_tup_ins FROM pg_stat_user_tables WHERE relname = 'discovered_coins'")
+    table_stats = cursor.fetchone()
+    cursor.close()
+
+    rows = fetch_index_stats(conn)
+    if not rows:
+        print("❌ Keine Indexe für discovered_coins gefunden (falsches Schema/DB?)")
+        return
+
+    print(f"📊 Index-Nutzung für discovered_coins (Statistik seit: {stats_reset or 'Start'})")
+    if table_stats:
+        print(f"   Zeilen: {table_stats[0]:,} | Inserts seit Reset: {table_stats[1]:,}")
+    print()
+    total_size = 0
+    table_rows = []
+    for name, idx_scan, tup_read, size, definition, is_unique, column, n_distinct in rows:
+        total_size += size
+        table_rows.append([
+            name, f"{idx_scan:,}", f"{tup_read:,}", f"{size / 1024 / 1024:.1f}",
+            "-" if n_distinct is None else f"{n_distinct:g}",
+            recommendation(idx_scan, n_distinct, is_unique, definition),
+        ])
+    print_table(["Index", "Scans", "Tupel gelesen", "MB", "n_distinct", "Empfehlung"], table_rows)
+    print()
+    print(f"Indexe gesamt: {len(rows)} ({total_size / 1024 / 1024:.1f} MB) - jeder Insert aktualisiert alle")
+    print("💡 Alternative: sql/optimized_indexes.sql (Vergleich: python scripts/index_audit.py bench)")
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT trader_public_key FROM discovered_coins ORDER BY discovered_at DESC LIMIT 1")
+    trader = cursor.fetchone()
+    cursor.close()
+    if trader:
+        print()
+        print("🔎 Coin-Explorer (UI): Pläne der Keyset-Abfragen")
+        print_explorer_plans(explorer_plans(conn, trader[0]))
+    conn.close()
+
+
+def run_variant(conn, schema, optimized, args):
+    reset_schema(conn, schema)
+    load_sql_file(conn, schema, "complete_schema.sql")
+    load_sql_file(conn, schema, "views.sql")
+    if optimized:
+        load_sql_file(conn, schema, "optimized_indexes.sql")
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT pg_current_wal_insert_lsn()")
+    wal_start = cursor.fetchone()[0]
+    total, seconds, _ = insert_coins(conn, "discovered_coins", generate_coins(args.rows, args.days, args.seed),
+                                     args.batch_size)
+    cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)", (wal_start,))
+    wal_bytes = cursor.fetchone()[0]
+    # VACUUM fasst auch neue BRIN-Ranges zusammen (in Produktion: autovacuum/autosummarize)
+    cursor.execute("VACUUM ANALYZE discovered_coins")
+    cursor.execute("SELECT pg_indexes_size('discovered_coins'), pg_relation_size('discovered_coins')")
+    index_size, table_size = cursor.fetchone()
+    cursor.execute("""
+        SELECT trader_public_key FROM discovered_coins
+        GROUP BY trader_public_key ORDER BY COUNT(*) DESC LIMIT 1
+    """)
+    trader = cursor.fetchone()[0]
+    cursor.close()
+    # Index-Scans vor dem Workload merken (kein pg_stat_reset - würde Produktiv-Statistiken löschen)
+    scans_before = {name: idx_scan for name, idx_scan, *_ in fetch_index_stats(conn)}
+
+    timings = {}
+    for label, query in WORKLOAD:
+        timings[label] = time_query(conn, query, (trader,) if "%s" in query else None, runs=args.runs)
+
+    # Ab PostgreSQL 15 werden Statistiken verzögert geschrieben - sofort flushen
+    if conn.server_version >= 150000:
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_stat_force_next_flush()")
+        cursor.close()
+    used = [(name, idx_scan - scans_before.get(name, 0)) for name, idx_scan, *_ in fetch_index_stats(conn)]
+    plans = explorer_plans(conn, trader)
+
+    return {
+        "insert_rate": total / seconds,
+        "wal_per_row": wal_bytes / max(total, 1),
+        "index_mb": index_size / 1024 / 1024,
+        "table_mb": table_size / 1024 / 1024,
+        "timings": timings,
+        "index_usage": used,
+        "explorer_plans": plans,
+    }
+
+
+def cmd_bench(args):
+    conn = connect(args)
+    print(f"📦 {args.rows:,} generierte Coins über {args.days} Tage (Seed {args.seed})")
+    print("⏳ Original-Indexe (complete_schema.sql)...")
+    baseline = run_variant(conn, "bench_idx_baseline", False, args)
+    print("⏳ Optimierte Indexe (optimized_indexes.sql)...")
+    optimized = run_variant(conn, "bench_idx_optimized", True, args)
+
+    print()
+    print_table(
+        ["Messung", "Original", "Optimiert"],
+        [
+            ["Inserts/s", f"{baseline['insert_rate']:,.0f}", f"{optimized['insert_rate']:,.0f}"],
+            ["WAL pro Insert (Bytes)", f"{baseline['wal_per_row']:,.0f}", f"{optimized['wal_per_row']:,.0f}"],
+            ["Indexgröße (MB)", f"{baseline['index_mb']:.1f}", f"{optimized['index_mb']:.1f}"],
+            ["Tabellengröße (MB)", f"{baseline['table_mb']:.1f}", f"{optimized['table_mb']:.1f}"],
+        ] + [
+            [f"{label} (ms)", f"{baseline['timings'][label]:.2f}", f"{optimized['timings'][label]:.2f}"]
+            for label, _ in WORKLOAD
+        ],
+    )
+
+    for title, result in (("Original", baseline), ("Optimiert", optimized)):
+        unused = [name for name, scans in result["index_usage"] if scans == 0]
+        print(f"\n🔍 {title}: {len(result['index_usage'])} Indexe, vom Workload ungenutzt: "
+              f"{', '.join(unused) if unused else '-'}")
+        print_explorer_plans(result["explorer_plans"])
+
+    if not args.keep:
+        cursor = conn.cursor()
+        cursor.execute("DROP SCHEMA bench_idx_baseline CASCADE")
+        cursor.execute("DROP SCHEMA bench_idx_optimized CASCADE")
+        cursor.close()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("report", help="Index-Nutzung der laufenden Datenbank auswerten")
+    bench = sub.add_parser("bench", help="Original vs. optimierte Indexe auf generierten Daten")
+    bench.add_argument("--rows", type=int, default=300000)
+    bench.add_argument("--days", type=int, default=30)
+    bench.add_argument("--batch-size", type=int, default=1000)
+    bench.add_argument("--runs", type=int, default=5)
+    bench.add_argument("--seed", type=int, default=42)
+    bench.add_argument("--keep", action="store_true", help="Benchmark-Schemas nicht löschen")
+    args = parser.parse_args()
+
+    if args.command == "report":
+        cmd_report(args)
+    else:
+        cmd_bench(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Lasttest für den RugCheck Enrichment-Client (relay/rugcheck.py) mit Mock-Backend
+
+Simuliert einen Coin-Stream (inkl. doppelter Mints), sammelt Batches wie der Relay
+und gibt Requests, Cache-/Coalescing-Treffer und Enrichment-Latenz-Perzentile aus.
+
+Beispiel:
+    python scripts/load_test_rugcheck.py --coins 2000 --rate 20 --coins-per-sec 50
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay"))
+
+from rugcheck import MockBackend, RugCheckClient  # noqa: E402
+from stats import percentiles  # noqa: E402
+
+
+async def run(args):
+    backend = MockBackend(
+        latency=(args.min_latency, args.max_latency),
+        not_indexed_ratio=args.not_indexed_ratio,
+        not_indexed_attempts=1,
+        error_ratio=args.error_ratio,
+        seed=args.seed,
+    )
+    client = RugCheckClient(
+        backend,
+        rate_per_sec=args.rate,
+        cache_ttl=600,
+        max_retries=args.max_retries,
+        retry_delay=args.retry_delay,
+    )
+    rnd = random.Random(args.seed)
+    unique_mints = [f"Mock{i:06d}pump" for i in range(int(args.coins * (1 - args.duplicate_ratio)) or 1)]
+
+    buffer = []
+    batch_durations = []
+    enriched_total = 0
+    started = time.monotonic()
+
+    for _ in range(args.coins):
+        mint = rnd.choice(unique_mints)
+        buffer.append({"mint": mint})
+        client.prefetch(mint)
+        if len(buffer) >= args.batch_size:
+            t0 = time.monotonic()
+            enriched_total += await client.enrich_batch(buffer, timeout=args.enrich_timeout)
+            batch_durations.append(time.monotonic() - t0)
+            buffer = []
+        await asyncio.sleep(1 / args.coins_per_sec)
+
+    if buffer:
+        enriched_total += await client.enrich_batch(buffer, timeout=args.enrich_timeout)
+
+    # Hintergrund-Retries auslaufen lassen, damit die Latenz-Perzentile vollständig sind
+    while client._inflight:
+        await asyncio.sleep(0.1)
+    elapsed = time.monotonic() - started
+
+    latency = client.latency_percentiles()
+    flush_wait = percentiles(batch_durations)
+    print("=" * 60)
+    print("📊 RugCheck Enrichment Lasttest")
+    print("=" * 60)
+    print(f"Coins:                {args.coins} ({len(unique_mints)} eindeutige Mints)")
+    print(f"Dauer:                {elapsed:.1f}s")
+    print(f"Backend-Requests:     {backend.requests} (Limit {args.rate}/s)")
+    print(f"Cache-Treffer:        {client.stats['cache_hits']}")
+    print(f"Coalesced:            {client.stats['coalesced']}")
+    print(f"Verzögerte Retries:   {client.stats['deferred_retries']}")
+    print(f"Fehler:               {client.stats['errors']}")
+    print(f"Im Batch angereichert: {enriched_total}/{args.coins}")
+    print("Enrichment-Latenz:    " + ", ".join(
+        f"{k}={v * 1000:.0f}ms" if v is not None else f"{k}=-" for k, v in latency.items()))
+    print("Wartezeit pro Flush:  " + ", ".join(
+        f"{k}={v * 1000:.0f}ms" if v is not None else f"{k}=-" for k, v in flush_wait.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--coins", type=int, default=1000)
+    parser.add_argument("--coins-per-sec", type=float, default=50)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--rate", type=float, default=20, help="RugCheck Requests pro Sekunde")
+    parser.add_argument("--enrich-timeout", type=float, default=5)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--retry-delay", type=float, default=2)
+    parser.add_argument("--min-latency", type=float, default=0.05)
+    parser.add_argument("--max-latency", type=float, default=0.3)
+    parser.add_argument("--not-indexed-ratio", type=float, default=0.2)
+    parser.add_argument("--error-ratio", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Partition-Wartung für discovered_coins (sql/partitioned_schema.sql)
+
+Ruft discovered_coins_maintain_partitions() auf: legt zukünftige Partitionen an und
+archiviert (DETACH + Archiv-Schema) Partitionen, die älter als die Retention sind.
+Für Setups ohne pg_cron - z.B. täglich per Cron oder als Coolify Scheduled Task:
+
+    python scripts/partition_maintenance.py --premake 4 --retention-days 90
+
+Optional werden archivierte Partitionen per pg_dump gesichert und anschließend gelöscht
+(--dump-dir) - zusammen mit ihren Einträgen in discovered_coins_registry.
+Ohne --dump-dir bleiben sie im Archiv-Schema liegen.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from db_utils import add_db_arguments, connect
+
+
+def dump_and_drop(conn, args, qualified_name):
+    """Sichert eine archivierte Partition mit pg_dump und löscht sie danach"""
+    os.makedirs(args.dump_dir, exist_ok=True)
+    target = os.path.join(args.dump_dir, f"{qualified_name}.dump")
+    env = dict(os.environ, PGPASSWORD=args.db_password)
+    result = subprocess.run(
+        ["pg_dump", "-h", args.db_host, "-p", str(args.db_port), "-U", args.db_user,
+         "-d", args.db_name, "-Fc", "-t", qualified_name, "-f", target],
+        env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        print(f"❌ pg_dump fehlgeschlagen für {qualified_name}: {result.stderr.strip()}")
+        return False
+    # Registry-Einträge und Tabelle gemeinsam löschen - sonst blieben die token_addresses
+    # der gelöschten Coins für immer gesperrt (der Trigger greift nach dem DETACH nicht mehr)
+    conn.autocommit = False
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"DELETE FROM discovered_coins_registry r USING {qualified_name} a "
+            "WHERE r.token_address = a.token_address AND r.discovered_at = a.discovered_at"
+        )
+        released = cursor.rowcount
+        cursor.execute(f"DROP TABLE {qualified_name}")
+        cursor.close()
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Löschen fehlgeschlagen für {qualified_name}: {e}")
+        return False
+    finally:
+        conn.autocommit = True
+    print(f"💾 {qualified_name} → {target} (Tabelle gelöscht, {released} Registry-Einträge freigegeben)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    parser.add_argument("--premake", type=int, default=4, help="Anzahl Partitionen im Voraus")
+    parser.add_argument("--retention-days", type=int, default=None,
+                        help="Partitionen älter als N Tage archivieren (Standard: nie)")
+    parser.add_argument("--granularity", choices=["day", "week"], default="week")
+    parser.add_argument("--archive-schema", default="archive")
+    parser.add_argument("--dump-dir", default=None, help="Archivierte Partitionen hierhin dumpen und löschen")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    cursor = conn.cursor()
+    retention = f"{args.retention_days} days" if args.retention_days else None
+    cursor.execute(
+        "SELECT action, partition_name FROM discovered_coins_maintain_partitions(%s, %s::INTERVAL, %s, %s)",
+        (args.premake, retention, args.granularity, args.archive_schema),
+    )
+    results = cursor.fetchall()
+    cursor.close()
+
+    if not results:
+        print("✅ Partitionen aktuell - nichts zu tun")
+    failed = False
+    for action, name in results:
+        print(f"{'➕' if action == 'created' else '📦'} {action}: {name}")
+        if action == "archived" and args.dump_dir:
+            failed |= not dump_and_drop(conn, args, name)
+    conn.close()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Refresh der materialisierten Graduation-Views (sql/materialized_views.sql)
+
+Ruft refresh_graduation_views() auf (REFRESH MATERIALIZED VIEW CONCURRENTLY).
+Für Setups ohne pg_cron - einmalig per Cron / Coolify Scheduled Task:
+
+    python scripts/refresh_views.py
+
+oder als Dauerprozess mit festem Intervall:
+
+    python scripts/refresh_views.py --interval 60
+"""
+import argparse
+import sys
+import time
+
+import psycopg2
+
+from db_utils import add_db_arguments, connect
+
+
+def refresh(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT view_name, status, duration_ms FROM refresh_graduation_views()")
+    results = cursor.fetchall()
+    cursor.close()
+    for view_name, status, duration_ms in results:
+        if status == "skipped":
+            print("⏭️ Refresh läuft bereits - übersprungen")
+        else:
+            print(f"🔄 {view_name}: {duration_ms} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    parser.add_argument("--interval", type=int, default=0,
+                        help="Sekunden zwischen Refreshes (0 = einmalig ausführen)")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    if not args.interval:
+        refresh(conn)
+        conn.close()
+        return
+
+    print(f"⏱️ Refresh alle {args.interval}s")
+    while True:
+        started = time.time()
+        try:
+            refresh(conn)
+        except psycopg2.OperationalError as e:
+            print(f"❌ Verbindung verloren: {e} - verbinde neu")
+            try:
+                conn.close()
+            except Exception:
+                pass
+            try:
+                conn = connect(args)
+            except psycopg2.OperationalError as e:
+                print(f"❌ Reconnect fehlgeschlagen: {e}")
+        except psycopg2.Error as e:
+            print(f"❌ Refresh fehlgeschlagen: {e}")
+        time.sleep(max(0, args.interval - (time.time() - started)))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(0)
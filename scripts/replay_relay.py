@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Replay-Harness für den Relay: aufgezeichnete oder generierte WebSocket-Frames
+durch den echten Relay (relay/main.py als Kind-Prozess) schicken
+
+Der Harness ersetzt beide Enden des Relays lokal:
+- WebSocket-Server statt pumpportal.fun (WS_URI=ws://127.0.0.1:...), sendet die
+  Frames mit --rate Frames/s (0 = so schnell wie möglich)
+- Webhook-Senke statt n8n (N8N_WEBHOOK_URL), misst pro Coin die Latenz vom
+  Senden des Frames bis zur Ankunft im Batch
+
+Pro Event-Loop (EVENT_LOOP, siehe relay/eventloop.py), Worker-Anzahl (WORKERS,
+siehe relay/workers.py) und Rate startet ein frischer Relay-Prozess. Ausgegeben
+werden Frames/s am Webhook, Latenz p50/p99/max und die CPU-Zeit des Relays
+(inkl. Worker-Prozesse) pro 1000 Frames. Mint, Name und Symbol werden pro
+Frame eindeutig gemacht und der Namensfilter ist aus - jeder Frame soll beim
+Webhook ankommen. Die Latenz enthält das Warten auf einen vollen Batch
+(--batch-size), bei niedriger Rate dominiert also die Batch-Füllzeit.
+
+Mit --priority-lane läuft der Relay mit PRIORITY_LANE=true (Schwellwerte aus
+PRIORITY_MIN_* der Umgebung, siehe relay/lanes.py); die Latenz wird zusätzlich
+pro Lane ausgegeben (Zuordnung mit demselben Classifier wie im Relay).
+
+Beispiel:
+    python scripts/replay_relay.py record --count 500 --out frames.jsonl
+    python scripts/replay_relay.py bench --frames frames.jsonl --count 20000
+    python scripts/replay_relay.py bench --loop asyncio --loop uvloop --rate 0 --rate 2000
+    python scripts/replay_relay.py bench --loop uvloop --workers 0 --workers 2 --rate 0
+    python scripts/replay_relay.py bench --loop asyncio --rate 20 --count 600 --batch-size 50 --batch-timeout 30 --priority-lane
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import resource
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+import websockets
+from aiohttp import web
+
+RELAY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay")
+sys.path.insert(0, RELAY_DIR)
+
+from lanes import PriorityClassifier  # noqa: E402
+from stats import percentiles  # noqa: E402
+
+SOCIAL_FIELDS = ("twitter", "telegram", "website")
+
+
+def generate_frames(count, seed=42):
+    """Synthetische subscribeNewToken-Frames mit den Feldern, die der Relay auswertet"""
+    rnd = random.Random(seed)
+    frames = []
+    for i in range(count):
+        frame = {
+            "signature": f"sig{i}",
+            "mint": f"mint{i}",
+            "traderPublicKey": f"trader{rnd.randrange(count // 10 + 1)}",
+            "txType": "create",
+            "initialBuy": rnd.uniform(1e6, 1e8),
+            "solAmount": rnd.uniform(0.1, 5),
+            "bondingCurveKey": f"curve{i}",
+            "vTokensInBondingCurve": rnd.uniform(8e8, 1.07e9),
+            "vSolInBondingCurve": rnd.uniform(30, 40),
+            "marketCapSol": rnd.uniform(25, 60),
+            "name": f"Coin {i}",
+            "symbol": f"C{i}",
+            "uri": f"https://ipfs.io/ipfs/{i}",
+            "pool": "pump",
+        }
+        for field in SOCIAL_FIELDS:
+            if rnd.random() < 0.4:
+                frame[field] = f"https://example.com/{field}/{i}"
+        frames.append(frame)
+    return frames
+
+
+def load_frames(path, count):
+    """Frames aus einer JSON-Lines-Aufnahme, zyklisch wiederholt bis `count`"""
+    with open(path) as f:
+        recorded = [json.loads(line) for line in f if line.strip()]
+    recorded = [frame for frame in recorded if frame.get("mint")]
+    if not recorded:
+        raise SystemExit(f"❌ Keine Coin-Frames (mit mint) in {path}")
+    return [dict(recorded[i % len(recorded)]) for i in range(count)]
+
+
+def make_unique(frames):
+    """Mint/Name/Symbol eindeutig machen (Zuordnung der Latenz, kein Spam-Burst-Filter)"""
+    for i, frame in enumerate(frames):
+        frame["mint"] = f"{frame['mint']}-{i}"
+        frame["name"] = f"{frame.get('name', '')} #{i}"
+        frame["symbol"] = f"{frame.get('symbol', '')}{i}"
+    return frames
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Replay:
+    """Ein Lauf: WebSocket-Quelle + Webhook-Senke für einen Relay-Prozess"""
+
+    def __init__(self, frames, rate, classifier=None):
+        self.classifier = classifier
+        self.lane_latencies = {"fast": [], "bulk": []}
+        self.messages = [(frame["mint"], json.dumps(frame)) for frame in frames]
+        self.rate = rate
+        self.sent_at = {}
+        self.latencies = []
+        self.first_sent = None
+        self.last_sent = None
+        self.last_arrival = None
+        self.batches = 0
+        self.done = asyncio.Event()
+
+    async def source(self, ws):
+        """WebSocket-Handler: wartet auf das Subscribe des Relays und spielt die Frames ab"""
+        await ws.recv()
+        self.first_sent = time.perf_counter()
+        for i, (mint, message) in enumerate(self.messages):
+            if self.rate:
+                # Sollzeitpunkt des Frames - sendet bei Verzug ohne Pause nach
+                delay = self.first_sent + i / self.rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self.sent_at[mint] = time.perf_counter()
+            await ws.send(message)
+        self.last_sent = time.perf_counter()
+        await self.done.wait()
+
+    async def sink(self, request):
+        """Webhook-Handler (wie n8n): Latenz jedes Coins im Batch festhalten"""
+        payload = await request.json()
+        now = time.perf_counter()
+        self.batches += 1
+        for coin in payload["data"]:
+            sent = self.sent_at.get(coin["mint"])
+            if sent is not None:
+                self.latencies.append(now - sent)
+                if self.classifier:
+                    lane = "fast" if self.classifier.classify(coin) else "bulk"
+                    self.lane_latencies[lane].append(now - sent)
+        self.last_arrival = now
+        if len(self.latencies) >= len(self.messages):
+            self.done.set()
+        return web.json_response({"ok": True})
+
+
+async def wait_for_relay(port, process, timeout=15):
+    """Bis der Health-Server des Relays antwortet (200 oder 503)"""
+    deadline = time.time() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.time() < deadline:
+            if process.poll() is not None:
+                raise SystemExit(f"❌ Relay beendet (Exit-Code {process.returncode})")
+            try:
+                async with session.get(f"http://127.0.0.1:{port}/health") as resp:
+                    return await resp.json()
+            except aiohttp.ClientError:
+                await asyncio.sleep(0.1)
+    raise SystemExit("❌ Relay-Health-Server antwortet nicht")
+
+
+async def run_once(frames, loop_name, workers, rate, args):
+    """Relay mit EVENT_LOOP=loop_name und WORKERS=workers starten, Frames abspielen, Ergebnis als dict"""
+    classifier = None
+    if args.priority_lane:
+        classifier = PriorityClassifier(
+            min_social_count=int(os.getenv("PRIORITY_MIN_SOCIALS", "3")),
+            min_sol_amount=float(os.getenv("PRIORITY_MIN_SOL_AMOUNT", "3")),
+            min_market_cap_sol=float(os.getenv("PRIORITY_MIN_MARKET_CAP_SOL", "0")),
+        )
+    replay = Replay(frames, rate, classifier)
+    app = web.Application()
+    app.add_routes([web.post("/hook", replay.sink)])
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    sink_port = free_port()
+    await web.TCPSite(runner, "127.0.0.1", sink_port).start()
+    ws_server = await websockets.serve(replay.source, "127.0.0.1", 0, max_size=2**23, compression=None)
+    ws_port = ws_server.sockets[0].getsockname()[1]
+    health_port = free_port()
+
+    env = dict(os.environ)
+    env.update({
+        "EVENT_LOOP": loop_name,
+        "WORKERS": str(workers),
+        "WS_URI": f"ws://127.0.0.1:{ws_port}",
+        "N8N_WEBHOOK_URL": f"http://127.0.0.1:{sink_port}/hook",
+        "N8N_WEBHOOK_METHOD": "POST",
+        "HEALTH_PORT": str(health_port),
+        "BATCH_SIZE": str(args.batch_size),
+        "BATCH_TIMEOUT": str(args.batch_timeout),
+        "PRIORITY_LANE": "true" if args.priority_lane else "false",
+        "BAD_NAMES_PATTERN": "(?!)",  # passt auf nichts
+        "RUGCHECK_ENABLED": "false",
+        "EXCHANGE_RATE_ENABLED": "false",
+    })
+    # Logs des Relays verwerfen (print pro Coin bleibt als Last erhalten)
+    process = subprocess.Popen(
+        [sys.executable, "-u", "main.py"], cwd=RELAY_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    cpu_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    try:
+        health = await wait_for_relay(health_port, process)
+        try:
+            await asyncio.wait_for(replay.done.wait(), timeout=args.timeout)
+        except asyncio.TimeoutError:
+            print(f"⚠️ Timeout: {len(replay.latencies)}/{len(frames)} Coins angekommen ({loop_name}, {workers} Worker, Rate {rate or 'max'})")
+    finally:
+        # SIGINT: der Relay beendet sich regulär und wartet auf seine Worker (CPU-Zeit wird mitgezählt)
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        ws_server.close()
+        await ws_server.wait_closed()
+        await runner.cleanup()
+
+    cpu_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_seconds = (cpu_after.ru_utime + cpu_after.ru_stime) - (cpu_before.ru_utime + cpu_before.ru_stime)
+    delivered = len(replay.latencies)
+    elapsed = (replay.last_arrival - replay.first_sent) if delivered else None
+    send_elapsed = (replay.last_sent - replay.first_sent) if replay.last_sent else None
+    return {
+        "loop": health.get("event_loop", "?"),
+        "workers": workers,
+        "rate": rate,
+        "delivered": delivered,
+        "batches": replay.batches,
+        "send_fps": len(frames) / send_elapsed if send_elapsed else None,
+        "fps": delivered / elapsed if elapsed else None,
+        "latency": percentiles(replay.latencies, points=(50, 99, 100)),
+        "lanes": {lane: (len(values), percentiles(values, points=(50, 99, 100)))
+                  for lane, values in replay.lane_latencies.items()} if classifier else None,
+        "cpu_ms_per_1000": cpu_seconds * 1000 / delivered * 1000 if delivered else None,
+    }
+
+
+def bench(args):
+    if args.frames:
+        frames = load_frames(args.frames, args.count)
+    else:
+        frames = generate_frames(args.count, seed=args.seed)
+    frames = make_unique(frames)
+
+    loops = args.loop or ["asyncio", "uvloop"]
+    if "uvloop" in loops and importlib.util.find_spec("uvloop") is None:
+        print("⚠️ uvloop ist nicht installiert (pip install uvloop) - wird übersprungen")
+        loops = [name for name in loops if name != "uvloop"]
+    workers_list = args.workers or [0]
+    rates = args.rate or [0, 1000]
+    print(f"🔁 {len(frames)} Frames ({args.frames or 'generiert'}), Batch {args.batch_size}, "
+          f"{args.runs} Lauf/Läufe pro Loop und Rate")
+
+    rows = []
+    lane_rows = []
+    for rate in rates:
+        for loop_name in loops:
+            for workers in workers_list:
+                for _ in range(args.runs):
+                    result = asyncio.run(run_once(frames, loop_name, workers, rate, args))
+                    latency = result["latency"]
+                    rows.append((
+                        result["loop"], result["workers"], rate or "max",
+                        f"{result['send_fps']:.0f}" if result["send_fps"] else "-",
+                        f"{result['fps']:.0f}" if result["fps"] else "-",
+                        f"{result['delivered']}/{len(frames)}",
+                        *(f"{latency[p] * 1000:.1f}" if latency[p] is not None else "-" for p in ("p50", "p99", "p100")),
+                        f"{result['cpu_ms_per_1000']:.0f}" if result["cpu_ms_per_1000"] else "-",
+                    ))
+                    for lane, (count, lane_latency) in (result["lanes"] or {}).items():
+                        lane_rows.append((
+                            result["loop"], result["workers"], rate or "max", lane, count,
+                            *(f"{lane_latency[p] * 1000:.1f}" if lane_latency[p] is not None else "-"
+                              for p in ("p50", "p99", "p100")),
+                        ))
+
+    from db_utils import print_table
+    print_table(["Loop", "Worker", "Rate", "Gesendet/s", "Frames/s", "Angekommen", "p50 ms", "p99 ms", "max ms", "CPU ms/1000"], rows)
+    if lane_rows:
+        print()
+        print("⚡ Latenz pro Lane")
+        print_table(["Loop", "Worker", "Rate", "Lane", "Coins", "p50 ms", "p99 ms", "max ms"], lane_rows)
+
+
+async def record(args):
+    """Frames vom echten WebSocket als JSON Lines aufzeichnen"""
+    import ssl
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    written = 0
+    async with websockets.connect(args.uri, max_size=2**23, ssl=ssl_context if args.uri.startswith("wss://") else None) as ws:
+        await ws.send(json.dumps({"method": "subscribeNewToken"}))
+        print(f"📡 Verbunden mit {args.uri} - zeichne {args.count} Coins auf...")
+        with open(args.out, "w") as f:
+            while written < args.count:
+                message = await ws.recv()
+                if not json.loads(message).get("mint"):
+                    continue
+                f.write(message.strip() + "\n")
+                written += 1
+    print(f"✅ {written} Frames in {args.out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_record = sub.add_parser("record", help="Frames vom Pump.fun WebSocket aufzeichnen")
+    p_record.add_argument("--uri", default="wss://pumpportal.fun/api/data")
+    p_record.add_argument("--count", type=int, default=500)
+    p_record.add_argument("--out", default="frames.jsonl")
+
+    p_bench = sub.add_parser("bench", help="Frames durch den Relay abspielen und Loops vergleichen")
+    p_bench.add_argument("--frames", help="JSON-Lines-Aufnahme (sonst synthetische Frames)")
+    p_bench.add_argument("--count", type=int, default=20000, help="Frames pro Lauf")
+    p_bench.add_argument("--loop", action="append", choices=["asyncio", "uvloop"],
+                         help="Event-Loop (mehrfach möglich, Default: asyncio und uvloop)")
+    p_bench.add_argument("--workers", type=int, action="append",
+                         help="WORKERS des Relays (mehrfach möglich, Default: 0 = Einzelprozess)")
+    p_bench.add_argument("--rate", type=float, action="append",
+                         help="Frames/s der Quelle, 0 = maximal (mehrfach möglich, Default: 0 und 1000)")
+    p_bench.add_argument("--batch-size", type=int, default=10)
+    p_bench.add_argument("--batch-timeout", type=int, default=1, help="BATCH_TIMEOUT des Relays in Sekunden")
+    p_bench.add_argument("--priority-lane", action="store_true", help="Relay mit PRIORITY_LANE=true, Latenz pro Lane")
+    p_bench.add_argument("--runs", type=int, default=1, help="Läufe pro Loop und Rate")
+    p_bench.add_argument("--timeout", type=float, default=120, help="Max. Sekunden pro Lauf")
+    p_bench.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        asyncio.run(record(args))
+    else:
+        bench(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Simulation mehrerer Relay-Replikas mit Leader-Wahl (relay/replicas.py)
+
+Alle Replikas empfangen denselben Coin-Stream und bauen Batches wie der Relay
+(BATCH_SIZE/BATCH_TIMEOUT); gesendet wird wie in flush_buffer() nur vom Leader
+und nur für neu beanspruchte Mints. Nach --kill-at Sekunden stirbt der Leader
+(Session-Abbruch), optional fällt der Store für --outage Sekunden aus. Am Ende:
+Failover-Zeit, doppelt und gar nicht gelieferte Mints, n8n-Aufrufe.
+
+Standard ist der In-Prozess-Fake (MemoryCoordinationStore); mit --store postgres
+laufen Lock und Claims gegen die DB (DB_HOST, DB_PORT, ...; die Claims der
+Simulation werden danach gelöscht).
+
+Beispiel:
+    python scripts/simulate_replicas.py --replicas 3 --coins 600 --coins-per-sec 20 --kill-at 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "relay"))
+
+from replicas import MemoryCoordinationStore, PostgresCoordinationStore, ReplicaCoordinator  # noqa: E402
+
+
+class Sink:
+    """n8n-Ersatz: zählt Aufrufe und Lieferungen pro Mint"""
+
+    def __init__(self, latency, error_ratio, rnd):
+        self.latency = latency
+        self.error_ratio = error_ratio
+        self.random = rnd
+        self.deliveries = Counter()
+        self.executions = 0
+        self.errors = 0
+
+    async def send(self, batch):
+        await asyncio.sleep(self.latency)
+        if self.random.random() < self.error_ratio:
+            self.errors += 1
+            return False
+        self.executions += 1
+        self.deliveries.update(coin["mint"] for coin in batch)
+        return True
+
+
+class SimReplica:
+    """Eine Replika: Coin-Queue, Buffer und Flush wie relay/main.py"""
+
+    def __init__(self, name, store, sink, args, events):
+        self.name = name
+        self.store = store
+        self.sink = sink
+        self.args = args
+        self.events = events
+        self.coordinator = ReplicaCoordinator(store, name, election_interval=args.election_interval,
+                                              standby_seconds=args.standby_seconds)
+        self.queue = asyncio.Queue()
+        self.buffer = []
+        self.tasks = []
+
+    async def flush(self, buffer):
+        if not self.coordinator.is_leader:
+            self.coordinator.keep_standby(buffer)
+            return True
+        batch = await self.coordinator.claim(buffer)
+        if not batch:
+            return True
+        success = await self.sink.send(batch)
+        if not success:
+            await self.coordinator.release(batch)
+        return success
+
+    async def on_change(self, change):
+        self.events.append((time.monotonic(), self.name, change))
+        if change == "elected":
+            standby = self.coordinator.take_standby()
+            if standby and not await self.flush(standby):
+                self.coordinator.keep_standby(standby)
+
+    async def ingest(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                coin = await asyncio.wait_for(self.queue.get(), timeout=0.1)
+                if coin is None:
+                    break
+                self.buffer.append(coin)
+            except asyncio.TimeoutError:
+                pass
+            is_full = len(self.buffer) >= self.args.batch_size
+            is_timeout = time.monotonic() - last_flush > self.args.batch_timeout
+            if self.buffer and (is_full or is_timeout):
+                if await self.flush(self.buffer):
+                    self.buffer = []
+                last_flush = time.monotonic()
+
+    def start(self):
+        self.tasks = [asyncio.create_task(self.coordinator.run(self.on_change)), asyncio.create_task(self.ingest())]
+
+    async def kill(self):
+        """Prozess stirbt: Tasks weg, Session (und damit das Lock) weg"""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        if hasattr(self.store, "disconnect"):
+            self.store.disconnect(self.name)
+        else:
+            await asyncio.to_thread(self.store.close)
+
+
+def make_store(args, shared):
+    if args.store == "memory":
+        return shared
+    return PostgresCoordinationStore(args.db_host, args.db_port, args.db_name, args.db_user, args.db_password)
+
+
+async def run(args):
+    rnd = random.Random(args.seed)
+    shared = MemoryCoordinationStore()
+    sink = Sink(args.send_latency, args.error_ratio, rnd)
+    events = []
+    replicas = [SimReplica(f"sim-replica-{i}", make_store(args, shared), sink, args, events)
+                for i in range(args.replicas)]
+    for replica in replicas:
+        replica.start()
+
+    mints = [f"Sim{args.seed}x{i:06d}pump" for i in range(args.coins)]
+    started = time.monotonic()
+    killed = None
+    outage = None
+    for index, mint in enumerate(mints):
+        elapsed = time.monotonic() - started
+        if killed is None and elapsed >= args.kill_at:
+            leader = next((r for r in replicas if r.coordinator.is_leader), None)
+            if leader:
+                await leader.kill()
+                replicas.remove(leader)
+                killed = (time.monotonic(), leader.name)
+        if args.outage and outage is None and elapsed >= args.outage_at:
+            outage = time.monotonic()
+            shared.fail = True
+        if outage and shared.fail and time.monotonic() - outage >= args.outage:
+            shared.fail = False
+        for replica in replicas:
+            # Jede Replika bekommt jeden Coin (eigene WebSocket-Verbindung), Mints wiederholen sich selten
+            replica.queue.put_nowait({"mint": mint, "seq": index})
+            if rnd.random() < args.duplicate_ratio:
+                replica.queue.put_nowait({"mint": mint, "seq": index})
+        await asyncio.sleep(1 / args.coins_per_sec)
+    shared.fail = False
+
+    for replica in replicas:
+        replica.queue.put_nowait(None)
+    await asyncio.gather(*(replica.tasks[1] for replica in replicas))
+    # Rest-Buffer wie beim Reconnect/Shutdown flushen, Wahl-Runde abwarten
+    await asyncio.sleep(args.election_interval * 2)
+    for replica in replicas:
+        if replica.buffer:
+            await replica.flush(replica.buffer)
+    await asyncio.sleep(args.election_interval * 2)
+    elapsed = time.monotonic() - started
+
+    failover = None
+    if killed:
+        after = [t for t, name, change in events if change == "elected" and t >= killed[0]]
+        failover = after[0] - killed[0] if after else None
+    duplicates = sum(1 for count in sink.deliveries.values() if count > 1)
+    missing = sum(1 for mint in mints if mint not in sink.deliveries)
+
+    print("=" * 60)
+    print(f"👥 Replika-Simulation ({args.store})")
+    print("=" * 60)
+    print(f"Replikas:             {args.replicas}")
+    print(f"Coins:                {args.coins} in {elapsed:.1f}s")
+    print(f"n8n-Aufrufe:          {sink.executions} (Fehler: {sink.errors})")
+    print(f"Gelieferte Mints:     {len(sink.deliveries)}")
+    print(f"Doppelt geliefert:    {duplicates}")
+    print(f"Nicht geliefert:      {missing}")
+    if killed:
+        print(f"Leader-Ausfall:       {killed[1]} nach {args.kill_at:.0f}s")
+        print(f"Failover-Zeit:        {failover * 1000:.0f}ms" if failover is not None else "Failover-Zeit:        -")
+    for t, name, change in events:
+        print(f"  {t - started:7.2f}s  {name}: {change}")
+    for replica in replicas:
+        snapshot = replica.coordinator.snapshot()
+        print(f"  {replica.name}: {snapshot['role']}, claimed={snapshot['claimed']}, "
+              f"duplicates={snapshot['duplicates']}, standby={snapshot['standby']}, errors={snapshot['errors']}")
+
+    for replica in replicas:
+        for task in replica.tasks:
+            task.cancel()
+        if args.store == "postgres":
+            await asyncio.to_thread(replica.store.release, replica.name, mints)
+            await asyncio.to_thread(replica.store.close)
+    if args.store == "postgres" and killed:
+        cleanup = PostgresCoordinationStore(args.db_host, args.db_port, args.db_name, args.db_user, args.db_password)
+        await asyncio.to_thread(cleanup.release, killed[1], mints)
+        cleanup.close()
+    return 1 if duplicates or missing else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replicas", type=int, default=3)
+    parser.add_argument("--coins", type=int, default=600)
+    parser.add_argument("--coins-per-sec", type=float, default=20)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.02, help="Anteil doppelt empfangener Frames")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--batch-timeout", type=float, default=5)
+    parser.add_argument("--election-interval", type=float, default=0.5)
+    parser.add_argument("--standby-seconds", type=float, default=60)
+    parser.add_argument("--send-latency", type=float, default=0.05)
+    parser.add_argument("--error-ratio", type=float, default=0.05, help="Anteil fehlgeschlagener n8n-Aufrufe")
+    parser.add_argument("--kill-at", type=float, default=10, help="Leader nach N Sekunden beenden (0 = nie)")
+    parser.add_argument("--outage", type=float, default=0, help="Store-Ausfall in Sekunden (nur memory)")
+    parser.add_argument("--outage-at", type=float, default=20)
+    parser.add_argument("--store", choices=("memory", "postgres"), default="memory")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db-host", default=os.getenv("DB_HOST", "localhost"))
+    parser.add_argument("--db-port", default=os.getenv("DB_PORT", "5432"))
+    parser.add_argument("--db-name", default=os.getenv("DB_NAME", "pump_discover"))
+    parser.add_argument("--db-user", default=os.getenv("DB_USER", "postgres"))
+    parser.add_argument("--db-password", default=os.getenv("DB_PASSWORD", ""))
+    args = parser.parse_args()
+    if args.kill_at <= 0:
+        args.kill_at = float("inf")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
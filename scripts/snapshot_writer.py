@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Bulk-Writer für coin_snapshots (sql/coin_snapshots.sql)
+
+Sammelt Snapshots im Speicher und schreibt sie gebündelt per COPY FROM STDIN -
+um ein Vielfaches schneller als einzelne INSERTs (ein Roundtrip + eine
+Transaktion pro Batch statt pro Zeile).
+
+Als Modul:
+    writer = SnapshotWriter(conn, batch_size=5000)
+    writer.add({"ts": ..., "stream_id": 42, "price_sol": ..., "phase_id": 1})
+    writer.close()
+
+Als Script (JSON Lines von stdin, z.B. aus einem n8n Execute-Command-Node):
+    cat snapshots.jsonl | python scripts/snapshot_writer.py
+
+Zeilen dürfen statt stream_id eine token_address enthalten; die Stream-ID wird
+dann aus coin_streams nachgeschlagen (und gecacht).
+"""
+import argparse
+import io
+import json
+import sys
+import time
+
+import psycopg2
+
+from db_utils import add_db_arguments, connect
+
+SNAPSHOT_COLUMNS = [
+    "ts", "stream_id", "price_sol", "market_cap_sol", "v_sol_in_bonding_curve",
+    "volume_sol", "buy_count", "sell_count", "holder_count", "phase_id",
+]
+
+
+def _copy_value(value):
+    """Formatiert einen Wert für COPY im Text-Format"""
+    if value is None:
+        return "\\N"
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+class SnapshotWriter:
+    """Puffert Snapshots und schreibt sie per COPY, sobald batch_size oder flush_interval erreicht ist
+
+    Schlägt ein COPY fehl, wird die Transaktion zurückgerollt und der Fehler weitergereicht:
+    - Datenfehler (DataError/IntegrityError): der Batch kann nie geschrieben werden → verworfen
+    - sonst (z.B. DB nicht erreichbar): der Puffer bleibt für den nächsten flush() erhalten,
+      aber höchstens max_buffer Zeilen (Standard: 10 × batch_size) - die ältesten fliegen raus
+    """
+
+    def __init__(self, conn, table="coin_snapshots", batch_size=5000, flush_interval=1.0, max_buffer=None):
+        self.conn = conn
+        self.table = table
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer or batch_size * 10
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.stream_ids = {}
+        self.written = 0
+        self.flushes = 0
+        self.dropped = 0
+
+    def resolve_stream_id(self, token_address):
+        """token_address → coin_streams.id (gecacht, None wenn kein Stream existiert)"""
+        if token_address not in self.stream_ids:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT id FROM coin_streams WHERE token_address = %s", (token_address,))
+            row = cursor.fetchone()
+            cursor.close()
+            self.stream_ids[token_address] = row[0] if row else None
+        return self.stream_ids[token_address]
+
+    def add(self, snapshot):
+        """Fügt einen Snapshot (dict oder Tupel in SNAPSHOT_COLUMNS-Reihenfolge) hinzu"""
+        if isinstance(snapshot, dict):
+            if snapshot.get("stream_id") is None and snapshot.get("token_address"):
+                snapshot = dict(snapshot, stream_id=self.resolve_stream_id(snapshot["token_address"]))
+                if snapshot["stream_id"] is None:
+                    return False
+            snapshot = tuple(snapshot.get(column) for column in SNAPSHOT_COLUMNS)
+        self.buffer.append(snapshot)
+        if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+        return True
+
+    def add_many(self, snapshots):
+        for snapshot in snapshots:
+            self.add(snapshot)
+
+    def flush(self):
+        """Schreibt den Puffer per COPY; liefert die Anzahl geschriebener Zeilen"""
+        self.last_flush = time.monotonic()
+        if not self.buffer:
+            return 0
+        data = io.StringIO()
+        for row in self.buffer:
+            data.write("\t".join(_copy_value(v) for v in row))
+            data.write("\n")
+        data.seek(0)
+        try:
+            cursor = self.conn.cursor()
+            cursor.copy_expert(f"COPY {self.table} ({', '.join(SNAPSHOT_COLUMNS)}) FROM STDIN", data)
+            cursor.close()
+            if not self.conn.autocommit:
+                self.conn.commit()
+        except psycopg2.Error as e:
+            # Abgebrochene Transaktion zurückrollen, sonst scheitert jeder weitere Befehl
+            if not self.conn.closed:
+                self.conn.rollback()
+            if isinstance(e, (psycopg2.DataError, psycopg2.IntegrityError)):
+                self.dropped += len(self.buffer)
+                self.buffer = []
+            elif len(self.buffer) > self.max_buffer:
+                self.dropped += len(self.buffer) - self.max_buffer
+                del self.buffer[:-self.max_buffer]
+            raise
+        count = len(self.buffer)
+        self.buffer = []
+        self.written += count
+        self.flushes += 1
+        return count
+
+    def close(self):
+        self.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_db_arguments(parser)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    parser.add_argument("--max-buffer", type=int, default=None,
+                        help="Max. gepufferte Zeilen bei DB-Fehlern (Standard: 10 × batch-size)")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    writer = SnapshotWriter(conn, batch_size=args.batch_size, flush_interval=args.flush_interval,
+                            max_buffer=args.max_buffer)
+    skipped = 0
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            if not writer.add(json.loads(line)):
+                skipped += 1
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Ungültige Zeile übersprungen: {e}", file=sys.stderr)
+            skipped += 1
+        except psycopg2.Error as e:
+            print(f"❌ COPY fehlgeschlagen ({len(writer.buffer)} Zeilen gepuffert): {e}", file=sys.stderr)
+    try:
+        writer.close()
+    except psycopg2.Error as e:
+        print(f"❌ COPY fehlgeschlagen: {e}", file=sys.stderr)
+        writer.dropped += len(writer.buffer)
+    conn.close()
+    print(f"✅ {writer.written:,} Snapshots geschrieben ({writer.flushes} COPY-Batches, {skipped} übersprungen)")
+    if writer.dropped:
+        print(f"❌ {writer.dropped:,} Snapshots verworfen (COPY fehlgeschlagen)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
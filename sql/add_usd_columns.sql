@@ -0,0 +1,21 @@
+-- ============================================================================
+-- PUMP DISCOVER - MIGRATION: USD-Spalten für discovered_coins
+-- ============================================================================
+--
+-- Der Relay stempelt beim Ingest sol_price_usd, market_cap_usd und price_usd
+-- (EXCHANGE_RATE_ENABLED=true, Kurs aus coin_metrics). Neue Installationen haben
+-- die Spalten bereits (complete_schema.sql / partitioned_schema.sql).
+--
+-- Idempotent, funktioniert für Heap- und partitionierte Tabelle:
+--   psql -d pump_discover -f sql/add_usd_columns.sql
+--
+-- Bestehende Zeilen nachträglich füllen: python scripts/backfill_usd.py
+-- ============================================================================
+
+ALTER TABLE discovered_coins ADD COLUMN IF NOT EXISTS sol_price_usd NUMERIC(20, 6);
+ALTER TABLE discovered_coins ADD COLUMN IF NOT EXISTS market_cap_usd NUMERIC(20, 2);
+ALTER TABLE discovered_coins ADD COLUMN IF NOT EXISTS price_usd NUMERIC(30, 18);
+
+COMMENT ON COLUMN discovered_coins.sol_price_usd IS 'SOL/USD-Kurs zum Zeitpunkt des Ingests (Relay, aus coin_metrics)';
+COMMENT ON COLUMN discovered_coins.market_cap_usd IS 'Market Cap in USD (Relay: market_cap_sol * sol_price_usd)';
+COMMENT ON COLUMN discovered_coins.price_usd IS 'Preis in USD (Relay: price_sol * sol_price_usd)';
@@ -0,0 +1,231 @@
+-- ============================================================================
+-- PUMP DISCOVER - ZEITREIHEN-SNAPSHOTS für coin_streams
+-- ============================================================================
+--
+-- coin_streams speichert nur den Stream-Zustand (Phase, aktiv, graduiert).
+-- Die eigentlichen Snapshots im Takt der Phase (ref_coin_phases.interval_seconds:
+-- Baby Zone 5s, Survival Zone 30s, Mature Zone 60s) landen in coin_snapshots.
+--
+-- Größenordnung: ein Coin, der 24h lebt, erzeugt ~1.600 Snapshots
+-- (120 Baby + 100 Survival + 1.380 Mature) → schnell zig Millionen Zeilen.
+--
+-- Design:
+-- - Schmale Zeilen: stream_id (BIGINT) statt token_address (VARCHAR(64)),
+--   DOUBLE PRECISION/REAL statt NUMERIC, kein PRIMARY KEY (reine Append-Tabelle)
+-- - BRIN auf ts (Zeilen kommen zeitlich sortiert → winziger Index)
+-- - B-Tree (stream_id, ts) für den Verlauf eines einzelnen Coins
+-- - Baby-Zone-Rohdaten (5s) werden nach einem Tag auf 1-Minuten-Kerzen
+--   (coin_snapshots_1m) verdichtet und gelöscht
+-- - Optional: TimescaleDB-Hypertable mit Kompression (falls Extension verfügbar)
+--
+-- Ausführung (nach complete_schema.sql):
+--   psql -d pump_discover -f sql/coin_snapshots.sql
+--
+-- Schreiben: scripts/snapshot_writer.py (gebündelt per COPY)
+-- Wartung:   SELECT * FROM coin_snapshots_maintain();  (täglich)
+-- ============================================================================
+
+DROP TABLE IF EXISTS coin_snapshots CASCADE;
+DROP TABLE IF EXISTS coin_snapshots_1m CASCADE;
+
+-- ============================================================================
+-- 1. COIN_SNAPSHOTS - Rohdaten im Phasen-Takt
+-- ============================================================================
+-- Spaltenreihenfolge: 8-Byte-Spalten zuerst (kein Alignment-Padding)
+CREATE TABLE coin_snapshots (
+    ts TIMESTAMPTZ NOT NULL,                      -- Zeitpunkt des Snapshots
+    stream_id BIGINT NOT NULL,                    -- coin_streams.id (kein FK: Insert-Rate)
+    price_sol DOUBLE PRECISION,                   -- Preis in SOL (braucht volle Präzision)
+    market_cap_sol REAL,                          -- Market Cap in SOL
+    v_sol_in_bonding_curve REAL,                  -- Virtuelles SOL in Bonding Curve
+    volume_sol REAL,                              -- Handelsvolumen seit letztem Snapshot
+    buy_count INT,                                -- Käufe seit letztem Snapshot
+    sell_count INT,                               -- Verkäufe seit letztem Snapshot
+    holder_count INT,                             -- Anzahl Holder
+    phase_id SMALLINT NOT NULL                    -- Phase zum Zeitpunkt des Snapshots
+);
+
+CREATE INDEX idx_coin_snapshots_ts_brin ON coin_snapshots USING BRIN (ts) WITH (pages_per_range = 32, autosummarize = on);
+CREATE INDEX idx_coin_snapshots_stream_ts ON coin_snapshots(stream_id, ts);
+
+COMMENT ON TABLE coin_snapshots IS 'Zeitreihen-Snapshots pro Coin-Stream im Takt der Phase (5s/30s/60s)';
+COMMENT ON COLUMN coin_snapshots.ts IS 'Zeitpunkt des Snapshots';
+COMMENT ON COLUMN coin_snapshots.stream_id IS 'Stream ID (Referenz zu coin_streams.id)';
+COMMENT ON COLUMN coin_snapshots.price_sol IS 'Preis in SOL';
+COMMENT ON COLUMN coin_snapshots.market_cap_sol IS 'Market Cap in SOL';
+COMMENT ON COLUMN coin_snapshots.v_sol_in_bonding_curve IS 'Virtuelles SOL in der Bonding Curve';
+COMMENT ON COLUMN coin_snapshots.volume_sol IS 'Handelsvolumen in SOL seit dem letzten Snapshot';
+COMMENT ON COLUMN coin_snapshots.buy_count IS 'Anzahl Käufe seit dem letzten Snapshot';
+COMMENT ON COLUMN coin_snapshots.sell_count IS 'Anzahl Verkäufe seit dem letzten Snapshot';
+COMMENT ON COLUMN coin_snapshots.holder_count IS 'Anzahl Holder';
+COMMENT ON COLUMN coin_snapshots.phase_id IS 'Phase ID (Referenz zu ref_coin_phases)';
+
+-- ============================================================================
+-- 2. COIN_SNAPSHOTS_1M - Verdichtete 1-Minuten-Kerzen
+-- ============================================================================
+CREATE TABLE coin_snapshots_1m (
+    bucket TIMESTAMPTZ NOT NULL,                  -- Minute (date_trunc('minute', ts))
+    stream_id BIGINT NOT NULL,
+    price_open DOUBLE PRECISION,
+    price_high DOUBLE PRECISION,
+    price_low DOUBLE PRECISION,
+    price_close DOUBLE PRECISION,
+    market_cap_sol REAL,                          -- Letzter Wert der Minute
+    volume_sol REAL,                              -- Summe der Minute
+    buy_count INT,                                -- Summe der Minute
+    sell_count INT,                               -- Summe der Minute
+    holder_count INT,                             -- Letzter Wert der Minute
+    samples SMALLINT NOT NULL,                    -- Anzahl verdichteter Snapshots
+    phase_id SMALLINT NOT NULL,
+    PRIMARY KEY (stream_id, bucket)
+);
+
+CREATE INDEX idx_coin_snapshots_1m_bucket_brin ON coin_snapshots_1m USING BRIN (bucket);
+
+COMMENT ON TABLE coin_snapshots_1m IS 'Auf 1-Minuten-Kerzen verdichtete Snapshots (ältere Baby-Zone-Daten)';
+
+-- ============================================================================
+-- 3. OPTIONAL: TimescaleDB-Hypertable mit Kompression
+-- ============================================================================
+-- Nur wenn die Extension auf dem Server verfügbar ist - sonst bleibt es bei der
+-- normalen Tabelle mit BRIN. Kompression erst nach dem Verdichtungs-Fenster von
+-- coin_snapshots_maintain() (p_downsample_after + p_lookback = 8 Tage, daher 9 Tage):
+-- DML auf komprimierten Chunks schlägt vor TimescaleDB 2.11 fehl.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'timescaledb') THEN
+        CREATE EXTENSION IF NOT EXISTS timescaledb;
+        PERFORM create_hypertable('coin_snapshots', 'ts', chunk_time_interval => INTERVAL '1 day');
+        ALTER TABLE coin_snapshots SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'stream_id',
+            timescaledb.compress_orderby = 'ts'
+        );
+        PERFORM add_compression_policy('coin_snapshots', INTERVAL '9 days');
+        RAISE NOTICE 'coin_snapshots: TimescaleDB-Hypertable mit Kompression angelegt';
+    ELSE
+        RAISE NOTICE 'coin_snapshots: TimescaleDB nicht verfügbar - normale Tabelle mit BRIN';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- 4. WARTUNG: Verdichtung + Retention
+-- ============================================================================
+-- 1. Rohdaten der Phasen p_downsample_phases älter als p_downsample_after werden zu
+--    1-Minuten-Kerzen verdichtet und gelöscht (Standard: Baby Zone nach 1 Tag).
+--    Betrachtet nur das Fenster p_lookback vor dem Cutoff (BRIN grenzt den Scan ein,
+--    ältere Zeilen sind bei täglichem Lauf längst verdichtet).
+--    Als TimescaleDB-Hypertable nur bis zum ersten komprimierten Chunk (kein DML darauf).
+-- 2. Alle Rohdaten älter als p_raw_retention werden gelöscht (NULL = behalten);
+--    als Hypertable per drop_chunks (ganze Chunks, auch komprimierte)
+-- 3. Kerzen älter als p_candle_retention werden gelöscht (NULL = behalten)
+-- Rückgabe: eine Zeile pro Schritt mit Anzahl betroffener Zeilen.
+CREATE OR REPLACE FUNCTION coin_snapshots_maintain(
+    p_downsample_after INTERVAL DEFAULT INTERVAL '1 day',
+    p_downsample_phases SMALLINT[] DEFAULT ARRAY[1]::SMALLINT[],
+    p_raw_retention INTERVAL DEFAULT INTERVAL '30 days',
+    p_candle_retention INTERVAL DEFAULT NULL,
+    p_lookback INTERVAL DEFAULT INTERVAL '7 days'
+)
+RETURNS TABLE(action TEXT, affected_rows BIGINT) AS $$
+DECLARE
+    v_cutoff TIMESTAMPTZ := date_trunc('minute', NOW() - p_downsample_after);
+    v_from TIMESTAMPTZ := v_cutoff - p_lookback;
+    v_rows BIGINT;
+    v_hypertable BOOLEAN := FALSE;
+BEGIN
+    IF to_regclass('timescaledb_information.chunks') IS NOT NULL THEN
+        v_hypertable := EXISTS (
+            SELECT 1 FROM timescaledb_information.hypertables
+            WHERE hypertable_name = 'coin_snapshots' AND hypertable_schema = current_schema()
+        );
+    END IF;
+    IF v_hypertable THEN
+        -- Komprimierte Chunks nicht anfassen (Verdichtung nur im unkomprimierten Bereich)
+        v_from := GREATEST(v_from, (
+            SELECT MAX(range_end) FROM timescaledb_information.chunks
+            WHERE hypertable_name = 'coin_snapshots' AND hypertable_schema = current_schema()
+              AND is_compressed
+        ));
+    END IF;
+
+    -- Kerzen bilden (ON CONFLICT: Minute wurde bei einem früheren Lauf schon teilweise verdichtet)
+    INSERT INTO coin_snapshots_1m (bucket, stream_id, price_open, price_high, price_low, price_close,
+                                   market_cap_sol, volume_sol, buy_count, sell_count, holder_count,
+                                   samples, phase_id)
+    SELECT date_trunc('minute', ts),
+           stream_id,
+           (array_agg(price_sol ORDER BY ts))[1],
+           MAX(price_sol),
+           MIN(price_sol),
+           (array_agg(price_sol ORDER BY ts DESC))[1],
+           (array_agg(market_cap_sol ORDER BY ts DESC))[1],
+           SUM(volume_sol),
+           SUM(buy_count),
+           SUM(sell_count),
+           (array_agg(holder_count ORDER BY ts DESC))[1],
+           COUNT(*),
+           MIN(phase_id)
+    FROM coin_snapshots
+    WHERE ts >= v_from AND ts < v_cutoff
+      AND phase_id = ANY(p_downsample_phases)
+    GROUP BY 1, 2
+    ON CONFLICT (stream_id, bucket) DO UPDATE SET
+        price_high = GREATEST(coin_snapshots_1m.price_high, EXCLUDED.price_high),
+        price_low = LEAST(coin_snapshots_1m.price_low, EXCLUDED.price_low),
+        price_close = EXCLUDED.price_close,
+        market_cap_sol = EXCLUDED.market_cap_sol,
+        volume_sol = coin_snapshots_1m.volume_sol + EXCLUDED.volume_sol,
+        buy_count = coin_snapshots_1m.buy_count + EXCLUDED.buy_count,
+        sell_count = coin_snapshots_1m.sell_count + EXCLUDED.sell_count,
+        holder_count = EXCLUDED.holder_count,
+        samples = coin_snapshots_1m.samples + EXCLUDED.samples;
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    action := 'downsampled_buckets';
+    affected_rows := v_rows;
+    RETURN NEXT;
+
+    DELETE FROM coin_snapshots
+    WHERE ts >= v_from AND ts < v_cutoff
+      AND phase_id = ANY(p_downsample_phases);
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    action := 'deleted_downsampled_raw';
+    affected_rows := v_rows;
+    RETURN NEXT;
+
+    IF p_raw_retention IS NOT NULL AND v_hypertable THEN
+        SELECT COUNT(*) INTO v_rows FROM drop_chunks('coin_snapshots', older_than => NOW() - p_raw_retention);
+        action := 'dropped_expired_chunks';
+        affected_rows := v_rows;
+        RETURN NEXT;
+    ELSIF p_raw_retention IS NOT NULL THEN
+        DELETE FROM coin_snapshots WHERE ts < NOW() - p_raw_retention;
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        action := 'deleted_expired_raw';
+        affected_rows := v_rows;
+        RETURN NEXT;
+    END IF;
+
+    IF p_candle_retention IS NOT NULL THEN
+        DELETE FROM coin_snapshots_1m WHERE bucket < NOW() - p_candle_retention;
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        action := 'deleted_expired_candles';
+        affected_rows := v_rows;
+        RETURN NEXT;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- ZEITPLAN (optional, mit pg_cron-Extension)
+-- ============================================================================
+-- CREATE EXTENSION IF NOT EXISTS pg_cron;
+-- SELECT cron.schedule(
+--     'coin-snapshots-maintenance',
+--     '30 0 * * *',
+--     $$SELECT * FROM coin_snapshots_maintain()$$
+-- );
+--
+-- Ohne pg_cron: psql -c "SELECT * FROM coin_snapshots_maintain()" per Cron /
+-- Coolify Scheduled Task.
+-- ============================================================================
@@ -58,11 +58,14 @@ CREATE TABLE discovered_coins (
     token_created_at TIMESTAMP WITH TIME ZONE,             -- Wann wurde der Token erstellt
     
     -- ============================================================================
-    -- 6. PREIS & MARKET CAP (nur SOL, USD über separate Tabelle mit Kursen)
+    -- 6. PREIS & MARKET CAP (SOL vom WebSocket, USD vom Relay beim Ingest gestempelt)
     -- ============================================================================
     price_sol NUMERIC(30, 18),                    -- Preis in SOL
     market_cap_sol NUMERIC(20, 2),                -- Market Cap in SOL (vom WebSocket: marketCapSol)
     liquidity_sol NUMERIC(20, 6),                 -- Liquidität in SOL (vom WebSocket: vSolInBondingCurve)
+    sol_price_usd NUMERIC(20, 6),                 -- SOL/USD-Kurs beim Ingest (aus coin_metrics)
+    market_cap_usd NUMERIC(20, 2),                -- market_cap_sol * sol_price_usd
+    price_usd NUMERIC(30, 18),                    -- price_sol * sol_price_usd
     
     -- ============================================================================
     -- 7. GRADUATION (Open Market Cap)
@@ -153,6 +156,9 @@ COMMENT ON COLUMN discovered_coins.bonding_curve_key IS 'Adresse der Bonding Cur
 COMMENT ON COLUMN discovered_coins.initial_buy_sol IS 'SOL Betrag beim initialen Buy - Indikator für Creator-Commitment';
 COMMENT ON COLUMN discovered_coins.market_cap_sol IS 'Market Cap in SOL (direkt vom WebSocket: marketCapSol)';
 COMMENT ON COLUMN discovered_coins.liquidity_sol IS 'Liquidität in SOL (direkt vom WebSocket: vSolInBondingCurve)';
+COMMENT ON COLUMN discovered_coins.sol_price_usd IS 'SOL/USD-Kurs zum Zeitpunkt des Ingests (Relay, aus coin_metrics)';
+COMMENT ON COLUMN discovered_coins.market_cap_usd IS 'Market Cap in USD (Relay: market_cap_sol * sol_price_usd)';
+COMMENT ON COLUMN discovered_coins.price_usd IS 'Preis in USD (Relay: price_sol * sol_price_usd)';
 COMMENT ON COLUMN discovered_coins.open_market_cap_sol IS 'Fester Wert für Graduierung (~85,000 SOL). Berechnungen über Views.';
 COMMENT ON COLUMN discovered_coins.phase_id IS 'Phase ID vom WebSocket (phaseId)';
 COMMENT ON COLUMN discovered_coins.token_decimals IS 'Token Decimals (vom API: token.decimals)';
@@ -0,0 +1,142 @@
+-- ============================================================================
+-- PUMP DISCOVER - Materialisierte Graduation-Views
+-- ============================================================================
+--
+-- Die Views aus views.sql berechnen distance/progress bei JEDER Abfrage über alle
+-- aktiven Coins neu - "nahe der Graduierung" ist damit immer ein Full Scan + Sort.
+-- Grafana und UI pollen diese Views ständig.
+--
+-- Hier werden die Werte materialisiert und indexiert. Die Liste "am nächsten an der
+-- Graduierung" wird dadurch zu einem Index-Scan. Aktualisiert wird per
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY (Leser werden nicht blockiert), z.B. jede Minute.
+--
+-- Voraussetzung: complete_schema.sql (oder partitioned_schema.sql)
+--   psql -d pump_discover -f sql/materialized_views.sql
+--
+-- Die normalen Views aus views.sql bleiben unverändert (immer aktuell, aber teuer).
+-- ============================================================================
+
+-- ============================================================================
+-- Materialisierte View: Graduation-Berechnungen (aktive Coins)
+-- ============================================================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS discovered_coins_graduation_mv AS
+SELECT
+    token_address,
+    name,
+    symbol,
+    market_cap_sol,
+    open_market_cap_sol,
+    (open_market_cap_sol - market_cap_sol) AS distance_to_graduation_sol,
+    -- NULLIF: ein einzelner Coin ohne open_market_cap_sol darf den Refresh nicht abbrechen
+    ROUND((market_cap_sol / NULLIF(open_market_cap_sol, 0) * 100)::NUMERIC, 2) AS graduation_progress_pct,
+    is_graduated,
+    discovered_at,
+    trader_public_key,
+    initial_buy_sol
+FROM discovered_coins
+WHERE is_active = TRUE;
+
+-- UNIQUE-Index ist Voraussetzung für REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dc_graduation_mv_token
+    ON discovered_coins_graduation_mv(token_address);
+CREATE INDEX IF NOT EXISTS idx_dc_graduation_mv_progress
+    ON discovered_coins_graduation_mv(graduation_progress_pct DESC);
+-- "Nahe der Graduierung": nur nicht graduierte Coins mit Market Cap
+CREATE INDEX IF NOT EXISTS idx_dc_graduation_mv_near
+    ON discovered_coins_graduation_mv(graduation_progress_pct DESC)
+    WHERE is_graduated = FALSE AND market_cap_sol > 0 AND graduation_progress_pct IS NOT NULL;
+
+-- ============================================================================
+-- Materialisierte View: Aktive Coins mit allen Berechnungen
+-- ============================================================================
+-- Achtung: dc.* wird beim Anlegen aufgelöst - nach neuen Spalten in discovered_coins
+-- die View löschen und diese Datei erneut ausführen.
+CREATE MATERIALIZED VIEW IF NOT EXISTS discovered_coins_active_mv AS
+SELECT
+    dc.*,
+    (dc.open_market_cap_sol - dc.market_cap_sol) AS distance_to_graduation_sol,
+    ROUND((dc.market_cap_sol / NULLIF(dc.open_market_cap_sol, 0) * 100)::NUMERIC, 2) AS graduation_progress_pct
+FROM discovered_coins dc
+WHERE dc.is_active = TRUE;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_dc_active_mv_token
+    ON discovered_coins_active_mv(token_address);
+CREATE INDEX IF NOT EXISTS idx_dc_active_mv_progress
+    ON discovered_coins_active_mv(graduation_progress_pct DESC);
+CREATE INDEX IF NOT EXISTS idx_dc_active_mv_discovered
+    ON discovered_coins_active_mv(discovered_at DESC);
+
+-- ============================================================================
+-- View: Coins nahe der Graduierung (auf der materialisierten View)
+-- ============================================================================
+-- Gleiche Spalten wie discovered_coins_near_graduation, aber Index-Scan statt Sortierung
+CREATE OR REPLACE VIEW discovered_coins_near_graduation_mv AS
+SELECT
+    token_address,
+    name,
+    symbol,
+    market_cap_sol,
+    open_market_cap_sol,
+    distance_to_graduation_sol,
+    graduation_progress_pct,
+    discovered_at,
+    trader_public_key,
+    initial_buy_sol
+FROM discovered_coins_graduation_mv
+WHERE is_graduated = FALSE
+  AND market_cap_sol > 0
+  AND graduation_progress_pct IS NOT NULL
+ORDER BY graduation_progress_pct DESC;
+
+-- ============================================================================
+-- Refresh-Funktion
+-- ============================================================================
+-- Aktualisiert beide materialisierten Views nacheinander (CONCURRENTLY).
+-- Advisory-Lock verhindert überlappende Refreshes (z.B. Cron-Job + manueller Aufruf);
+-- läuft bereits einer, wird 'skipped' zurückgegeben.
+-- Rückgabe: eine Zeile pro View mit Status und Dauer.
+CREATE OR REPLACE FUNCTION refresh_graduation_views()
+RETURNS TABLE(view_name TEXT, status TEXT, duration_ms NUMERIC) AS $$
+DECLARE
+    v_view TEXT;
+    v_start TIMESTAMPTZ;
+BEGIN
+    IF NOT pg_try_advisory_lock(hashtext('refresh_graduation_views')) THEN
+        view_name := '*';
+        status := 'skipped';
+        duration_ms := 0;
+        RETURN NEXT;
+        RETURN;
+    END IF;
+
+    BEGIN
+        FOREACH v_view IN ARRAY ARRAY['discovered_coins_graduation_mv', 'discovered_coins_active_mv'] LOOP
+            v_start := clock_timestamp();
+            EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I', v_view);
+            view_name := v_view;
+            status := 'refreshed';
+            duration_ms := ROUND((EXTRACT(EPOCH FROM clock_timestamp() - v_start) * 1000)::NUMERIC, 1);
+            RETURN NEXT;
+        END LOOP;
+    EXCEPTION WHEN OTHERS THEN
+        PERFORM pg_advisory_unlock(hashtext('refresh_graduation_views'));
+        RAISE;
+    END;
+
+    PERFORM pg_advisory_unlock(hashtext('refresh_graduation_views'));
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- ZEITPLAN (optional, mit pg_cron-Extension)
+-- ============================================================================
+-- CREATE EXTENSION IF NOT EXISTS pg_cron;
+-- SELECT cron.schedule(
+--     'refresh-graduation-views',
+--     '* * * * *',
+--     $$SELECT * FROM refresh_graduation_views()$$
+-- );
+--
+-- Ohne pg_cron: scripts/refresh_views.py per Cron / Coolify Scheduled Task
+-- (oder mit --interval als Dauerprozess).
+-- ============================================================================
@@ -0,0 +1,151 @@
+-- ============================================================================
+-- PUMP DISCOVER - MIGRATION: discovered_coins (Heap) → partitioniert
+-- ============================================================================
+--
+-- Überführt eine bestehende discovered_coins-Tabelle in die partitionierte
+-- Variante aus partitioned_schema.sql. Die alte Tabelle bleibt als
+-- discovered_coins_legacy erhalten (Rollback möglich).
+--
+-- Ausführung (mit psql, aus dem Projekt-Root):
+--   psql -v ON_ERROR_STOP=1 -d pump_discover -f sql/migrate_discovered_coins_partitioned.sql
+--
+-- Hinweise:
+-- - Während der Migration n8n-Workflows pausieren (keine Inserts).
+-- - Daten werden pro Partition in eigenen Transaktionen kopiert (kein Riesen-Lock).
+-- - Rollback: siehe Ende der Datei.
+-- ============================================================================
+
+-- ============================================================================
+-- 1. Alte Tabelle umbenennen (inkl. Indexe, damit die Namen frei werden)
+-- ============================================================================
+BEGIN;
+
+ALTER TABLE discovered_coins RENAME TO discovered_coins_legacy;
+
+DO $$
+DECLARE
+    v_index RECORD;
+BEGIN
+    FOR v_index IN
+        SELECT indexrelid::regclass::TEXT AS name
+        FROM pg_index
+        WHERE indrelid = 'discovered_coins_legacy'::regclass
+    LOOP
+        EXECUTE format('ALTER INDEX %s RENAME TO %I', v_index.name, v_index.name || '_legacy');
+    END LOOP;
+END $$;
+
+-- Partition-Key darf nicht NULL sein
+UPDATE discovered_coins_legacy
+SET discovered_at = COALESCE(token_created_at, NOW())
+WHERE discovered_at IS NULL;
+
+COMMIT;
+
+-- ============================================================================
+-- 2. Partitionierte Tabelle + Funktionen anlegen
+-- ============================================================================
+\ir partitioned_schema.sql
+
+-- Partitionen für den gesamten Datenbereich der alten Tabelle
+SELECT discovered_coins_create_partitions_between(MIN(discovered_at), MAX(discovered_at))
+FROM discovered_coins_legacy
+HAVING COUNT(*) > 0;
+
+-- ============================================================================
+-- 3. Daten partitionsweise kopieren (jede Partition in eigener Transaktion)
+-- ============================================================================
+-- Spalten explizit über den Namen zuordnen: später per ALTER TABLE ergänzte Spalten
+-- (z.B. add_usd_columns.sql) stehen in der alten Tabelle am Ende
+DO $$
+DECLARE
+    v_part RECORD;
+    v_rows BIGINT;
+    v_columns TEXT;
+BEGIN
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO v_columns
+    FROM pg_attribute
+    WHERE attrelid = 'discovered_coins_legacy'::regclass
+      AND attnum > 0
+      AND NOT attisdropped;
+
+    FOR v_part IN
+        SELECT c.relname,
+               (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'FROM \(''([^'']+)''\)'))[1]::TIMESTAMPTZ AS lower_bound,
+               (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'TO \(''([^'']+)''\)'))[1]::TIMESTAMPTZ AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'discovered_coins'::regclass
+          AND c.relname <> 'discovered_coins_default'
+        ORDER BY 2
+    LOOP
+        EXECUTE format(
+            'INSERT INTO discovered_coins (%s) SELECT %s FROM discovered_coins_legacy '
+            'WHERE discovered_at >= $1 AND discovered_at < $2 ORDER BY discovered_at',
+            v_columns, v_columns
+        ) USING v_part.lower_bound, v_part.upper_bound;
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        RAISE NOTICE '% : % Zeilen kopiert', v_part.relname, v_rows;
+        COMMIT;
+    END LOOP;
+
+    -- Rest außerhalb aller Partitionen (landet in discovered_coins_default)
+    EXECUTE format(
+        'INSERT INTO discovered_coins (%s) SELECT %s FROM discovered_coins_legacy l '
+        'WHERE NOT EXISTS (SELECT 1 FROM discovered_coins_registry r WHERE r.token_address = l.token_address) '
+        'ORDER BY discovered_at',
+        v_columns, v_columns
+    );
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RAISE NOTICE 'discovered_coins_default : % Zeilen kopiert', v_rows;
+    COMMIT;
+END $$;
+
+-- Abbruch, falls Zeilen fehlen (discovered_coins_legacy bleibt für den Rollback erhalten)
+DO $$
+DECLARE
+    v_legacy BIGINT := (SELECT COUNT(*) FROM discovered_coins_legacy);
+    v_partitioned BIGINT := (SELECT COUNT(*) FROM discovered_coins);
+BEGIN
+    IF v_legacy <> v_partitioned THEN
+        RAISE EXCEPTION 'Migration unvollständig: % Zeilen in discovered_coins_legacy, % in discovered_coins',
+            v_legacy, v_partitioned;
+    END IF;
+END $$;
+
+ANALYZE discovered_coins;
+
+-- ============================================================================
+-- 4. Views auf die neue Tabelle umstellen
+-- ============================================================================
+-- Bestehende Views zeigen nach dem RENAME noch auf discovered_coins_legacy
+DROP VIEW IF EXISTS discovered_coins_graduation;
+DROP VIEW IF EXISTS discovered_coins_active;
+DROP VIEW IF EXISTS discovered_coins_near_graduation;
+\ir views.sql
+-- Falls sql/materialized_views.sql genutzt wird, zeigen auch die materialisierten Views
+-- noch auf die Legacy-Tabelle:
+--   DROP MATERIALIZED VIEW IF EXISTS discovered_coins_graduation_mv CASCADE;
+--   DROP MATERIALIZED VIEW IF EXISTS discovered_coins_active_mv;
+--   \ir materialized_views.sql
+
+-- ============================================================================
+-- 5. Prüfung
+-- ============================================================================
+SELECT
+    (SELECT COUNT(*) FROM discovered_coins_legacy) AS legacy_rows,
+    (SELECT COUNT(*) FROM discovered_coins) AS partitioned_rows,
+    (SELECT COUNT(*) FROM discovered_coins_default) AS default_partition_rows;
+
+-- ============================================================================
+-- FERTIG!
+-- ============================================================================
+-- Wenn legacy_rows = partitioned_rows:
+--   DROP TABLE discovered_coins_legacy;
+--
+-- Rollback (solange discovered_coins_legacy existiert):
+--   DROP TABLE discovered_coins CASCADE;
+--   DROP TABLE discovered_coins_registry;
+--   ALTER TABLE discovered_coins_legacy RENAME TO discovered_coins;
+--   (Indexe: *_legacy wieder umbenennen, danach views.sql ausführen)
+-- ============================================================================
@@ -0,0 +1,90 @@
+-- ============================================================================
+-- PUMP DISCOVER - OPTIMIERTE INDEXE für discovered_coins
+-- ============================================================================
+--
+-- Alternative zu den 16 einspaltigen Indexen aus complete_schema.sql.
+-- Jeder Index kostet bei JEDEM Insert einen zusätzlichen B-Tree-Eintrag (+ WAL).
+-- Indexe auf Booleans/wenigen Werten (is_active, is_graduated, Flags, phase_id)
+-- werden vom Planner kaum genutzt, kosten aber bei jedem Insert.
+--
+-- Strategie:
+-- - Boolean-Indexe → Partial-Indexe auf discovered_at (nur die seltenen/interessanten Zeilen)
+-- - Wenige Werte (phase_id, social_count) → kein eigener Index: "neueste zuerst"
+--   mit Filter läuft über idx_dc_discovered (Planner nutzt die Einzel-Indexe ohnehin nicht)
+-- - Meist NULL / Default (image_hash, classification) → Partial-Index ohne Default-Werte
+-- - token_created_at → BRIN (nur Zeitbereichs-Filter, wächst mit der Zeit mit;
+--   neue Seiten werden per autosummarize/VACUUM zusammengefasst)
+-- - discovered_at bleibt B-Tree: `ORDER BY discovered_at DESC LIMIT n` braucht
+--   die Sortierung, die BRIN nicht liefert
+--
+-- Idempotent - kann auf bestehende Installationen angewendet werden:
+--   psql -d pump_discover -f sql/optimized_indexes.sql
+-- Vorher/Nachher messen: python scripts/index_audit.py bench
+-- ============================================================================
+
+-- ============================================================================
+-- 1. Boolean-Indexe ersetzen (Partial-Indexe)
+-- ============================================================================
+
+DROP INDEX IF EXISTS idx_dc_active;
+DROP INDEX IF EXISTS idx_dc_graduated;
+DROP INDEX IF EXISTS idx_dc_metadata_mutable;
+DROP INDEX IF EXISTS idx_dc_mint_authority;
+
+-- Aktive Coins, neueste zuerst (Views discovered_coins_active / _graduation filtern auf is_active)
+CREATE INDEX IF NOT EXISTS idx_dc_active_discovered
+    ON discovered_coins(discovered_at DESC) WHERE is_active = TRUE;
+
+-- Graduierte Coins sind selten → kleiner Partial-Index
+CREATE INDEX IF NOT EXISTS idx_dc_graduated_discovered
+    ON discovered_coins(discovered_at DESC) WHERE is_graduated = TRUE;
+
+-- Kandidaten für "nahe der Graduierung"
+CREATE INDEX IF NOT EXISTS idx_dc_near_graduation
+    ON discovered_coins(market_cap_sol DESC) WHERE is_active = TRUE AND is_graduated = FALSE;
+
+-- RugCheck-Flags: nur die "gefährlichen" Werte sind für Abfragen interessant
+CREATE INDEX IF NOT EXISTS idx_dc_mint_authority_enabled
+    ON discovered_coins(discovered_at DESC) WHERE mint_authority_enabled = TRUE;
+CREATE INDEX IF NOT EXISTS idx_dc_metadata_mutable_true
+    ON discovered_coins(discovered_at DESC) WHERE metadata_is_mutable = TRUE;
+
+-- ============================================================================
+-- 2. Wenige Werte → Index entfällt (idx_dc_discovered + Filter)
+-- ============================================================================
+-- Geprüft gegen die Coin-Explorer-Filter (ui/explorer_sql.py, phase_id / social_count)
+-- mit `scripts/index_audit.py bench --rows 300000`: schon MIT den beiden Indexen wählt
+-- der Planner für alle Explorer-Seiten idx_dc_discovered + Filter (beide Indexe bleiben
+-- ungenutzt), ohne sie ändern sich Pläne und Laufzeiten nicht (Seite 1, Phase 2: ~4-5 ms)
+
+DROP INDEX IF EXISTS idx_dc_phase_id;
+DROP INDEX IF EXISTS idx_dc_social_count;
+
+-- ============================================================================
+-- 3. Meist NULL / Default-Wert → Partial-Index
+-- ============================================================================
+
+DROP INDEX IF EXISTS idx_dc_image_hash;
+DROP INDEX IF EXISTS idx_dc_classification;
+
+CREATE INDEX IF NOT EXISTS idx_dc_image_hash_present
+    ON discovered_coins(image_hash) WHERE image_hash IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_dc_classification_known
+    ON discovered_coins(classification) WHERE classification <> 'UNKNOWN';
+
+-- ============================================================================
+-- 4. Zeitspalten ohne Sortier-Bedarf → BRIN
+-- ============================================================================
+
+DROP INDEX IF EXISTS idx_dc_created_at;
+
+CREATE INDEX IF NOT EXISTS idx_dc_created_at_brin
+    ON discovered_coins USING BRIN (token_created_at) WITH (pages_per_range = 32, autosummarize = on);
+
+-- ============================================================================
+-- Unverändert (selektiv genug bzw. für Sortierung benötigt):
+--   idx_dc_discovered, idx_dc_trader, idx_dc_signature, idx_dc_initial_buy,
+--   idx_dc_market_cap_sol, idx_dc_deploy_platform, idx_dc_risk_score
+-- ============================================================================
+
+ANALYZE discovered_coins;
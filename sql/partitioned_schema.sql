@@ -0,0 +1,345 @@
+-- ============================================================================
+-- PUMP DISCOVER - PARTITIONIERTE VARIANTE VON discovered_coins
+-- ============================================================================
+--
+-- Variante von complete_schema.sql für große Datenmengen (Millionen Zeilen):
+-- discovered_coins wird nach `discovered_at` range-partitioniert (Standard: wöchentlich).
+--
+-- Vorteile:
+-- - Inserts landen immer in der kleinen, "heißen" Partition → Indexe bleiben klein
+-- - `ORDER BY discovered_at DESC` / Zeitfenster-Queries lesen nur die neuesten Partitionen
+-- - Alte Daten werden per DETACH (Metadaten-Operation) archiviert statt per DELETE
+--
+-- Ausführung:
+--   1. complete_schema.sql (legt coin_streams, ref_coin_phases, coin_metrics an)
+--   2. diese Datei (ersetzt discovered_coins durch die partitionierte Variante)
+--   3. views.sql
+--
+-- Bestehende Installation? → sql/migrate_discovered_coins_partitioned.sql
+--
+-- WICHTIG - Unterschiede zur Heap-Tabelle:
+-- - Der PRIMARY KEY muss den Partition-Key enthalten: (token_address, discovered_at).
+--   Die globale Eindeutigkeit von token_address sichert die Tabelle
+--   discovered_coins_registry (Trigger, wirft wie bisher einen unique_violation).
+-- - `INSERT ... ON CONFLICT (token_address)` funktioniert nicht mehr → in n8n
+--   normale Inserts verwenden (Duplikate werfen wie bisher einen Fehler).
+-- - UPDATEs nur über token_address prüfen alle Partitionen; wenn möglich
+--   `AND discovered_at = ...` (aus discovered_coins_registry) mitgeben.
+-- - Benötigt PostgreSQL >= 13.
+-- ============================================================================
+
+DROP TABLE IF EXISTS discovered_coins CASCADE;
+DROP TABLE IF EXISTS discovered_coins_registry CASCADE;
+
+CREATE TABLE discovered_coins (
+    -- ============================================================================
+    -- 1. IDENTIFIKATION
+    -- ============================================================================
+    token_address VARCHAR(64) NOT NULL,           -- Mint-Adresse
+    blockchain_id INT NOT NULL DEFAULT 1,         -- Blockchain ID (1 = Solana)
+    symbol VARCHAR(30),                           -- Token-Symbol
+    name VARCHAR(255),                            -- Token-Name
+    token_decimals INT,                           -- Token Decimals (vom API: token.decimals)
+    token_supply NUMERIC(30, 6),                  -- Token Supply (vom API: token.supply)
+    deploy_platform VARCHAR(50),                 -- Deployment Platform (vom API: deployPlatform)
+
+    -- Partition-Key muss Teil des PRIMARY KEY sein
+    PRIMARY KEY (token_address, discovered_at),
+
+    -- ============================================================================
+    -- 2. TRANSAKTIONS-INFORMATIONEN
+    -- ============================================================================
+    signature VARCHAR(88),                        -- Transaktions-Signatur (für Verifizierung)
+    trader_public_key VARCHAR(44),                -- Creator/Trader Public Key (für Risiko-Analyse)
+
+    -- ============================================================================
+    -- 3. BONDING CURVE & POOL INFORMATIONEN
+    -- ============================================================================
+    bonding_curve_key VARCHAR(44),               -- Bonding Curve Adresse
+    pool_address VARCHAR(64),                     -- Pool-Adresse (falls unterschiedlich)
+    pool_type VARCHAR(20) DEFAULT 'pump',         -- Pool-Typ (meist "pump")
+    v_tokens_in_bonding_curve NUMERIC(30, 6),    -- Virtuelle Tokens in Bonding Curve
+    v_sol_in_bonding_curve NUMERIC(20, 6),       -- Virtuelles SOL in Bonding Curve
+
+    -- ============================================================================
+    -- 4. INITIAL BUY INFORMATIONEN
+    -- ============================================================================
+    initial_buy_sol NUMERIC(20, 6),               -- SOL Betrag beim initialen Buy
+    initial_buy_tokens NUMERIC(30, 6),           -- Anzahl Tokens beim initialen Buy
+
+    -- ============================================================================
+    -- 5. ZEITSTEMPEL
+    -- ============================================================================
+    discovered_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),  -- Partition-Key
+    token_created_at TIMESTAMP WITH TIME ZONE,                      -- Wann wurde der Token erstellt
+
+    -- ============================================================================
+    -- 6. PREIS & MARKET CAP (SOL vom WebSocket, USD vom Relay beim Ingest gestempelt)
+    -- ============================================================================
+    price_sol NUMERIC(30, 18),                    -- Preis in SOL
+    market_cap_sol NUMERIC(20, 2),                -- Market Cap in SOL (vom WebSocket: marketCapSol)
+    liquidity_sol NUMERIC(20, 6),                 -- Liquidität in SOL (vom WebSocket: vSolInBondingCurve)
+    sol_price_usd NUMERIC(20, 6),                 -- SOL/USD-Kurs beim Ingest (aus coin_metrics)
+    market_cap_usd NUMERIC(20, 2),                -- market_cap_sol * sol_price_usd
+    price_usd NUMERIC(30, 18),                    -- price_sol * sol_price_usd
+
+    -- ============================================================================
+    -- 7. GRADUATION (Open Market Cap)
+    -- ============================================================================
+    open_market_cap_sol NUMERIC(20, 2) DEFAULT 85000,  -- Fester Wert für Graduierung (~85,000 SOL)
+    phase_id INT,                                       -- Phase ID (vom WebSocket: phaseId)
+
+    -- ============================================================================
+    -- 8. STATUS FLAGS
+    -- ============================================================================
+    is_mayhem_mode BOOLEAN DEFAULT FALSE,         -- Spezieller "Mayhem Mode" Flag
+    is_graduated BOOLEAN DEFAULT FALSE,           -- Ob der Token bereits graduiert ist
+    is_active BOOLEAN DEFAULT TRUE,               -- Ob der Token noch aktiv ist
+
+    -- ============================================================================
+    -- 9. RISIKO & ANALYSE
+    -- ============================================================================
+    risk_score INT,                               -- Risiko-Score (0-100)
+    top_10_holders_pct NUMERIC(5, 2),             -- Prozentualer Anteil der Top-10-Holder
+    has_socials BOOLEAN DEFAULT FALSE,           -- Ob Social Media vorhanden ist
+    social_count INT DEFAULT 0,                   -- Anzahl Social-Links (0-4)
+    metadata_is_mutable BOOLEAN,                  -- Kann Dev Metadata nachträglich ändern? (RugCheck)
+    mint_authority_enabled BOOLEAN,                -- Kann Dev neue Tokens drucken? (RugCheck)
+    image_hash VARCHAR(64),                       -- pHash des Bildes (für Lazy Scam Detection)
+
+    -- ============================================================================
+    -- 10. METADATA & SOCIAL MEDIA
+    -- ============================================================================
+    metadata_uri TEXT,                             -- URI zur Metadata (IPFS/RapidLaunch)
+    description TEXT,                              -- Token-Beschreibung (aus Metadata)
+    image_url TEXT,                                -- Bild-URL (aus Metadata)
+    twitter_url TEXT,                              -- Twitter/X URL (aus Metadata)
+    telegram_url TEXT,                             -- Telegram URL (aus Metadata)
+    website_url TEXT,                              -- Website URL (aus Metadata)
+    discord_url TEXT,                              -- Discord URL (aus Metadata)
+
+    -- ============================================================================
+    -- 11. MANAGEMENT & KLASSIFIZIERUNG
+    -- ============================================================================
+    final_outcome VARCHAR(20) DEFAULT 'PENDING', -- Ergebnis: PENDING, GRADUATED, RUG, etc.
+    classification VARCHAR(50) DEFAULT 'UNKNOWN', -- Klassifizierung
+    status_note VARCHAR(255)                      -- Notiz zum Status
+) PARTITION BY RANGE (discovered_at);
+
+-- Default-Partition fängt Zeilen außerhalb der angelegten Bereiche auf
+-- (sollte leer bleiben - Wartungsjob legt Partitionen im Voraus an)
+CREATE TABLE discovered_coins_default PARTITION OF discovered_coins DEFAULT;
+
+-- ============================================================================
+-- INDEXE für discovered_coins (werden automatisch auf alle Partitionen vererbt)
+-- ============================================================================
+-- Gleiche Indexe wie complete_schema.sql. idx_dc_discovered bleibt, damit
+-- `ORDER BY discovered_at DESC LIMIT n` pro Partition ein Index-Scan ist.
+-- Ausnahme idx_dc_active: zusammengesetzt mit discovered_at, sonst muss der
+-- Merge Append bei `WHERE is_active ORDER BY discovered_at DESC LIMIT n` alte
+-- Partitionen (ohne aktive Coins) komplett durchsuchen.
+
+-- Basis-Indexe
+CREATE INDEX idx_dc_active ON discovered_coins(is_active, discovered_at DESC);
+CREATE INDEX idx_dc_graduated ON discovered_coins(is_graduated);
+CREATE INDEX idx_dc_discovered ON discovered_coins(discovered_at DESC);
+CREATE INDEX idx_dc_created_at ON discovered_coins(token_created_at);
+
+-- Transaktions-Indexe
+CREATE INDEX idx_dc_trader ON discovered_coins(trader_public_key);
+CREATE INDEX idx_dc_signature ON discovered_coins(signature);
+
+-- Initial Buy Index (für Commitment-Analyse)
+CREATE INDEX idx_dc_initial_buy ON discovered_coins(initial_buy_sol DESC);
+
+-- Market Cap Indexe
+CREATE INDEX idx_dc_market_cap_sol ON discovered_coins(market_cap_sol DESC);
+
+-- Phase-Index
+CREATE INDEX idx_dc_phase_id ON discovered_coins(phase_id);
+
+-- Token-Indexe
+CREATE INDEX idx_dc_deploy_platform ON discovered_coins(deploy_platform);
+
+-- Risiko-Indexe
+CREATE INDEX idx_dc_risk_score ON discovered_coins(risk_score);
+CREATE INDEX idx_dc_classification ON discovered_coins(classification);
+CREATE INDEX idx_dc_social_count ON discovered_coins(social_count);
+CREATE INDEX idx_dc_metadata_mutable ON discovered_coins(metadata_is_mutable);
+CREATE INDEX idx_dc_mint_authority ON discovered_coins(mint_authority_enabled);
+CREATE INDEX idx_dc_image_hash ON discovered_coins(image_hash);
+
+COMMENT ON TABLE discovered_coins IS 'Speichert alle entdeckten Pump.fun Tokens (range-partitioniert nach discovered_at)';
+COMMENT ON COLUMN discovered_coins.discovered_at IS 'Wann wurde der Coin entdeckt - Partition-Key (NOT NULL)';
+
+-- ============================================================================
+-- DISCOVERED_COINS_REGISTRY - globale Eindeutigkeit von token_address
+-- ============================================================================
+
+CREATE TABLE discovered_coins_registry (
+    token_address VARCHAR(64) PRIMARY KEY,
+    discovered_at TIMESTAMP WITH TIME ZONE NOT NULL   -- Partition des Coins (für gezielte UPDATEs)
+);
+
+COMMENT ON TABLE discovered_coins_registry IS 'Eindeutige token_address über alle Partitionen (auch archivierte) - gepflegt per Trigger und scripts/partition_maintenance.py';
+
+CREATE OR REPLACE FUNCTION discovered_coins_register()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        -- Wirft unique_violation bei Duplikaten (wie der PRIMARY KEY der Heap-Tabelle)
+        INSERT INTO discovered_coins_registry (token_address, discovered_at)
+        VALUES (NEW.token_address, NEW.discovered_at);
+    ELSIF TG_OP = 'UPDATE' AND (
+          NEW.token_address IS DISTINCT FROM OLD.token_address
+       OR NEW.discovered_at IS DISTINCT FROM OLD.discovered_at) THEN
+        UPDATE discovered_coins_registry
+        SET token_address = NEW.token_address, discovered_at = NEW.discovered_at
+        WHERE token_address = OLD.token_address;
+    ELSIF TG_OP = 'DELETE' THEN
+        -- Gelöschte Coins geben ihre token_address wieder frei
+        DELETE FROM discovered_coins_registry
+        WHERE token_address = OLD.token_address;
+        RETURN OLD;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_discovered_coins_register
+    AFTER INSERT OR UPDATE OF token_address, discovered_at OR DELETE ON discovered_coins
+    FOR EACH ROW EXECUTE FUNCTION discovered_coins_register();
+
+-- ============================================================================
+-- PARTITION-MANAGEMENT
+-- ============================================================================
+
+-- Legt die Partition an, die p_day enthält (Grenzen in UTC).
+-- p_granularity: 'day' oder 'week'
+CREATE OR REPLACE FUNCTION discovered_coins_create_partition(
+    p_day DATE,
+    p_granularity TEXT DEFAULT 'week'
+)
+RETURNS TEXT AS $$
+DECLARE
+    v_start TIMESTAMP := date_trunc(p_granularity, p_day::TIMESTAMP);
+    v_end TIMESTAMP := v_start + ('1 ' || p_granularity)::INTERVAL;
+    v_name TEXT := 'discovered_coins_p' || to_char(v_start, 'YYYYMMDD');
+BEGIN
+    IF p_granularity NOT IN ('day', 'week') THEN
+        RAISE EXCEPTION 'Ungültige Granularität: % (erlaubt: day, week)', p_granularity;
+    END IF;
+
+    IF to_regclass(v_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF discovered_coins FOR VALUES FROM (%L) TO (%L)',
+            v_name,
+            v_start AT TIME ZONE 'UTC',
+            v_end AT TIME ZONE 'UTC'
+        );
+        RETURN v_name;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Legt alle Partitionen zwischen zwei Zeitpunkten an (z.B. für Migration/Backfill)
+CREATE OR REPLACE FUNCTION discovered_coins_create_partitions_between(
+    p_from TIMESTAMPTZ,
+    p_to TIMESTAMPTZ,
+    p_granularity TEXT DEFAULT 'week'
+)
+RETURNS SETOF TEXT AS $$
+DECLARE
+    -- Auf den Partitionsbeginn ausrichten: sonst überspringt der Schritt die
+    -- Partition von p_to, wenn p_from später in der Woche liegt als p_to
+    v_day DATE := date_trunc(p_granularity, p_from AT TIME ZONE 'UTC')::DATE;
+    v_name TEXT;
+BEGIN
+    WHILE v_day <= (p_to AT TIME ZONE 'UTC')::DATE LOOP
+        v_name := discovered_coins_create_partition(v_day, p_granularity);
+        IF v_name IS NOT NULL THEN
+            RETURN NEXT v_name;
+        END IF;
+        v_day := v_day + ('1 ' || p_granularity)::INTERVAL;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Wartungsjob:
+-- 1. Legt die aktuelle + p_premake zukünftige Partitionen an
+-- 2. Hängt Partitionen, die komplett älter als p_retention sind, aus (DETACH)
+--    und verschiebt sie ins Archiv-Schema (p_archive_schema).
+--    Archivierte Partitionen können per pg_dump gesichert und danach gelöscht werden
+--    (scripts/partition_maintenance.py --dump-dir räumt dabei auch discovered_coins_registry auf).
+--    p_retention = NULL → nichts archivieren
+CREATE OR REPLACE FUNCTION discovered_coins_maintain_partitions(
+    p_premake INT DEFAULT 4,
+    p_retention INTERVAL DEFAULT NULL,
+    p_granularity TEXT DEFAULT 'week',
+    p_archive_schema TEXT DEFAULT 'archive'
+)
+RETURNS TABLE (action TEXT, partition_name TEXT) AS $$
+DECLARE
+    v_name TEXT;
+    v_part RECORD;
+BEGIN
+    -- 1. Partitionen im Voraus anlegen
+    FOR i IN 0..p_premake LOOP
+        v_name := discovered_coins_create_partition(
+            ((NOW() AT TIME ZONE 'UTC') + (i || ' ' || p_granularity)::INTERVAL)::DATE,
+            p_granularity
+        );
+        IF v_name IS NOT NULL THEN
+            action := 'created';
+            partition_name := v_name;
+            RETURN NEXT;
+        END IF;
+    END LOOP;
+
+    -- 2. Alte Partitionen archivieren
+    IF p_retention IS NULL THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format('CREATE SCHEMA IF NOT EXISTS %I', p_archive_schema);
+
+    FOR v_part IN
+        SELECT c.relname,
+               (regexp_match(pg_get_expr(c.relpartbound, c.oid), 'TO \(''([^'']+)''\)'))[1]::TIMESTAMPTZ AS upper_bound
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'discovered_coins'::regclass
+          AND c.relname <> 'discovered_coins_default'
+        ORDER BY c.relname
+    LOOP
+        IF v_part.upper_bound <= NOW() - p_retention THEN
+            EXECUTE format('ALTER TABLE discovered_coins DETACH PARTITION %I', v_part.relname);
+            EXECUTE format('ALTER TABLE %I SET SCHEMA %I', v_part.relname, p_archive_schema);
+            action := 'archived';
+            partition_name := p_archive_schema || '.' || v_part.relname;
+            RETURN NEXT;
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION discovered_coins_maintain_partitions(INT, INTERVAL, TEXT, TEXT) IS
+    'Wartungsjob: legt zukünftige Partitionen an und archiviert alte (DETACH + Archiv-Schema)';
+
+-- Initiale Partitionen: letzte 4 Wochen + 4 Wochen im Voraus
+SELECT discovered_coins_create_partitions_between(NOW() - INTERVAL '4 weeks', NOW());
+SELECT * FROM discovered_coins_maintain_partitions(4);
+
+-- ============================================================================
+-- ZEITPLAN (optional, mit pg_cron-Extension)
+-- ============================================================================
+-- CREATE EXTENSION IF NOT EXISTS pg_cron;
+-- SELECT cron.schedule(
+--     'discovered-coins-partitions',
+--     '15 0 * * *',
+--     $$SELECT * FROM discovered_coins_maintain_partitions(4, INTERVAL '90 days')$$
+-- );
+--
+-- Ohne pg_cron: scripts/partition_maintenance.py per Cron / Coolify Scheduled Task.
+-- ============================================================================
@@ -27,6 +27,11 @@ WHERE is_active = TRUE;
 -- ============================================================================
 -- View: Mit USD-Werten (über Kurs-Tabelle)
 -- ============================================================================
+-- HINWEIS: Mit EXCHANGE_RATE_ENABLED=true stempelt der Relay sol_price_usd, market_cap_usd
+-- und price_usd bereits beim Ingest (Kurs aus coin_metrics) - der LATERAL-Join pro Abfrage
+-- ist dann nur noch für Live-Umrechnungen zum aktuellen Kurs nötig.
+-- Alte Zeilen nachträglich füllen: scripts/backfill_usd.py
+--
 -- ANPASSUNG ERFORDERLICH: Ersetze 'exchange_rates' mit deiner tatsächlichen Kurs-Tabelle
 -- ANPASSUNG ERFORDERLICH: Ersetze 'sol_price_usd' mit deinem tatsächlichen Kurs-Feld
 -- 
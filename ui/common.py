@@ -0,0 +1,367 @@
+"""
+Gemeinsame Bausteine der UI: Konstanten, Konfiguration und Relay-API
+
+Wird von app.py bei jedem Rerun gebraucht und enthält deshalb nur leichte
+Imports. Schwere Abhängigkeiten (pandas, psycopg2, docker) laden erst die
+Tab-Module bzw. die Funktionen, die sie wirklich brauchen.
+"""
+import os
+import re
+from urllib.parse import urlparse
+
+import streamlit as st
+import yaml
+
+from relay_client import RelayClient
+
+# Konfiguration
+CONFIG_FILE = "/app/config/config.yaml"
+ENV_FILE = "/app/.env"  # .env Datei für Docker Compose
+RELAY_SERVICE = os.getenv("RELAY_SERVICE", "pump-discover-relay")  # Container-Name
+RELAY_PORT = int(os.getenv("RELAY_PORT", "8000"))
+COOLIFY_MODE = os.getenv("COOLIFY_MODE", "false").lower() == "true"  # Coolify-Modus (kein Docker Socket)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "3000"))  # Abbruch langsamer Dashboard-Queries
+DB_POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", "5"))  # Geteilt von allen Viewern/Sessions
+# Auto-Refresh-Intervalle der Live-Bereiche (Streamlit-Fragmente, kein Rerun der ganzen Seite)
+DASHBOARD_REFRESH_SECONDS = 5
+DB_REFRESH_SECONDS = 15  # = TTL von fetch_sol_rate_overview
+LOGS_REFRESH_SECONDS = 10
+LOG_MAX_LINES = 1000  # = Log-Buffer des Relays
+RELAY_CACHE_TTL = 2  # Health/Metrics/Stats: Fragmente und Viewer innerhalb von 2s teilen sich eine Relay-Anfrage
+FEED_REFRESH_SECONDS = 2  # Live-Feed Tabelle
+FEED_MAX_ROWS = 1000  # Zeilen im Live-Feed (st.dataframe rendert nur den sichtbaren Ausschnitt)
+FEED_IDLE_TIMEOUT = 60  # SSE-Verbindung schließen, wenn so lange kein Viewer den Feed anzeigt
+
+def load_config():
+    """Lädt Konfiguration aus YAML-Datei oder .env"""
+    # Versuche zuerst YAML
+    if os.path.exists(CONFIG_FILE):
+        with open(CONFIG_FILE, 'r') as f:
+            config = yaml.safe_load(f)
+            if config:
+                return config
+    
+    # Fallback: Lade aus .env
+    env_paths = ["/app/.env", "/app/../.env", "/app/config/.env", ".env"]
+    config = {}
+    env_file_found = False
+    
+    for env_path in env_paths:
+        if os.path.exists(env_path):
+            env_file_found = True
+            with open(env_path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        key = key.strip()
+                        value = value.strip()
+                        # Konvertiere Zahlen
+                        if value.isdigit():
+                            config[key] = int(value)
+                        else:
+                            config[key] = value
+            break
+    
+    # Wenn keine Config-Datei gefunden wurde, erstelle .env mit Default-Werten
+    if not env_file_found and not config:
+        default_config = get_default_config()
+        # Erstelle .env Datei mit Default-Werten
+        save_config(default_config)
+        return default_config
+    
+    # Wenn Config aus .env geladen wurde, aber leer ist, verwende Defaults
+    if not config:
+        return get_default_config()
+    
+    return config
+
+def save_config(config):
+    """Speichert Konfiguration in YAML-Datei UND .env Datei"""
+    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
+    
+    # Speichere YAML (für UI)
+    with open(CONFIG_FILE, 'w') as f:
+        yaml.dump(config, f, default_flow_style=False)
+    
+    # Speichere .env (für Docker Compose / Relay Service)
+    n8n_url = config.get('N8N_WEBHOOK_URL', '')
+    env_content = f"""# ============================================================================
+# PUMP DISCOVER - Umgebungsvariablen
+# ============================================================================
+# Diese Datei wird automatisch von der Streamlit UI verwaltet.
+# Änderungen werden beim Service-Neustart übernommen.
+# ============================================================================
+
+# Batch-Einstellungen
+BATCH_SIZE={config.get('BATCH_SIZE', 10)}
+BATCH_TIMEOUT={config.get('BATCH_TIMEOUT', 30)}
+
+# n8n Webhook (Lass leer, wenn n8n noch nicht konfiguriert ist)
+N8N_WEBHOOK_URL={n8n_url}
+N8N_WEBHOOK_METHOD={config.get('N8N_WEBHOOK_METHOD', 'POST')}
+
+# WebSocket Einstellungen
+WS_URI={config.get('WS_URI', 'wss://pumpportal.fun/api/data')}
+WS_RETRY_DELAY={config.get('WS_RETRY_DELAY', 3)}
+WS_MAX_RETRY_DELAY={config.get('WS_MAX_RETRY_DELAY', 60)}
+WS_PING_INTERVAL={config.get('WS_PING_INTERVAL', 20)}
+WS_PING_TIMEOUT={config.get('WS_PING_TIMEOUT', 10)}
+WS_CONNECTION_TIMEOUT={config.get('WS_CONNECTION_TIMEOUT', 30)}
+
+# n8n Retry-Einstellungen
+N8N_RETRY_DELAY={config.get('N8N_RETRY_DELAY', 5)}
+
+# Filter-Einstellungen
+BAD_NAMES_PATTERN={config.get('BAD_NAMES_PATTERN', 'test|bot|rug|scam|cant|honey|faucet')}
+
+# Health-Check Port
+HEALTH_PORT={config.get('HEALTH_PORT', 8000)}
+
+# Datenbank-Einstellungen (für UI DB-Prüfung)
+DB_HOST={config.get('DB_HOST', 'localhost')}
+DB_PORT={config.get('DB_PORT', 5432)}
+DB_NAME={config.get('DB_NAME', 'pump_discover')}
+DB_USER={config.get('DB_USER', 'postgres')}
+DB_PASSWORD={config.get('DB_PASSWORD', '')}
+
+# Docker Compose Ports
+RELAY_PORT=8000
+UI_PORT=8501
+"""
+    
+    # Speichere .env Datei in Config-Volume (wird vom Relay-Service geladen)
+    env_paths = [
+        "/app/config/.env",  # Config-Volume (wichtig für Coolify!)
+        "/app/.env",  # Fallback
+        "/app/../.env",  # Projekt-Root (wenn gemountet)
+    ]
+    
+    saved_env = False
+    for env_path in env_paths:
+        try:
+            env_dir = os.path.dirname(env_path)
+            if env_dir and env_dir != "/app":
+                os.makedirs(env_dir, exist_ok=True)
+            with open(env_path, 'w') as f:
+                f.write(env_content)
+            saved_env = True
+            break
+        except Exception as e:
+            continue
+    
+    # Wenn .env nicht geschrieben werden konnte, versuche über Docker Compose
+    if not saved_env:
+        try:
+            import subprocess
+            # Schreibe temporäre .env und kopiere sie
+            temp_env = "/tmp/.env"
+            with open(temp_env, 'w') as f:
+                f.write(env_content)
+            # Versuche über docker compose exec zu kopieren (falls möglich)
+        except:
+            pass
+    
+    return True  # YAML wurde immer gespeichert
+
+def get_default_config():
+    """Gibt Standard-Konfiguration zurück"""
+    return {
+        "BATCH_SIZE": 10,
+        "BATCH_TIMEOUT": 30,
+        "N8N_WEBHOOK_URL": "",  # Leer als Default
+        "N8N_WEBHOOK_METHOD": "POST",
+        "WS_RETRY_DELAY": 3,
+        "WS_MAX_RETRY_DELAY": 60,
+        "N8N_RETRY_DELAY": 5,
+        "WS_PING_INTERVAL": 20,
+        "WS_PING_TIMEOUT": 10,
+        "WS_CONNECTION_TIMEOUT": 30,
+        "WS_URI": "wss://pumpportal.fun/api/data",
+        "BAD_NAMES_PATTERN": "test|bot|rug|scam|cant|honey|faucet",
+        "HEALTH_PORT": 8000,
+        "DB_HOST": "localhost",
+        "DB_PORT": 5432,
+        "DB_NAME": "pump_discover",
+        "DB_USER": "postgres",
+        "DB_PASSWORD": ""  # Leer als Default
+    }
+
+def validate_url(url, allow_empty=False):
+    """Validiert eine URL"""
+    if allow_empty and not url:
+        return True, None
+    if not url:
+        return False, "URL darf nicht leer sein"
+    try:
+        result = urlparse(url)
+        if not result.scheme or not result.netloc:
+            return False, "Ungültige URL-Format"
+        if result.scheme not in ["http", "https", "wss", "ws"]:
+            return False, f"Ungültiges Protokoll: {result.scheme}. Erlaubt: http, https, ws, wss"
+        return True, None
+    except Exception as e:
+        return False, f"URL-Validierungsfehler: {str(e)}"
+
+def validate_port(port):
+    """Validiert einen Port"""
+    try:
+        port_int = int(port)
+        if 1 <= port_int <= 65535:
+            return True, None
+        return False, "Port muss zwischen 1 und 65535 liegen"
+    except ValueError:
+        return False, "Port muss eine Zahl sein"
+
+def validate_regex(pattern, allow_empty=False):
+    """Validiert ein Regex-Pattern"""
+    if allow_empty and not pattern:
+        return True, None
+    if not pattern:
+        return False, "Pattern darf nicht leer sein"
+    try:
+        re.compile(pattern)
+        return True, None
+    except re.error as e:
+        return False, f"Ungültiges Regex-Pattern: {str(e)}"
+
+@st.cache_resource(show_spinner=False)
+def get_relay_client():
+    """Ein Relay-Client pro UI-Prozess (Session, Circuit Breaker, Cache), geteilt von allen Viewern"""
+    return RelayClient(f"http://{RELAY_SERVICE}:{RELAY_PORT}", cache_ttl=RELAY_CACHE_TTL)
+
+# Endpunkte für fetch_relay(): Name → (Pfad, Optionen von RelayClient.get)
+RELAY_ENDPOINTS = {
+    "health": ("/health", {"ok_status": (200, 503)}),  # 503 = degraded, Antwort enthält trotzdem den Status
+    "metrics": ("/metrics", {"as_json": False}),
+    "stats": ("/stats", {}),
+}
+
+def fetch_relay(*names):
+    """Mehrere Relay-Endpunkte parallel holen (z.B. "health", "stats"); None für nicht erreichbare"""
+    return get_relay_client().fetch_many(*(RELAY_ENDPOINTS[name] for name in names))
+
+def get_relay_last_known(name):
+    """Letzter erfolgreich geholter Wert eines Endpunkts und sein Alter in Sekunden"""
+    return get_relay_client().last_known(RELAY_ENDPOINTS[name][0])
+
+def get_relay_health():
+    """Holt Health-Status vom Relay-Service (kurz gecacht)"""
+    return fetch_relay("health")[0]
+
+def reload_config():
+    """Lädt die Konfiguration im Relay-Service neu (ohne Neustart)"""
+    try:
+        response = get_relay_client().request("POST", "/reload-config", timeout=5)
+        if response.status_code == 200:
+            data = response.json()
+            return True, data.get("message", "Konfiguration wurde neu geladen")
+        else:
+            return False, f"Fehler: HTTP {response.status_code}"
+    except Exception as e:
+        return False, f"Fehler beim Neuladen: {str(e)}"
+
+def restart_service():
+    """Startet Relay-Service neu (über Docker API, damit .env neu geladen wird)"""
+    # Coolify-Modus: Versuche zuerst Config-Neuladen über API
+    if COOLIFY_MODE:
+        success, message = reload_config()
+        if success:
+            return True, f"✅ {message} (ohne Neustart - funktioniert in Coolify!)"
+        else:
+            return False, f"⚠️ Coolify-Modus: {message}. Falls das nicht funktioniert, starte den 'api' Service im Coolify-Dashboard neu."
+    
+    try:
+        import docker
+        client = docker.from_env()
+        
+        # Versuche verschiedene Container-Namen
+        container_names = ["pump-discover-relay", "relay", RELAY_SERVICE]
+        container = None
+        for name in container_names:
+            try:
+                container = client.containers.get(name)
+                break
+            except docker.errors.NotFound:
+                continue
+        
+        if not container:
+            return False, "Container 'pump-discover-relay' nicht gefunden"
+        
+        # Stoppe Container
+        container.stop(timeout=10)
+        
+        # Starte Container neu (lädt .env neu)
+        container.start()
+        
+        return True, "Service erfolgreich neu gestartet! Neue Environment Variables werden geladen."
+        
+    except ImportError:
+        # Docker Python Client nicht verfügbar - versuche über Docker Socket direkt
+        try:
+            import subprocess
+            import os
+            
+            # Prüfe ob docker compose verfügbar ist
+            docker_compose_cmd = None
+            for cmd in ["docker", "docker-compose"]:
+                try:
+                    result = subprocess.run(
+                        [cmd, "--version"],
+                        capture_output=True,
+                        timeout=5
+                    )
+                    if result.returncode == 0:
+                        docker_compose_cmd = cmd
+                        break
+                except:
+                    continue
+            
+            if not docker_compose_cmd:
+                return False, "Docker/Docker Compose nicht gefunden. Bitte manuell neu starten: docker compose restart relay"
+            
+            # Versuche über Docker Socket zu arbeiten
+            # Finde das Projekt-Verzeichnis (wo docker-compose.yml ist)
+            compose_file = "/app/../docker-compose.yml"
+            if not os.path.exists(compose_file):
+                compose_file = "/app/docker-compose.yml"
+            
+            if os.path.exists(compose_file):
+                work_dir = os.path.dirname(compose_file)
+                result = subprocess.run(
+                    [docker_compose_cmd, "restart", "relay"],
+                    cwd=work_dir,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                if result.returncode == 0:
+                    return True, "Service neu gestartet (via docker compose)"
+                else:
+                    return False, f"Docker Compose Fehler: {result.stderr}"
+            else:
+                return False, "docker-compose.yml nicht gefunden"
+                
+        except Exception as e:
+            return False, f"Fehler: {str(e)}"
+    except Exception as e:
+        return False, f"Fehler: {str(e)}"
+    except ImportError:
+        # Fallback: Docker Python Client nicht verfügbar
+        import subprocess
+        try:
+            result = subprocess.run(
+                ["docker", "compose", "restart", "relay"],
+                cwd="/app",
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                return True, "Service erfolgreich neu gestartet (via docker compose)"
+            else:
+                return False, f"Docker Compose Fehler: {result.stderr}"
+        except Exception as e:
+            return False, f"Fehler: {str(e)}"
+    except Exception as e:
+        return False, f"Fehler: {str(e)}"
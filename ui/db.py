@@ -0,0 +1,165 @@
+"""
+Datenbank-Zugriff der UI (Connection-Pool + gecachte Dashboard-Queries)
+
+Eigenes Modul, damit psycopg2 erst geladen wird, wenn ein Tab die Datenbank braucht.
+"""
+import os
+
+import psycopg2
+from psycopg2 import pool as pg_pool
+import streamlit as st
+
+from common import DB_POOL_MAX_CONN, DB_STATEMENT_TIMEOUT_MS, load_config
+from explorer_sql import COUNT_ESTIMATE_SQL, count_estimate_query, page_query, plan_rows, plan_scans
+
+def get_db_params(config=None):
+    """DB-Verbindungsparameter aus Config-Datei oder Environment Variables (hashbar für Caches)"""
+    if config is None:
+        config = load_config()
+    return (
+        config.get('DB_HOST', os.getenv('DB_HOST', 'localhost')),
+        str(config.get('DB_PORT', os.getenv('DB_PORT', '5432'))),
+        config.get('DB_NAME', os.getenv('DB_NAME', 'pump_discover')),
+        config.get('DB_USER', os.getenv('DB_USER', 'postgres')),
+        config.get('DB_PASSWORD', os.getenv('DB_PASSWORD', ''))
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_db_pool(db_params):
+    """Connection-Pool pro DB-Konfiguration - einmal pro Prozess, geteilt von allen Sessions"""
+    host, port, database, user, password = db_params
+    return pg_pool.ThreadedConnectionPool(
+        1, DB_POOL_MAX_CONN,
+        host=host,
+        port=port,
+        database=database,
+        user=user,
+        password=password,
+        connect_timeout=5,
+        options=f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}",
+        application_name="pump-discover-ui"
+    )
+
+def run_query(db_params, query, params=None):
+    """Führt eine Query über den Pool aus und liefert alle Zeilen"""
+    db_pool = get_db_pool(db_params)
+    conn = db_pool.getconn()
+    broken = False
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        # Verbindung verwerfen (z.B. DB-Neustart), der Pool baut eine neue auf
+        broken = True
+        raise
+    finally:
+        db_pool.putconn(conn, close=broken or conn.closed != 0)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_database_status(db_params):
+    """Verbindung + Tabellen-Existenz (gecacht, Test-Button umgeht den Cache)"""
+    result = {
+        'connected': False,
+        'tables': {
+            'discovered_coins': False,
+            'coin_streams': False,
+            'ref_coin_phases': False,
+            'exchange_rates': False
+        },
+        'error': None,
+        'configured': True
+    }
+    try:
+        rows = run_query(db_params, """
+            SELECT table_name 
+            FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_name IN ('discovered_coins', 'coin_streams', 'ref_coin_phases', 'exchange_rates')
+        """)
+        existing_tables = [row[0] for row in rows]
+        result['connected'] = True
+        for table in result['tables']:
+            result['tables'][table] = table in existing_tables
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+def check_database_connection(fresh=False, db_params=None):
+    """Prüft DB-Verbindung und Tabellen-Existenz"""
+    if db_params is None:
+        db_params = get_db_params()
+    
+    # Prüfe ob DB-Credentials gesetzt sind
+    if not db_params[4]:
+        return {
+            'connected': False,
+            'tables': {
+                'discovered_coins': False,
+                'coin_streams': False,
+                'ref_coin_phases': False,
+                'exchange_rates': False
+            },
+            'error': 'DB-Credentials nicht konfiguriert (DB_PASSWORD fehlt)',
+            'configured': False
+        }
+    
+    if fresh:
+        fetch_database_status.clear()
+        get_db_pool.clear()
+    return fetch_database_status(db_params)
+
+@st.cache_data(ttl=15, show_spinner=False)
+def fetch_sol_rate_overview(db_params):
+    """Aktueller SOL-Kurs, Verlauf der letzten 5 Minuten und Statistik aus exchange_rates"""
+    current_rate = run_query(db_params, """
+        SELECT sol_price_usd, created_at 
+        FROM exchange_rates 
+        ORDER BY created_at DESC 
+        LIMIT 1
+    """)
+    history = run_query(db_params, """
+        SELECT sol_price_usd, created_at 
+        FROM exchange_rates 
+        WHERE created_at >= NOW() - INTERVAL '5 minutes'
+        ORDER BY created_at ASC
+    """)
+    stats = run_query(db_params, """
+        SELECT 
+            COUNT(*) as total_snapshots,
+            AVG(sol_price_usd) as avg_sol_price,
+            MIN(sol_price_usd) as min_sol_price,
+            MAX(sol_price_usd) as max_sol_price
+        FROM exchange_rates
+    """)
+    return {
+        "current": current_rate[0] if current_rate else None,
+        "history": history,
+        "stats": stats[0] if stats else None
+    }
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_coin_count_estimate(db_params):
+    """Geschätzte Anzahl Coins aus pg_class.reltuples (aktualisiert von ANALYZE/autovacuum, kein COUNT(*))"""
+    return run_query(db_params, COUNT_ESTIMATE_SQL)[0][0]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_filtered_count_estimate(db_params, filters):
+    """Geschätzte Treffer für die Explorer-Filter (Zeilenschätzung des Planners)"""
+    query, params = count_estimate_query(filters)
+    return plan_rows(run_query(db_params, "EXPLAIN (FORMAT JSON) " + query, params)[0][0])
+
+@st.cache_data(ttl=15, show_spinner=False)
+def fetch_coin_page(db_params, filters, after, limit):
+    """Eine Explorer-Seite (Keyset) und ob es eine weitere gibt"""
+    query, params = page_query(filters, after, limit)
+    rows = run_query(db_params, query, params)
+    return rows[:limit], len(rows) > limit
+
+def explain_coin_page(db_params, filters, after, limit):
+    """Plan der Seiten-Abfrage (EXPLAIN ohne ANALYZE): Text + genutzte Scans"""
+    query, params = page_query(filters, after, limit)
+    plan = run_query(db_params, "EXPLAIN (FORMAT JSON) " + query, params)[0][0]
+    text = run_query(db_params, "EXPLAIN " + query, params)
+    return "\n".join(row[0] for row in text), plan_scans(plan)
@@ -0,0 +1,84 @@
+"""
+SQL für den Coin-Explorer (discovered_coins durchblättern)
+
+Ohne Streamlit-Abhängigkeit, damit scripts/index_audit.py dieselben Abfragen
+auf ihre Pläne prüfen kann.
+- Keyset-Pagination auf (discovered_at, token_address): jede Seite ist ein
+  Index-Scan auf idx_dc_discovered ab der letzten Zeile der Vorseite - kein
+  OFFSET, das bei Seite 1000 erst 50.000 Zeilen lesen und verwerfen müsste
+- Filter nur auf indexierten Spalten (bzw. Spalten, für die der Planner
+  idx_dc_discovered + Filter wählt, siehe sql/optimized_indexes.sql)
+- Anzahl als Schätzung aus pg_class.reltuples bzw. dem Plan statt COUNT(*)
+"""
+
+# Filter → SQL-Bedingung (feste Fragmente, Werte immer als Parameter)
+FILTERS = {
+    "phase_id": "phase_id = %(phase_id)s",
+    "min_social_count": "social_count >= %(min_social_count)s",
+    "max_risk_score": "risk_score <= %(max_risk_score)s",
+    "trader_public_key": "trader_public_key = %(trader_public_key)s",
+}
+
+COLUMNS = (
+    "discovered_at", "token_address", "symbol", "name", "phase_id", "social_count",
+    "risk_score", "market_cap_sol", "initial_buy_sol", "trader_public_key",
+)
+
+# Summe über Tabelle und Partitionen (partitionierte Eltern-Tabelle hat selbst reltuples = -1 bzw. 0)
+COUNT_ESTIMATE_SQL = """
+    SELECT COALESCE(SUM(c.reltuples) FILTER (WHERE c.reltuples > 0), 0)::bigint
+    FROM pg_class c
+    WHERE c.oid = 'discovered_coins'::regclass
+       OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'discovered_coins'::regclass)
+"""
+
+
+def where_clause(filters, after=None):
+    """WHERE-Teil und Parameter; `after` = (discovered_at, token_address) der letzten Zeile der Vorseite"""
+    conditions = ["discovered_at IS NOT NULL"]
+    params = {}
+    for name, condition in FILTERS.items():
+        if filters.get(name) not in (None, ""):
+            conditions.append(condition)
+            params[name] = filters[name]
+    if after is not None:
+        # Die einfache Bedingung auf discovered_at wird Index-Bedingung, der Zeilenvergleich
+        # klärt Gleichstände beim Zeitstempel
+        conditions.append("discovered_at <= %(after_at)s")
+        conditions.append("(discovered_at, token_address) < (%(after_at)s, %(after_token)s)")
+        params["after_at"], params["after_token"] = after
+    return " AND ".join(conditions), params
+
+
+def page_query(filters, after=None, limit=50):
+    """Eine Seite (neueste zuerst) + 1 Zeile, um zu erkennen, ob es weitergeht"""
+    where, params = where_clause(filters, after)
+    params["limit"] = limit + 1
+    query = (
+        f"SELECT {', '.join(COLUMNS)} FROM discovered_coins WHERE {where} "
+        "ORDER BY discovered_at DESC, token_address DESC LIMIT %(limit)s"
+    )
+    return query, params
+
+
+def count_estimate_query(filters):
+    """Abfrage für EXPLAIN: die geschätzte Zeilenzahl des Plans ersetzt COUNT(*)"""
+    where, params = where_clause(filters)
+    return f"SELECT 1 FROM discovered_coins WHERE {where}", params
+
+
+def plan_rows(plan):
+    """Geschätzte Zeilen aus EXPLAIN (FORMAT JSON)"""
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def plan_scans(plan):
+    """Alle Scan-Knoten eines EXPLAIN (FORMAT JSON) als (Knotentyp, Relation, Index)"""
+    scans = []
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Scan" in node["Node Type"]:
+            scans.append((node["Node Type"], node.get("Relation Name"), node.get("Index Name")))
+        nodes.extend(node.get("Plans", []))
+    return scans
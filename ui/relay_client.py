@@ -0,0 +1,165 @@
+"""
+HTTP-Client der UI für die Relay-API
+
+Bisher öffnete jeder Getter eine neue Verbindung (requests.get) und die Abrufe
+liefen nacheinander - bei nicht erreichbarem Relay blockierte ein Dashboard-
+Render für die Summe aller Timeouts. Der Client (einmal pro UI-Prozess):
+- requests.Session mit Connection-Pool (Keep-Alive zum Relay)
+- fetch_many(): unabhängige Endpunkte parallel (ThreadPool) → Wartezeit = langsamster Abruf
+- Circuit Breaker: nach `failure_threshold` Verbindungsfehlern in Folge werden
+  Anfragen `open_seconds` lang sofort abgelehnt; danach darf genau ein Test-Abruf
+  durch (half-open), der den Breaker wieder schließt oder erneut öffnet
+- Kurzzeit-Cache (TTL) für Abrufe ohne Parameter, geteilt von allen Viewern, und
+  der letzte bekannte Wert pro Endpunkt für die Anzeige bei Ausfällen
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class RelayUnavailable(requests.exceptions.ConnectionError):
+    """Circuit Breaker offen - Anfrage wurde gar nicht erst gesendet"""
+
+
+class RelayClient:
+    """Gemeinsamer Client für alle Relay-Endpunkte (thread-safe)"""
+
+    def __init__(self, base_url, timeout=2, connect_timeout=1, cache_ttl=2,
+                 failure_threshold=3, open_seconds=10, max_workers=4):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.cache_ttl = cache_ttl
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers * 2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="relay-client")
+        self.lock = threading.Lock()
+        self.path_locks = {}
+        self.cache = {}  # Pfad → (Zeitpunkt, Wert)
+        # Circuit Breaker
+        self.failures = 0
+        self.open_until = 0
+        self.probing = False
+        self.last_error = None
+        self.stats = {"requests": 0, "failures": 0, "short_circuited": 0, "cache_hits": 0}
+
+    # --- Circuit Breaker ---
+
+    def state(self):
+        if self.open_until == 0:
+            return "closed"
+        return "open" if time.time() < self.open_until else "half_open"
+
+    def _before_request(self):
+        with self.lock:
+            state = self.state()
+            if state == "open" or (state == "half_open" and self.probing):
+                self.stats["short_circuited"] += 1
+                retry_in = max(0, self.open_until - time.time())
+                raise RelayUnavailable(f"Relay nicht erreichbar (nächster Versuch in {retry_in:.0f}s): {self.last_error}")
+            if state == "half_open":
+                self.probing = True
+            self.stats["requests"] += 1
+
+    def _record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.open_until = 0
+            self.probing = False
+
+    def _record_failure(self, error):
+        with self.lock:
+            self.failures += 1
+            self.stats["failures"] += 1
+            self.last_error = str(error)[:100]
+            if self.probing or self.failures >= self.failure_threshold:
+                self.open_until = time.time() + self.open_seconds
+            self.probing = False
+
+    # --- Anfragen ---
+
+    def request(self, method, path, timeout=None, **kwargs):
+        """Eine Anfrage über die Session; Verbindungsfehler zählen für den Breaker
+
+        Jede HTTP-Antwort (auch 4xx/5xx) gilt als erreichbar. Wirft RelayUnavailable
+        (eine ConnectionError), solange der Breaker offen ist.
+        """
+        self._before_request()
+        try:
+            response = self.session.request(
+                method, f"{self.base_url}{path}",
+                timeout=(self.connect_timeout, timeout or self.timeout), **kwargs
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            self._record_failure(e)
+            raise
+        except Exception:
+            with self.lock:
+                self.probing = False
+            raise
+        self._record_success()
+        return response
+
+    def _path_lock(self, path):
+        with self.lock:
+            if path not in self.path_locks:
+                self.path_locks[path] = threading.Lock()
+            return self.path_locks[path]
+
+    def get(self, path, as_json=True, ok_status=(200,)):
+        """Gecachter GET ohne Parameter: Wert oder None (Fehler, Status nicht in ok_status)
+
+        Gleichzeitige Abrufe desselben Pfads (mehrere Viewer) warten auf den ersten.
+        """
+        with self._path_lock(path):
+            cached = self.cache.get(path)
+            if cached and time.time() - cached[0] < self.cache_ttl:
+                with self.lock:
+                    self.stats["cache_hits"] += 1
+                return cached[1]
+            try:
+                response = self.request("GET", path)
+                if response.status_code not in ok_status:
+                    return None
+                value = response.json() if as_json else response.text
+            except (requests.exceptions.RequestException, ValueError):
+                return None
+            self.cache[path] = (time.time(), value)
+            return value
+
+    def fetch_many(self, *paths):
+        """Mehrere get()-Aufrufe parallel; `paths` sind Pfade oder (Pfad, kwargs)
+
+        Liefert die Werte in derselben Reihenfolge.
+        """
+        calls = [(item, {}) if isinstance(item, str) else item for item in paths]
+        if len(calls) == 1:
+            return [self.get(calls[0][0], **calls[0][1])]
+        futures = [self.executor.submit(self.get, path, **kwargs) for path, kwargs in calls]
+        return [future.result() for future in futures]
+
+    def last_known(self, path):
+        """Letzter erfolgreich geholter Wert und sein Alter in Sekunden (oder None, None)"""
+        cached = self.cache.get(path)
+        if not cached:
+            return None, None
+        return cached[1], time.time() - cached[0]
+
+    def snapshot(self):
+        """Zustand des Clients (Breaker, Zähler) für die Anzeige in der UI"""
+        with self.lock:
+            state = self.state()
+            return {
+                **self.stats,
+                "state": state,
+                "consecutive_failures": self.failures,
+                "retry_in": round(max(0, self.open_until - time.time()), 1) if state == "open" else None,
+                "last_error": self.last_error,
+            }
@@ -0,0 +1,172 @@
+"""
+Konfigurations-Tab: Einstellungen bearbeiten, DB-Verbindung testen, Relay neu laden
+"""
+import time
+
+import streamlit as st
+
+from common import (
+    COOLIFY_MODE, get_default_config, load_config, reload_config, save_config,
+    validate_port, validate_regex, validate_url,
+)
+from db import check_database_connection, get_db_pool
+
+def render():
+    """Konfigurations-Tab"""
+    
+    config = load_config()
+    
+    st.info("💡 Änderungen werden in der Konfigurationsdatei gespeichert. Ein Service-Neustart ist erforderlich, damit die Änderungen wirksam werden.")
+    
+    with st.form("config_form"):
+        st.subheader("📦 Batch-Einstellungen")
+        config["BATCH_SIZE"] = st.number_input("Batch Größe", min_value=1, max_value=100, value=config.get("BATCH_SIZE", 10))
+        config["BATCH_TIMEOUT"] = st.number_input("Batch Timeout (Sekunden)", min_value=1, max_value=300, value=config.get("BATCH_TIMEOUT", 30))
+        
+        st.subheader("🔗 n8n Einstellungen")
+        config["N8N_WEBHOOK_URL"] = st.text_input("n8n Webhook URL", value=config.get("N8N_WEBHOOK_URL", ""), help="Lass leer, wenn n8n noch nicht konfiguriert ist")
+        if config["N8N_WEBHOOK_URL"]:
+            url_valid, url_error = validate_url(config["N8N_WEBHOOK_URL"], allow_empty=True)
+            if not url_valid:
+                st.error(f"❌ {url_error}")
+        config["N8N_WEBHOOK_METHOD"] = st.selectbox("n8n Webhook Methode", ["POST", "GET"], index=["POST", "GET"].index(config.get("N8N_WEBHOOK_METHOD", "POST")))
+        config["N8N_RETRY_DELAY"] = st.number_input("n8n Retry Delay (Sekunden)", min_value=1, max_value=60, value=config.get("N8N_RETRY_DELAY", 5))
+        
+        st.subheader("🌐 WebSocket Einstellungen")
+        config["WS_URI"] = st.text_input("WebSocket URI", value=config.get("WS_URI", ""))
+        if config["WS_URI"]:
+            ws_valid, ws_error = validate_url(config["WS_URI"], allow_empty=False)
+            if not ws_valid:
+                st.error(f"❌ {ws_error}")
+        config["WS_RETRY_DELAY"] = st.number_input("WS Retry Delay (Sekunden)", min_value=1, max_value=300, value=config.get("WS_RETRY_DELAY", 3))
+        config["WS_MAX_RETRY_DELAY"] = st.number_input("WS Max Retry Delay (Sekunden)", min_value=1, max_value=600, value=config.get("WS_MAX_RETRY_DELAY", 60))
+        config["WS_PING_INTERVAL"] = st.number_input("WS Ping Interval (Sekunden)", min_value=1, max_value=300, value=config.get("WS_PING_INTERVAL", 20))
+        config["WS_PING_TIMEOUT"] = st.number_input("WS Ping Timeout (Sekunden)", min_value=1, max_value=300, value=config.get("WS_PING_TIMEOUT", 10))
+        config["WS_CONNECTION_TIMEOUT"] = st.number_input("WS Connection Timeout (Sekunden)", min_value=1, max_value=600, value=config.get("WS_CONNECTION_TIMEOUT", 30))
+        
+        st.subheader("🚫 Filter-Einstellungen")
+        config["BAD_NAMES_PATTERN"] = st.text_input("Bad Names Pattern (Regex)", value=config.get("BAD_NAMES_PATTERN", ""), help="Regex-Pattern für zu filternde Namen (z.B. 'test|bot|rug')")
+        if config["BAD_NAMES_PATTERN"]:
+            regex_valid, regex_error = validate_regex(config["BAD_NAMES_PATTERN"], allow_empty=True)
+            if not regex_valid:
+                st.error(f"❌ {regex_error}")
+        
+        st.subheader("🗄️ Datenbank-Einstellungen")
+        config["DB_HOST"] = st.text_input("DB Host", value=config.get("DB_HOST", "localhost"), help="PostgreSQL Host-Adresse")
+        config["DB_PORT"] = st.number_input("DB Port", min_value=1, max_value=65535, value=int(config.get("DB_PORT", 5432)))
+        config["DB_NAME"] = st.text_input("DB Name", value=config.get("DB_NAME", "pump_discover"), help="Datenbank-Name")
+        config["DB_USER"] = st.text_input("DB User", value=config.get("DB_USER", "postgres"), help="Datenbank-Benutzer")
+        config["DB_PASSWORD"] = st.text_input("DB Password", value=config.get("DB_PASSWORD", ""), type="password", help="Datenbank-Passwort")
+        
+        st.subheader("🔧 Sonstige Einstellungen")
+        config["HEALTH_PORT"] = st.number_input("Health Port", min_value=1000, max_value=65535, value=config.get("HEALTH_PORT", 8000))
+        port_valid, port_error = validate_port(config["HEALTH_PORT"])
+        if not port_valid:
+            st.error(f"❌ {port_error}")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            save_button = st.form_submit_button("💾 Konfiguration speichern", type="primary")
+        with col2:
+            reset_button = st.form_submit_button("🔄 Auf Standard zurücksetzen")
+        
+        if save_button:
+            # Validierung vor dem Speichern
+            errors = []
+            
+            # URL-Validierung
+            if config["N8N_WEBHOOK_URL"]:
+                url_valid, url_error = validate_url(config["N8N_WEBHOOK_URL"], allow_empty=True)
+                if not url_valid:
+                    errors.append(f"n8n Webhook URL: {url_error}")
+            
+            ws_valid, ws_error = validate_url(config["WS_URI"], allow_empty=False)
+            if not ws_valid:
+                errors.append(f"WebSocket URI: {ws_error}")
+            
+            # Port-Validierung
+            port_valid, port_error = validate_port(config["HEALTH_PORT"])
+            if not port_valid:
+                errors.append(f"Health Port: {port_error}")
+            
+            # Regex-Validierung
+            if config["BAD_NAMES_PATTERN"]:
+                regex_valid, regex_error = validate_regex(config["BAD_NAMES_PATTERN"], allow_empty=True)
+                if not regex_valid:
+                    errors.append(f"Bad Names Pattern: {regex_error}")
+            
+            if errors:
+                st.error("❌ **Validierungsfehler:**")
+                for error in errors:
+                    st.error(f"  - {error}")
+            else:
+                result = save_config(config)
+                if result:
+                    # Neue DB-Parameter → neuer Pool; alte Verbindungen schließen
+                    get_db_pool.clear()
+                    st.session_state.config_saved = True
+                    st.success("✅ Konfiguration gespeichert!")
+                    st.warning("⚠️ **WICHTIG:** Die `.env` Datei wurde aktualisiert. Bitte Relay-Service neu starten, damit die Änderungen wirksam werden!")
+        
+        if reset_button:
+            default_config = get_default_config()
+            if save_config(default_config):
+                st.session_state.config_saved = True
+                st.success("✅ Konfiguration auf Standard zurückgesetzt!")
+                st.warning("⚠️ Bitte Service neu starten, damit die Änderungen wirksam werden.")
+                st.rerun()
+    
+    # DB-Verbindungstest (außerhalb des Forms)
+    st.divider()
+    st.subheader("🔍 Datenbank-Verbindung testen")
+    if st.button("🔍 DB-Verbindung testen", type="secondary", key="db_test_button"):
+        with st.spinner("Teste Datenbank-Verbindung..."):
+            db_status = check_database_connection(fresh=True)
+            if db_status['connected']:
+                st.success("✅ Datenbank-Verbindung erfolgreich!")
+                if db_status['tables']['discovered_coins']:
+                    st.success("✅ Tabelle 'discovered_coins' vorhanden")
+                else:
+                    st.warning("⚠️ Tabelle 'discovered_coins' fehlt")
+                if db_status['tables']['coin_streams']:
+                    st.success("✅ Tabelle 'coin_streams' vorhanden")
+                else:
+                    st.info("ℹ️ Tabelle 'coin_streams' fehlt (optional)")
+                if db_status['tables']['ref_coin_phases']:
+                    st.success("✅ Tabelle 'ref_coin_phases' vorhanden")
+                else:
+                    st.info("ℹ️ Tabelle 'ref_coin_phases' fehlt (optional)")
+                if db_status['tables']['exchange_rates']:
+                    st.success("✅ Tabelle 'exchange_rates' vorhanden")
+                else:
+                    st.info("ℹ️ Tabelle 'exchange_rates' fehlt (optional - für Marktstimmung)")
+            else:
+                st.error(f"❌ Datenbank-Verbindung fehlgeschlagen: {db_status.get('error', 'Unbekannter Fehler')}")
+    
+    # Neustart-Button außerhalb des Forms (wenn Konfiguration gespeichert wurde)
+    if st.session_state.get("config_saved", False):
+        st.divider()
+        st.subheader("🔄 Service-Neustart")
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.info("💡 Die Konfiguration wurde gespeichert. Starte den Relay-Service neu, damit die neuen Werte geladen werden.")
+        with col2:
+            if st.button("🔄 Konfiguration neu laden", type="primary", use_container_width=True, key="reload_config_button"):
+                with st.spinner("Konfiguration wird neu geladen..."):
+                    success, message = reload_config()
+                    if success:
+                        st.success(message)
+                        st.info("💡 Die neue Konfiguration ist jetzt aktiv! Kein Neustart nötig.")
+                        st.session_state.config_saved = False  # Reset Flag
+                        time.sleep(2)
+                        st.rerun()
+                    else:
+                        st.error(message)
+                        if COOLIFY_MODE:
+                            st.info("💡 **Coolify:** Falls das nicht funktioniert, starte den 'api' Service im Coolify-Dashboard neu.")
+                        else:
+                            st.info("💡 Du kannst den Service auch manuell neu starten: `docker compose restart relay`")
+    
+    # Aktuelle Konfiguration anzeigen
+    st.subheader("📄 Aktuelle Konfiguration")
+    st.json(config)
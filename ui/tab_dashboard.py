@@ -0,0 +1,325 @@
+"""
+Dashboard-Tab: Relay-Status, Live-Metriken, SOL-Kurs und Datenbank-Status
+"""
+import time
+
+import pandas as pd
+import streamlit as st
+
+from common import (
+    COOLIFY_MODE, DASHBOARD_REFRESH_SECONDS, DB_REFRESH_SECONDS,
+    fetch_relay, get_relay_client, get_relay_health, get_relay_last_known, reload_config,
+)
+from db import check_database_connection, fetch_sol_rate_overview, get_db_params
+
+def render_relay_status():
+    """Dashboard: Relay-Status und Live-Metriken (als Fragment, wird einzeln aktualisiert)"""
+    # Health und Stats parallel holen (eine Wartezeit statt zwei)
+    health, stats = fetch_relay("health", "stats")
+    
+    if health is None:
+        client = get_relay_client().snapshot()
+        if client["state"] == "open":
+            st.warning(f"⚡ Relay nicht erreichbar - Anfragen pausiert, nächster Versuch in {client['retry_in']:.0f}s")
+    
+    # Zähler: bei Ausfall der letzte bekannte Stand statt leerer Felder
+    last_health, last_health_age = get_relay_last_known("health") if health is None else (None, None)
+    counters = health or last_health
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if health:
+            status = "🟢 Online" if health.get("ws_connected") else "🔴 Offline"
+            st.metric("Status", status)
+        else:
+            st.metric("Status", "❌ Nicht erreichbar")
+    
+    with col2:
+        if counters:
+            st.metric("Coins empfangen", counters.get("total_coins", 0))
+        else:
+            st.metric("Coins empfangen", "-")
+    
+    with col3:
+        if counters:
+            st.metric("Batches gesendet", counters.get("total_batches", 0))
+        else:
+            st.metric("Batches gesendet", "-")
+    
+    with col4:
+        if counters:
+            uptime = counters.get("uptime_seconds", 0)
+            hours = uptime // 3600
+            minutes = (uptime % 3600) // 60
+            st.metric("Uptime", f"{int(hours)}h {int(minutes)}m")
+        else:
+            st.metric("Uptime", "-")
+    if last_health:
+        st.caption(f"🕒 Letzter bekannter Stand von vor {last_health_age:.0f}s")
+    
+    # Metriken direkt im Dashboard anzeigen (aggregiert vom Relay, /stats)
+    st.subheader("📈 Live-Metriken")
+    if stats is None:
+        stats, stats_age = get_relay_last_known("stats")
+        if stats:
+            st.caption(f"🕒 Relay nicht erreichbar - letzter bekannter Stand von vor {stats_age:.0f}s")
+    
+    if stats:
+        totals = stats.get('totals', {})
+        rates = stats.get('rates_per_minute', {})
+        status = stats.get('status', {})
+        
+        sparklines = stats.get('sparklines', {})
+        
+        # Wichtige Metriken in Spalten (Delta = Rate der letzten Minute, Sparkline = letzte 5 Minuten)
+        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+        
+        with col_m1:
+            st.metric("Coins empfangen (Total)", f"{totals.get('received', 0):,}",
+                      f"{rates.get('received', {}).get('1m', 0):g}/min", delta_color="off",
+                      chart_data=sparklines.get('received'))
+        
+        with col_m2:
+            st.metric("Coins gesendet (Total)", f"{totals.get('sent', 0):,}",
+                      f"{rates.get('sent', {}).get('1m', 0):g}/min", delta_color="off",
+                      chart_data=sparklines.get('sent'))
+        
+        with col_m3:
+            st.metric("Coins gefiltert (Total)", f"{totals.get('filtered', 0):,}",
+                      f"{rates.get('filtered', {}).get('1m', 0):g}/min", delta_color="off",
+                      chart_data=sparklines.get('filtered'))
+        
+        with col_m4:
+            latency_series = [value for value in sparklines.get('send_latency', []) if value is not None]
+            st.metric("Batches gesendet (Total)", f"{totals.get('batches', 0):,}",
+                      chart_data=latency_series or None,
+                      help="Sparkline: Ø Batch-Latenz (Sekunden) der letzten 5 Minuten")
+        
+        col_m5, col_m6, col_m7, col_m8 = st.columns(4)
+        
+        with col_m5:
+            status_text = "🟢 Verbunden" if status.get('ws_connected') else "🔴 Getrennt"
+            st.metric("WebSocket Status", status_text)
+        
+        with col_m6:
+            status_text = "🟢 Verfügbar" if status.get('n8n_available') else "🔴 Nicht verfügbar"
+            st.metric("n8n Status", status_text)
+        
+        with col_m7:
+            st.metric("Buffer Größe", f"{status.get('buffer_size', 0)}")
+        
+        with col_m8:
+            st.metric("WebSocket Reconnects", f"{totals.get('reconnects', 0)}")
+        
+        col_r1, col_r2, col_r3 = st.columns(3)
+        
+        with col_r1:
+            st.write("**Raten (pro Minute):**")
+            windows = stats.get('windows', [])
+            rate_rows = [
+                {"Kennzahl": name, **{window: values.get(window) for window in windows}}
+                for name, values in rates.items()
+            ]
+            st.dataframe(pd.DataFrame(rate_rows), hide_index=True, use_container_width=True)
+        
+        with col_r2:
+            st.write("**Gefiltert nach Grund:**")
+            filtered = stats.get('filtered_by_reason', {})
+            if filtered:
+                filter_rows = [{"Grund": reason, **values} for reason, values in filtered.items()]
+                st.dataframe(pd.DataFrame(filter_rows), hide_index=True, use_container_width=True)
+            else:
+                st.caption("Noch keine gefilterten Coins")
+        
+        with col_r3:
+            st.write("**Batch-Latenz (Anreicherung + Versand):**")
+            latency = stats.get('batch_latency_seconds', {})
+            if latency.get('count'):
+                st.write(f"- p50: {latency.get('p50', 0):.3f}s")
+                st.write(f"- p95: {latency.get('p95', 0):.3f}s")
+                st.write(f"- p99: {latency.get('p99', 0):.3f}s")
+                avg_1h = latency.get('avg', {}).get('1h')
+                if avg_1h is not None:
+                    st.write(f"- Ø 1h: {avg_1h:.3f}s")
+                st.caption(f"Letzte {latency['count']} Batches")
+            else:
+                st.caption("Noch keine Batches gesendet")
+    else:
+        st.warning("⚠️ Metriken konnten nicht abgerufen werden. Bitte prüfe, ob der Relay-Service läuft.")
+    
+def render_database_overview():
+    """Dashboard: SOL-Kurs und Datenbank-Status (als Fragment, Queries gecacht)"""
+    # SOL-Kurs Übersicht (wenn DB verbunden)
+    # DB-Config einmal pro Rerun lesen; Queries laufen über Pool + Cache (TTL)
+    db_params = get_db_params()
+    db_status = check_database_connection(db_params=db_params)
+    rate_overview = None
+    rate_error = None
+    if db_status['configured'] and db_status['connected'] and db_status['tables'].get('exchange_rates', False):
+        try:
+            rate_overview = fetch_sol_rate_overview(db_params)
+        except Exception as e:
+            rate_error = str(e)
+    
+    if rate_overview is not None or rate_error:
+        st.subheader("💹 SOL-Kurs Übersicht")
+        try:
+            if rate_error:
+                raise Exception(rate_error)
+            current_rate = rate_overview["current"]
+            history = rate_overview["history"]
+            
+            if current_rate and current_rate[0]:
+                col_sol1, col_sol2, col_sol3 = st.columns(3)
+                with col_sol1:
+                    st.metric("Aktueller SOL-Preis", f"${current_rate[0]:.2f}")
+                with col_sol2:
+                    if history and len(history) > 1:
+                        first_price = history[0][0]
+                        change = current_rate[0] - first_price
+                        change_pct = (change / first_price * 100) if first_price else 0
+                        st.metric("Änderung (5 Min)", f"${change:+.2f}", f"{change_pct:+.2f}%")
+                    else:
+                        st.metric("Änderung (5 Min)", "N/A")
+                with col_sol3:
+                    st.metric("Datenpunkte", f"{len(history)}")
+                
+                # Chart für Verlauf
+                if history and len(history) > 1:
+                    df = pd.DataFrame(history, columns=['price', 'timestamp'])
+                    df['timestamp'] = pd.to_datetime(df['timestamp'])
+                    df['price'] = df['price'].astype(float)
+                    st.line_chart(df.set_index('timestamp')['price'])
+                    st.caption(f"SOL-Preis Verlauf der letzten 5 Minuten ({len(history)} Datenpunkte)")
+                else:
+                    st.info("ℹ️ Noch nicht genug Daten für Verlauf (benötigt mindestens 2 Datenpunkte)")
+            else:
+                st.info("ℹ️ Noch keine SOL-Kurs-Daten verfügbar")
+        except Exception as e:
+            st.warning(f"⚠️ SOL-Kurs-Daten nicht verfügbar: {str(e)[:100]}")
+    
+    # Datenbank-Verbindungsprüfung
+    st.subheader("🗄️ Datenbank-Status")
+    
+    if not db_status['configured']:
+        st.info("ℹ️ DB-Credentials nicht konfiguriert. Bitte konfiguriere die Datenbank-Verbindung im **Konfigurations-Tab** (⚙️ Konfiguration).")
+    else:
+        col_db1, col_db2, col_db3, col_db4 = st.columns(4)
+        
+        with col_db1:
+            if db_status['connected']:
+                st.success("✅ Verbunden")
+            else:
+                st.error("❌ Nicht verbunden")
+                if db_status['error']:
+                    st.caption(f"Fehler: {db_status['error'][:50]}")
+        
+        with col_db2:
+            if db_status['tables']['discovered_coins']:
+                st.success("✅ discovered_coins")
+            else:
+                st.error("❌ discovered_coins fehlt")
+        
+        with col_db3:
+            if db_status['tables']['coin_streams']:
+                st.success("✅ coin_streams")
+            else:
+                st.warning("⚠️ coin_streams fehlt")
+        
+        with col_db4:
+            if db_status['tables']['ref_coin_phases']:
+                st.success("✅ ref_coin_phases")
+            else:
+                st.warning("⚠️ ref_coin_phases fehlt")
+        
+        # Exchange Rates Tabelle
+        st.markdown("---")
+        col_ex1, col_ex2 = st.columns(2)
+        with col_ex1:
+            if db_status['tables']['exchange_rates']:
+                st.success("✅ exchange_rates")
+            else:
+                st.warning("⚠️ exchange_rates fehlt")
+        
+        with col_ex2:
+            if db_status['tables']['exchange_rates'] and rate_overview is not None:
+                # Aktuelle Coin Metrics Metriken (gleiche gecachte Abfrage wie oben)
+                last_rate = rate_overview["current"]
+                stats = rate_overview["stats"]
+                if last_rate:
+                    st.metric("Aktueller SOL-Preis", f"${last_rate[0]:.2f}" if last_rate[0] else "N/A")
+                    if stats and stats[0] > 0:
+                        st.caption(f"📊 {stats[0]} Snapshots | Ø ${stats[1]:.2f}" if stats[1] else f"📊 {stats[0]} Snapshots")
+            elif rate_error:
+                st.caption(f"⚠️ Metriken nicht verfügbar: {rate_error[:50]}")
+    
+def render_relay_details():
+    """Dashboard: Detaillierte Relay-Informationen (als Fragment)"""
+    health = get_relay_health()
+    
+    # Detaillierte Informationen
+    if health:
+        st.subheader("📈 Detaillierte Informationen")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**WebSocket Status:**")
+            st.write(f"- Verbunden: {'✅' if health.get('ws_connected') else '❌'}")
+            st.write(f"- Reconnects: {health.get('reconnect_count', 0)}")
+            if health.get('last_message_ago'):
+                st.write(f"- Letzte Nachricht: vor {health.get('last_message_ago')}s")
+            
+            st.write("**n8n Status:**")
+            st.write(f"- Verfügbar: {'✅' if health.get('n8n_available') else '❌'}")
+            if health.get('last_error'):
+                st.write(f"- Letzter Fehler: {health.get('last_error')}")
+        
+        with col2:
+            st.write("**Coin-Statistiken:**")
+            st.write(f"- Gesamt empfangen: {health.get('total_coins', 0)}")
+            st.write(f"- Gesamt Batches: {health.get('total_batches', 0)}")
+            if health.get('last_coin_ago'):
+                st.write(f"- Letzter Coin: vor {health.get('last_coin_ago')}s")
+    
+
+def render():
+    """Dashboard-Tab"""
+    st.title("📊 Dashboard")
+    
+    # Auto-Refresh: nur die Live-Bereiche laufen als Fragment neu (kein Rerun der ganzen App)
+    auto_refresh = st.session_state.get("dashboard_auto_refresh", False)
+    st.fragment(run_every=DASHBOARD_REFRESH_SECONDS if auto_refresh else None)(render_relay_status)()
+    st.fragment(run_every=DB_REFRESH_SECONDS if auto_refresh else None)(render_database_overview)()
+    st.fragment(run_every=DASHBOARD_REFRESH_SECONDS if auto_refresh else None)(render_relay_details)()
+    
+    # Neustart-Button
+    st.subheader("🔧 Service-Management")
+    
+    # Coolify-Hinweis
+    if COOLIFY_MODE:
+        st.info("🌐 **Coolify-Modus aktiv:** Konfiguration wird über API neu geladen (kein Neustart nötig!)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("🔄 Konfiguration neu laden", type="primary"):
+            with st.spinner("Konfiguration wird neu geladen..."):
+                success, message = reload_config()
+                if success:
+                    st.success(message)
+                    st.info("💡 Die neue Konfiguration ist jetzt aktiv! Kein Neustart nötig.")
+                    time.sleep(2)
+                    st.rerun()
+                else:
+                    st.error(message)
+                    if COOLIFY_MODE:
+                        st.info("💡 **Hinweis:** Falls das nicht funktioniert, starte den 'api' Service im Coolify-Dashboard neu.")
+    
+    with col2:
+        if st.button("🔄 Seite aktualisieren"):
+            st.rerun()
+    
+    # Auto-Refresh
+    st.checkbox("🔄 Auto-Refresh (5s)", key="dashboard_auto_refresh")
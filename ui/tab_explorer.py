@@ -0,0 +1,133 @@
+"""
+Coin-Explorer-Tab: discovered_coins seitenweise durchsuchen (Keyset-Pagination)
+"""
+import pandas as pd
+import streamlit as st
+
+from db import (
+    check_database_connection, explain_coin_page, fetch_coin_count_estimate,
+    fetch_coin_page, fetch_filtered_count_estimate, get_db_params,
+)
+from explorer_sql import COLUMNS
+
+EXPLORER_PAGE_SIZES = [25, 50, 100]
+EXPLORER_PHASES = ["alle", 1, 2, 3, 99]
+
+COLUMN_LABELS = {
+    "discovered_at": "Entdeckt", "token_address": "Token", "symbol": "Symbol", "name": "Name",
+    "phase_id": "Phase", "social_count": "Socials", "risk_score": "Risiko",
+    "market_cap_sol": "Market Cap (SOL)", "initial_buy_sol": "Initial Buy (SOL)",
+    "trader_public_key": "Creator",
+}
+
+def current_filters():
+    """Filter aus den Widgets (nur gesetzte Werte, Schlüssel wie explorer_sql.FILTERS)"""
+    filters = {}
+    if st.session_state.explorer_phase != "alle":
+        filters["phase_id"] = st.session_state.explorer_phase
+    if st.session_state.explorer_min_social > 0:
+        filters["min_social_count"] = st.session_state.explorer_min_social
+    if st.session_state.explorer_max_risk < 100:
+        filters["max_risk_score"] = st.session_state.explorer_max_risk
+    if st.session_state.explorer_trader.strip():
+        filters["trader_public_key"] = st.session_state.explorer_trader.strip()
+    return filters
+
+def render_plan(db_params, filters, after, limit):
+    """Query-Plan der aktuellen Seite anzeigen und prüfen, ob ein Index genutzt wird"""
+    plan_text, scans = explain_coin_page(db_params, filters, after, limit)
+    seq_scans = [relation for node_type, relation, _ in scans if node_type == "Seq Scan"]
+    indexes = sorted({index for _, _, index in scans if index})
+    if seq_scans:
+        st.warning(f"⚠️ Sequentieller Scan auf {', '.join(seq_scans)} - Filter trifft keinen passenden Index")
+    elif indexes:
+        st.success(f"✅ Index genutzt: {', '.join(indexes)}")
+    st.code(plan_text, language="text")
+
+def render():
+    """Coin-Explorer-Tab"""
+    st.subheader("🔎 Coin-Explorer")
+    st.caption("Neueste Coins zuerst. Blättern per Keyset (discovered_at, token_address) statt OFFSET - jede Seite ist gleich schnell.")
+
+    db_params = get_db_params()
+    db_status = check_database_connection(db_params=db_params)
+    if not db_status['configured']:
+        st.info("ℹ️ DB-Credentials nicht konfiguriert. Bitte konfiguriere die Datenbank-Verbindung im **Konfigurations-Tab** (⚙️ Konfiguration).")
+        return
+    if not db_status['connected']:
+        st.error(f"❌ Datenbank nicht verbunden: {(db_status['error'] or '')[:100]}")
+        return
+    if not db_status['tables']['discovered_coins']:
+        st.warning("⚠️ Tabelle discovered_coins fehlt")
+        return
+
+    # Startwerte über Session State (bleiben beim Tab-Wechsel erhalten, siehe app.py)
+    st.session_state.setdefault("explorer_max_risk", 100)
+    st.session_state.setdefault("explorer_page_size", 50)
+
+    col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 2, 1])
+    with col1:
+        st.selectbox("Phase", EXPLORER_PHASES, key="explorer_phase")
+    with col2:
+        st.slider("Socials mindestens", 0, 4, key="explorer_min_social")
+    with col3:
+        st.slider("Risiko höchstens", 0, 100, key="explorer_max_risk", help="100 = kein Filter (auch Coins ohne Risiko-Score)")
+    with col4:
+        st.text_input("Creator (Public Key)", key="explorer_trader")
+    with col5:
+        st.selectbox("Zeilen pro Seite", EXPLORER_PAGE_SIZES, key="explorer_page_size")
+
+    filters = current_filters()
+    limit = st.session_state.explorer_page_size
+    # Filter oder Seitengröße geändert → zurück auf die erste Seite
+    # explorer_pages: Keyset-Cursor je Seite (None = neueste), der letzte ist die aktuelle Seite
+    if st.session_state.get("explorer_query") != (filters, limit):
+        st.session_state.explorer_query = (filters, limit)
+        st.session_state.explorer_pages = [None]
+    pages = st.session_state.explorer_pages
+    after = pages[-1]
+
+    try:
+        rows, has_more = fetch_coin_page(db_params, filters, after, limit)
+        total = fetch_coin_count_estimate(db_params)
+        matching = fetch_filtered_count_estimate(db_params, filters) if filters else total
+    except Exception as e:
+        st.error(f"❌ Abfrage fehlgeschlagen: {str(e)[:200]}")
+        return
+
+    col_m1, col_m2, col_m3 = st.columns(3)
+    with col_m1:
+        st.metric("Coins gesamt (geschätzt)", f"~{total:,}", help="pg_class.reltuples - aktualisiert durch ANALYZE/autovacuum")
+    with col_m2:
+        st.metric("Treffer (geschätzt)", f"~{matching:,}", help="Zeilenschätzung des Query-Planners, kein COUNT(*)")
+    with col_m3:
+        st.metric("Seite", f"{len(pages)}")
+
+    if rows:
+        df = pd.DataFrame(rows, columns=COLUMNS)
+        for column in ("market_cap_sol", "initial_buy_sol"):
+            df[column] = df[column].astype(float)
+        st.dataframe(df.rename(columns=COLUMN_LABELS), hide_index=True, use_container_width=True)
+    else:
+        st.info("Keine Coins für diese Filter.")
+
+    col_n1, col_n2, col_n3 = st.columns(3)
+    with col_n1:
+        if st.button("⏮️ Neueste", disabled=len(pages) == 1, key="explorer_first"):
+            st.session_state.explorer_pages = [None]
+            st.rerun()
+    with col_n2:
+        if st.button("◀️ Zurück", disabled=len(pages) == 1, key="explorer_prev"):
+            pages.pop()
+            st.rerun()
+    with col_n3:
+        if st.button("Weiter ▶️", disabled=not has_more, key="explorer_next"):
+            pages.append((rows[-1][0], rows[-1][1]))
+            st.rerun()
+
+    with st.expander("🔍 Query-Plan"):
+        if st.button("Plan der aktuellen Seite prüfen", key="explorer_explain"):
+            try:
+                render_plan(db_params, filters, after, limit)
+            except Exception as e:
+                st.error(f"❌ EXPLAIN fehlgeschlagen: {str(e)[:200]}")
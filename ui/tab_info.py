@@ -0,0 +1,574 @@
+"""
+Info-Tab: Projekt-Informationen (statischer Text)
+"""
+import streamlit as st
+
+def render():
+    """Info-Tab"""
+    st.title("ℹ️ Projekt-Informationen")
+    
+    # Projekt-Übersicht
+    st.header("📋 Was macht dieses Projekt?")
+    st.markdown("""
+    **Pump Discover** ist ein Echtzeit-Monitoring-System für neu erstellte Tokens auf Pump.fun.
+    
+    Das System:
+    - ✅ Empfängt neue Token-Erstellungen über WebSocket in Echtzeit
+    - ✅ Führt erste Filterung durch (Spam, Bad Names, etc.)
+    - ✅ Sendet gefilterte Tokens an n8n für weitere Verarbeitung
+    - ✅ Speichert Token-Daten in einer PostgreSQL-Datenbank
+    - ✅ Bietet eine Web-UI für Monitoring und Konfiguration
+    """)
+    
+    # Datenfluss
+    st.header("🔄 Datenfluss")
+    st.code("""
+    Pump.fun WebSocket (wss://pumpportal.fun/api/data)
+            ↓
+    Python Relay Service (relay/main.py)
+            ├─ Filterung: Bad Names, Spam-Burst
+            ├─ Batching: Sammelt Coins in Batches
+            └─ Weiterleitung an n8n
+            ↓
+    n8n Workflow (Token Processing)
+            ├─ Empfängt Batches vom Relay
+            ├─ Ruft API-Daten ab (RugCheck, etc.)
+            ├─ Parst Metadata (IPFS/RapidLaunch)
+            ├─ Führt weitere Filterung durch
+            └─ Speichert in Datenbank
+            ↓
+    n8n Workflow (Exchange Rates) ⭐ NEU
+            ├─ Trigger: Bei jedem Batch-Erhalt
+            ├─ Jupiter API v3: SOL-Preis in USD
+            ├─ Frankfurter App API: USD zu EUR
+            └─ Speichert Marktstimmung in coin_metrics
+            ↓
+    PostgreSQL Datenbank
+            ├─ discovered_coins Tabelle
+            ├─ coin_streams Tabelle
+            ├─ ref_coin_phases Tabelle
+            └─ exchange_rates Tabelle ⭐ NEU
+    """, language="text")
+    
+    # Weitergegebene Informationen
+    st.header("📤 Welche Informationen werden weitergegeben?")
+    
+    st.subheader("1️⃣ WebSocket-Daten (vom Relay an n8n)")
+    st.markdown("""
+    Der Relay-Service sendet folgende Daten für jeden Token:
+    
+    | Feld | Beschreibung | Beispiel |
+    |------|--------------|----------|
+    | `mint` | Token-Adresse (Mint) | `7GggZA5GEHqTyiuFBTsWiU5uz7HDvSBMH11UB8GDpump` |
+    | `name` | Token-Name | `wifmas` |
+    | `symbol` | Token-Symbol | `wifmas` |
+    | `signature` | Transaktions-Signatur | `UEFn9JFNHYaUVDvmq66EBPFVKENsP4bS1Q75hXkvzQgWbKnKWdymxnRE3RZeG23Fm1AXwL1FByK59mdRioC4o7H` |
+    | `traderPublicKey` | Creator Public Key | `DxGLoNf279eyYqTRTYqPZTtiB5BbF4fqRtfjfrvQyiwt` |
+    | `bondingCurveKey` | Bonding Curve Adresse | `BMyRVLmarQUvTJ7YwkH3cQsg1VgSX3fV6AKgSYNb1joR` |
+    | `pool_address` | Pool-Adresse | `BMyRVLmarQUvTJ7YwkH3cQsg1VgSX3fV6AKgSYNb1joR` |
+    | `vTokensInBondingCurve` | Virtuelle Tokens | `1006714285.776477` |
+    | `vSolInBondingCurve` | Virtuelles SOL | `31.975308639999987` |
+    | `initialBuy` | Initiale Token-Anzahl | `66285714.223523` |
+    | `solAmount` | Initialer SOL-Betrag | `1.97530864` |
+    | `marketCapSol` | Market Cap in SOL | `31.762049165059267` |
+    | `price_sol` | Preis in SOL (berechnet) | `3.155021202521354e-8` |
+    | `uri` | Metadata URI | `https://ipfs.io/ipfs/...` |
+    | `is_mayhem_mode` | Mayhem Mode Flag | `false` |
+    | `pool` | Pool-Typ | `pump` |
+    | `phaseId` | Phase ID | `1` |
+    """)
+    
+    st.subheader("2️⃣ API-Daten (in n8n abgerufen)")
+    st.markdown("""
+    Zusätzlich werden in n8n folgende Daten von externen APIs abgerufen:
+    
+    | Feld | Quelle | Beschreibung |
+    |------|--------|--------------|
+    | `token.decimals` | RugCheck API | Token Decimals (z.B. `6`) |
+    | `token.supply` | RugCheck API | Token Supply (raw, mit decimals) |
+    | `deployPlatform` | RugCheck API | Deployment Platform (z.B. `"rapidlaunch"`) |
+    | `score` / `score_normalised` | RugCheck API | Risiko-Score (0-100) |
+    | `topHolders` | RugCheck API | Top Holders Array (für Berechnung) |
+    | `metadata.isMutable` | RugCheck API | **NEU:** Kann Dev Metadata nachträglich ändern? → `metadata_is_mutable` |
+    | `mintAuthority.enabled` | RugCheck API | **NEU:** Kann Dev neue Tokens drucken? → `mint_authority_enabled` |
+    """)
+    
+    st.subheader("3️⃣ Berechnete Felder (im Relay)")
+    st.markdown("""
+    Der Relay-Service berechnet folgende Felder automatisch:
+    
+    | Feld | Berechnung | Beschreibung |
+    |------|------------|--------------|
+    | `price_sol` | `marketCapSol / vTokensInBondingCurve` | Preis in SOL |
+    | `pool_address` | `bondingCurveKey` | Pool-Adresse |
+    | `social_count` | **NEU:** Anzahl vorhandener Social-Links (0-4) | Twitter + Telegram + Website + Discord |
+    """)
+    
+    st.subheader("4️⃣ Metadata-Daten (aus URI geparst)")
+    st.markdown("""
+    Die Metadata-URI wird in n8n geparst und liefert:
+    
+    - `description` - Token-Beschreibung
+    - `image` - Bild-URL
+    - `twitter` - Twitter/X URL
+    - `telegram` - Telegram URL
+    - `website` - Website URL
+    - `discord` - Discord URL
+    """)
+    
+    # Datenbankschema
+    st.header("🗄️ Datenbankschema")
+    
+    st.subheader("Haupttabelle: `discovered_coins`")
+    st.markdown("""
+    Diese Tabelle speichert den **initialen Snapshot** jedes entdeckten Tokens.
+    Metriken (die sich ändern) werden in einer separaten Tabelle (`coin_streams`) gespeichert (alle 5 Sekunden).
+    
+    **Wichtig:** Diese Tabelle dient als initialer Snapshot. Für kontinuierliches Tracking wird `coin_streams` verwendet.
+    """)
+    
+    with st.expander("📋 Vollständiges Schema anzeigen"):
+        st.markdown("""
+        #### 1. Identifikation
+        - `token_address` (PRIMARY KEY) - Mint-Adresse
+        - `blockchain_id` - Blockchain ID (1 = Solana)
+        - `symbol` - Token-Symbol
+        - `name` - Token-Name
+        - `token_decimals` - Token Decimals (vom API)
+        - `token_supply` - Token Supply (vom API)
+        - `deploy_platform` - Deployment Platform (vom API)
+        
+        #### 2. Transaktions-Informationen
+        - `signature` - Transaktions-Signatur
+        - `trader_public_key` - Creator Public Key
+        
+        #### 3. Bonding Curve & Pool
+        - `bonding_curve_key` - Bonding Curve Adresse
+        - `pool_address` - Pool-Adresse
+        - `pool_type` - Pool-Typ (meist "pump")
+        - `v_tokens_in_bonding_curve` - Virtuelle Tokens
+        - `v_sol_in_bonding_curve` - Virtuelles SOL
+        
+        #### 4. Initial Buy
+        - `initial_buy_sol` - SOL Betrag beim initialen Buy
+        - `initial_buy_tokens` - Anzahl Tokens beim initialen Buy
+        
+        #### 5. Zeitstempel
+        - `discovered_at` - Wann wurde der Coin entdeckt
+        - `token_created_at` - Wann wurde der Token erstellt
+        
+        #### 6. Preis & Market Cap
+        - `price_sol` - Preis in SOL
+        - `market_cap_sol` - Market Cap in SOL
+        - `liquidity_sol` - Liquidität in SOL
+        
+        #### 7. Graduation
+        - `open_market_cap_sol` - Fester Wert für Graduierung (85,000 SOL)
+        - `phase_id` - Phase ID
+        
+        #### 8. Status Flags
+        - `is_mayhem_mode` - Mayhem Mode Flag
+        - `is_graduated` - Ob bereits graduiert
+        - `is_active` - Ob noch aktiv
+        
+        #### 9. Risiko & Analyse
+        - `risk_score` - Risiko-Score (0-100)
+        - `top_10_holders_pct` - Prozentualer Anteil der Top-10-Holder
+        - `has_socials` - Ob Social Media vorhanden
+        - `social_count` - **NEU:** Anzahl Social-Links (0-4): Twitter + Telegram + Website + Discord
+        - `metadata_is_mutable` - **NEU:** Kann Dev Metadata nachträglich ändern? (aus RugCheck API)
+        - `mint_authority_enabled` - **NEU:** Kann Dev neue Tokens drucken? (aus RugCheck API)
+        - `image_hash` - **NEU:** pHash des Bildes (64 Zeichen) - für Lazy Scam Detection
+        
+        #### 10. Metadata & Social Media
+        - `metadata_uri` - URI zur Metadata
+        - `description` - Token-Beschreibung
+        - `image_url` - Bild-URL
+        - `twitter_url` - Twitter/X URL
+        - `telegram_url` - Telegram URL
+        - `website_url` - Website URL
+        - `discord_url` - Discord URL
+        
+        #### 11. Management & Klassifizierung
+        - `final_outcome` - Ergebnis (PENDING, GRADUATED, RUG, etc.)
+        - `classification` - Klassifizierung
+        - `status_note` - Notiz zum Status
+        """)
+    
+    # Daten-Mapping
+    st.header("🗺️ Daten-Mapping: Was wird wo gefüllt?")
+    
+    st.subheader("WebSocket → Datenbank")
+    st.markdown("""
+    | WebSocket Feld | SQL Feld | Gefüllt von |
+    |----------------|----------|-------------|
+    | `mint` | `token_address` | WebSocket |
+    | `name` | `name` | WebSocket |
+    | `symbol` | `symbol` | WebSocket |
+    | `signature` | `signature` | WebSocket |
+    | `traderPublicKey` | `trader_public_key` | WebSocket |
+    | `bondingCurveKey` | `bonding_curve_key` | WebSocket |
+    | `pool_address` | `pool_address` | WebSocket (berechnet) |
+    | `vTokensInBondingCurve` | `v_tokens_in_bonding_curve` | WebSocket |
+    | `vSolInBondingCurve` | `v_sol_in_bonding_curve` | WebSocket |
+    | `solAmount` | `initial_buy_sol` | WebSocket |
+    | `initialBuy` | `initial_buy_tokens` | WebSocket |
+    | `marketCapSol` | `market_cap_sol` | WebSocket |
+    | `price_sol` | `price_sol` | WebSocket (berechnet) |
+    | `social_count` | `social_count` | **NEU:** Relay (berechnet: 0-4) |
+    | `uri` | `metadata_uri` | WebSocket |
+    | `is_mayhem_mode` | `is_mayhem_mode` | WebSocket |
+    | `pool` | `pool_type` | WebSocket |
+    | `phaseId` | `phase_id` | WebSocket |
+    | `vSolInBondingCurve` | `liquidity_sol` | WebSocket (gleicher Wert) |
+    """)
+    
+    st.subheader("API → Datenbank")
+    st.markdown("""
+    | API Feld | SQL Feld | Gefüllt von |
+    |----------|----------|-------------|
+    | `token.decimals` | `token_decimals` | RugCheck API (in n8n) |
+    | `token.supply` | `token_supply` | RugCheck API (in n8n) |
+    | `deployPlatform` | `deploy_platform` | RugCheck API (in n8n) |
+    | `score` / `score_normalised` | `risk_score` | RugCheck API (in n8n) |
+    | `topHolders[]` | `top_10_holders_pct` | RugCheck API (in n8n, berechnet) |
+    | `metadata.isMutable` | `metadata_is_mutable` | **NEU:** RugCheck API (in n8n) |
+    | `mintAuthority.enabled` | `mint_authority_enabled` | **NEU:** RugCheck API (in n8n) |
+    """)
+    
+    st.subheader("Metadata → Datenbank")
+    st.markdown("""
+    | Metadata Feld | SQL Feld | Gefüllt von |
+    |---------------|----------|-------------|
+    | `description` | `description` | Metadata URI (in n8n geparst) |
+    | `image` | `image_url` | Metadata URI (in n8n geparst) |
+    | `twitter` | `twitter_url` | Metadata URI (in n8n geparst) |
+    | `telegram` | `telegram_url` | Metadata URI (in n8n geparst) |
+    | `website` | `website_url` | Metadata URI (in n8n geparst) |
+    | `discord` | `discord_url` | Metadata URI (in n8n geparst) |
+    | (berechnet) | `has_socials` | Metadata URI (in n8n, wenn URLs vorhanden) |
+    | (berechnet) | `social_count` | **NEU:** Relay (Anzahl vorhandener Social-Links: 0-4) |
+    | (berechnet) | `image_hash` | **NEU:** Optional in n8n (pHash des Bildes für Lazy Scam Detection) |
+    """)
+    
+    st.subheader("Default-Werte")
+    st.markdown("""
+    | SQL Feld | Default-Wert | Setzt |
+    |----------|--------------|-------|
+    | `discovered_at` | `NOW()` | Datenbank |
+    | `open_market_cap_sol` | `85000` | Datenbank |
+    | `blockchain_id` | `1` | Datenbank |
+    | `is_active` | `TRUE` | Datenbank |
+    | `final_outcome` | `'PENDING'` | Datenbank |
+    | `classification` | `'UNKNOWN'` | Datenbank |
+    | `pool_type` | `'pump'` | Datenbank |
+    """)
+    
+    # Zusammenfassung
+    st.header("📊 Zusammenfassung")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("WebSocket Felder", "17", "Direkt vom Relay (+ social_count)")
+    
+    with col2:
+        st.metric("API Felder", "6-8", "In n8n abgerufen (+ 2 neue Flags)")
+    
+    with col3:
+        st.metric("Metadata Felder", "7-9", "In n8n geparst (+ image_hash optional)")
+    
+    st.info("""
+    **Wichtig:** 
+    - Die `discovered_coins` Tabelle speichert nur den **initialen Snapshot**
+    - **NEU:** `social_count` wird im Relay berechnet und direkt an n8n gesendet
+    - **NEU:** `metadata_is_mutable` und `mint_authority_enabled` werden in n8n aus der RugCheck API geholt
+    - **NEU:** `image_hash` kann optional in n8n berechnet werden (pHash für Lazy Scam Detection)
+    - Metriken (die sich ändern) werden in einer separaten Tabelle gespeichert
+    - Alle Felder werden in n8n zusammengeführt und in die Datenbank geschrieben
+    """)
+    
+    # Technische Details
+    st.header("🔧 Technische Details")
+    
+    st.subheader("Services")
+    st.markdown("""
+    - **Relay Service** (`relay/main.py`): Empfängt WebSocket-Daten, filtert, sendet an n8n
+    - **UI Service** (`ui/app.py`): Streamlit Web-Interface für Monitoring und Konfiguration
+    - **n8n Workflow**: Empfängt Batches, ruft APIs ab, parst Metadata, speichert in DB
+    """)
+    
+    st.subheader("Ports")
+    st.markdown("""
+    - **Web UI**: Port `8500` (extern) → `8501` (intern)
+    - **API/Relay**: Port `8010` (extern) → `8000` (intern)
+    """)
+    
+    st.subheader("API Endpoints")
+    st.markdown("""
+    | Endpoint | Methode | Beschreibung |
+    |----------|---------|--------------|
+    | `/health` | GET | Health Check (Status, Uptime, n8n-Verbindung, etc.) |
+    | `/livez` | GET | Liveness: Event-Loop reagiert (Docker-Healthcheck) |
+    | `/readyz` | GET | Readiness: WebSocket und mindestens ein Sink gesund |
+    | `/metrics` | GET | Prometheus Metrics (Text-Format) |
+    | `/logs` | GET | Service-Logs (JSON, Parameter: `?lines=100`) |
+    | `/reload-config` | POST | Lädt Konfiguration neu (ohne Neustart) |
+    """)
+    
+    # Zusätzliche Tabellen
+    st.subheader("Zusätzliche Tabellen")
+    st.markdown("""
+    #### `coin_streams`
+    Speichert aktive Coin-Streams für kontinuierliches Metriken-Tracking:
+    - `id` (BIGSERIAL PRIMARY KEY)
+    - `token_address` (VARCHAR(64), UNIQUE)
+    - `current_phase_id` (INTEGER, Referenz zu `ref_coin_phases`)
+    - `is_active` (BOOLEAN)
+    - `is_graduated` (BOOLEAN)
+    - `started_at` (TIMESTAMP)
+    
+    #### `ref_coin_phases`
+    Referenztabelle für Coin-Phasen:
+    - `id` (INT PRIMARY KEY)
+    - `name` (VARCHAR(50)) - z.B. "Baby Zone", "Survival Zone", "Mature Zone"
+    - `interval_seconds` (INT) - Intervall für Metriken-Updates
+    - `min_age_minutes` / `max_age_minutes` (INT) - Zeitfenster für diese Phase
+    
+    **Phasen:**
+    - **Baby Zone** (ID: 1): 0-10 Min, Intervall: 5s
+    - **Survival Zone** (ID: 2): 10-60 Min, Intervall: 30s
+    - **Mature Zone** (ID: 3): 1-24 Std, Intervall: 60s
+    - **Finished** (ID: 99): Ab 24 Std
+    - **Graduated** (ID: 100): Graduierte Tokens
+    
+    #### `exchange_rates` ⭐ NEU
+    **Ziel:** Erfassung der allgemeinen Marktstimmung ("Wasserstand"), um bei der KI-Analyse echte Token-Pumps von allgemeinen Marktbewegungen (z.B. SOL-Crash) zu unterscheiden.
+    
+    **Struktur:**
+    - `id` (SERIAL PRIMARY KEY)
+    - `created_at` (TIMESTAMPTZ) - Zeitstempel des Snapshots
+    - `sol_price_usd` (NUMERIC) - **WICHTIG:** Der "Wasserstand" (z.B. 145.50)
+    - `usd_to_eur_rate` (NUMERIC) - Währungsumrechnung
+    - `native_currency_price_usd` (NUMERIC) - Redundant zu sol_price (für Mapping)
+    - `blockchain_id` (INTEGER) - ID der Chain (1 = Solana)
+    - `source` (VARCHAR(50)) - Herkunft (z.B. "Scout Workflow", "Exchange Rates Workflow")
+    
+    **Bedeutung für KI-Training:**
+    Dieser Kontext ermöglicht der KI zu lernen:
+    - **"Token steigt, während SOL stabil ist"** → Bullish (Echter Pump) ✅
+    - **"Token steigt, weil SOL um 5% steigt"** → Neutral (Marktbewegung) ⚠️
+    - **"Token ist stabil, während SOL crasht"** → Stärke (Relative Strength) 💪
+    
+    **n8n Workflow (Exchange Rates):**
+    - **Trigger:** Jedes Mal, wenn ein Batch an n8n gesendet wird
+    - **Datenquellen:**
+      - Jupiter API v3: Aktueller SOL-Preis in USD (So111...112 Mint Address)
+      - Frankfurter App API: Aktueller USD zu EUR Wechselkurs
+    - **Aktion:** Schreibt einen Snapshot der Marktdaten in die Datenbank
+    """)
+    
+    # KI-optimierte Features
+    st.header("🤖 KI-optimierte Rug-Detection Features")
+    
+    st.subheader("1️⃣ Lazy Scam Detektor (Bild-Hash)")
+    st.markdown("""
+    **Ziel:** Erkenne Coins, die dasselbe Bild wie bereits bekannte Rugs verwenden.
+    
+    **Implementierung:**
+    - `image_hash` (VARCHAR(64)) - pHash des Bildes
+    - Wird optional in n8n berechnet (wenn `image_url` vorhanden)
+    - KI kann lernen: "Wenn Hash = X und letzte 50 Coins mit diesem Hash waren Rugs → Rug-Wahrscheinlichkeit = 99%"
+    
+    **Status:** ✅ SQL-Schema erweitert, Implementierung in n8n optional
+    """)
+    
+    st.subheader("2️⃣ RugCheck Details (Erweiterte Flags)")
+    st.markdown("""
+    **Ziel:** Nicht nur den `risk_score` speichern, sondern auch konkrete Boolean-Flags.
+    
+    **Implementierung:**
+    - `metadata_is_mutable` (BOOLEAN) - Kann Dev Metadata nachträglich ändern? (Soft-Rug-Indikator)
+    - `mint_authority_enabled` (BOOLEAN) - Kann Dev neue Tokens drucken? (Hartes Ausschlusskriterium)
+    - Werden in n8n aus RugCheck API geholt (`metadata.isMutable`, `mintAuthority.enabled`)
+    
+    **KI-Lernziele:**
+    - "Wenn `mint_authority_enabled = true` → Rug-Wahrscheinlichkeit = 99%"
+    - "Wenn `metadata_is_mutable = true` → Soft-Rug-Wahrscheinlichkeit = 70%"
+    
+    **Status:** ✅ SQL-Schema erweitert, Mapping in n8n erforderlich
+    """)
+    
+    st.subheader("3️⃣ Social Effort Metrik")
+    st.markdown("""
+    **Ziel:** Einfache Metrik für KI: "Coins mit Social Count < 2 ruggen zu 80% schneller."
+    
+    **Implementierung:**
+    - `social_count` (INT, 0-4) - Anzahl vorhandener Social-Links
+    - Berechnung: Twitter + Telegram + Website + Discord
+    - Wird im Relay automatisch berechnet und an n8n gesendet
+    
+    **KI-Lernziele:**
+    - "Wenn `social_count < 2` → Rug-Wahrscheinlichkeit = 80%"
+    - "Wenn `social_count >= 3` → Rug-Wahrscheinlichkeit = 20%"
+    
+    **Status:** ✅ Implementiert - wird automatisch berechnet
+    """)
+    
+    st.subheader("4️⃣ Marktstimmung (\"Wasserstand\") ⭐ NEU")
+    st.markdown("""
+    **Ziel:** Erfassung der allgemeinen Marktstimmung ("Wasserstand"), um bei der KI-Analyse echte Token-Pumps von allgemeinen Marktbewegungen (z.B. SOL-Crash) zu unterscheiden.
+    
+    **Implementierung:**
+    - `exchange_rates` Tabelle speichert Markt-Snapshots
+    - **n8n Workflow (Exchange Rates):** Läuft parallel zum Token-Processing
+    - **Trigger:** Jedes Mal, wenn ein Batch an n8n gesendet wird
+    - **Datenquellen:**
+      - Jupiter API v3: Aktueller SOL-Preis in USD (So111...112 Mint Address)
+      - Frankfurter App API: Aktueller USD zu EUR Wechselkurs
+    - **Aktion:** Schreibt einen Snapshot der Marktdaten in die Datenbank
+    
+    **KI-Lernziele:**
+    - **"Token steigt, während SOL stabil ist"** → Bullish (Echter Pump) ✅
+    - **"Token steigt, weil SOL um 5% steigt"** → Neutral (Marktbewegung) ⚠️
+    - **"Token ist stabil, während SOL crasht"** → Stärke (Relative Strength) 💪
+    
+    **Status:** ✅ SQL-Schema erweitert, n8n Workflow implementiert
+    """)
+    
+    # Deployment & Konfiguration
+    st.header("🚀 Deployment & Konfiguration")
+    
+    st.subheader("Lokale Entwicklung")
+    st.markdown("""
+    ```bash
+    # Docker Compose starten
+    docker compose up -d
+    
+    # Services
+    - Web UI: http://localhost:8500
+    - API: http://localhost:8010
+    ```
+    """)
+    
+    st.subheader("Coolify Deployment")
+    st.markdown("""
+    **Wichtige Hinweise:**
+    - Ports: Web UI (8500), API (8010)
+    - Named Volume: `config_data` für persistente Konfiguration
+    - Kein Docker Socket verfügbar → UI verwendet API-Endpunkte
+    - Service-Name: `api` für interne Kommunikation
+    
+    **Dokumentation:** Siehe `COOLIFY.md` für detaillierte Anleitung
+    """)
+    
+    st.subheader("Konfiguration")
+    st.markdown("""
+    **Über UI konfigurierbar:**
+    - Batch-Einstellungen (Größe, Timeout)
+    - n8n Webhook (URL, Methode)
+    - WebSocket-Einstellungen (URI, Retry, Ping)
+    - Filter-Pattern (Bad Names Regex)
+    - **Datenbank-Credentials** (Host, Port, Name, User, Password)
+    
+    **Konfiguration wird gespeichert in:**
+    - `/app/config/.env` (geteiltes Volume)
+    - Wird vom Relay-Service dynamisch geladen (via `/reload-config` Endpoint)
+    """)
+    
+    # Troubleshooting
+    st.header("🔧 Troubleshooting")
+    
+    st.subheader("Häufige Probleme")
+    st.markdown("""
+    **Problem:** n8n URL wird nicht übernommen
+    - ✅ **Gelöst:** Konfiguration wird in Volume gespeichert, Relay lädt sie dynamisch
+    - Lösung: Konfiguration speichern → "Konfiguration neu laden" klicken
+    
+    **Problem:** Logs nicht sichtbar in UI
+    - ✅ **Gelöst:** Logs werden über API-Endpoint `/logs` abgerufen
+    - Lösung: Prüfe, ob Relay-Service läuft (`/health` Endpoint)
+    
+    **Problem:** DB-Verbindung schlägt fehl
+    - Lösung: DB-Credentials im Konfigurations-Tab prüfen
+    - Lösung: "DB-Verbindung testen" Button verwenden
+    - Lösung: Prüfe, ob PostgreSQL läuft und erreichbar ist
+    
+    **Problem:** Container zeigt "running unknown" in Coolify
+    - ✅ **Gelöst:** Healthchecks wurden verbessert
+    - Lösung: Prüfe Healthcheck-Logs in Coolify-Dashboard
+    """)
+    
+    st.subheader("Logs & Debugging")
+    st.markdown("""
+    **Logs abrufen:**
+    - **UI:** Tab "📋 Logs" (zeigt neueste zuerst)
+    - **API:** `GET http://localhost:8010/logs?lines=100`
+    - **Docker:** `docker compose logs api` oder `docker compose logs web`
+    
+    **Health-Check:**
+    - `GET http://localhost:8010/health` - Zeigt Status, Uptime, n8n-Verbindung
+    - `GET http://localhost:8010/readyz` - Ready? (mit Grund, z.B. "Kein Sink gesund")
+    
+    **Metrics:**
+    - `GET http://localhost:8010/metrics` - Prometheus-kompatible Metriken
+    """)
+    
+    # Dokumentation & Links
+    st.header("📚 Dokumentation & Ressourcen")
+    
+    st.subheader("Projekt-Dokumentation")
+    st.markdown("""
+    - **[README.md](../README.md)** - Projekt-Übersicht und Schnellstart
+    - **[ERWEITERUNGSPLAN.md](../ERWEITERUNGSPLAN.md)** - KI-optimierte Features
+    - **[COOLIFY.md](../COOLIFY.md)** - Coolify Deployment-Anleitung
+    - **[DATEN_MAPPING.md](../DATEN_MAPPING.md)** - Daten-Mapping (WebSocket → SQL)
+    - **[API_SQL_MAPPING.md](../API_SQL_MAPPING.md)** - API-Daten → SQL Mapping
+    - **[sql/schema.sql](../sql/schema.sql)** - Vollständiges Datenbankschema
+    """)
+    
+    st.subheader("Externe Ressourcen")
+    st.markdown("""
+    - **Pump.fun**: https://pump.fun
+    - **n8n**: https://n8n.io
+    - **Prometheus**: https://prometheus.io
+    - **Streamlit**: https://streamlit.io
+    """)
+    
+    # Projekt-Status
+    st.header("✅ Projekt-Status")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.success("✅ WebSocket Relay")
+        st.caption("Empfängt & filtert Tokens")
+    
+    with col2:
+        st.success("✅ n8n Integration")
+        st.caption("GET/POST Webhooks")
+    
+    with col3:
+        st.success("✅ DB-Verbindung")
+        st.caption("PostgreSQL mit Prüfung")
+    
+    with col4:
+        st.success("✅ Metrics & Monitoring")
+        st.caption("Prometheus + Dashboard")
+    
+    st.markdown("""
+    **Implementierte Features:**
+    - ✅ Echtzeit-WebSocket-Verbindung zu Pump.fun
+    - ✅ Spam-Burst-Filterung
+    - ✅ Bad Names Filter (Regex)
+    - ✅ Batch-Verarbeitung
+    - ✅ n8n Webhook-Integration (GET/POST)
+    - ✅ Prometheus Metrics
+    - ✅ Streamlit UI für Monitoring & Konfiguration
+    - ✅ Dynamische Konfiguration (ohne Neustart)
+    - ✅ DB-Verbindungsprüfung
+    - ✅ KI-optimierte Felder (social_count, metadata_is_mutable, mint_authority_enabled, image_hash)
+    - ✅ Health-Checks für Docker/Coolify
+    - ✅ Logs-API für zentrale Log-Anzeige
+    - ✅ Marktstimmung ("Wasserstand") - exchange_rates Tabelle für KI-Analyse ⭐ NEU
+    """)
@@ -0,0 +1,127 @@
+"""
+Live-Feed-Tab: akzeptierte und gefilterte Coins per SSE vom Relay
+"""
+import json
+import threading
+import time
+from collections import deque
+
+import requests
+import streamlit as st
+
+from common import FEED_IDLE_TIMEOUT, FEED_MAX_ROWS, FEED_REFRESH_SECONDS, RELAY_PORT, RELAY_SERVICE
+
+class LiveFeedListener:
+    """Liest den SSE-Feed des Relays (/feed) in einem Hintergrund-Thread in einen Ringpuffer
+    
+    Eine Verbindung pro UI-Prozess, geteilt von allen Viewern (st.cache_resource).
+    Der Thread beendet sich, wenn FEED_IDLE_TIMEOUT lang niemand den Feed anzeigt.
+    """
+    
+    def __init__(self, url, max_rows=FEED_MAX_ROWS):
+        self.url = url
+        self.events = deque(maxlen=max_rows)
+        self.thread = None
+        self.last_access = 0
+        self.connected = False
+        self.error = None
+        self.dropped = 0
+        self.lock = threading.Lock()
+    
+    def ensure_running(self):
+        self.last_access = time.time()
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+    
+    def _idle(self):
+        return time.time() - self.last_access > FEED_IDLE_TIMEOUT
+    
+    def _run(self):
+        while not self._idle():
+            try:
+                # Lese-Timeout > Heartbeat des Relays (15s)
+                with requests.get(self.url, params={"backfill": 200}, stream=True, timeout=(3, 30)) as response:
+                    response.raise_for_status()
+                    self.connected = True
+                    self.error = None
+                    self.events.clear()  # Backfill ersetzt den alten Stand
+                    event_type = None
+                    # chunk_size=None: Zeilen sofort verarbeiten, nicht auf volle Blöcke warten
+                    for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                        if self._idle():
+                            return
+                        if line.startswith("event:"):
+                            event_type = line[6:].strip()
+                        elif line.startswith("data:"):
+                            data = line[5:].strip()
+                            if event_type == "dropped":
+                                self.dropped += int(data)
+                            else:
+                                self.events.append(json.loads(data))
+                            event_type = None
+            except Exception as e:
+                self.error = str(e)[:100]
+            finally:
+                self.connected = False
+            time.sleep(3)
+    
+    def rows(self):
+        return list(self.events)
+
+@st.cache_resource
+def get_live_feed():
+    """Geteilter Live-Feed-Listener (eine SSE-Verbindung für alle Viewer)"""
+    return LiveFeedListener(f"http://{RELAY_SERVICE}:{RELAY_PORT}/feed")
+
+def render_live_feed(status_filter):
+    """Live-Feed-Tab: Tabelle der zuletzt empfangenen Coins (als Fragment)"""
+    feed = get_live_feed()
+    feed.ensure_running()
+    
+    rows = feed.rows()
+    if status_filter != "alle":
+        rows = [row for row in rows if row.get("status") == status_filter]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Verbindung", "🟢 Verbunden" if feed.connected else "🔴 Getrennt")
+    with col2:
+        st.metric("Coins im Puffer", f"{len(rows):,}")
+    with col3:
+        st.metric("Verworfen (UI zu langsam)", f"{feed.dropped:,}")
+    if feed.error and not feed.connected:
+        st.caption(f"⚠️ {feed.error}")
+    
+    if rows:
+        import pandas as pd  # erst laden, wenn der Feed wirklich angezeigt wird
+        df = pd.DataFrame(rows[::-1])  # Neueste oben
+        df["ts"] = pd.to_datetime(df["ts"], unit="s").dt.strftime("%H:%M:%S")
+        df = df.rename(columns={
+            "ts": "Zeit", "status": "Status", "reason": "Grund", "symbol": "Symbol", "name": "Name",
+            "marketCapSol": "Market Cap (SOL)", "price_sol": "Preis (SOL)", "market_cap_usd": "Market Cap (USD)",
+            "social_count": "Socials", "initialBuy": "Initial Buy", "solAmount": "SOL", "traderPublicKey": "Creator",
+            "mint": "Mint"
+        })
+        # st.dataframe ist virtualisiert: nur sichtbare Zeilen werden gerendert
+        st.dataframe(df, hide_index=True, use_container_width=True, height=600)
+    else:
+        st.info("Noch keine Coins empfangen.")
+
+def render():
+    """Live-Feed-Tab"""
+    st.subheader("🪙 Live-Feed")
+    st.caption("Akzeptierte und gefilterte Coins direkt vom Relay (Server-Sent Events, eine Verbindung für alle Viewer).")
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        live_feed_active = st.toggle("Live-Feed anzeigen", key="live_feed_active")
+    with col2:
+        feed_status_filter = st.radio("Status", ["alle", "accepted", "filtered"], horizontal=True, key="live_feed_status")
+    
+    if live_feed_active:
+        # Nur die Tabelle läuft als Fragment neu; die SSE-Verbindung hält der Listener-Thread
+        st.fragment(run_every=FEED_REFRESH_SECONDS)(render_live_feed)(feed_status_filter)
+    else:
+        st.info("💡 Live-Feed einschalten, um die Coins in Echtzeit zu sehen.")
@@ -0,0 +1,149 @@
+"""
+Logs-Tab: Service-Logs inkrementell über die Relay-API (Fallback: Docker)
+"""
+from collections import deque
+
+import requests
+import streamlit as st
+
+from common import COOLIFY_MODE, LOG_MAX_LINES, LOGS_REFRESH_SECONDS, RELAY_PORT, RELAY_SERVICE, get_relay_client
+
+def fetch_log_entries(since):
+    """Log-Zeilen nach Sequenznummer `since` von der Relay-API (gzip über requests)"""
+    try:
+        response = get_relay_client().request("GET", "/logs", params={"since": since}, timeout=5)
+        if response.status_code == 200:
+            return response.json()
+    except:
+        pass
+    return None
+
+def get_service_logs(lines=100):
+    """Holt Logs vom Relay-Service"""
+    # Coolify-Modus: Logs über API abrufen
+    if COOLIFY_MODE:
+        try:
+            response = get_relay_client().request("GET", "/logs", params={"lines": lines}, timeout=5)
+            if response.status_code == 200:
+                data = response.json()
+                logs = data.get("logs", [])
+                if logs:
+                    return '\n'.join(logs)
+                else:
+                    return "[Keine Logs verfügbar - Service startet gerade oder noch keine Logs generiert]"
+            else:
+                return f"❌ Fehler beim Abrufen der Logs: HTTP {response.status_code}\n\n💡 Prüfe, ob der Relay-Service läuft."
+        except requests.exceptions.ConnectionError:
+            return f"❌ Verbindungsfehler: Kann Relay-Service nicht erreichen (http://{RELAY_SERVICE}:{RELAY_PORT})\n\n💡 Prüfe, ob der Service läuft."
+        except Exception as e:
+            return f"❌ Fehler beim Abrufen der Logs über API: {str(e)}\n\n💡 Falls das nicht funktioniert, verwende die Logs im Coolify-Dashboard."
+    
+    # Normale Docker-Methode (wenn Docker Socket verfügbar)
+    try:
+        import docker
+        client = docker.from_env()
+        # Versuche verschiedene Container-Namen
+        container_names = [RELAY_SERVICE, "pump-discover-relay", "relay"]
+        container = None
+        for name in container_names:
+            try:
+                container = client.containers.get(name)
+                break
+            except:
+                continue
+        if container:
+            logs = container.logs(tail=lines, timestamps=True).decode('utf-8')
+            # Logs umdrehen: Neueste oben
+            log_lines = logs.split('\n')
+            log_lines.reverse()
+            return '\n'.join(log_lines)
+        else:
+            raise Exception("Container nicht gefunden")
+    except ImportError:
+        # Fallback: Docker Python Client nicht verfügbar
+        import subprocess
+        try:
+            result = subprocess.run(
+                ["docker", "compose", "logs", "--tail", str(lines), "relay"],
+                cwd="/app",
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                # Logs umdrehen: Neueste oben
+                log_lines = result.stdout.split('\n')
+                log_lines.reverse()
+                return '\n'.join(log_lines)
+            else:
+                return f"Fehler beim Abrufen der Logs: {result.stderr}"
+        except Exception as e:
+            return f"Fehler beim Abrufen der Logs: {str(e)}"
+    except Exception as e:
+        return f"Fehler beim Abrufen der Logs: {str(e)}"
+
+def update_log_entries():
+    """Holt nur neue Log-Zeilen (/logs?since=<seq>) und hängt sie an den Session-Puffer an
+    
+    Liefert False, wenn die Relay-API nicht erreichbar ist.
+    """
+    if "log_entries" not in st.session_state:
+        st.session_state.log_entries = deque(maxlen=LOG_MAX_LINES)
+        st.session_state.log_seq = 0
+    data = fetch_log_entries(st.session_state.log_seq)
+    if data is None:
+        return False
+    if data.get("truncated"):
+        # Lücke (Buffer übergelaufen) oder Relay neu gestartet → die Antwort enthält
+        # schon das komplette aktuelle Fenster, alten Puffer verwerfen
+        st.session_state.log_entries.clear()
+    for entry in data.get("entries", []):
+        st.session_state.log_entries.append(entry["line"])
+    st.session_state.log_seq = data.get("last_seq", st.session_state.log_seq)
+    return True
+
+def render_service_logs(lines):
+    """Logs-Tab: Log-Ausgabe (als Fragment)"""
+    if update_log_entries():
+        # Inkrementell über die Relay-API: neueste oben
+        entries = st.session_state.log_entries
+        logs = '\n'.join(entries[i] for i in range(len(entries) - 1, max(-1, len(entries) - 1 - lines), -1))
+        if not logs:
+            logs = "[Keine Logs verfügbar - Service startet gerade oder noch keine Logs generiert]"
+    else:
+        # Fallback: Docker-Logs bzw. Fehlermeldung (komplett)
+        logs = get_service_logs(lines=lines)
+    
+    # Stelle sicher, dass Logs als String vorliegen
+    if isinstance(logs, list):
+        logs = '\n'.join(logs)
+    
+    # Zeige Logs an (neueste oben) - ohne key, damit das Fragment den Inhalt aktualisieren kann
+    st.text_area(
+        "Service Logs (neueste oben)",
+        logs,
+        height=600,
+        help="Die neuesten Logs stehen oben, die ältesten unten."
+    )
+
+def render():
+    """Logs-Tab"""
+    st.subheader("📋 Service Logs")
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        # Startwert über Session State (der Wert bleibt beim Tab-Wechsel erhalten, siehe app.py)
+        st.session_state.setdefault("logs_lines_input", 100)
+        lines = st.number_input("Anzahl Zeilen", min_value=10, max_value=1000, step=10, key="logs_lines_input")
+    
+    with col2:
+        refresh_logs = st.button("🔄 Logs aktualisieren", key="refresh_logs_button")
+        if refresh_logs:
+            st.rerun()
+    
+    # Auto-Refresh: nur der Log-Bereich läuft als Fragment neu
+    auto_refresh_logs = st.session_state.get("auto_refresh_logs", False)
+    st.fragment(run_every=LOGS_REFRESH_SECONDS if auto_refresh_logs else None)(render_service_logs)(lines)
+    
+    st.checkbox("🔄 Auto-Refresh Logs (10s)", key="auto_refresh_logs")
@@ -0,0 +1,38 @@
+"""
+Metriken-Tab: Raw-Metriken (Prometheus) und aggregierte Statistiken
+"""
+import streamlit as st
+
+from common import DASHBOARD_REFRESH_SECONDS, fetch_relay
+
+def render_raw_metrics():
+    """Metriken-Tab: Raw-Metriken und geparste Ansicht (als Fragment)"""
+    # Raw-Metriken und Stats parallel holen
+    metrics, stats = fetch_relay("metrics", "stats")
+    
+    if metrics:
+        # Vollständige Metriken
+        st.subheader("📄 Vollständige Prometheus Metriken (Raw)")
+        st.code(metrics, language="text")
+        
+        # Aggregierte Kennzahlen (vom Relay berechnet, inkl. Labels)
+        st.subheader("📊 Aggregierte Statistiken (/stats)")
+        if stats:
+            st.json(stats)
+        else:
+            st.caption("⚠️ /stats nicht verfügbar")
+    else:
+        st.error("❌ Metriken konnten nicht abgerufen werden. Bitte prüfe, ob der Relay-Service läuft.")
+
+def render():
+    """Metriken-Tab"""
+    st.info("💡 Die Metriken werden jetzt direkt im Dashboard angezeigt. Dieser Tab zeigt die vollständigen Raw-Metriken.")
+    
+    if st.button("🔄 Metriken aktualisieren"):
+        st.rerun()
+    
+    # Auto-Refresh: nur die Raw-Metriken laufen als Fragment neu
+    auto_refresh_metrics = st.session_state.get("auto_refresh_metrics", False)
+    st.fragment(run_every=DASHBOARD_REFRESH_SECONDS if auto_refresh_metrics else None)(render_raw_metrics)()
+    
+    st.checkbox("🔄 Auto-Refresh Metriken (5s)", key="auto_refresh_metrics")
@@ -0,0 +1,112 @@
+"""
+Start- und Rerun-Zeiten der UI
+
+Streamlit führt app.py bei jeder Interaktion komplett neu aus. Damit Kaltstart
+und Rerun-Zeit nicht unbemerkt wachsen, misst dieses Modul:
+- Kaltstart: erster Run im Prozess (inkl. aller Imports, z.B. pandas)
+- Import-Zeit jedes Tab-Moduls beim ersten Laden (inkl. seiner Abhängigkeiten)
+- Rerun-Zeiten pro Tab (letzte TIMING_HISTORY Runs → p50/p95)
+
+Die Werte gelten pro Prozess (alle Sessions) und stehen in der Sidebar unter
+"⏱️ Performance". Mit UI_TIMING_LOG=true wird zusätzlich jeder Run geloggt.
+Fragment-Reruns (Auto-Refresh) führen app.py nicht aus und zählen nicht mit.
+"""
+import importlib
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import streamlit as st
+
+TIMING_LOG = os.getenv("UI_TIMING_LOG", "false").lower() == "true"
+TIMING_HISTORY = 200  # Runs pro Tab für die Perzentile
+
+_lock = threading.Lock()
+_cold_start = None  # (Tab, Sekunden)
+_imports = {}  # Modul → Sekunden
+_runs = {}  # Tab → deque der Laufzeiten
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def start_run():
+    """Startzeitpunkt des aktuellen Runs (ganz oben in app.py aufrufen)"""
+    return time.perf_counter()
+
+
+def import_tab(module_name):
+    """Tab-Modul laden; beim ersten Mal im Prozess wird die Import-Zeit erfasst"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    duration = time.perf_counter() - started
+    with _lock:
+        _imports.setdefault(module_name, duration)
+    print(f"⏱️ Modul {module_name} geladen in {duration * 1000:.0f} ms")
+    return module
+
+
+def finish_run(started, tab):
+    """Laufzeit des aktuellen Runs erfassen (ganz unten in app.py aufrufen)"""
+    global _cold_start
+    duration = time.perf_counter() - started
+    with _lock:
+        if _cold_start is None:
+            _cold_start = (tab, duration)
+            print(f"⏱️ UI-Kaltstart ({tab}): {duration * 1000:.0f} ms")
+        elif TIMING_LOG:
+            print(f"⏱️ UI-Run ({tab}): {duration * 1000:.0f} ms")
+        if tab not in _runs:
+            _runs[tab] = deque(maxlen=TIMING_HISTORY)
+        _runs[tab].append(duration)
+    return duration
+
+
+def snapshot():
+    """Alle Messwerte in Millisekunden (für die Sidebar und scripts/bench_ui.py)"""
+    with _lock:
+        return {
+            "cold_start": {"tab": _cold_start[0], "ms": round(_cold_start[1] * 1000, 1)} if _cold_start else None,
+            "imports_ms": {name: round(duration * 1000, 1) for name, duration in _imports.items()},
+            "runs": {
+                tab: {
+                    "count": len(durations),
+                    "last_ms": round(durations[-1] * 1000, 1),
+                    "p50_ms": round(_percentile(durations, 0.5) * 1000, 1),
+                    "p95_ms": round(_percentile(durations, 0.95) * 1000, 1),
+                }
+                for tab, durations in _runs.items()
+            },
+        }
+
+
+def render_report():
+    """Sidebar: Kaltstart, Import-Zeiten und Rerun-Perzentile pro Tab"""
+    data = snapshot()
+    with st.sidebar.expander("⏱️ Performance"):
+        if data["cold_start"]:
+            st.metric("Kaltstart", f"{data['cold_start']['ms']:.0f} ms", help=f"Erster Run im Prozess ({data['cold_start']['tab']})")
+        if data["imports_ms"]:
+            st.write("**Tab-Module (erster Import):**")
+            for name, ms in data["imports_ms"].items():
+                st.write(f"- {name}: {ms:.0f} ms")
+        if data["runs"]:
+            # Markdown statt st.table: st.table würde pandas laden
+            rows = [
+                f"| {tab} | {values['count']} | {values['last_ms']:.0f} | {values['p50_ms']:.0f} | {values['p95_ms']:.0f} |"
+                for tab, values in data["runs"].items()
+            ]
+            st.markdown("\n".join([
+                "**Reruns pro Tab (ms):**",
+                "",
+                "| Tab | Runs | Letzter | p50 | p95 |",
+                "|---|---:|---:|---:|---:|",
+                *rows,
+            ]))
+        st.caption("Pro UI-Prozess (alle Viewer); Fragment-Refreshs zählen nicht mit.")